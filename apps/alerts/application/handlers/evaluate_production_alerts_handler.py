@@ -0,0 +1,50 @@
+from apps.alerts.application.services.alerts_service import AlertsService
+from apps.alerts.domain.entities.alerts_model import AlertsModel
+from apps.alerts.exceptions.application.handlers.alerts_handlers_exceptions import \
+    EvaluateProductionAlertsHandlerException
+from apps.production.application.events.production_recorded_event import ProductionRecordedEvent
+from shared.communication_bus.event_bus.event_handler_interface import EventHandlerInterface
+from shared.constants import ALERTS_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class EvaluateProductionAlertsHandler(EventHandlerInterface):
+    """Handler that feeds the production events into the alert rules engine."""
+
+    def __init__(self, alerts_service: AlertsService):
+        """
+        Constructor for the EvaluateProductionAlertsHandler class.
+
+        Args:
+            alerts_service (AlertsService): The service to evaluate and persist the alerts.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = ALERTS_SERVICE
+        self.alerts_service = alerts_service
+
+    def publish(self, event: ProductionRecordedEvent, trace_id: str = None) -> list[AlertsModel]:
+        """
+        Handles the ProductionRecordedEvent.
+
+        Args:
+            event (ProductionRecordedEvent): The production event to evaluate.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            list[AlertsModel]: The alerts raised by the event.
+
+        Raises:
+            EvaluateProductionAlertsHandlerException: If an error occurs while evaluating the alerts.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.alerts_service.evaluate_production_event(event, trace_id=trace_id)
+        except ServiceException as e:
+            raise EvaluateProductionAlertsHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error evaluating alerts for record {event.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise EvaluateProductionAlertsHandlerException(error_message) from e
@@ -0,0 +1,50 @@
+from apps.alerts.application.queries.fetch_alerts_by_filter_query import FetchAlertsByFilterQuery
+from apps.alerts.application.services.alerts_service import AlertsService
+from apps.alerts.domain.entities.alerts_model import AlertsModel
+from apps.alerts.exceptions.application.handlers.alerts_handlers_exceptions import FetchAlertsByFilterHandlerException
+from shared.communication_bus.query_bus.query_handler_interface import QueryHandlerInterface
+from shared.constants import ALERTS_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class FetchAlertsByFilterHandler(QueryHandlerInterface):
+    """Handler to fetch alerts by filter."""
+
+    def __init__(self, alerts_service: AlertsService):
+        """
+        Constructor for the FetchAlertsByFilterHandler class.
+
+        Args:
+            alerts_service (AlertsService): The service to fetch the alerts.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = ALERTS_SERVICE
+        self.fetch_service = alerts_service
+
+    def ask(self, query: FetchAlertsByFilterQuery, trace_id: str = None) -> list[AlertsModel]:
+        """
+        Handles the query to fetch the alerts by filter.
+
+        Args:
+            query (FetchAlertsByFilterQuery): The query containing the filter criteria.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            list[AlertsModel]: The alerts matching the filters.
+
+        Raises:
+            FetchAlertsByFilterHandlerException: If an error occurs while fetching the alerts.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            filters = query.model_dump(exclude_none=True, exclude={'limit'})
+            return self.fetch_service.fetch_alerts_by_filter(filters, limit=query.limit, trace_id=trace_id)
+        except ServiceException as e:
+            raise FetchAlertsByFilterHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error fetching alerts for tenant {query.tenant_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise FetchAlertsByFilterHandlerException(error_message) from e
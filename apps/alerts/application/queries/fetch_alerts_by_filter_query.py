@@ -0,0 +1,19 @@
+from typing import Optional
+
+from shared.communication_bus.query_bus.query_dto import QueryDTO
+
+
+class FetchAlertsByFilterQuery(QueryDTO):
+    """
+    Query to fetch the alerts by filter.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant of the alerts.
+        status (Optional[str]): The status of the alerts to fetch.
+        severity (Optional[str]): The severity of the alerts to fetch.
+        limit (Optional[int]): The maximum number of alerts to fetch, newest first.
+    """
+    tenant_id: str
+    status: Optional[str] = None
+    severity: Optional[str] = None
+    limit: Optional[int] = None
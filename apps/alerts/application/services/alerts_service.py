@@ -0,0 +1,200 @@
+from datetime import datetime, UTC
+from typing import Optional
+from pydantic import ValidationError
+
+from apps.alerts.domain.entities.alerts_model import AlertsModel, GetAlertsByFilterModel, InsertAlertsModel
+from apps.alerts.domain.repositories.alerts_db_interface import AlertsDBInterface
+from apps.alerts.domain.services.alert_rules_engine import AlertRulesEngine
+from apps.alerts.exceptions.application.services.alerts_service_exceptions import AlertsServiceException, \
+    AlertsServiceValidationException
+from apps.dashboard.domain.repositories.live_updates_interface import LiveUpdatesInterface
+from apps.production.application.events.production_recorded_event import ProductionRecordedEvent
+from shared.constants import ALERTS_SERVICE, LIVE_EVENT_ALERT_RAISED, LIVE_EVENT_ALERT_RESOLVED
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException
+from shared.logger import LoggerService
+from shared.tenancy import all_tenants_scope, tenant_scope
+from shared.tracing import get_trace_id
+
+
+class AlertsService:
+    """
+    Service to evaluate, persist and fetch the alerts
+    """
+    def __init__(self, db_repository: AlertsDBInterface, database_manager: DataBaseManager,
+                 rules_engine: AlertRulesEngine, live_updates_repository: Optional[LiveUpdatesInterface] = None):
+        """
+        Constructor for the AlertsService class.
+
+        Args:
+            db_repository (AlertsDBInterface): The repository to handle the database operations.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            rules_engine (AlertRulesEngine): The in-memory engine that evaluates the alert rules.
+            live_updates_repository (Optional[LiveUpdatesInterface]): The repository to push the alert
+                transitions to the live dashboards.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = ALERTS_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.rules_engine = rules_engine
+        self.live_updates_repository = live_updates_repository
+
+    def evaluate_production_event(self, event: ProductionRecordedEvent, trace_id: str = None) -> list[AlertsModel]:
+        """
+        Evaluates the alert rules for a production event and persists the alert transitions.
+
+        The database is only touched when the event raises or resolves an alert.
+
+        Args:
+            event (ProductionRecordedEvent): The production event to evaluate.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            list[AlertsModel]: The alerts raised by the event.
+
+        Raises:
+            AlertsServiceException: If an error occurs while persisting the alerts.
+        """
+        raised, resolved = self.rules_engine.evaluate(event)
+        if not raised and not resolved:
+            return []
+        with tenant_scope(event.tenant_id):
+            inserted = self.persist_transitions(raised, resolved, trace_id)
+        self._push_transitions(inserted, resolved, trace_id)
+        return inserted
+
+    def sweep_inactivity(self, trace_id: str = None) -> list[AlertsModel]:
+        """
+        Evaluates the idle rules (stalled references) and persists the alert transitions.
+
+        Args:
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            list[AlertsModel]: The alerts raised by the sweep.
+
+        Raises:
+            AlertsServiceException: If an error occurs while persisting the alerts.
+        """
+        raised, resolved = self.rules_engine.sweep_inactivity()
+        if not raised and not resolved:
+            return []
+        transitions_by_tenant: dict[str, tuple[list, list]] = {}
+        for alert in raised:
+            transitions_by_tenant.setdefault(alert.tenant_id, ([], []))[0].append(alert)
+        for fingerprint in resolved:
+            transitions_by_tenant.setdefault(fingerprint.split(':', 1)[0], ([], []))[1].append(fingerprint)
+
+        inserted = []
+        for tenant_id, (tenant_raised, tenant_resolved) in transitions_by_tenant.items():
+            with tenant_scope(tenant_id):
+                inserted.extend(self.persist_transitions(tenant_raised, tenant_resolved, trace_id))
+        self._push_transitions(inserted, resolved, trace_id)
+        return inserted
+
+    def _push_transitions(self, inserted: list[AlertsModel], resolved: list[str], trace_id: str = None):
+        """
+        Pushes the persisted alert transitions to the live dashboards of their tenants.
+        """
+        if self.live_updates_repository is None:
+            return
+        for alert in inserted:
+            self.live_updates_repository.push(alert.tenant_id, LIVE_EVENT_ALERT_RAISED,
+                                              alert.model_dump(mode='json'), trace_id)
+        for fingerprint in resolved:
+            tenant_id = fingerprint.split(':', 1)[0]
+            self.live_updates_repository.push(tenant_id, LIVE_EVENT_ALERT_RESOLVED,
+                                              {"fingerprint": fingerprint}, trace_id)
+
+    @with_scoped_session
+    def persist_transitions(self, session, raised: list[InsertAlertsModel], resolved: list[str],
+                            trace_id: str = None) -> list[AlertsModel]:
+        """
+        Persists the raised alerts and resolves the active alerts in one transaction.
+
+        Args:
+            session: Database session provided by the decorator.
+            raised (list[InsertAlertsModel]): The alerts to insert.
+            resolved (list[str]): The fingerprints of the alerts to resolve.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            list[AlertsModel]: The inserted alerts.
+
+        Raises:
+            AlertsServiceException: If an error occurs while persisting the alerts.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            self.db_repository.resolve_by_fingerprints(session, resolved, datetime.now(UTC), trace_id)
+            inserted = self.db_repository.insert_many(session, raised, trace_id) if raised else []
+            session.commit()
+            return inserted
+        except InfrastructureException as e:
+            raise AlertsServiceException(e)
+        except Exception as e:
+            error_message = "Unexpected error persisting alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsServiceException(error_message) from e
+
+    @with_scoped_session
+    def fetch_alerts_by_filter(self, session, filters: dict, limit: Optional[int] = None,
+                               trace_id: str = None) -> list[AlertsModel]:
+        """
+        Fetches the alerts matching the filters, newest first.
+
+        Args:
+            session: Database session provided by the decorator.
+            filters (dict): The filters to apply.
+            limit (Optional[int]): The maximum number of alerts to fetch, all of them if None.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            list[AlertsModel]: The alerts found.
+
+        Raises:
+            AlertsServiceException: If an error occurs while fetching the alerts.
+            AlertsServiceValidationException: If the provided filters are invalid.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.db_repository.get_by_filter(session, GetAlertsByFilterModel(**filters), trace_id, limit)
+        except ValidationError as e:
+            LoggerService.insert_error(self.origin, f"Error validating alert filters: {str(e)}", self.user, trace_id)
+            raise AlertsServiceValidationException(e)
+        except InfrastructureException as e:
+            raise AlertsServiceException(e)
+        except Exception as e:
+            error_message = "Unexpected error fetching alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsServiceException(error_message) from e
+
+    @with_scoped_session
+    def restore_active_alerts(self, session, trace_id: str = None):
+        """
+        Loads the fingerprints of the active alerts into the rules engine so they are not raised twice.
+
+        Args:
+            session: Database session provided by the decorator.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Raises:
+            AlertsServiceException: If an error occurs while fetching the active alerts.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            with all_tenants_scope():
+                active_alerts = self.db_repository.get_by_filter(
+                    session, GetAlertsByFilterModel(status='active'), trace_id)
+            self.rules_engine.restore_active(alert.fingerprint for alert in active_alerts)
+        except InfrastructureException as e:
+            raise AlertsServiceException(e)
+        except Exception as e:
+            error_message = "Unexpected error restoring the active alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsServiceException(error_message) from e
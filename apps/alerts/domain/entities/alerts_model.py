@@ -0,0 +1,141 @@
+import enum
+import uuid
+from datetime import datetime, UTC
+from pydantic import Field
+from typing import Optional
+
+from shared.models import TPBaseModel, TPGetBaseModel, TPInsertBaseModel, TPUpdateBaseModel
+from shared import constants
+
+
+class AlertSeverity(enum.Enum):
+    CRITICAL = constants.ALERT_SEVERITY_CRITICAL
+    WARNING = constants.ALERT_SEVERITY_WARNING
+    INFO = constants.ALERT_SEVERITY_INFO
+
+
+class AlertStatus(enum.Enum):
+    ACTIVE = constants.ALERT_STATUS_ACTIVE
+    RESOLVED = constants.ALERT_STATUS_RESOLVED
+
+
+class AlertScope(enum.Enum):
+    MODULE = constants.ALERT_SCOPE_MODULE
+    PERSON = constants.ALERT_SCOPE_PERSON
+    REFERENCE = constants.ALERT_SCOPE_REFERENCE
+
+
+class AlertsModel(TPBaseModel):
+    """
+    AlertsModel: Entity to represent an alert raised by the rules engine.
+
+    Class Attributes:
+        id (int): The ID of the alert.
+        uuid (str): The UUID of the alert.
+        tenant_id (str): The ID of the tenant the alert belongs to.
+        fingerprint (str): Key that identifies the rule and the scope that raised the alert.
+        rule_code (str): The code of the rule that raised the alert.
+        severity (AlertSeverity): The severity of the alert.
+        scope (AlertScope): The kind of entity the alert refers to.
+        scope_id (str): The ID of the module, person or reference the alert refers to.
+        title (str): The title of the alert.
+        message (str): The message of the alert.
+        value (Optional[float]): The observed value that breached the threshold.
+        threshold (Optional[float]): The threshold of the rule.
+        status (AlertStatus): The status of the alert.
+        raised_at (datetime): The date the alert was raised.
+        resolved_at (Optional[datetime]): The date the alert was resolved.
+        created_at (datetime): The creation date of the record.
+        updated_at (datetime): The update date of the record.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    fingerprint: str
+    rule_code: str
+    severity: AlertSeverity
+    scope: AlertScope
+    scope_id: str
+    title: str
+    message: str
+    value: Optional[float] = None
+    threshold: Optional[float] = None
+    status: AlertStatus
+    raised_at: datetime
+    resolved_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class GetAlertsByFilterModel(TPGetBaseModel):
+    """
+    GetAlertsByFilterModel: Entity to represent the filter for getting alerts.
+    """
+    tenant_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    scope: Optional[AlertScope] = None
+    scope_id: Optional[str] = None
+    severity: Optional[AlertSeverity] = None
+    status: Optional[AlertStatus] = None
+
+
+class InsertAlertsModel(TPInsertBaseModel):
+    """
+    InsertAlertsModel: Entity to represent the insertion of an alert.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str
+    fingerprint: str
+    rule_code: str
+    severity: AlertSeverity
+    scope: AlertScope
+    scope_id: str
+    title: str
+    message: str
+    value: Optional[float] = None
+    threshold: Optional[float] = None
+    status: AlertStatus = AlertStatus.ACTIVE
+    raised_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC), alias='raisedAt')
+    created_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC), alias='createdAt')
+    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC), alias="updatedAt")
+
+
+class UpdateAlertsModel(TPUpdateBaseModel):
+    """
+    UpdateAlertsModel: Entity to represent the update of an alert.
+    """
+    id: int
+    status: Optional[AlertStatus] = None
+    resolved_at: Optional[datetime] = Field(None, alias='resolvedAt')
+    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC), alias="updatedAt")
+
+
+class AlertRuleModel(TPBaseModel):
+    """
+    AlertRuleModel: Entity to represent a rule evaluated by the alert rules engine.
+
+    A rule with `window_seconds` equal to zero is a threshold rule evaluated on every single event. Any
+    other value makes it a windowed rule evaluated over the sliding window aggregate of its scope.
+
+    Class Attributes:
+        code (str): The unique code of the rule.
+        severity (AlertSeverity): The severity of the alerts raised by the rule.
+        scope (AlertScope): The kind of entity the rule is evaluated for.
+        metric (str): The metric evaluated, 'efficiency' or 'worked_minutes'.
+        operator (str): The comparison that breaches the rule, 'lt' or 'gt'.
+        threshold (float): The threshold of the rule.
+        window_seconds (int): The length of the sliding window, zero for threshold rules.
+        min_samples (int): The minimum samples in the window before the rule is evaluated.
+        cooldown_seconds (int): The minimum time between two alerts with the same fingerprint.
+        title (str): The title of the alerts raised by the rule.
+    """
+    code: str
+    severity: AlertSeverity
+    scope: AlertScope
+    metric: str
+    operator: str = 'lt'
+    threshold: float
+    window_seconds: int = 0
+    min_samples: int = 1
+    cooldown_seconds: int = 15 * 60
+    title: str
@@ -0,0 +1,80 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, TypeVar
+from sqlalchemy.orm import Session
+
+from shared.models import TPBaseModel, TPGetBaseModel, TPInsertBaseModel, TPUpdateBaseModel
+
+TPBaseModelType = TypeVar("TPBaseModelType", bound=TPBaseModel)
+
+
+class AlertsDBInterface(ABC):
+    """
+    AlertsDBInterface is an interface that defines the methods to persist the alerts
+    """
+
+    @abstractmethod
+    def get_by_filter(self, session: Session, filters: TPGetBaseModel, trace_id: str = None,
+                      limit: Optional[int] = None) -> Optional[list[TPBaseModelType]]:
+        """
+        get_by_filter is a method that gets data by filter
+
+        Args:
+            session (Session): SQLAlchemy session
+            filters (TPGetBaseModel): Filters to get data
+            trace_id (Optional[str]): The id of the trace
+            limit (Optional[int]): Maximum number of rows to get, all of them if None
+
+        Returns:
+            Optional[list[TPBaseModelType]]: List of TPBaseModelType
+        """
+        pass
+
+    @abstractmethod
+    def insert_many(self, session: Session, params: list[TPInsertBaseModel], trace_id: str = None
+                    ) -> list[TPBaseModelType]:
+        """
+        insert_many is a method that inserts several rows in the database, skipping the alerts that are
+        already active
+
+        Args:
+            session (Session): SQLAlchemy session
+            params (list[TPInsertBaseModel]): Data to insert in the database
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: Data inserted in the database
+        """
+        pass
+
+    @abstractmethod
+    def update(self, session: Session, params: TPUpdateBaseModel, trace_id: str = None) -> TPBaseModelType:
+        """
+        update is a method that updates an alert in the database
+
+        Args:
+            session (Session): SQLAlchemy session
+            params (TPUpdateBaseModel): Data to update in the database
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            TPBaseModelType: Data updated in the database
+        """
+        pass
+
+    @abstractmethod
+    def resolve_by_fingerprints(self, session: Session, fingerprints: list[str], resolved_at: datetime,
+                                trace_id: str = None) -> int:
+        """
+        resolve_by_fingerprints is a method that resolves the active alerts with the given fingerprints
+
+        Args:
+            session (Session): SQLAlchemy session
+            fingerprints (list[str]): Fingerprints of the alerts to resolve
+            resolved_at (datetime): Date the alerts were resolved
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            int: Number of alerts resolved
+        """
+        pass
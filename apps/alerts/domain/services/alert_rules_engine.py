@@ -0,0 +1,265 @@
+import threading
+import time
+from typing import Iterable, Optional
+
+from apps.alerts.domain.entities.alerts_model import AlertRuleModel, AlertScope, AlertSeverity, InsertAlertsModel
+from apps.production.application.events.production_recorded_event import ProductionRecordedEvent
+from shared.metrics import SlidingWindowAggregate
+
+METRIC_EFFICIENCY = 'efficiency'
+METRIC_WORKED_MINUTES = 'worked_minutes'
+METRIC_IDLE_SECONDS = 'idle_seconds'
+
+_NOT_EVALUATED = object()
+
+DEFAULT_ALERT_RULES = [
+    AlertRuleModel(code='module_low_efficiency', severity=AlertSeverity.WARNING, scope=AlertScope.MODULE,
+                   metric=METRIC_EFFICIENCY, operator='lt', threshold=85, window_seconds=60 * 60, min_samples=2,
+                   title='Low module efficiency'),
+    AlertRuleModel(code='module_critical_efficiency', severity=AlertSeverity.CRITICAL, scope=AlertScope.MODULE,
+                   metric=METRIC_EFFICIENCY, operator='lt', threshold=60, window_seconds=60 * 60, min_samples=2,
+                   title='Critical module efficiency'),
+    AlertRuleModel(code='module_idle_in_slot', severity=AlertSeverity.CRITICAL, scope=AlertScope.MODULE,
+                   metric=METRIC_WORKED_MINUTES, operator='lt', threshold=1, title='Module idle in slot'),
+    AlertRuleModel(code='person_low_efficiency', severity=AlertSeverity.WARNING, scope=AlertScope.PERSON,
+                   metric=METRIC_EFFICIENCY, operator='lt', threshold=70, window_seconds=4 * 60 * 60,
+                   min_samples=3, title='Low person efficiency'),
+    AlertRuleModel(code='reference_stalled', severity=AlertSeverity.WARNING, scope=AlertScope.REFERENCE,
+                   metric=METRIC_IDLE_SECONDS, operator='gt', threshold=2 * 60 * 60, title='Reference stalled'),
+]
+
+
+class _AlertState:
+    """
+    Deduplication state of a fingerprint.
+    """
+    __slots__ = ("active", "last_raised_at")
+
+    def __init__(self):
+        self.active = False
+        self.last_raised_at = float("-inf")
+
+
+class AlertRulesEngine:
+    """
+    Streaming rules engine that evaluates threshold and windowed alert rules on production events.
+
+    Windowed rules are evaluated on in-memory sliding window aggregates kept per tenant, rule and scope, so
+    the evaluation cost of an event only depends on the number of rules and people in the event, never on
+    the history seen. Alerts are deduplicated by fingerprint while active and debounced with the cooldown
+    of the rule once they are resolved.
+
+    The scopes not seen for `idle_seconds` are evicted with their windows, together with the resolved
+    states past their cooldown, so the memory follows the active modules, people and references instead of
+    every one seen since the start. Active states are kept until they are resolved.
+    """
+
+    def __init__(self, rules: Optional[Iterable[AlertRuleModel]] = None, window_buckets: int = 12,
+                 idle_seconds: float = 24 * 60 * 60):
+        """
+        Constructor for the AlertRulesEngine class.
+
+        Args:
+            rules (Optional[Iterable[AlertRuleModel]]): The rules to evaluate. Defaults to DEFAULT_ALERT_RULES.
+            window_buckets (int): The number of buckets of every sliding window. Defaults to 12.
+            idle_seconds (float): The seconds without events after which a scope is evicted. Defaults to a day.
+        """
+        self.rules = list(rules if rules is not None else DEFAULT_ALERT_RULES)
+        self.window_buckets = window_buckets
+        self.idle_seconds = idle_seconds
+        self._rules_by_scope: dict[AlertScope, list[AlertRuleModel]] = {scope: [] for scope in AlertScope}
+        self._rules_by_code: dict[str, AlertRuleModel] = {rule.code: rule for rule in self.rules}
+        for rule in self.rules:
+            self._rules_by_scope[rule.scope].append(rule)
+        self._windows: dict[tuple[str, str, str], SlidingWindowAggregate] = {}
+        self._states: dict[str, _AlertState] = {}
+        self._last_seen: dict[tuple[str, AlertScope, str], float] = {}
+        # Evictions are amortized: they run at most every tenth of the idle time
+        self._next_eviction_at = time.time() + idle_seconds / 10
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_fingerprint(tenant_id: str, rule_code: str, scope_id: str) -> str:
+        return f"{tenant_id}:{rule_code}:{scope_id}"
+
+    @staticmethod
+    def _samples(event: ProductionRecordedEvent, scope: AlertScope) -> list[tuple[str, float, float]]:
+        """
+        Returns the (scope_id, produced_minutes, worked_minutes) samples of an event for a scope.
+        """
+        if scope == AlertScope.MODULE:
+            return [(event.module_id, event.produced_minutes, event.worked_minutes)]
+        if scope == AlertScope.REFERENCE:
+            return [(event.reference_id, event.produced_minutes, event.worked_minutes)]
+        return [(entry.person_id, entry.produced_minutes, entry.minutes_worked) for entry in event.person_entries]
+
+    def evaluate(self, event: ProductionRecordedEvent) -> tuple[list[InsertAlertsModel], list[str]]:
+        """
+        Evaluates the rules for a production event.
+
+        Args:
+            event (ProductionRecordedEvent): The production event to evaluate.
+
+        Returns:
+            tuple[list[InsertAlertsModel], list[str]]: The alerts to raise and the fingerprints to resolve.
+        """
+        timestamp = event.logged_at.timestamp() if event.logged_at else time.time()
+        raised, resolved = [], []
+        with self._lock:
+            for scope, rules in self._rules_by_scope.items():
+                if not rules:
+                    continue
+                for scope_id, produced, worked in self._samples(event, scope):
+                    self._last_seen[(event.tenant_id, scope, scope_id)] = timestamp
+                    for rule in rules:
+                        value = self._observe(rule, event.tenant_id, scope_id, timestamp, produced, worked)
+                        if value is _NOT_EVALUATED:
+                            continue
+                        self._apply(rule, event.tenant_id, scope_id, value, timestamp, raised, resolved)
+            self._maybe_evict(time.time())
+        return raised, resolved
+
+    def sweep_inactivity(self, now: Optional[float] = None) -> tuple[list[InsertAlertsModel], list[str]]:
+        """
+        Evaluates the idle rules against the last time every scope was seen.
+
+        This is meant to be run periodically, it is not part of the per-event path.
+
+        Args:
+            now (Optional[float]): The current POSIX timestamp. Defaults to the current time.
+
+        Returns:
+            tuple[list[InsertAlertsModel], list[str]]: The alerts to raise and the fingerprints to resolve.
+        """
+        now = now if now is not None else time.time()
+        raised, resolved = [], []
+        with self._lock:
+            for (tenant_id, scope, scope_id), last_seen in self._last_seen.items():
+                for rule in self._rules_by_scope[scope]:
+                    if rule.metric == METRIC_IDLE_SECONDS:
+                        self._apply(rule, tenant_id, scope_id, now - last_seen, now, raised, resolved)
+            self._maybe_evict(now)
+        return raised, resolved
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Evicts the scopes not seen for `idle_seconds` and the resolved states past their cooldown.
+
+        Args:
+            now (Optional[float]): The current POSIX timestamp. Defaults to the current time.
+
+        Returns:
+            int: The number of scopes evicted.
+        """
+        with self._lock:
+            return self._evict_idle(now if now is not None else time.time())
+
+    def _maybe_evict(self, now: float):
+        """
+        Runs the eviction when it is due. The lock must be held.
+        """
+        if now >= self._next_eviction_at:
+            self._evict_idle(now)
+
+    def _evict_idle(self, now: float) -> int:
+        """
+        Evicts the idle scopes and states. The lock must be held.
+        """
+        self._next_eviction_at = now + self.idle_seconds / 10
+        idle_scopes = [key for key, last_seen in self._last_seen.items() if now - last_seen >= self.idle_seconds]
+        for tenant_id, scope, scope_id in idle_scopes:
+            del self._last_seen[(tenant_id, scope, scope_id)]
+            for rule in self._rules_by_scope[scope]:
+                self._windows.pop((tenant_id, rule.code, scope_id), None)
+
+        for fingerprint in [fingerprint for fingerprint, state in self._states.items()
+                            if not state.active and self._state_expired(fingerprint, state, now)]:
+            del self._states[fingerprint]
+        return len(idle_scopes)
+
+    def _state_expired(self, fingerprint: str, state: _AlertState, now: float) -> bool:
+        """
+        Whether a resolved state is past the idle time and the cooldown of its rule, so it debounces nothing.
+        """
+        rule = self._rules_by_code.get(fingerprint.split(':', 2)[1])
+        cooldown = rule.cooldown_seconds if rule is not None else 0
+        return now - state.last_raised_at >= max(self.idle_seconds, cooldown)
+
+    def _observe(self, rule: AlertRuleModel, tenant_id: str, scope_id: str, timestamp: float,
+                 produced: float, worked: float):
+        """
+        Feeds a sample into the rule and returns the value to compare against the threshold.
+        """
+        if rule.metric == METRIC_IDLE_SECONDS:
+            return 0.0
+        if rule.metric == METRIC_EFFICIENCY:
+            numerator, denominator = produced, worked
+        else:
+            numerator, denominator = worked, 1.0
+
+        if not rule.window_seconds:
+            if rule.metric == METRIC_EFFICIENCY:
+                return numerator / denominator * 100 if denominator > 0 else _NOT_EVALUATED
+            return numerator
+
+        key = (tenant_id, rule.code, scope_id)
+        window = self._windows.get(key)
+        if window is None:
+            window = SlidingWindowAggregate(rule.window_seconds, self.window_buckets)
+            self._windows[key] = window
+        window.add(timestamp, numerator, denominator)
+        if window.count < rule.min_samples:
+            return _NOT_EVALUATED
+        if rule.metric == METRIC_EFFICIENCY:
+            ratio = window.ratio
+            return ratio * 100 if ratio is not None else _NOT_EVALUATED
+        return window.total
+
+    def _apply(self, rule: AlertRuleModel, tenant_id: str, scope_id: str, value: float, timestamp: float,
+               raised: list, resolved: list):
+        """
+        Applies the deduplication and debounce state machine of a fingerprint to an observed value.
+        """
+        breached = value < rule.threshold if rule.operator == 'lt' else value > rule.threshold
+        fingerprint = self.build_fingerprint(tenant_id, rule.code, scope_id)
+        state = self._states.get(fingerprint)
+
+        if not breached:
+            if state is not None and state.active:
+                state.active = False
+                resolved.append(fingerprint)
+            return
+
+        if state is None:
+            state = _AlertState()
+            self._states[fingerprint] = state
+        if state.active or timestamp - state.last_raised_at < rule.cooldown_seconds:
+            return
+        state.active = True
+        state.last_raised_at = timestamp
+        raised.append(InsertAlertsModel(
+            tenant_id=tenant_id,
+            fingerprint=fingerprint,
+            rule_code=rule.code,
+            severity=rule.severity,
+            scope=rule.scope,
+            scope_id=scope_id,
+            title=rule.title,
+            message=f"{rule.scope.value.capitalize()} {scope_id} {rule.metric.replace('_', ' ')} at {value:.1f} "
+                    f"(threshold {rule.threshold:g})",
+            value=round(value, 2),
+            threshold=rule.threshold,
+        ))
+
+    def restore_active(self, fingerprints: Iterable[str]):
+        """
+        Marks persisted active alerts as active so they are not raised again after a restart.
+
+        Args:
+            fingerprints (Iterable[str]): The fingerprints of the active alerts.
+        """
+        with self._lock:
+            for fingerprint in fingerprints:
+                state = self._states.setdefault(fingerprint, _AlertState())
+                state.active = True
+
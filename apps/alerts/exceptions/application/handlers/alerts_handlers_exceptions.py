@@ -0,0 +1,11 @@
+from shared.exceptions import HandlerException
+
+
+class EvaluateProductionAlertsHandlerException(HandlerException):
+    """ Base exception for EvaluateProductionAlertsHandler """
+    pass
+
+
+class FetchAlertsByFilterHandlerException(HandlerException):
+    """ Base exception for FetchAlertsByFilterHandler """
+    pass
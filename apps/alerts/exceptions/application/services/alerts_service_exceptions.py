@@ -0,0 +1,13 @@
+from pydantic import ValidationError
+
+from shared.exceptions import ServiceException
+
+
+class AlertsServiceException(ServiceException):
+    """ Base exception for the service layer."""
+    pass
+
+
+class AlertsServiceValidationException(AlertsServiceException, ValidationError):
+    """Raised when an alert validation error occurs."""
+    pass
@@ -0,0 +1,16 @@
+from shared.exceptions import InfrastructureException
+
+
+class AlertsOrmRepositoryException(InfrastructureException):
+    """Base exception for Alerts ORM Repository errors."""
+    pass
+
+
+class AlertsOrmRepositoryNotFoundException(AlertsOrmRepositoryException):
+    """Raised when an alert is not found in the database."""
+    pass
+
+
+class AlertsOrmRepositoryDBException(AlertsOrmRepositoryException):
+    """Raised when there is a database error in the Alerts ORM Repository."""
+    pass
@@ -0,0 +1,30 @@
+# Standard library imports
+from flask import Blueprint, jsonify, request, current_app, make_response
+
+# Local application/library specific imports
+from apps.alerts.application.queries.fetch_alerts_by_filter_query import FetchAlertsByFilterQuery
+from apps.alerts.infrastructure.adapters.primary.framework.validator.alerts_validator import GetAlertsValidator
+from shared.decorators import cache_response, handle_exceptions, token_required
+from shared.tenancy import get_current_tenant_id
+
+
+# Create a new Blueprint for the alerts service
+alerts_blueprint = Blueprint('alerts', __name__)
+ORIGIN = 'alerts_urls'
+
+
+@alerts_blueprint.route('/alerts', methods=['GET'])
+@handle_exceptions
+@token_required
+@cache_response(namespaces=('alerts',))
+def get_alerts(payload):
+    """
+    Get the alerts of the tenant.
+
+    The dashboards poll this route, unchanged alerts are answered with a 304 or the cached body.
+    """
+    validated_model = GetAlertsValidator(tenantId=get_current_tenant_id(), **request.args.to_dict())
+    alerts = current_app.config['query_bus'].ask(
+        FetchAlertsByFilterQuery(**validated_model.model_dump())
+    )
+    return make_response(jsonify({"Alerts": alerts}), 200)
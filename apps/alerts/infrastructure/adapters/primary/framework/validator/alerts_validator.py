@@ -0,0 +1,29 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+# Alerts returned when the request does not ask for a number, and the most it can ask for
+DEFAULT_ALERTS_LIMIT = 100
+MAX_ALERTS_LIMIT = 500
+
+
+class GetAlertsValidator(BaseModel):
+    """
+    GetAlertsValidator: Entity to represent the filters for getting alerts.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        status (Optional[str]): The status of the alerts to get.
+        severity (Optional[str]): The severity of the alerts to get.
+        limit (int): The maximum number of alerts to get, newest first.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    status: Optional[str] = Field(None, alias='status')
+    severity: Optional[str] = Field(None, alias='severity')
+    limit: int = Field(DEFAULT_ALERTS_LIMIT, alias='limit', ge=1, le=MAX_ALERTS_LIMIT)
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        if not value or not value.strip():
+            raise ValueError("El token no pertenece a ningún tenant")
+        return value
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, String, DateTime, Float, func
+from shared.constants import ALERT_STATUS_ACTIVE
+from shared.models import TextileProBaseOrmModel
+
+
+class AlertsOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the alerts table.
+
+    A fingerprint has at most one active alert per tenant, so the workers that raise the same alert at once
+    insert it only once. The resolved alerts are kept as history.
+
+    Class Attributes:
+        fingerprint (Column): Key of the rule and scope that raised the alert.
+        rule_code (Column): Code of the rule that raised the alert.
+        severity (Column): Severity of the alert, using AlertSeverity enum.
+        scope (Column): Kind of entity the alert refers to, using AlertScope enum.
+        scope_id (Column): ID of the module, person or reference the alert refers to.
+        title (Column): Title of the alert.
+        message (Column): Message of the alert.
+        value (Column): Observed value that breached the threshold.
+        threshold (Column): Threshold of the rule.
+        status (Column): Status of the alert, using AlertStatus enum.
+        raised_at (Column): Date the alert was raised.
+        resolved_at (Column): Date the alert was resolved.
+        created_at (Column): Created at column for the alert, using DateTime.
+        updated_at (Column): Updated at column for the alert, using DateTime.
+    """
+
+    __tablename__ = "alerts"
+    __tenant_indexes__ = (("status", "raised_at"), ("fingerprint", "status"))
+    __tenant_partial_unique__ = ((("fingerprint",), f"status = '{ALERT_STATUS_ACTIVE}'"),)
+    fingerprint = Column(String(255), nullable=False)
+    rule_code = Column(String(100), nullable=False)
+    severity = Column(String(20), nullable=False)
+    scope = Column(String(20), nullable=False)
+    scope_id = Column(String(100), nullable=False)
+    title = Column(String(150), nullable=False)
+    message = Column(String(500), nullable=False)
+    value = Column(Float, nullable=True)
+    threshold = Column(Float, nullable=True)
+    status = Column(String(20), nullable=False)
+    raised_at = Column(DateTime(timezone=True), nullable=False)
+    resolved_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,182 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from apps.alerts.domain.entities.alerts_model import AlertsModel, AlertStatus, GetAlertsByFilterModel, \
+    InsertAlertsModel, UpdateAlertsModel
+from apps.alerts.domain.repositories.alerts_db_interface import AlertsDBInterface
+from apps.alerts.exceptions.infrastructure.orm.alerts_orm_repository_exceptions import AlertsOrmRepositoryException, \
+    AlertsOrmRepositoryDBException, AlertsOrmRepositoryNotFoundException
+from apps.alerts.infrastructure.adapters.secondary.orm.models.alerts_orm_model import AlertsOrmModel
+from shared.constants import ALERTS_SERVICE
+from shared.logger import LoggerService
+
+
+class AlertsOrmRepository(AlertsDBInterface):
+
+    def __init__(self):
+        """
+        Constructor for the AlertsOrmRepository class.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = ALERTS_SERVICE
+
+    @staticmethod
+    def _to_db_values(model) -> dict:
+        return {k: (v.value if hasattr(v, 'value') else v) for k, v in model.to_db_dict().items()}
+
+    def get_by_filter(self, session: Session, filters: GetAlertsByFilterModel, trace_id: str = None,
+                      limit: Optional[int] = None) -> list[Optional[AlertsModel]]:
+        """
+        Retrieves alerts based on the provided filters, newest first.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            filters (GetAlertsByFilterModel): Filters to retrieve alerts.
+            trace_id (Optional[str]): The id of the trace.
+            limit (Optional[int]): The maximum number of alerts to return, all of them if None.
+
+        Returns:
+            Optional[list[AlertsModel]]: List of alerts.
+
+        Raises:
+            AlertsOrmRepositoryDBException: If there is a database error.
+            AlertsOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            alerts_query = (
+                session.query(AlertsOrmModel)
+                .filter_by(**self._to_db_values(filters))
+                .order_by(AlertsOrmModel.raised_at.desc())
+                .limit(limit)
+                .all()
+            )
+            return [AlertsModel(**alert.__dict__) for alert in alerts_query]
+
+        except SQLAlchemyError as e:
+            error_message = "Database error getting alerts by filters"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting alerts by filters"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryException(error_message) from e
+
+    def insert_many(self, session: Session, params: list[InsertAlertsModel], trace_id: str = None
+                    ) -> list[AlertsModel]:
+        """
+        Insert the alerts in the database.
+
+        Every alert is inserted in its own savepoint: the ones whose fingerprint already has an active alert,
+        raised at the same time by another worker, are skipped.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            params (list[InsertAlertsModel]): The alerts to insert in the database.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[AlertsModel]: The inserted alerts, without the skipped ones.
+
+        Raises:
+            AlertsOrmRepositoryDBException: If there is a database error, insert the alerts.
+            AlertsOrmRepositoryException: If there is an unexpected error, insert the alerts.
+        """
+        try:
+            inserted = []
+            for alert in params:
+                alert_to_insert = AlertsOrmModel(**self._to_db_values(alert))
+                try:
+                    with session.begin_nested():
+                        session.add(alert_to_insert)
+                except IntegrityError:
+                    LoggerService.insert_log(self.origin, f"Alert {alert.fingerprint} is already active",
+                                             self.user, trace_id)
+                    continue
+                inserted.append(AlertsModel(**alert_to_insert.__dict__))
+            return inserted
+        except SQLAlchemyError as e:
+            error_message = "Database error inserting alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error inserting alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryException(error_message) from e
+
+    def update(self, session: Session, params: UpdateAlertsModel, trace_id: str = None) -> AlertsModel:
+        """
+        Update the alert in the database.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            params (UpdateAlertsModel): The alert to update in the database.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            AlertsModel: The updated alert.
+
+        Raises:
+            AlertsOrmRepositoryDBException: If there is a database error, update the alert.
+            AlertsOrmRepositoryException: If there is an unexpected error, update the alert.
+        """
+        try:
+            alert_to_update = session.query(AlertsOrmModel).filter_by(id=params.id).first()
+            if not alert_to_update:
+                error_message = f"Alert with ID {params.id} not found"
+                LoggerService.insert_error(self.origin, error_message, self.user, trace_id)
+                raise AlertsOrmRepositoryNotFoundException(error_message)
+
+            for key, value in self._to_db_values(params).items():
+                setattr(alert_to_update, key, value)
+
+            return AlertsModel(**alert_to_update.__dict__)
+        except SQLAlchemyError as e:
+            error_message = "Database error updating alert"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryDBException(error_message) from e
+        except AlertsOrmRepositoryException:
+            raise
+        except Exception as e:
+            error_message = "Unexpected error updating alert"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryException(error_message) from e
+
+    def resolve_by_fingerprints(self, session: Session, fingerprints: list[str], resolved_at: datetime,
+                                trace_id: str = None) -> int:
+        """
+        Resolve the active alerts with the given fingerprints in a single statement.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            fingerprints (list[str]): Fingerprints of the alerts to resolve.
+            resolved_at (datetime): Date the alerts were resolved.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            int: Number of alerts resolved.
+
+        Raises:
+            AlertsOrmRepositoryDBException: If there is a database error, resolve the alerts.
+            AlertsOrmRepositoryException: If there is an unexpected error, resolve the alerts.
+        """
+        if not fingerprints:
+            return 0
+        try:
+            result = session.execute(
+                update(AlertsOrmModel)
+                .where(AlertsOrmModel.fingerprint.in_(fingerprints),
+                       AlertsOrmModel.status == AlertStatus.ACTIVE.value)
+                .values(status=AlertStatus.RESOLVED.value, resolved_at=resolved_at, updated_at=resolved_at)
+            )
+            return result.rowcount
+        except SQLAlchemyError as e:
+            error_message = "Database error resolving alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error resolving alerts"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise AlertsOrmRepositoryException(error_message) from e
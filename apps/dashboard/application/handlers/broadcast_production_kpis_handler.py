@@ -0,0 +1,53 @@
+from apps.dashboard.domain.repositories.live_updates_interface import LiveUpdatesInterface
+from apps.dashboard.exceptions.application.handlers.dashboard_handlers_exceptions import \
+    BroadcastProductionKpisHandlerException
+from apps.production.application.events.production_recorded_event import ProductionRecordedEvent
+from shared.communication_bus.event_bus.event_handler_interface import EventHandlerInterface
+from shared.constants import DASHBOARD_SERVICE, LIVE_EVENT_KPI_DELTA
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class BroadcastProductionKpisHandler(EventHandlerInterface):
+    """Handler that pushes the KPI delta of every production record to the live dashboards."""
+
+    def __init__(self, live_updates_repository: LiveUpdatesInterface):
+        """
+        Constructor for the BroadcastProductionKpisHandler class.
+
+        Args:
+            live_updates_repository (LiveUpdatesInterface): The repository to push the live updates.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = DASHBOARD_SERVICE
+        self.live_updates_repository = live_updates_repository
+
+    def publish(self, event: ProductionRecordedEvent, trace_id: str = None):
+        """
+        Handles the ProductionRecordedEvent.
+
+        Args:
+            event (ProductionRecordedEvent): The production event to broadcast.
+            trace_id (str, optional): The trace ID for the request.
+
+        Raises:
+            BroadcastProductionKpisHandlerException: If an error occurs while building the KPI delta.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            efficiency = (event.produced_minutes / event.worked_minutes * 100) if event.worked_minutes else None
+            self.live_updates_repository.push(event.tenant_id, LIVE_EVENT_KPI_DELTA, {
+                "recordId": event.record_id,
+                "moduleId": event.module_id,
+                "referenceId": event.reference_id,
+                "timeSlotId": event.time_slot_id,
+                "workedMinutes": event.worked_minutes,
+                "producedMinutes": event.produced_minutes,
+                "efficiency": round(efficiency, 2) if efficiency is not None else None,
+                "loggedAt": event.logged_at,
+            }, trace_id)
+        except Exception as e:
+            error_message = f"Unexpected error broadcasting KPIs for record {event.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise BroadcastProductionKpisHandlerException(error_message) from e
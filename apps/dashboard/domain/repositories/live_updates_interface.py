@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class LiveUpdatesInterface(ABC):
+    """
+    LiveUpdatesInterface is an interface that defines the method to push live updates to the dashboards
+    """
+
+    @abstractmethod
+    def push(self, tenant_id: str, event: str, payload: dict, trace_id: str = None):
+        """
+        push is a method that sends an update to the dashboards connected for a tenant
+
+        Args:
+            tenant_id (str): ID of the tenant whose dashboards receive the update
+            event (str): Name of the update
+            payload (dict): JSON serializable content of the update
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
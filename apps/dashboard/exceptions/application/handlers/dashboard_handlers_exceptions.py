@@ -0,0 +1,6 @@
+from shared.exceptions import HandlerException
+
+
+class BroadcastProductionKpisHandlerException(HandlerException):
+    """ Base exception for BroadcastProductionKpisHandler """
+    pass
@@ -0,0 +1,91 @@
+# Standard library imports
+from flask import Blueprint, Response, jsonify, request, current_app, make_response
+
+# Local application/library specific imports
+from apps.dashboard.infrastructure.adapters.primary.framework.validator.live_updates_validator import \
+    LiveUpdatesValidator
+from shared.decorators import handle_exceptions, token_required
+from shared.tenancy import get_current_tenant_id
+
+
+# Create a new Blueprint for the live dashboard updates
+live_updates_blueprint = Blueprint('live_updates', __name__)
+ORIGIN = 'live_updates_urls'
+
+
+def _validate_live_updates_request() -> LiveUpdatesValidator:
+    """
+    Builds the validated subscription parameters from the headers and the query string, the tenant always being
+    the one of the verified token.
+    """
+    return LiveUpdatesValidator(
+        tenantId=get_current_tenant_id(),
+        lastEventId=request.headers.get('Last-Event-ID') or request.args.get('lastEventId'),
+        timeout=request.args.get('timeout'),
+    )
+
+
+def _too_many_connections():
+    response = make_response(jsonify({"error": "Too many live connections"}), 503)
+    response.headers['Retry-After'] = '5'
+    return response
+
+
+@live_updates_blueprint.route('/live/stream', methods=['GET'])
+@handle_exceptions
+@token_required
+def stream_live_updates(payload):
+    """
+    Stream the KPI deltas and alerts of the tenant as Server-Sent Events.
+
+    The token is checked once when the stream is opened, afterwards the connection only costs a blocked
+    wait until the hub has messages for it or a heartbeat is due.
+    """
+    validated_model = _validate_live_updates_request()
+    broadcast_hub = current_app.config['broadcast_hub']
+    heartbeat_seconds = current_app.config['LIVE_UPDATES_HEARTBEAT_SECONDS']
+
+    subscription = broadcast_hub.subscribe(validated_model.tenant_id, validated_model.last_event_id)
+    if subscription is None:
+        return _too_many_connections()
+
+    def generate():
+        try:
+            yield b"retry: 5000\n\n"
+            while not subscription.closed:
+                messages = subscription.drain(heartbeat_seconds)
+                if messages:
+                    yield b"".join(message.frame for message in messages)
+                else:
+                    yield b": keepalive\n\n"
+        finally:
+            broadcast_hub.unsubscribe(subscription)
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@live_updates_blueprint.route('/live/poll', methods=['GET'])
+@handle_exceptions
+@token_required
+def poll_live_updates(payload):
+    """
+    Long-poll the KPI deltas and alerts of the tenant newer than the given last event id.
+    """
+    validated_model = _validate_live_updates_request()
+    broadcast_hub = current_app.config['broadcast_hub']
+    timeout = validated_model.timeout
+    if timeout is None:
+        timeout = current_app.config['LIVE_UPDATES_POLL_TIMEOUT_SECONDS']
+
+    subscription = broadcast_hub.subscribe(validated_model.tenant_id, validated_model.last_event_id)
+    if subscription is None:
+        return _too_many_connections()
+    try:
+        messages = subscription.drain(timeout)
+    finally:
+        broadcast_hub.unsubscribe(subscription)
+
+    last_event_id = messages[-1].id if messages else validated_model.last_event_id
+    return make_response(jsonify({"Events": [message.to_dict() for message in messages],
+                                  "lastEventId": last_event_id}), 200)
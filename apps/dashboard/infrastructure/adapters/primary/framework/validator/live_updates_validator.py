@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class LiveUpdatesValidator(BaseModel):
+    """
+    LiveUpdatesValidator: Entity to represent the parameters to subscribe to the live updates.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        lastEventId (Optional[int]): The last event received, taken from the Last-Event-ID header or the query string.
+        timeout (Optional[int]): The maximum seconds a long-poll request waits for events.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    last_event_id: Optional[int] = Field(None, alias='lastEventId')
+    timeout: Optional[int] = Field(None, alias='timeout', ge=0, le=60)
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        if not value or not value.strip():
+            raise ValueError("El token no pertenece a ningún tenant")
+        return value
@@ -0,0 +1,36 @@
+from apps.dashboard.domain.repositories.live_updates_interface import LiveUpdatesInterface
+from shared.constants import DASHBOARD_SERVICE
+from shared.logger import LoggerService
+from shared.realtime import BroadcastHub
+
+
+class BroadcastHubLiveUpdatesRepository(LiveUpdatesInterface):
+
+    def __init__(self, broadcast_hub: BroadcastHub):
+        """
+        Constructor for the BroadcastHubLiveUpdatesRepository class.
+
+        Args:
+            broadcast_hub (BroadcastHub): The hub the connected dashboards are subscribed to.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = DASHBOARD_SERVICE
+        self.broadcast_hub = broadcast_hub
+
+    def push(self, tenant_id: str, event: str, payload: dict, trace_id: str = None):
+        """
+        Publish the update in the channel of the tenant.
+
+        Live updates are best effort: a failure is logged and never breaks the caller.
+
+        Args:
+            tenant_id (str): ID of the tenant whose dashboards receive the update.
+            event (str): Name of the update.
+            payload (dict): JSON serializable content of the update.
+            trace_id (Optional[str]): The id of the trace.
+        """
+        try:
+            self.broadcast_hub.publish(tenant_id, event, payload)
+        except Exception as e:
+            LoggerService.insert_error(self.origin, f"Error pushing live update {event}: {str(e)}", self.user,
+                                       trace_id)
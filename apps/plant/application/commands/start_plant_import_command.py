@@ -0,0 +1,23 @@
+from typing import Optional
+
+from shared.communication_bus.command_bus.command_dto import CommandDTO
+
+
+class StartPlantImportCommand(CommandDTO):
+    """
+    StartPlantImportCommand: Command to import people, modules or references from an uploaded file.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        entity (str): 'people', 'modules' or 'references'.
+        file_format (str): 'csv' or 'xlsx'.
+        file_name (str): The name of the uploaded file.
+        file_path (str): The path where the upload was stored.
+        created_by (Optional[str]): The user that uploaded the file.
+    """
+    tenant_id: str
+    entity: str
+    file_format: str
+    file_name: str
+    file_path: str
+    created_by: Optional[str] = None
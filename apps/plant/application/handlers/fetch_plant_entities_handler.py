@@ -0,0 +1,50 @@
+from apps.plant.application.queries.fetch_plant_entities_query import FetchPlantEntitiesQuery
+from apps.plant.application.services.plant_service import PlantService
+from apps.plant.domain.repositories.plant_db_interface import TPBaseModelType
+from apps.plant.exceptions.application.handlers.plant_handlers_exceptions import FetchPlantEntitiesHandlerException
+from shared.communication_bus.query_bus.query_handler_interface import QueryHandlerInterface
+from shared.constants import PLANT_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class FetchPlantEntitiesHandler(QueryHandlerInterface):
+    """Handler to fetch the people, modules or references of a tenant."""
+
+    def __init__(self, plant_service: PlantService):
+        """
+        Constructor for the FetchPlantEntitiesHandler class.
+
+        Args:
+            plant_service (PlantService): The service to fetch the rows of the plant.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PLANT_SERVICE
+        self.fetch_service = plant_service
+
+    def ask(self, query: FetchPlantEntitiesQuery, trace_id: str = None) -> list[TPBaseModelType]:
+        """
+        Handles the query to fetch a page of the rows of the plant.
+
+        Args:
+            query (FetchPlantEntitiesQuery): The query with the tenant, the entity and the page.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            list[TPBaseModelType]: The rows of the page.
+
+        Raises:
+            FetchPlantEntitiesHandlerException: If an error occurs while fetching the rows.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.fetch_service.fetch_entities(query.tenant_id, query.entity, query.offset, query.limit,
+                                                     trace_id=trace_id)
+        except ServiceException as e:
+            raise FetchPlantEntitiesHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error fetching the {query.entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise FetchPlantEntitiesHandlerException(error_message) from e
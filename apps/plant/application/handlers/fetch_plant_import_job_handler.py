@@ -0,0 +1,56 @@
+from typing import Optional
+
+from apps.plant.application.queries.fetch_plant_import_job_query import FetchPlantImportJobQuery
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.plant.domain.entities.plant_import_model import ImportJobsModel
+from apps.plant.exceptions.application.handlers.plant_handlers_exceptions import \
+    FetchPlantImportJobHandlerException
+from apps.plant.exceptions.application.services.plant_import_service_exceptions import \
+    PlantImportServiceNotFoundException
+from shared.communication_bus.query_bus.query_handler_interface import QueryHandlerInterface
+from shared.constants import PLANT_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class FetchPlantImportJobHandler(QueryHandlerInterface):
+    """Handler to fetch the progress of an import job."""
+
+    def __init__(self, plant_import_service: PlantImportService):
+        """
+        Constructor for the FetchPlantImportJobHandler class.
+
+        Args:
+            plant_import_service (PlantImportService): The service to fetch the import jobs.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PLANT_SERVICE
+        self.fetch_service = plant_import_service
+
+    def ask(self, query: FetchPlantImportJobQuery, trace_id: str = None) -> Optional[ImportJobsModel]:
+        """
+        Handles the query to fetch an import job.
+
+        Args:
+            query (FetchPlantImportJobQuery): The query with the tenant and the job.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            Optional[ImportJobsModel]: The job, or None if not found.
+
+        Raises:
+            FetchPlantImportJobHandlerException: If an error occurs while fetching the job.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.fetch_service.fetch_import_job(query.tenant_id, query.job_id, trace_id=trace_id)
+        except PlantImportServiceNotFoundException:
+            return None
+        except ServiceException as e:
+            raise FetchPlantImportJobHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error fetching import job {query.job_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise FetchPlantImportJobHandlerException(error_message) from e
@@ -0,0 +1,51 @@
+from apps.plant.application.commands.start_plant_import_command import StartPlantImportCommand
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.plant.domain.entities.plant_import_model import ImportJobsModel
+from apps.plant.exceptions.application.handlers.plant_handlers_exceptions import StartPlantImportHandlerException
+from shared.communication_bus.command_bus.command_handler_interface import CommandHandlerInterface
+from shared.constants import PLANT_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class StartPlantImportHandler(CommandHandlerInterface):
+    """Handler for starting the bulk imports of the plant."""
+
+    def __init__(self, plant_import_service: PlantImportService):
+        """
+        Constructor for the StartPlantImportHandler class.
+
+        Args:
+            plant_import_service (PlantImportService): The service to run the imports.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PLANT_SERVICE
+        self.import_service = plant_import_service
+
+    def execute(self, command: StartPlantImportCommand, trace_id: str = None) -> ImportJobsModel:
+        """
+        Handles the StartPlantImportCommand.
+
+        Args:
+            command (StartPlantImportCommand): The command to start the import.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            ImportJobsModel: The pending job.
+
+        Raises:
+            StartPlantImportHandlerException: If an error occurs while starting the import.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.import_service.start_import(command.tenant_id, command.entity, command.file_format,
+                                                    command.file_name, command.file_path, command.created_by,
+                                                    trace_id=trace_id)
+        except ServiceException as e:
+            raise StartPlantImportHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error starting the import of {command.entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise StartPlantImportHandlerException(error_message) from e
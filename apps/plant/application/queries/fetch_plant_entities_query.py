@@ -0,0 +1,17 @@
+from shared.communication_bus.query_bus.query_dto import QueryDTO
+
+
+class FetchPlantEntitiesQuery(QueryDTO):
+    """
+    Query to fetch a page of the people, modules or references of a tenant.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        entity (str): 'people', 'modules' or 'references'.
+        offset (int): The rows to skip.
+        limit (int): The maximum rows to return.
+    """
+    tenant_id: str
+    entity: str
+    offset: int
+    limit: int
@@ -0,0 +1,13 @@
+from shared.communication_bus.query_bus.query_dto import QueryDTO
+
+
+class FetchPlantImportJobQuery(QueryDTO):
+    """
+    Query to fetch the progress of an import job.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        job_id (str): The UUID of the job.
+    """
+    tenant_id: str
+    job_id: str
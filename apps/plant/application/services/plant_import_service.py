@@ -0,0 +1,459 @@
+import enum
+import functools
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
+from apps.plant.domain.entities.plant_import_model import ImportEntity, ImportFormat, ImportJobStatus, \
+    ImportJobsModel, InsertImportJobsModel, ModuleImportRow, PersonImportRow, ReferenceImportRow
+from apps.plant.domain.repositories.plant_db_interface import PlantDBInterface
+from apps.plant.exceptions.application.services.plant_import_service_exceptions import \
+    PlantImportServiceException, PlantImportServiceNotFoundException
+from apps.plant.exceptions.infrastructure.orm.plant_orm_repository_exceptions import \
+    PlantOrmRepositoryDuplicatedException
+from apps.tenants.application.services.plan_limits_service import PlanLimitsService
+from shared.constants import PLAN_RESOURCE_MODULES, PLANT_SERVICE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException
+from shared.logger import LoggerService
+from shared.tabular import estimate_row_count, iter_row_chunks
+from shared.tenancy import all_tenants_scope, tenant_scope
+from shared.tracing import get_trace_id
+
+IMPORT_ROW_SCHEMAS = {
+    ImportEntity.PEOPLE: PersonImportRow,
+    ImportEntity.MODULES: ModuleImportRow,
+    ImportEntity.REFERENCES: ReferenceImportRow,
+}
+
+# Resource of the plan limits created by every import, if any
+IMPORT_PLAN_RESOURCES = {
+    ImportEntity.MODULES: PLAN_RESOURCE_MODULES,
+}
+
+_HEADER_SEPARATORS = str.maketrans('', '', ' _-')
+
+
+def _normalize_header(name: str) -> str:
+    return name.lower().translate(_HEADER_SEPARATORS)
+
+
+@functools.cache
+def _chunk_adapter(entity: ImportEntity) -> TypeAdapter:
+    """
+    Builds the validator of a whole chunk once per entity. Validating the chunk as one list runs a single
+    call into the pydantic core instead of one per row.
+    """
+    return TypeAdapter(list[IMPORT_ROW_SCHEMAS[entity]])
+
+
+@functools.cache
+def _header_aliases(entity: ImportEntity) -> dict[str, str]:
+    """
+    Maps the normalized names and aliases of the fields of an entity to the name pydantic expects, so the
+    headers 'Daily Minutes', 'daily_minutes' and 'dailyMinutes' all reach the same field.
+    """
+    aliases = {}
+    for name, field in IMPORT_ROW_SCHEMAS[entity].model_fields.items():
+        aliases[_normalize_header(name)] = name
+        if field.alias:
+            aliases[_normalize_header(field.alias)] = name
+    return aliases
+
+
+class PlantImportService:
+    """
+    Service to import people, modules and references in bulk from CSV or Excel files.
+
+    A file is read in chunks, so the memory does not grow with its size. Every chunk is validated with one
+    cached adapter, checked for duplicated codes with one indexed query and written with multi-row inserts in
+    its own transaction, together with the progress of the job.
+
+    The jobs run in an executor of the worker, which stores a heartbeat of its pending and running jobs. The
+    jobs of a worker that stopped lose their heartbeat and are failed by `recover_stale_jobs`, which deletes
+    their uploaded files.
+    """
+    def __init__(self, db_repository: PlantDBInterface, database_manager: DataBaseManager,
+                 plan_limits_service: Optional[PlanLimitsService] = None, chunk_size: int = 2000,
+                 max_errors: int = 500, max_workers: int = 2, stale_seconds: float = 300):
+        """
+        Constructor for the PlantImportService class.
+
+        Args:
+            db_repository (PlantDBInterface): The repository to handle the database operations.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            plan_limits_service (Optional[PlanLimitsService]): The service that bounds the imported modules.
+            chunk_size (int): The rows validated and inserted per transaction. Defaults to 2000.
+            max_errors (int): The rejected rows reported in the job. Defaults to 500.
+            max_workers (int): The imports run at the same time by the worker. Defaults to 2.
+            stale_seconds (float): The seconds without heartbeat after which a job is failed. Defaults to 300.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PLANT_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.plan_limits_service = plan_limits_service
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.stale_seconds = stale_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='plant-import')
+        self._active_jobs: set[str] = set()
+        self._active_jobs_lock = threading.Lock()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start_import(self, tenant_id: str, entity: str, file_format: str, file_name: str, file_path: str,
+                     created_by: Optional[str] = None, trace_id: str = None) -> ImportJobsModel:
+        """
+        Creates an import job and runs it in the background.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            entity (str): 'people', 'modules' or 'references'.
+            file_format (str): 'csv' or 'xlsx'.
+            file_name (str): The name of the uploaded file.
+            file_path (str): The path of the uploaded file, deleted when the job ends.
+            created_by (Optional[str]): The user that uploaded the file.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ImportJobsModel: The pending job, to poll its progress.
+
+        Raises:
+            PlantImportServiceException: If the job cannot be created.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            job = InsertImportJobsModel(tenant_id=tenant_id, entity=ImportEntity(entity),
+                                        file_format=ImportFormat(file_format), file_name=file_name,
+                                        created_by=created_by, file_path=file_path)
+        except ValueError as e:
+            self._remove_file(file_path)
+            LoggerService.insert_error(self.origin, f"Invalid import of {entity}: {str(e)}", self.user, trace_id)
+            raise PlantImportServiceException(f"Unsupported import of {entity} from a {file_format} file") from e
+
+        with tenant_scope(tenant_id):
+            created = self.insert_import_job(job, trace_id=trace_id)
+        self._track_job(created.uuid)
+        self._executor.submit(self.run_import, created.uuid, tenant_id, created.entity, created.file_format,
+                              file_path, trace_id)
+        return created
+
+    def run_import(self, job_uuid: str, tenant_id: str, entity: ImportEntity, file_format: ImportFormat,
+                   file_path: str, trace_id: str = None):
+        """
+        Runs an import job and records its outcome. Errors are stored in the job instead of raised, since the
+        job runs outside of any request.
+        """
+        try:
+            with tenant_scope(tenant_id):
+                self.import_file(job_uuid, tenant_id, entity, file_format, file_path, trace_id=trace_id)
+        except Exception as e:
+            LoggerService.insert_error(self.origin, f"Import job {job_uuid} failed: {str(e)}", self.user, trace_id)
+            with tenant_scope(tenant_id):
+                self._finish_job(job_uuid, {'status': ImportJobStatus.FAILED, 'message': str(e)[:500],
+                                            'finished_at': datetime.now(UTC)}, trace_id)
+        finally:
+            self._remove_file(file_path)
+            with self._active_jobs_lock:
+                self._active_jobs.discard(job_uuid)
+
+    def _track_job(self, job_uuid: str):
+        """
+        Adds a job to the ones the heartbeat reports alive, starting the heartbeat with the first job.
+        """
+        with self._active_jobs_lock:
+            self._active_jobs.add(job_uuid)
+            if self._heartbeat_thread is None:
+                self._heartbeat_thread = threading.Thread(target=self._heartbeat, name='plant-import-heartbeat',
+                                                          daemon=True)
+                self._heartbeat_thread.start()
+
+    def _heartbeat(self):
+        """
+        Stores the heartbeat of the pending and running jobs of the worker a few times per stale period.
+        """
+        while not self._stopped.wait(self.stale_seconds / 3):
+            with self._active_jobs_lock:
+                job_uuids = list(self._active_jobs)
+            if not job_uuids:
+                continue
+            trace_id = get_trace_id()
+            try:
+                with all_tenants_scope():
+                    self._touch_jobs(job_uuids, trace_id)
+            except Exception as e:
+                LoggerService.insert_error(self.origin, f"Error storing the heartbeat of the import jobs: {str(e)}",
+                                           self.user, trace_id)
+
+    @with_scoped_session
+    def _touch_jobs(self, session, job_uuids: list[str], trace_id: str = None):
+        self.db_repository.touch_import_jobs(session, job_uuids, datetime.now(UTC), trace_id)
+        session.commit()
+
+    @with_scoped_session
+    def recover_stale_jobs(self, session, trace_id: str = None) -> int:
+        """
+        Fails the pending and running jobs of every tenant whose worker stopped storing their heartbeat, e.g.
+        because it was restarted, and deletes their uploaded files.
+
+        Args:
+            session: Database session provided by the decorator.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            int: The number of jobs failed.
+
+        Raises:
+            PlantImportServiceException: If an error occurs while failing the jobs.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            now = datetime.now(UTC)
+            with all_tenants_scope():
+                stale_jobs = self.db_repository.get_stale_import_jobs(
+                    session, now - timedelta(seconds=self.stale_seconds), trace_id)
+                for job in stale_jobs:
+                    self.db_repository.update_import_job(
+                        session, job.uuid, {'status': ImportJobStatus.FAILED, 'finished_at': now,
+                                            'message': "The worker running the import stopped"}, trace_id)
+            session.commit()
+        except InfrastructureException as e:
+            raise PlantImportServiceException(e)
+        except Exception as e:
+            error_message = "Unexpected error failing the stale import jobs"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantImportServiceException(error_message) from e
+        for job in stale_jobs:
+            if job.file_path:
+                self._remove_file(job.file_path)
+        return len(stale_jobs)
+
+    def import_file(self, job_uuid: str, tenant_id: str, entity: ImportEntity, file_format: ImportFormat,
+                    file_path: str, trace_id: str = None) -> dict:
+        """
+        Imports a file chunk by chunk for the tenant in context, committing the rows and the progress of the
+        job after every chunk.
+
+        Args:
+            job_uuid (str): The UUID of the job.
+            tenant_id (str): The ID of the tenant.
+            entity (ImportEntity): What the file contains.
+            file_format (ImportFormat): The format of the file.
+            file_path (str): The path of the file.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            dict: The final progress of the job.
+
+        Raises:
+            PlantImportServiceException: If the file cannot be read or a chunk cannot be written.
+        """
+        try:
+            total_rows = estimate_row_count(file_path, file_format.value)
+        except OSError as e:
+            raise PlantImportServiceException(f"The file of import job {job_uuid} cannot be read") from e
+        progress = {'processed_rows': 0, 'inserted_rows': 0, 'duplicated_rows': 0, 'failed_rows': 0}
+        errors: list[dict] = []
+        seen_codes: set[str] = set()
+        self._finish_job(job_uuid, {'status': ImportJobStatus.RUNNING, 'total_rows': total_rows,
+                                    'started_at': datetime.now(UTC)}, trace_id)
+        try:
+            for rows in iter_row_chunks(file_path, file_format.value, self.chunk_size):
+                self.import_chunk(job_uuid, tenant_id, entity, rows, progress, errors, seen_codes,
+                                  trace_id=trace_id)
+        except InfrastructureException as e:
+            raise PlantImportServiceException(e)
+        self._finish_job(job_uuid, {'status': ImportJobStatus.COMPLETED, 'finished_at': datetime.now(UTC)},
+                         trace_id)
+        return progress
+
+    def _validate_chunk(self, entity: ImportEntity, rows: list[dict], first_row: int, errors: list[dict]
+                        ) -> list[tuple[int, object]]:
+        """
+        Validates a chunk with one adapter call. When some rows are invalid they are reported and the valid
+        ones are validated again, which only costs a second call for the chunks with errors.
+        """
+        aliases = _header_aliases(entity)
+        rows = [{aliases.get(_normalize_header(key), key): value for key, value in row.items()} for row in rows]
+        adapter = _chunk_adapter(entity)
+        try:
+            return list(enumerate(adapter.validate_python(rows), start=first_row))
+        except ValidationError as e:
+            invalid: dict[int, str] = {}
+            for error in e.errors(include_url=False, include_input=False):
+                index = error['loc'][0]
+                field = '.'.join(str(part) for part in error['loc'][1:])
+                invalid.setdefault(index, f"{field}: {error['msg']}" if field else error['msg'])
+        for index, message in invalid.items():
+            self._add_error(errors, first_row + index, message)
+        valid_indexes = [index for index in range(len(rows)) if index not in invalid]
+        validated = adapter.validate_python([rows[index] for index in valid_indexes])
+        return [(first_row + index, row) for index, row in zip(valid_indexes, validated)]
+
+    def _add_error(self, errors: list[dict], row: int, message: str):
+        if len(errors) < self.max_errors:
+            errors.append({'row': row, 'message': message})
+
+    @staticmethod
+    def _to_db_row(row, tenant_id: str) -> dict:
+        values = {'uuid': str(uuid.uuid4()), 'tenant_id': tenant_id}
+        for key, value in row.__dict__.items():
+            if isinstance(value, enum.Enum):
+                value = value.value
+            elif isinstance(value, list):
+                value = orjson.dumps([item.__dict__ for item in value]).decode()
+            values[key] = value
+        if 'join_date' in values and values['join_date'] is None:
+            values['join_date'] = datetime.now(UTC).date()
+        return values
+
+    @with_scoped_session
+    def import_chunk(self, session, job_uuid: str, tenant_id: str, entity: ImportEntity, rows: list[dict],
+                     progress: dict, errors: list[dict], seen_codes: set[str], trace_id: str = None):
+        """
+        Validates, deduplicates and inserts a chunk of rows and stores the progress of the job, in one
+        transaction.
+
+        Args:
+            session: Database session provided by the decorator.
+            job_uuid (str): The UUID of the job.
+            tenant_id (str): The ID of the tenant.
+            entity (ImportEntity): What the rows contain.
+            rows (list[dict]): The rows of the chunk, as read from the file.
+            progress (dict): The counters of the job, updated in place.
+            errors (list[dict]): The rejected rows of the job, updated in place.
+            seen_codes (set[str]): The codes read so far from the file, updated in place.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Raises:
+            InfrastructureException: If the chunk cannot be written.
+        """
+        # Spreadsheet row of the first row of the chunk, the header is row 1
+        first_row = progress['processed_rows'] + 2
+        validated = self._validate_chunk(entity, rows, first_row, errors)
+        failed = len(rows) - len(validated)
+
+        candidates = []
+        duplicated = 0
+        for row_number, row in validated:
+            if row.code in seen_codes:
+                duplicated += 1
+                continue
+            seen_codes.add(row.code)
+            candidates.append((row_number, row))
+
+        resource = IMPORT_PLAN_RESOURCES.get(entity) if self.plan_limits_service is not None else None
+        # The plan quota is reserved once for the chunk and kept for the retry, then the unused rows are given back
+        granted = None
+        db_rows = []
+        try:
+            for attempt in range(2):
+                existing = self.db_repository.get_existing_codes(session, entity.value,
+                                                                 [row.code for _, row in candidates], trace_id)
+                new_rows = [(row_number, row) for row_number, row in candidates if row.code not in existing]
+                if granted is None:
+                    granted = (self.plan_limits_service.reserve_resource(tenant_id, resource, len(new_rows))
+                               if resource else len(new_rows))
+                db_rows = [self._to_db_row(row, tenant_id) for _, row in new_rows[:granted]]
+                try:
+                    self.db_repository.insert_many(session, entity.value, db_rows, trace_id)
+                    break
+                except PlantOrmRepositoryDuplicatedException:
+                    # A concurrent import wrote some of the codes after the lookup, read them again once
+                    if attempt:
+                        raise
+            rejected = new_rows[granted:]
+            for row_number, _ in rejected:
+                self._add_error(errors, row_number, f"The plan of the tenant does not allow more {resource}")
+            duplicated += len(candidates) - len(new_rows)
+            failed += len(rejected)
+
+            progress['processed_rows'] += len(rows)
+            progress['inserted_rows'] += len(db_rows)
+            progress['duplicated_rows'] += duplicated
+            progress['failed_rows'] += failed
+            self.db_repository.update_import_job(session, job_uuid,
+                                                 {**progress, 'errors': orjson.dumps(errors).decode()}, trace_id)
+            session.commit()
+        except Exception:
+            if resource and granted:
+                self.plan_limits_service.finish_reservation(tenant_id, resource, granted, 0)
+            raise
+        if resource and granted:
+            self.plan_limits_service.finish_reservation(tenant_id, resource, granted, len(db_rows))
+
+    @with_scoped_session
+    def insert_import_job(self, session, job: InsertImportJobsModel, trace_id: str = None) -> ImportJobsModel:
+        """
+        Creates an import job in its own transaction.
+
+        Raises:
+            PlantImportServiceException: If an error occurs while creating the job.
+        """
+        try:
+            created = self.db_repository.insert_import_job(session, job, trace_id)
+            session.commit()
+            return created
+        except InfrastructureException as e:
+            raise PlantImportServiceException(e)
+        except Exception as e:
+            error_message = f"Unexpected error creating the import of {job.entity.value}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantImportServiceException(error_message) from e
+
+    @with_scoped_session
+    def _finish_job(self, session, job_uuid: str, values: dict, trace_id: str = None):
+        self.db_repository.update_import_job(session, job_uuid, values, trace_id)
+        session.commit()
+
+    @with_scoped_session
+    def fetch_import_job(self, session, tenant_id: str, job_uuid: str, trace_id: str = None) -> ImportJobsModel:
+        """
+        Fetches the progress of an import job.
+
+        Args:
+            session: Database session provided by the decorator.
+            tenant_id (str): The ID of the tenant.
+            job_uuid (str): The UUID of the job.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ImportJobsModel: The job.
+
+        Raises:
+            PlantImportServiceNotFoundException: If the job does not exist.
+            PlantImportServiceException: If an error occurs while fetching the job.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            with tenant_scope(tenant_id):
+                job = self.db_repository.get_import_job(session, job_uuid, trace_id)
+        except InfrastructureException as e:
+            raise PlantImportServiceException(e)
+        if job is None:
+            raise PlantImportServiceNotFoundException(f"Import job {job_uuid} not found")
+        return job
+
+    def _remove_file(self, file_path: str):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops accepting imports and waits for the running ones.
+        """
+        self._executor.shutdown(wait=wait)
+        self._stopped.set()
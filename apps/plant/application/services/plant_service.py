@@ -0,0 +1,59 @@
+from apps.plant.domain.repositories.plant_db_interface import PlantDBInterface, TPBaseModelType
+from apps.plant.exceptions.application.services.plant_service_exceptions import PlantServiceException
+from shared.constants import PLANT_SERVICE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException
+from shared.logger import LoggerService
+from shared.tenancy import tenant_scope
+from shared.tracing import get_trace_id
+
+
+class PlantService:
+    """
+    Service to read the people, modules and references of the plant of a tenant.
+    """
+    def __init__(self, db_repository: PlantDBInterface, database_manager: DataBaseManager):
+        """
+        Constructor for the PlantService class.
+
+        Args:
+            db_repository (PlantDBInterface): The repository to handle the database operations.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PLANT_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+
+    @with_scoped_session
+    def fetch_entities(self, session, tenant_id: str, entity: str, offset: int, limit: int,
+                       trace_id: str = None) -> list[TPBaseModelType]:
+        """
+        Fetches a page of the people, modules or references of a tenant, ordered by their code.
+
+        Args:
+            session: Database session provided by the decorator.
+            tenant_id (str): The ID of the tenant.
+            entity (str): 'people', 'modules' or 'references'.
+            offset (int): The rows to skip.
+            limit (int): The maximum rows to return.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            list[TPBaseModelType]: The rows of the page.
+
+        Raises:
+            PlantServiceException: If an error occurs while fetching the rows.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            with tenant_scope(tenant_id):
+                return self.db_repository.get_entities(session, entity, offset, limit, trace_id)
+        except InfrastructureException as e:
+            raise PlantServiceException(e)
+        except Exception as e:
+            error_message = f"Unexpected error fetching the {entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantServiceException(error_message) from e
@@ -0,0 +1,166 @@
+import enum
+import re
+import uuid
+from datetime import date, datetime, UTC
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional
+
+from apps.plant.domain.entities.plant_model import ModuleStatus, PersonStatus, ReferencePriority, ReferenceSize, \
+    ReferenceStatus
+from shared.models import TPBaseModel, TPInsertBaseModel
+from shared import constants
+
+_SIZE_SEPARATORS = re.compile(r"[;,|]")
+
+
+class ImportEntity(enum.Enum):
+    PEOPLE = constants.PLANT_ENTITY_PEOPLE
+    MODULES = constants.PLANT_ENTITY_MODULES
+    REFERENCES = constants.PLANT_ENTITY_REFERENCES
+
+
+class ImportFormat(enum.Enum):
+    CSV = constants.IMPORT_FORMAT_CSV
+    XLSX = constants.IMPORT_FORMAT_XLSX
+
+
+class ImportJobStatus(enum.Enum):
+    PENDING = constants.IMPORT_STATUS_PENDING
+    RUNNING = constants.IMPORT_STATUS_RUNNING
+    COMPLETED = constants.IMPORT_STATUS_COMPLETED
+    FAILED = constants.IMPORT_STATUS_FAILED
+
+
+class ImportRowError(BaseModel):
+    """
+    ImportRowError: A row of an import file that was not inserted.
+
+    Class Attributes:
+        row (int): The row of the file, counting the header as row 1 like a spreadsheet does.
+        message (str): Why the row was rejected.
+    """
+    row: int
+    message: str
+
+
+class ImportJobsModel(TPBaseModel):
+    """
+    ImportJobsModel: Entity to represent the progress of a bulk import of people, modules or references.
+
+    Class Attributes:
+        id (int): The ID of the row.
+        uuid (str): The UUID of the job, returned to the client to poll the progress.
+        tenant_id (str): The ID of the tenant.
+        entity (ImportEntity): What the file contains.
+        file_format (ImportFormat): The format of the file.
+        file_name (str): The name of the uploaded file.
+        status (ImportJobStatus): The status of the job.
+        total_rows (Optional[int]): The estimated data rows of the file.
+        processed_rows (int): The rows read so far.
+        inserted_rows (int): The rows inserted.
+        duplicated_rows (int): The rows skipped because their code already existed.
+        failed_rows (int): The rows rejected by the validation or the plan limits.
+        errors (list[ImportRowError]): The first rejected rows and why.
+        message (Optional[str]): The error that stopped the job.
+        created_by (Optional[str]): The user that uploaded the file.
+        file_path (Optional[str]): The path of the uploaded file, never sent to the client.
+        heartbeat_at (Optional[datetime]): The last time the worker of the job reported it alive.
+        started_at (Optional[datetime]): The date the job started.
+        finished_at (Optional[datetime]): The date the job finished.
+        created_at (datetime): The creation date of the record.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    entity: ImportEntity
+    file_format: ImportFormat
+    file_name: str
+    status: ImportJobStatus
+    total_rows: Optional[int] = None
+    processed_rows: int = 0
+    inserted_rows: int = 0
+    duplicated_rows: int = 0
+    failed_rows: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
+    message: Optional[str] = None
+    created_by: Optional[str] = None
+    file_path: Optional[str] = Field(None, exclude=True)
+    heartbeat_at: Optional[datetime] = Field(None, exclude=True)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+
+
+class InsertImportJobsModel(TPInsertBaseModel):
+    """
+    InsertImportJobsModel: Entity to represent the creation of an import job.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str
+    entity: ImportEntity
+    file_format: ImportFormat
+    file_name: str
+    status: ImportJobStatus = ImportJobStatus.PENDING
+    created_by: Optional[str] = None
+    file_path: Optional[str] = None
+    heartbeat_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class _ImportRow(BaseModel):
+    """
+    Base of the rows of the import files. The fields accept the camelCase names of the forms of the dashboard
+    and their snake_case names, and unknown columns are ignored.
+    """
+    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True, extra='ignore')
+
+    code: str = Field(..., min_length=1, max_length=100)
+
+
+class PersonImportRow(_ImportRow):
+    """
+    PersonImportRow: Row of a people import file.
+    """
+    name: str = Field(..., min_length=1, max_length=150)
+    status: PersonStatus = PersonStatus.ACTIVE
+    department: str = Field('Production', max_length=100)
+    daily_minutes: int = Field(480, alias='dailyMinutes', gt=0, le=1440)
+    module_code: Optional[str] = Field(None, alias='assignedModule', max_length=100)
+    join_date: Optional[date] = Field(None, alias='joinDate')
+
+
+class ModuleImportRow(_ImportRow):
+    """
+    ModuleImportRow: Row of a modules import file.
+    """
+    name: str = Field(..., min_length=1, max_length=150)
+    status: ModuleStatus = ModuleStatus.INACTIVE
+
+
+class ReferenceImportRow(_ImportRow):
+    """
+    ReferenceImportRow: Row of a references import file.
+
+    The sizes are one cell with the units of every size, e.g. 'S:10; M:25; L:5'.
+    """
+    description: str = Field(..., min_length=1, max_length=255)
+    lot: Optional[str] = Field(None, max_length=100)
+    status: ReferenceStatus = ReferenceStatus.PENDING
+    priority: ReferencePriority = ReferencePriority.MEDIUM
+    minutes_per_unit: float = Field(..., alias='minutesPerUnit', gt=0)
+    sizes: list[ReferenceSize] = Field(default_factory=list)
+    estimated_completion: Optional[date] = Field(None, alias='estimatedCompletion')
+
+    @field_validator('sizes', mode='before')
+    def parse_sizes(cls, value):
+        if not isinstance(value, str):
+            return value
+        sizes = []
+        for part in _SIZE_SEPARATORS.split(value):
+            if not part.strip():
+                continue
+            name, separator, quantity = part.partition(':')
+            if not separator:
+                raise ValueError(f"La talla '{part.strip()}' debe tener el formato 'talla:unidades'")
+            sizes.append({'name': name.strip(), 'quantity': quantity.strip()})
+        return sizes
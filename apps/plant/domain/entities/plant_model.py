@@ -0,0 +1,172 @@
+import enum
+import uuid
+from datetime import date, datetime, UTC
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from shared.models import TPBaseModel, TPInsertBaseModel
+from shared import constants
+
+
+class PersonStatus(enum.Enum):
+    ACTIVE = constants.PERSON_STATUS_ACTIVE
+    INACTIVE = constants.PERSON_STATUS_INACTIVE
+
+
+class ModuleStatus(enum.Enum):
+    ACTIVE = constants.MODULE_STATUS_ACTIVE
+    INACTIVE = constants.MODULE_STATUS_INACTIVE
+    MAINTENANCE = constants.MODULE_STATUS_MAINTENANCE
+
+
+class ReferenceStatus(enum.Enum):
+    PENDING = constants.REFERENCE_STATUS_PENDING
+    IN_PROGRESS = constants.REFERENCE_STATUS_IN_PROGRESS
+    FINISHED = constants.REFERENCE_STATUS_FINISHED
+
+
+class ReferencePriority(enum.Enum):
+    HIGH = constants.REFERENCE_PRIORITY_HIGH
+    MEDIUM = constants.REFERENCE_PRIORITY_MEDIUM
+    LOW = constants.REFERENCE_PRIORITY_LOW
+
+
+class PeopleModel(TPBaseModel):
+    """
+    PeopleModel: Entity to represent a person of the plant.
+
+    Class Attributes:
+        id (int): The ID of the row.
+        uuid (str): The UUID of the row.
+        tenant_id (str): The ID of the tenant.
+        code (str): The employee code, unique per tenant.
+        name (str): The full name of the person.
+        status (PersonStatus): The status of the person.
+        department (str): The department of the person.
+        daily_minutes (int): The minutes the person works in a day.
+        module_code (Optional[str]): The code of the module the person is assigned to.
+        join_date (date): The date the person joined the plant.
+        created_at (datetime): The creation date of the record.
+        updated_at (datetime): The update date of the record.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    code: str
+    name: str
+    status: PersonStatus
+    department: str
+    daily_minutes: int
+    module_code: Optional[str] = None
+    join_date: date
+    created_at: datetime
+    updated_at: datetime
+
+
+class InsertPeopleModel(TPInsertBaseModel):
+    """
+    InsertPeopleModel: Entity to represent the insertion of a person.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    code: str
+    name: str
+    status: PersonStatus = PersonStatus.ACTIVE
+    department: str = 'Production'
+    daily_minutes: int = Field(480, alias='dailyMinutes', gt=0)
+    module_code: Optional[str] = Field(None, alias='assignedModule')
+    join_date: date = Field(default_factory=lambda: datetime.now(UTC).date(), alias='joinDate')
+
+
+class ModulesModel(TPBaseModel):
+    """
+    ModulesModel: Entity to represent a production module (a line of machines and people).
+
+    Class Attributes:
+        id (int): The ID of the row.
+        uuid (str): The UUID of the row.
+        tenant_id (str): The ID of the tenant.
+        code (str): The code of the module, unique per tenant.
+        name (str): The name of the module.
+        status (ModuleStatus): The status of the module.
+        created_at (datetime): The creation date of the record.
+        updated_at (datetime): The update date of the record.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    code: str
+    name: str
+    status: ModuleStatus
+    created_at: datetime
+    updated_at: datetime
+
+
+class InsertModulesModel(TPInsertBaseModel):
+    """
+    InsertModulesModel: Entity to represent the insertion of a module.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    code: str
+    name: str
+    status: ModuleStatus = ModuleStatus.INACTIVE
+
+
+class ReferenceSize(BaseModel):
+    """
+    ReferenceSize: Units of a size ordered for a reference.
+
+    Class Attributes:
+        name (str): The name of the size, e.g. 'M'.
+        quantity (int): The units to produce.
+    """
+    name: str
+    quantity: int = Field(0, ge=0)
+
+
+class ReferencesModel(TPBaseModel):
+    """
+    ReferencesModel: Entity to represent a reference (a garment order) to produce.
+
+    Class Attributes:
+        id (int): The ID of the row.
+        uuid (str): The UUID of the row.
+        tenant_id (str): The ID of the tenant.
+        code (str): The code of the reference, unique per tenant.
+        description (str): The description of the garment.
+        lot (Optional[str]): The lot of the order.
+        status (ReferenceStatus): The status of the reference.
+        priority (ReferencePriority): The priority of the reference.
+        minutes_per_unit (float): The standard minutes to produce a unit.
+        sizes (list[ReferenceSize]): The units ordered per size.
+        estimated_completion (Optional[date]): The date the reference should be finished.
+        created_at (datetime): The creation date of the record.
+        updated_at (datetime): The update date of the record.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    code: str
+    description: str
+    lot: Optional[str] = None
+    status: ReferenceStatus
+    priority: ReferencePriority
+    minutes_per_unit: float
+    sizes: list[ReferenceSize] = Field(default_factory=list)
+    estimated_completion: Optional[date] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class InsertReferencesModel(TPInsertBaseModel):
+    """
+    InsertReferencesModel: Entity to represent the insertion of a reference.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    code: str
+    description: str
+    lot: Optional[str] = None
+    status: ReferenceStatus = ReferenceStatus.PENDING
+    priority: ReferencePriority = ReferencePriority.MEDIUM
+    minutes_per_unit: float = Field(..., alias='minutesPerUnit', gt=0)
+    sizes: list[ReferenceSize] = Field(default_factory=list)
+    estimated_completion: Optional[date] = Field(None, alias='estimatedCompletion')
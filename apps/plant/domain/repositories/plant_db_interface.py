@@ -0,0 +1,140 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional, TypeVar
+from sqlalchemy.orm import Session
+
+from shared.models import TPBaseModel
+
+TPBaseModelType = TypeVar("TPBaseModelType", bound=TPBaseModel)
+
+
+class PlantDBInterface(ABC):
+    """
+    PlantDBInterface is an interface that defines the methods of the people, modules and references of a plant
+    and of the jobs that import them in bulk
+    """
+
+    @abstractmethod
+    def get_existing_codes(self, session: Session, entity: str, codes: list[str], trace_id: str = None
+                           ) -> set[str]:
+        """
+        get_existing_codes is a method that gets which of some codes already exist, with one indexed query
+
+        Args:
+            session (Session): SQLAlchemy session
+            entity (str): 'people', 'modules' or 'references'
+            codes (list[str]): The codes to look up
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            set[str]: The codes that already exist in the tenant in context
+        """
+        pass
+
+    @abstractmethod
+    def get_entities(self, session: Session, entity: str, offset: int, limit: int, trace_id: str = None
+                     ) -> list[TPBaseModelType]:
+        """
+        get_entities is a method that gets a page of the people, modules or references ordered by their code
+
+        Args:
+            session (Session): SQLAlchemy session
+            entity (str): 'people', 'modules' or 'references'
+            offset (int): The rows to skip
+            limit (int): The maximum rows to return
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The rows of the tenant in context
+        """
+        pass
+
+    @abstractmethod
+    def insert_many(self, session: Session, entity: str, rows: list[dict], trace_id: str = None) -> int:
+        """
+        insert_many is a method that inserts rows with multi-row INSERT statements
+
+        Args:
+            session (Session): SQLAlchemy session
+            entity (str): 'people', 'modules' or 'references'
+            rows (list[dict]): The column values of every row, tenant included
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            int: The inserted rows
+        """
+        pass
+
+    @abstractmethod
+    def insert_import_job(self, session: Session, job: TPBaseModelType, trace_id: str = None) -> TPBaseModelType:
+        """
+        insert_import_job is a method that creates an import job
+
+        Args:
+            session (Session): SQLAlchemy session
+            job (TPBaseModelType): The job to create
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            TPBaseModelType: The created job
+        """
+        pass
+
+    @abstractmethod
+    def get_import_job(self, session: Session, job_uuid: str, trace_id: str = None) -> Optional[TPBaseModelType]:
+        """
+        get_import_job is a method that gets an import job of the tenant in context
+
+        Args:
+            session (Session): SQLAlchemy session
+            job_uuid (str): The UUID of the job
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[TPBaseModelType]: The job, None when it does not exist
+        """
+        pass
+
+    @abstractmethod
+    def get_stale_import_jobs(self, session: Session, heartbeat_before: datetime, trace_id: str = None
+                              ) -> list[TPBaseModelType]:
+        """
+        get_stale_import_jobs is a method that gets the pending and running import jobs of every tenant whose
+        worker stopped reporting them alive
+
+        Args:
+            session (Session): SQLAlchemy session
+            heartbeat_before (datetime): The jobs with an older heartbeat are stale
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The stale jobs
+        """
+        pass
+
+    @abstractmethod
+    def touch_import_jobs(self, session: Session, job_uuids: list[str], heartbeat_at: datetime,
+                          trace_id: str = None):
+        """
+        touch_import_jobs is a method that stores the heartbeat of the import jobs run by a worker
+
+        Args:
+            session (Session): SQLAlchemy session
+            job_uuids (list[str]): The UUIDs of the jobs
+            heartbeat_at (datetime): The date of the heartbeat
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def update_import_job(self, session: Session, job_uuid: str, values: dict, trace_id: str = None):
+        """
+        update_import_job is a method that updates the progress of an import job
+
+        Args:
+            session (Session): SQLAlchemy session
+            job_uuid (str): The UUID of the job
+            values (dict): The columns to update
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
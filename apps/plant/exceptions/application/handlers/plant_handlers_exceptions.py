@@ -0,0 +1,16 @@
+from shared.exceptions import HandlerException
+
+
+class StartPlantImportHandlerException(HandlerException):
+    """ Base exception for StartPlantImportHandler """
+    pass
+
+
+class FetchPlantImportJobHandlerException(HandlerException):
+    """ Base exception for FetchPlantImportJobHandler """
+    pass
+
+
+class FetchPlantEntitiesHandlerException(HandlerException):
+    """ Base exception for FetchPlantEntitiesHandler """
+    pass
@@ -0,0 +1,18 @@
+from pydantic import ValidationError
+
+from shared.exceptions import ServiceException
+
+
+class PlantImportServiceException(ServiceException):
+    """ Base exception for the plant import service."""
+    pass
+
+
+class PlantImportServiceValidationException(PlantImportServiceException, ValidationError):
+    """Raised when an import request validation error occurs."""
+    pass
+
+
+class PlantImportServiceNotFoundException(PlantImportServiceException):
+    """Raised when the import job does not exist."""
+    pass
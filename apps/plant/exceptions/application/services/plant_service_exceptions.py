@@ -0,0 +1,6 @@
+from shared.exceptions import ServiceException
+
+
+class PlantServiceException(ServiceException):
+    """ Base exception for the plant service."""
+    pass
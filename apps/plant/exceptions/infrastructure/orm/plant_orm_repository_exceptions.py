@@ -0,0 +1,16 @@
+from shared.exceptions import InfrastructureException
+
+
+class PlantOrmRepositoryException(InfrastructureException):
+    """Base exception for Plant ORM Repository errors."""
+    pass
+
+
+class PlantOrmRepositoryDBException(PlantOrmRepositoryException):
+    """Raised when there is a database error in the Plant ORM Repository."""
+    pass
+
+
+class PlantOrmRepositoryDuplicatedException(PlantOrmRepositoryException):
+    """Raised when an inserted code already exists, usually written by a concurrent import."""
+    pass
@@ -0,0 +1,29 @@
+from flask import Blueprint, jsonify, request, current_app, make_response
+
+# Local application/library specific imports
+from apps.plant.application.queries.fetch_plant_entities_query import FetchPlantEntitiesQuery
+from apps.plant.infrastructure.adapters.primary.framework.validator.plant_validator import GetPlantEntitiesValidator
+from shared.constants import PLANT_MODULES_CACHE_NAMESPACE, PLANT_PEOPLE_CACHE_NAMESPACE, \
+    PLANT_REFERENCES_CACHE_NAMESPACE
+from shared.decorators import cache_response, handle_exceptions, token_required
+from shared.tenancy import get_current_tenant_id
+
+
+# Create a new Blueprint for the plant
+plant_blueprint = Blueprint('plant', __name__)
+ORIGIN = 'plant_urls'
+
+
+@plant_blueprint.route('/plant/<entity>', methods=['GET'])
+@handle_exceptions
+@token_required
+@cache_response(namespaces=(PLANT_PEOPLE_CACHE_NAMESPACE, PLANT_MODULES_CACHE_NAMESPACE,
+                            PLANT_REFERENCES_CACHE_NAMESPACE))
+def get_plant_entities(payload, entity):
+    """
+    Get a page of the people, modules or references of the plant, ordered by their code.
+    """
+    validated_model = GetPlantEntitiesValidator(tenantId=get_current_tenant_id(), entity=entity,
+                                                **request.args.to_dict())
+    entities = current_app.config['query_bus'].ask(FetchPlantEntitiesQuery(**validated_model.model_dump()))
+    return make_response(jsonify(entities), 200)
@@ -0,0 +1,59 @@
+# Standard library imports
+import os
+import tempfile
+
+from flask import Blueprint, jsonify, request, current_app, make_response
+from werkzeug.exceptions import NotFound
+
+# Local application/library specific imports
+from apps.plant.application.commands.start_plant_import_command import StartPlantImportCommand
+from apps.plant.application.queries.fetch_plant_import_job_query import FetchPlantImportJobQuery
+from apps.plant.infrastructure.adapters.primary.framework.validator.plant_import_validator import \
+    GetPlantImportJobValidator, StartPlantImportValidator
+from shared.decorators import handle_exceptions, token_required
+from shared.tenancy import get_current_tenant_id
+
+
+# Create a new Blueprint for the bulk imports of the plant
+plant_imports_blueprint = Blueprint('plant_imports', __name__)
+ORIGIN = 'plant_imports_urls'
+
+
+@plant_imports_blueprint.route('/plant/imports/<entity>', methods=['POST'])
+@handle_exceptions
+@token_required
+def start_plant_import(payload, entity):
+    """
+    Import people, modules or references from a CSV or Excel file sent as the multipart field 'file'.
+
+    The file is imported in the background, the response carries the job to poll for its progress.
+    """
+    upload = request.files.get('file')
+    validated_model = StartPlantImportValidator(tenantId=get_current_tenant_id(), entity=entity,
+                                                fileName=upload.filename if upload else None,
+                                                fileFormat=request.form.get('format'))
+    # The upload goes to disk so the import streams it instead of holding it in memory
+    descriptor, file_path = tempfile.mkstemp(suffix=f'.{validated_model.file_format}',
+                                             dir=current_app.config.get('IMPORT_UPLOAD_DIR'))
+    with os.fdopen(descriptor, 'wb') as file:
+        upload.save(file)
+    job = current_app.config['command_bus'].execute(StartPlantImportCommand(**validated_model.model_dump(),
+                                                                            file_path=file_path,
+                                                                            created_by=payload.get('sub')))
+    response = make_response(jsonify(job), 202)
+    response.headers['Location'] = f'/plant/imports/jobs/{job.uuid}'
+    return response
+
+
+@plant_imports_blueprint.route('/plant/imports/jobs/<job_id>', methods=['GET'])
+@handle_exceptions
+@token_required
+def get_plant_import_job(payload, job_id):
+    """
+    Get the progress and the rejected rows of an import job.
+    """
+    validated_model = GetPlantImportJobValidator(tenantId=get_current_tenant_id(), jobId=job_id)
+    job = current_app.config['query_bus'].ask(FetchPlantImportJobQuery(**validated_model.model_dump()))
+    if job is None:
+        raise NotFound(description=f"Import job {job_id} not found")
+    return make_response(jsonify(job), 200)
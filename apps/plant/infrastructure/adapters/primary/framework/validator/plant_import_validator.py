@@ -0,0 +1,67 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from shared.constants import IMPORT_FORMAT_CSV, IMPORT_FORMAT_XLSX, PLANT_ENTITY_MODULES, PLANT_ENTITY_PEOPLE, \
+    PLANT_ENTITY_REFERENCES
+
+
+class StartPlantImportValidator(BaseModel):
+    """
+    StartPlantImportValidator: Entity to represent the upload of a file to import.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        entity (str): What the file contains, taken from the URL.
+        fileName (str): The name of the uploaded file.
+        fileFormat (Optional[str]): 'csv' or 'xlsx', taken from the extension of the file when not provided.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    entity: str = Field(..., alias='entity')
+    file_name: Optional[str] = Field(None, alias='fileName', validate_default=True)
+    file_format: Optional[str] = Field(None, alias='fileFormat', validate_default=True)
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        if not value or not value.strip():
+            raise ValueError("El token no pertenece a ningún tenant")
+        return value
+
+    @field_validator('entity')
+    def check_entity(cls, value):
+        if value not in (PLANT_ENTITY_PEOPLE, PLANT_ENTITY_MODULES, PLANT_ENTITY_REFERENCES):
+            raise ValueError(f"Solo se pueden importar '{PLANT_ENTITY_PEOPLE}', '{PLANT_ENTITY_MODULES}' o "
+                             f"'{PLANT_ENTITY_REFERENCES}'")
+        return value
+
+    @field_validator('file_name')
+    def check_file(cls, value):
+        if not value:
+            raise ValueError("El fichero 'file' es obligatorio")
+        return value
+
+    @field_validator('file_format')
+    def check_format(cls, value, info):
+        if value is None:
+            value = (info.data.get('file_name') or '').rsplit('.', 1)[-1].lower()
+        if value not in (IMPORT_FORMAT_CSV, IMPORT_FORMAT_XLSX):
+            raise ValueError(f"El fichero debe ser '{IMPORT_FORMAT_CSV}' o '{IMPORT_FORMAT_XLSX}'")
+        return value
+
+
+class GetPlantImportJobValidator(BaseModel):
+    """
+    GetPlantImportJobValidator: Entity to represent the request of the progress of an import job.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        jobId (str): The UUID of the job, taken from the URL.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    job_id: str = Field(..., alias='jobId')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        if not value or not value.strip():
+            raise ValueError("El token no pertenece a ningún tenant")
+        return value
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field, field_validator
+
+from shared.constants import PLANT_ENTITY_MODULES, PLANT_ENTITY_PEOPLE, PLANT_ENTITY_REFERENCES
+
+
+class GetPlantEntitiesValidator(BaseModel):
+    """
+    GetPlantEntitiesValidator: Entity to represent the request of a page of the rows of the plant.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        entity (str): 'people', 'modules' or 'references', taken from the URL.
+        offset (int): The rows to skip. Defaults to 0.
+        limit (int): The maximum rows to return, up to 1000. Defaults to 200.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    entity: str = Field(..., alias='entity')
+    offset: int = Field(0, alias='offset', ge=0)
+    limit: int = Field(200, alias='limit', gt=0, le=1000)
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        if not value or not value.strip():
+            raise ValueError("El token no pertenece a ningún tenant")
+        return value
+
+    @field_validator('entity')
+    def check_entity(cls, value):
+        if value not in (PLANT_ENTITY_PEOPLE, PLANT_ENTITY_MODULES, PLANT_ENTITY_REFERENCES):
+            raise ValueError(f"Solo se pueden listar '{PLANT_ENTITY_PEOPLE}', '{PLANT_ENTITY_MODULES}' o "
+                             f"'{PLANT_ENTITY_REFERENCES}'")
+        return value
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from shared.models import TextileProBaseOrmModel
+
+
+class ImportJobsOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the plant_import_jobs table, the progress of the bulk imports.
+
+    Class Attributes:
+        entity (Column): What the file contains, using ImportEntity enum.
+        file_format (Column): Format of the file, using ImportFormat enum.
+        file_name (Column): Name of the uploaded file.
+        status (Column): Status of the job, using ImportJobStatus enum.
+        total_rows (Column): Estimated data rows of the file.
+        processed_rows (Column): Rows read so far.
+        inserted_rows (Column): Rows inserted.
+        duplicated_rows (Column): Rows skipped because their code already existed.
+        failed_rows (Column): Rows rejected by the validation or the plan limits.
+        errors (Column): JSON list of the first rejected rows.
+        message (Column): Error that stopped the job.
+        created_by (Column): User that uploaded the file.
+        file_path (Column): Path of the uploaded file in the host of the worker, deleted when the job ends.
+        heartbeat_at (Column): Last time the worker of a pending or running job reported it alive.
+        started_at (Column): Date the job started.
+        finished_at (Column): Date the job finished.
+        created_at (Column): Created at column for the job, using DateTime.
+    """
+
+    __tablename__ = "plant_import_jobs"
+    entity = Column(String(30), nullable=False)
+    file_format = Column(String(10), nullable=False)
+    file_name = Column(String(255), nullable=False)
+    status = Column(String(30), nullable=False)
+    total_rows = Column(Integer, nullable=True)
+    processed_rows = Column(Integer, nullable=False, default=0)
+    inserted_rows = Column(Integer, nullable=False, default=0)
+    duplicated_rows = Column(Integer, nullable=False, default=0)
+    failed_rows = Column(Integer, nullable=False, default=0)
+    errors = Column(Text, nullable=False, default='[]')
+    message = Column(String(500), nullable=True)
+    created_by = Column(String(255), nullable=True)
+    file_path = Column(String(1024), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
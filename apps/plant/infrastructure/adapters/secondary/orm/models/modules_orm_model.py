@@ -0,0 +1,23 @@
+from sqlalchemy import Column, DateTime, String, func
+from shared.models import TextileProBaseOrmModel
+
+
+class ModulesOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the modules table.
+
+    Class Attributes:
+        code (Column): Code of the module, unique per tenant.
+        name (Column): Name of the module.
+        status (Column): Status of the module, using ModuleStatus enum.
+        created_at (Column): Created at column for the module, using DateTime.
+        updated_at (Column): Updated at column for the module, using DateTime.
+    """
+
+    __tablename__ = "modules"
+    __tenant_unique__ = (("code",),)
+    code = Column(String(100), nullable=False)
+    name = Column(String(150), nullable=False)
+    status = Column(String(30), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
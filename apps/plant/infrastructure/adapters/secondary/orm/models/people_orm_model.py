@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Date, DateTime, Integer, String, func
+from shared.models import TextileProBaseOrmModel
+
+
+class PeopleOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the people table.
+
+    Class Attributes:
+        code (Column): Employee code of the person, unique per tenant.
+        name (Column): Full name of the person.
+        status (Column): Status of the person, using PersonStatus enum.
+        department (Column): Department of the person.
+        daily_minutes (Column): Minutes the person works in a day.
+        module_code (Column): Code of the module the person is assigned to.
+        join_date (Column): Date the person joined the plant.
+        created_at (Column): Created at column for the person, using DateTime.
+        updated_at (Column): Updated at column for the person, using DateTime.
+    """
+
+    __tablename__ = "people"
+    __tenant_indexes__ = (("module_code",),)
+    __tenant_unique__ = (("code",),)
+    code = Column(String(100), nullable=False)
+    name = Column(String(150), nullable=False)
+    status = Column(String(30), nullable=False)
+    department = Column(String(100), nullable=False)
+    daily_minutes = Column(Integer, nullable=False)
+    module_code = Column(String(100), nullable=True)
+    join_date = Column(Date, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Date, DateTime, Float, String, Text, func
+from shared.models import TextileProBaseOrmModel
+
+
+class ReferencesOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the production_references table (REFERENCES is a reserved word in SQL).
+
+    Class Attributes:
+        code (Column): Code of the reference, unique per tenant.
+        description (Column): Description of the garment.
+        lot (Column): Lot of the order.
+        status (Column): Status of the reference, using ReferenceStatus enum.
+        priority (Column): Priority of the reference, using ReferencePriority enum.
+        minutes_per_unit (Column): Standard minutes to produce a unit.
+        sizes (Column): JSON list of the units ordered per size.
+        estimated_completion (Column): Date the reference should be finished.
+        created_at (Column): Created at column for the reference, using DateTime.
+        updated_at (Column): Updated at column for the reference, using DateTime.
+    """
+
+    __tablename__ = "production_references"
+    __tenant_unique__ = (("code",),)
+    code = Column(String(100), nullable=False)
+    description = Column(String(255), nullable=False)
+    lot = Column(String(100), nullable=True)
+    status = Column(String(30), nullable=False)
+    priority = Column(String(30), nullable=False)
+    minutes_per_unit = Column(Float, nullable=False)
+    sizes = Column(Text, nullable=False)
+    estimated_completion = Column(Date, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
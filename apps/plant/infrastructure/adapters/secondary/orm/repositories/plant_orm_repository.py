@@ -0,0 +1,316 @@
+from datetime import datetime
+from typing import Optional
+
+import orjson
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from apps.plant.domain.entities.plant_import_model import ImportJobsModel, ImportJobStatus, InsertImportJobsModel
+from apps.plant.domain.entities.plant_model import ModulesModel, PeopleModel, ReferencesModel
+from apps.plant.domain.repositories.plant_db_interface import PlantDBInterface
+from apps.plant.exceptions.infrastructure.orm.plant_orm_repository_exceptions import PlantOrmRepositoryException, \
+    PlantOrmRepositoryDBException, PlantOrmRepositoryDuplicatedException
+from apps.plant.infrastructure.adapters.secondary.orm.models.import_jobs_orm_model import ImportJobsOrmModel
+from apps.plant.infrastructure.adapters.secondary.orm.models.modules_orm_model import ModulesOrmModel
+from apps.plant.infrastructure.adapters.secondary.orm.models.people_orm_model import PeopleOrmModel
+from apps.plant.infrastructure.adapters.secondary.orm.models.references_orm_model import ReferencesOrmModel
+from shared.constants import PLANT_ENTITY_MODULES, PLANT_ENTITY_PEOPLE, PLANT_ENTITY_REFERENCES, PLANT_SERVICE
+from shared.logger import LoggerService
+
+PLANT_ORM_MODELS = {
+    PLANT_ENTITY_PEOPLE: PeopleOrmModel,
+    PLANT_ENTITY_MODULES: ModulesOrmModel,
+    PLANT_ENTITY_REFERENCES: ReferencesOrmModel,
+}
+PLANT_MODELS = {
+    PLANT_ENTITY_PEOPLE: PeopleModel,
+    PLANT_ENTITY_MODULES: ModulesModel,
+    PLANT_ENTITY_REFERENCES: ReferencesModel,
+}
+
+
+class PlantOrmRepository(PlantDBInterface):
+
+    def __init__(self):
+        """
+        Constructor for the PlantOrmRepository class.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PLANT_SERVICE
+
+    @staticmethod
+    def _to_db_values(model) -> dict:
+        return {k: (v.value if hasattr(v, 'value') else v) for k, v in model.to_db_dict().items()}
+
+    @staticmethod
+    def _orm_model(entity: str):
+        try:
+            return PLANT_ORM_MODELS[entity]
+        except KeyError:
+            raise PlantOrmRepositoryException(f"Unknown plant entity {entity}")
+
+    def get_existing_codes(self, session: Session, entity: str, codes: list[str], trace_id: str = None
+                           ) -> set[str]:
+        """
+        Retrieves which of some codes already exist in the tenant in context, through its (tenant_id, code)
+        unique index.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            entity (str): 'people', 'modules' or 'references'.
+            codes (list[str]): The codes to look up.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            set[str]: The codes that already exist.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        if not codes:
+            return set()
+        orm_model = self._orm_model(entity)
+        try:
+            return set(session.execute(select(orm_model.code).where(orm_model.code.in_(codes))).scalars())
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting the existing {entity} codes"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting the existing {entity} codes"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def get_entities(self, session: Session, entity: str, offset: int, limit: int, trace_id: str = None
+                     ) -> list[PeopleModel | ModulesModel | ReferencesModel]:
+        """
+        Retrieves a page of the people, modules or references of the tenant in context, ordered by their code
+        through its (tenant_id, code) unique index.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            entity (str): 'people', 'modules' or 'references'.
+            offset (int): The rows to skip.
+            limit (int): The maximum rows to return.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[PeopleModel | ModulesModel | ReferencesModel]: The rows of the page.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        orm_model = self._orm_model(entity)
+        try:
+            rows = session.execute(
+                select(orm_model).order_by(orm_model.code).offset(offset).limit(limit)).scalars().all()
+            entities = []
+            for row in rows:
+                values = dict(row.__dict__)
+                if isinstance(values.get('sizes'), str):
+                    values['sizes'] = orjson.loads(values['sizes'])
+                entities.append(PLANT_MODELS[entity](**values))
+            return entities
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting the {entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting the {entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def insert_many(self, session: Session, entity: str, rows: list[dict], trace_id: str = None) -> int:
+        """
+        Inserts rows with one executemany, which the drivers send as multi-row INSERT statements instead of
+        one round trip per row. The rows skip the ORM unit of work, so they must carry their tenant_id.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            entity (str): 'people', 'modules' or 'references'.
+            rows (list[dict]): The column values of every row.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            int: The inserted rows.
+
+        Raises:
+            PlantOrmRepositoryDuplicatedException: If a code already exists.
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        if not rows:
+            return 0
+        orm_model = self._orm_model(entity)
+        try:
+            with session.begin_nested():
+                session.execute(insert(orm_model), rows)
+            return len(rows)
+        except IntegrityError as e:
+            error_message = f"Some {entity} codes were inserted by another request"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDuplicatedException(error_message) from e
+        except SQLAlchemyError as e:
+            error_message = f"Database error inserting {entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error inserting {entity}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def insert_import_job(self, session: Session, job: InsertImportJobsModel, trace_id: str = None
+                          ) -> ImportJobsModel:
+        """
+        Creates an import job.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            job (InsertImportJobsModel): The job to create.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            ImportJobsModel: The created job.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            job_to_insert = ImportJobsOrmModel(**self._to_db_values(job))
+            session.add(job_to_insert)
+            session.flush()
+            return ImportJobsModel(**job_to_insert.__dict__)
+        except SQLAlchemyError as e:
+            error_message = "Database error inserting import job"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error inserting import job"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def get_import_job(self, session: Session, job_uuid: str, trace_id: str = None) -> Optional[ImportJobsModel]:
+        """
+        Retrieves an import job of the tenant in context.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            job_uuid (str): The UUID of the job.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Optional[ImportJobsModel]: The job, None when it does not exist.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            job = session.query(ImportJobsOrmModel).filter_by(uuid=job_uuid).first()
+            if not job:
+                LoggerService.insert_log(self.origin, f"Import job {job_uuid} not found", self.user, trace_id)
+                return None
+            return ImportJobsModel(**job.__dict__)
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting import job {job_uuid}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting import job {job_uuid}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def get_stale_import_jobs(self, session: Session, heartbeat_before: datetime, trace_id: str = None
+                              ) -> list[ImportJobsModel]:
+        """
+        Retrieves the pending and running import jobs of the tenants in scope whose worker stopped reporting
+        them alive.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            heartbeat_before (datetime): The jobs with an older heartbeat are stale.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[ImportJobsModel]: The stale jobs.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            jobs = session.execute(
+                select(ImportJobsOrmModel)
+                .where(ImportJobsOrmModel.status.in_([ImportJobStatus.PENDING.value, ImportJobStatus.RUNNING.value]),
+                       func.coalesce(ImportJobsOrmModel.heartbeat_at, ImportJobsOrmModel.created_at)
+                       < heartbeat_before)
+            ).scalars().all()
+            return [ImportJobsModel(**job.__dict__) for job in jobs]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting stale import jobs"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting stale import jobs"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def touch_import_jobs(self, session: Session, job_uuids: list[str], heartbeat_at: datetime,
+                          trace_id: str = None):
+        """
+        Stores the heartbeat of the import jobs run by a worker in a single statement.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            job_uuids (list[str]): The UUIDs of the jobs.
+            heartbeat_at (datetime): The date of the heartbeat.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        if not job_uuids:
+            return
+        try:
+            session.query(ImportJobsOrmModel).filter(ImportJobsOrmModel.uuid.in_(job_uuids)).update(
+                {'heartbeat_at': heartbeat_at}, synchronize_session=False)
+        except SQLAlchemyError as e:
+            error_message = "Database error storing the heartbeat of the import jobs"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error storing the heartbeat of the import jobs"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
+
+    def update_import_job(self, session: Session, job_uuid: str, values: dict, trace_id: str = None):
+        """
+        Updates the progress of an import job.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            job_uuid (str): The UUID of the job.
+            values (dict): The columns to update.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            PlantOrmRepositoryDBException: If there is a database error.
+            PlantOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            session.query(ImportJobsOrmModel).filter_by(uuid=job_uuid).update(
+                {k: (v.value if hasattr(v, 'value') else v) for k, v in values.items()},
+                synchronize_session=False)
+        except SQLAlchemyError as e:
+            error_message = f"Database error updating import job {job_uuid}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error updating import job {job_uuid}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlantOrmRepositoryException(error_message) from e
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry
+from shared.communication_bus.command_bus.command_dto import CommandDTO
+
+
+class CorrectProductionRecordCommand(CommandDTO):
+    """
+    CorrectProductionRecordCommand: Command to replace the minutes of a production record.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        record_id (str): The ID of the record.
+        expected_version (int): The version of the record the client edited.
+        person_entries (list[PersonMinutesEntry]): The new minutes per person.
+        logged_by (Optional[str]): The user that corrects the record.
+        notes (Optional[str]): The notes of the correction.
+    """
+    tenant_id: str
+    record_id: str
+    expected_version: int
+    person_entries: list[PersonMinutesEntry]
+    logged_by: Optional[str] = None
+    notes: Optional[str] = None
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import Field
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry
+from shared.communication_bus.command_bus.command_dto import CommandDTO
+
+
+class RecordProductionCommand(CommandDTO):
+    """
+    RecordProductionCommand: Command to log a production record of a module in a time slot.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        record_id (Optional[str]): The ID of the record, generated when not provided.
+        module_id (str): The ID of the module.
+        reference_id (str): The ID of the reference.
+        time_slot_id (str): The ID of the time slot.
+        person_entries (list[PersonMinutesEntry]): The minutes per person.
+        logged_by (Optional[str]): The user that logs the record.
+        notes (Optional[str]): The notes of the record.
+        occurred_at (Optional[datetime]): The date the production happened, defaults to now.
+    """
+    tenant_id: str
+    record_id: Optional[str] = None
+    module_id: str
+    reference_id: str
+    time_slot_id: str
+    person_entries: list[PersonMinutesEntry] = Field(default_factory=list)
+    logged_by: Optional[str] = None
+    notes: Optional[str] = None
+    occurred_at: Optional[datetime] = None
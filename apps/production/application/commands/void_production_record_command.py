@@ -0,0 +1,21 @@
+from typing import Optional
+
+from shared.communication_bus.command_bus.command_dto import CommandDTO
+
+
+class VoidProductionRecordCommand(CommandDTO):
+    """
+    VoidProductionRecordCommand: Command to cancel a production record.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        record_id (str): The ID of the record.
+        expected_version (int): The version of the record the client voided.
+        logged_by (Optional[str]): The user that voids the record.
+        notes (Optional[str]): The reason of the cancellation.
+    """
+    tenant_id: str
+    record_id: str
+    expected_version: int
+    logged_by: Optional[str] = None
+    notes: Optional[str] = None
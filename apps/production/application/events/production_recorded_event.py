@@ -0,0 +1,46 @@
+from datetime import datetime, UTC
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from shared.communication_bus.event_bus.event_dto import EventDTO
+
+
+class PersonMinutesEntry(BaseModel):
+    """
+    PersonMinutesEntry: Minutes logged by a person inside a production record.
+
+    Class Attributes:
+        person_id (str): The ID of the person.
+        minutes_worked (float): The minutes the person was present in the module.
+        produced_minutes (float): The standard minutes produced by the person.
+    """
+    person_id: str
+    minutes_worked: float
+    produced_minutes: float = 0
+
+
+class ProductionRecordedEvent(EventDTO):
+    """
+    ProductionRecordedEvent: Event published every time a production record is logged for a module and slot.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant that owns the record.
+        record_id (str): The ID of the production record.
+        module_id (str): The ID of the module.
+        reference_id (str): The ID of the reference being produced.
+        time_slot_id (str): The ID of the time slot.
+        worked_minutes (float): The total minutes worked by the people of the module in the slot.
+        produced_minutes (float): The standard minutes produced in the slot.
+        person_entries (list[PersonMinutesEntry]): The minutes logged per person.
+        logged_at (datetime): The date the record was logged.
+    """
+    tenant_id: str
+    record_id: str
+    module_id: str
+    reference_id: str
+    time_slot_id: str
+    worked_minutes: float
+    produced_minutes: float
+    person_entries: list[PersonMinutesEntry] = Field(default_factory=list)
+    logged_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC))
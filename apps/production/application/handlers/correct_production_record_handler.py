@@ -0,0 +1,62 @@
+from apps.production.application.commands.correct_production_record_command import CorrectProductionRecordCommand
+from apps.production.application.services.production_ledger_service import ProductionLedgerService
+from apps.production.domain.entities.production_ledger_model import ProductionEventsModel
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    CorrectProductionRecordHandlerException, ProductionRecordConflictHandlerException, \
+    ProductionRecordNotFoundHandlerException
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionLedgerServiceConflictException, ProductionLedgerServiceNotFoundException
+from shared.communication_bus.command_bus.command_handler_interface import CommandHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class CorrectProductionRecordHandler(CommandHandlerInterface):
+    """Handler for correcting production records."""
+
+    def __init__(self, production_ledger_service: ProductionLedgerService):
+        """
+        Constructor for the CorrectProductionRecordHandler class.
+
+        Args:
+            production_ledger_service (ProductionLedgerService): The service to manage the production ledger.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.ledger_service = production_ledger_service
+
+    def execute(self, command: CorrectProductionRecordCommand, trace_id: str = None) -> ProductionEventsModel:
+        """
+        Handles the CorrectProductionRecordCommand.
+
+        Args:
+            command (CorrectProductionRecordCommand): The command to correct the record.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended correction.
+
+        Raises:
+            ProductionRecordNotFoundHandlerException: If the record does not exist.
+            ProductionRecordConflictHandlerException: If the record changed since the expected version.
+            CorrectProductionRecordHandlerException: If an error occurs while correcting the record.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.ledger_service.correct_production(command.tenant_id, command.record_id,
+                                                          command.expected_version,
+                                                          command.model_dump()['person_entries'], command.logged_by,
+                                                          command.notes, trace_id=trace_id)
+        except ProductionLedgerServiceNotFoundException as e:
+            raise ProductionRecordNotFoundHandlerException(e)
+        except ProductionLedgerServiceConflictException as e:
+            raise ProductionRecordConflictHandlerException(e)
+        except ServiceException as e:
+            raise CorrectProductionRecordHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error correcting production record {command.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise CorrectProductionRecordHandlerException(error_message) from e
@@ -0,0 +1,53 @@
+from typing import Iterator
+
+from apps.production.application.queries.export_production_report_query import ExportProductionReportQuery
+from apps.production.application.services.production_report_service import ProductionReportService
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    ExportProductionReportHandlerException
+from shared.communication_bus.query_bus.query_handler_interface import QueryHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class ExportProductionReportHandler(QueryHandlerInterface):
+    """Handler to export the production reports."""
+
+    def __init__(self, production_report_service: ProductionReportService):
+        """
+        Constructor for the ExportProductionReportHandler class.
+
+        Args:
+            production_report_service (ProductionReportService): The service to export the reports.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.report_service = production_report_service
+
+    def ask(self, query: ExportProductionReportQuery, trace_id: str = None) -> Iterator[bytes]:
+        """
+        Handles the ExportProductionReportQuery.
+
+        Args:
+            query (ExportProductionReportQuery): The query with the report, the format and the period.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            Iterator[bytes]: The chunks of the file, read from the database while they are consumed.
+
+        Raises:
+            ExportProductionReportHandlerException: If the report or the format cannot be exported.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.report_service.export_report(query.tenant_id, query.report, query.file_format,
+                                                     query.date_from, query.date_to, query.module_id,
+                                                     trace_id=trace_id)
+        except ServiceException as e:
+            raise ExportProductionReportHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error exporting the production {query.report} report"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ExportProductionReportHandlerException(error_message) from e
@@ -0,0 +1,51 @@
+from apps.production.application.queries.fetch_production_aggregate_query import FetchProductionAggregateQuery
+from apps.production.application.services.production_ledger_service import ProductionLedgerService
+from apps.production.domain.entities.production_ledger_model import ProductionAggregateStateModel
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    FetchProductionAggregateHandlerException
+from shared.communication_bus.query_bus.query_handler_interface import QueryHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class FetchProductionAggregateHandler(QueryHandlerInterface):
+    """Handler to fetch the production totals of a module or a reference."""
+
+    def __init__(self, production_ledger_service: ProductionLedgerService):
+        """
+        Constructor for the FetchProductionAggregateHandler class.
+
+        Args:
+            production_ledger_service (ProductionLedgerService): The service to manage the production ledger.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.fetch_service = production_ledger_service
+
+    def ask(self, query: FetchProductionAggregateQuery, trace_id: str = None) -> ProductionAggregateStateModel:
+        """
+        Handles the FetchProductionAggregateQuery.
+
+        Args:
+            query (FetchProductionAggregateQuery): The query with the tenant, type and ID of the aggregate.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            ProductionAggregateStateModel: The current totals of the aggregate.
+
+        Raises:
+            FetchProductionAggregateHandlerException: If an error occurs while fetching the aggregate.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.fetch_service.fetch_aggregate_state(query.tenant_id, query.aggregate_type,
+                                                            query.aggregate_id, trace_id=trace_id)
+        except ServiceException as e:
+            raise FetchProductionAggregateHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error fetching production {query.aggregate_type} {query.aggregate_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise FetchProductionAggregateHandlerException(error_message) from e
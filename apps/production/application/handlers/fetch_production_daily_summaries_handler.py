@@ -0,0 +1,54 @@
+from apps.production.application.queries.fetch_production_daily_summaries_query import \
+    FetchProductionDailySummariesQuery
+from apps.production.application.services.production_summary_service import ProductionSummaryService
+from apps.production.domain.entities.production_summary_model import DailyModuleSummaryModel, \
+    DailyPersonSummaryModel
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    FetchProductionDailySummariesHandlerException
+from shared.communication_bus.query_bus.query_handler_interface import QueryHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class FetchProductionDailySummariesHandler(QueryHandlerInterface):
+    """Handler to fetch the daily production summaries of a period."""
+
+    def __init__(self, production_summary_service: ProductionSummaryService):
+        """
+        Constructor for the FetchProductionDailySummariesHandler class.
+
+        Args:
+            production_summary_service (ProductionSummaryService): The service to read the daily summaries.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.summary_service = production_summary_service
+
+    def ask(self, query: FetchProductionDailySummariesQuery, trace_id: str = None
+            ) -> list[DailyModuleSummaryModel] | list[DailyPersonSummaryModel]:
+        """
+        Handles the FetchProductionDailySummariesQuery.
+
+        Args:
+            query (FetchProductionDailySummariesQuery): The query with the summary and the period.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            list[DailyModuleSummaryModel] | list[DailyPersonSummaryModel]: The summaries of the period.
+
+        Raises:
+            FetchProductionDailySummariesHandlerException: If an error occurs while fetching the summaries.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.summary_service.get_daily_summaries(query.tenant_id, query.summary, query.date_from,
+                                                            query.date_to, query.module_id, trace_id=trace_id)
+        except ServiceException as e:
+            raise FetchProductionDailySummariesHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error fetching the daily {query.summary} summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise FetchProductionDailySummariesHandlerException(error_message) from e
@@ -0,0 +1,55 @@
+from apps.production.application.commands.record_production_command import RecordProductionCommand
+from apps.production.application.services.production_ledger_service import ProductionLedgerService
+from apps.production.domain.entities.production_ledger_model import ProductionEventsModel
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    ProductionRecordConflictHandlerException, RecordProductionHandlerException
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionLedgerServiceConflictException
+from shared.communication_bus.command_bus.command_handler_interface import CommandHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class RecordProductionHandler(CommandHandlerInterface):
+    """Handler for logging production records."""
+
+    def __init__(self, production_ledger_service: ProductionLedgerService):
+        """
+        Constructor for the RecordProductionHandler class.
+
+        Args:
+            production_ledger_service (ProductionLedgerService): The service to manage the production ledger.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.ledger_service = production_ledger_service
+
+    def execute(self, command: RecordProductionCommand, trace_id: str = None) -> ProductionEventsModel:
+        """
+        Handles the RecordProductionCommand.
+
+        Args:
+            command (RecordProductionCommand): The command to log the record.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended event.
+
+        Raises:
+            ProductionRecordConflictHandlerException: If the record already exists.
+            RecordProductionHandlerException: If an error occurs while logging the record.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.ledger_service.record_production(command.model_dump(), trace_id=trace_id)
+        except ProductionLedgerServiceConflictException as e:
+            raise ProductionRecordConflictHandlerException(e)
+        except ServiceException as e:
+            raise RecordProductionHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error logging production record {command.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise RecordProductionHandlerException(error_message) from e
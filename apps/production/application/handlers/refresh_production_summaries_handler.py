@@ -0,0 +1,44 @@
+from apps.production.application.events.production_recorded_event import ProductionRecordedEvent
+from apps.production.application.services.production_summary_service import ProductionSummaryService
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    RefreshProductionSummariesHandlerException
+from shared.communication_bus.event_bus.event_handler_interface import EventHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class RefreshProductionSummariesHandler(EventHandlerInterface):
+    """Handler that asks for a refresh of the daily summaries on every production record."""
+
+    def __init__(self, production_summary_service: ProductionSummaryService):
+        """
+        Constructor for the RefreshProductionSummariesHandler class.
+
+        Args:
+            production_summary_service (ProductionSummaryService): The service that refreshes the summaries.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.summary_service = production_summary_service
+
+    def publish(self, event: ProductionRecordedEvent, trace_id: str = None):
+        """
+        Handles the ProductionRecordedEvent. The refresh runs in the background, the request does not wait
+        for it.
+
+        Args:
+            event (ProductionRecordedEvent): The logged production record.
+            trace_id (str, optional): The trace ID for the request.
+
+        Raises:
+            RefreshProductionSummariesHandlerException: If the refresh cannot be requested.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            self.summary_service.request_refresh()
+        except Exception as e:
+            error_message = f"Unexpected error requesting the refresh of the summaries for record {event.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise RefreshProductionSummariesHandlerException(error_message) from e
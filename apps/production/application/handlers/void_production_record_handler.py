@@ -0,0 +1,61 @@
+from apps.production.application.commands.void_production_record_command import VoidProductionRecordCommand
+from apps.production.application.services.production_ledger_service import ProductionLedgerService
+from apps.production.domain.entities.production_ledger_model import ProductionEventsModel
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    ProductionRecordConflictHandlerException, ProductionRecordNotFoundHandlerException, \
+    VoidProductionRecordHandlerException
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionLedgerServiceConflictException, ProductionLedgerServiceNotFoundException
+from shared.communication_bus.command_bus.command_handler_interface import CommandHandlerInterface
+from shared.constants import PRODUCTION_SERVICE
+from shared.exceptions import ServiceException
+from shared.logger import LoggerService
+from shared.tracing import get_trace_id
+
+
+class VoidProductionRecordHandler(CommandHandlerInterface):
+    """Handler for voiding production records."""
+
+    def __init__(self, production_ledger_service: ProductionLedgerService):
+        """
+        Constructor for the VoidProductionRecordHandler class.
+
+        Args:
+            production_ledger_service (ProductionLedgerService): The service to manage the production ledger.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.ledger_service = production_ledger_service
+
+    def execute(self, command: VoidProductionRecordCommand, trace_id: str = None) -> ProductionEventsModel:
+        """
+        Handles the VoidProductionRecordCommand.
+
+        Args:
+            command (VoidProductionRecordCommand): The command to void the record.
+            trace_id (str, optional): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended event.
+
+        Raises:
+            ProductionRecordNotFoundHandlerException: If the record does not exist.
+            ProductionRecordConflictHandlerException: If the record changed since the expected version.
+            VoidProductionRecordHandlerException: If an error occurs while voiding the record.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            return self.ledger_service.void_production(command.tenant_id, command.record_id,
+                                                       command.expected_version, command.logged_by, command.notes,
+                                                       trace_id=trace_id)
+        except ProductionLedgerServiceNotFoundException as e:
+            raise ProductionRecordNotFoundHandlerException(e)
+        except ProductionLedgerServiceConflictException as e:
+            raise ProductionRecordConflictHandlerException(e)
+        except ServiceException as e:
+            raise VoidProductionRecordHandlerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error voiding production record {command.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise VoidProductionRecordHandlerException(error_message) from e
@@ -0,0 +1,58 @@
+from sqlalchemy.orm import Session
+
+from apps.production.domain.entities.production_ledger_model import ProductionAggregateStateModel, \
+    ProductionAggregateType, ProductionEventsModel, ProductionSnapshotsModel
+from apps.production.domain.projections.production_projection_interface import ProductionProjectionInterface
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.production.domain.services.production_ledger import ProductionAggregate, aggregate_keys
+from shared.constants import PRODUCTION_SNAPSHOTS_PROJECTION
+
+
+class AggregateSnapshotsProjection(ProductionProjectionInterface):
+    """
+    Keeps a snapshot of every module and reference up to date, so reading an aggregate only folds the events
+    appended since the last projection batch.
+    """
+    name = PRODUCTION_SNAPSHOTS_PROJECTION
+
+    def __init__(self, db_repository: ProductionLedgerDBInterface):
+        """
+        Constructor for the AggregateSnapshotsProjection class.
+
+        Args:
+            db_repository (ProductionLedgerDBInterface): The repository that stores the snapshots.
+        """
+        self.db_repository = db_repository
+
+    def reset(self, session: Session, trace_id: str = None):
+        self.db_repository.delete_snapshots(session, trace_id)
+
+    def apply_batch(self, session: Session, events: list[ProductionEventsModel], trace_id: str = None):
+        """
+        Folds a batch into the aggregates it touches, reading their snapshots with one query and writing them
+        back once per batch instead of once per event.
+        """
+        keys = {(event.tenant_id, aggregate_type.value, aggregate_id)
+                for event in events for aggregate_type, aggregate_id in aggregate_keys(event)}
+        if not keys:
+            return
+        aggregates: dict[tuple[str, str, str], ProductionAggregate] = {}
+        for snapshot in self.db_repository.get_snapshots(session, list(keys), trace_id):
+            aggregates[(snapshot.tenant_id, snapshot.aggregate_type.value, snapshot.aggregate_id)] = \
+                ProductionAggregate.from_state(ProductionAggregateStateModel(**snapshot.state))
+        for event in events:
+            for aggregate_type, aggregate_id in aggregate_keys(event):
+                key = (event.tenant_id, aggregate_type.value, aggregate_id)
+                aggregate = aggregates.get(key)
+                if aggregate is None:
+                    aggregate = aggregates[key] = ProductionAggregate(event.tenant_id, aggregate_type, aggregate_id)
+                aggregate.apply(event)
+
+        snapshots = []
+        for aggregate in aggregates.values():
+            state = aggregate.to_model()
+            snapshots.append(ProductionSnapshotsModel(
+                tenant_id=state.tenant_id, aggregate_type=ProductionAggregateType(state.aggregate_type),
+                aggregate_id=state.aggregate_id, last_event_id=state.last_event_id,
+                state=state.model_dump(mode='json')))
+        self.db_repository.save_snapshots(session, snapshots, trace_id)
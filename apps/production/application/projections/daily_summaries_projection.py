@@ -0,0 +1,86 @@
+from datetime import date, UTC
+
+from sqlalchemy.orm import Session
+
+from apps.production.domain.entities.production_ledger_model import ProductionEventType, ProductionEventsModel
+from apps.production.domain.entities.production_summary_model import DailyModuleSummaryModel, \
+    DailyPersonSummaryModel
+from apps.production.domain.projections.production_projection_interface import ProductionProjectionInterface
+from apps.production.domain.repositories.production_summaries_db_interface import ProductionSummariesDBInterface
+from shared.constants import PRODUCTION_DAILY_SUMMARIES_PROJECTION
+
+
+def summary_date(event: ProductionEventsModel) -> date:
+    """
+    Returns the day of the summaries an event counts in: the UTC day its production happened. The tenants
+    have no time zone, the API documents the days of the summaries as UTC days.
+    """
+    return event.occurred_at.astimezone(UTC).date()
+
+
+class DailySummariesProjection(ProductionProjectionInterface):
+    """
+    Materializes the totals of every module and every person per day, so a dashboard range reads one row per
+    module and day instead of aggregating the ledger.
+
+    Corrections and cancellations keep the day and the module of their record, so every event only adds its
+    deltas to the rows of one day.
+    """
+    name = PRODUCTION_DAILY_SUMMARIES_PROJECTION
+
+    def __init__(self, db_repository: ProductionSummariesDBInterface):
+        """
+        Constructor for the DailySummariesProjection class.
+
+        Args:
+            db_repository (ProductionSummariesDBInterface): The repository that stores the daily summaries.
+        """
+        self.db_repository = db_repository
+
+    def reset(self, session: Session, trace_id: str = None):
+        self.db_repository.delete_summaries(session, trace_id)
+
+    def apply_batch(self, session: Session, events: list[ProductionEventsModel], trace_id: str = None):
+        """
+        Adds a batch to the daily rows it touches, reading them with one query per table and writing them back
+        once per batch. Events older than the last one folded into a row are skipped, so replays are idempotent.
+        """
+        if not events:
+            return
+        module_keys = {(event.tenant_id, summary_date(event), event.module_id) for event in events}
+        person_keys = {(event.tenant_id, summary_date(event), event.module_id, delta.person_id)
+                       for event in events for delta in event.person_deltas}
+        modules = {(summary.tenant_id, summary.summary_date, summary.module_id): summary
+                   for summary in self.db_repository.get_module_summaries(session, list(module_keys), trace_id)}
+        people = {(summary.tenant_id, summary.summary_date, summary.module_id, summary.person_id): summary
+                  for summary in self.db_repository.get_person_summaries(session, list(person_keys), trace_id)}
+
+        for event in events:
+            day = summary_date(event)
+            key = (event.tenant_id, day, event.module_id)
+            module = modules.get(key)
+            if module is None:
+                module = modules[key] = DailyModuleSummaryModel(tenant_id=event.tenant_id, summary_date=day,
+                                                                module_id=event.module_id)
+            if event.id > module.last_event_id:
+                module.last_event_id = event.id
+                if event.event_type == ProductionEventType.RECORD_LOGGED:
+                    module.records += 1
+                elif event.event_type == ProductionEventType.RECORD_VOIDED:
+                    module.records -= 1
+                module.worked_minutes += event.worked_minutes_delta
+                module.produced_minutes += event.produced_minutes_delta
+
+            for delta in event.person_deltas:
+                key = (event.tenant_id, day, event.module_id, delta.person_id)
+                person = people.get(key)
+                if person is None:
+                    person = people[key] = DailyPersonSummaryModel(
+                        tenant_id=event.tenant_id, summary_date=day, module_id=event.module_id,
+                        person_id=delta.person_id)
+                if event.id > person.last_event_id:
+                    person.last_event_id = event.id
+                    person.worked_minutes += delta.minutes_worked
+                    person.produced_minutes += delta.produced_minutes
+
+        self.db_repository.save_summaries(session, list(modules.values()), list(people.values()), trace_id)
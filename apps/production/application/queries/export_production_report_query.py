@@ -0,0 +1,24 @@
+from datetime import date
+from typing import Optional
+
+from shared.communication_bus.query_bus.query_dto import QueryDTO
+
+
+class ExportProductionReportQuery(QueryDTO):
+    """
+    Query to export a production report of a period as a file.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        report (str): 'records' or 'people'.
+        file_format (str): 'csv', 'xlsx' or 'parquet'.
+        date_from (date): The first day of the report.
+        date_to (date): The last day of the report, included.
+        module_id (Optional[str]): The ID of the module to filter by.
+    """
+    tenant_id: str
+    report: str
+    file_format: str
+    date_from: date
+    date_to: date
+    module_id: Optional[str] = None
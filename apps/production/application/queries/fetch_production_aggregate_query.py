@@ -0,0 +1,15 @@
+from shared.communication_bus.query_bus.query_dto import QueryDTO
+
+
+class FetchProductionAggregateQuery(QueryDTO):
+    """
+    Query to fetch the production totals of a module or a reference.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        aggregate_type (str): 'module' or 'reference'.
+        aggregate_id (str): The ID of the module or the reference.
+    """
+    tenant_id: str
+    aggregate_type: str
+    aggregate_id: str
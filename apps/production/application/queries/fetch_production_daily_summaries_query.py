@@ -0,0 +1,22 @@
+from datetime import date
+from typing import Optional
+
+from shared.communication_bus.query_bus.query_dto import QueryDTO
+
+
+class FetchProductionDailySummariesQuery(QueryDTO):
+    """
+    Query to fetch the daily production summaries of a period.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        summary (str): 'modules' or 'people'.
+        date_from (date): The first day of the period.
+        date_to (date): The last day of the period, included.
+        module_id (Optional[str]): The ID of the module to filter by.
+    """
+    tenant_id: str
+    summary: str
+    date_from: date
+    date_to: date
+    module_id: Optional[str] = None
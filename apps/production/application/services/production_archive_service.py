@@ -0,0 +1,170 @@
+from datetime import date, datetime, time, UTC
+from typing import Optional
+
+from apps.production.application.services.production_projection_runner import ProductionProjectionRunner
+from apps.production.domain.repositories.production_archive_interface import ProductionArchiveInterface
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionArchiveServiceException
+from shared.constants import PRODUCTION_SERVICE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException, ServiceException
+from shared.logger import LoggerService
+from shared.tenancy import all_tenants_scope, tenant_scope
+from shared.tracing import get_trace_id
+
+
+def _month_start(value: date) -> datetime:
+    return datetime.combine(date(value.year, value.month, 1), time.min, UTC)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class ProductionArchiveService:
+    """
+    Moves the production events of the closed months from the ledger to the cold archive, by tenant and month.
+
+    Only the events up to the watermark of the projection runner are moved: they are folded into every read
+    model and no event still uncommitted can land among them, so the totals of the modules and references and
+    the daily summaries keep counting every archived event. Once a month is archived its records can no longer
+    be corrected or voided, and rebuilding a read model only replays the events still in the ledger.
+    """
+    def __init__(self, db_repository: ProductionLedgerDBInterface, archive_repository: ProductionArchiveInterface,
+                 database_manager: DataBaseManager, projection_runner: ProductionProjectionRunner,
+                 archive_after_months: int = 6, fetch_size: int = 1000):
+        """
+        Constructor for the ProductionArchiveService class.
+
+        Args:
+            db_repository (ProductionLedgerDBInterface): The repository of the production ledger.
+            archive_repository (ProductionArchiveInterface): The repository of the cold archive.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            projection_runner (ProductionProjectionRunner): The runner that brings the read models up to date.
+            archive_after_months (int): The full months kept in the ledger before the current one. Defaults to 6.
+            fetch_size (int): The events fetched from the database at a time. Defaults to 1000.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.db_repository = db_repository
+        self.archive_repository = archive_repository
+        self.database_manager = database_manager
+        self.projection_runner = projection_runner
+        self.archive_after_months = archive_after_months
+        self.fetch_size = fetch_size
+
+    def closed_before(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Returns the start of the oldest month that stays in the ledger, every earlier month is closed.
+        """
+        now = now or datetime.now(UTC)
+        return _month_start(_add_months(date(now.year, now.month, 1), -self.archive_after_months))
+
+    def archive_closed_months(self, now: Optional[datetime] = None, trace_id: str = None) -> dict[str, int]:
+        """
+        Archives the closed months of every tenant.
+
+        Every month is written, removed from the ledger and published in its own transaction, so an
+        interrupted run leaves whole months in one place or the other and the next run resumes it.
+
+        Args:
+            now (Optional[datetime]): The current date. Defaults to now.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            dict[str, int]: The events archived per tenant.
+
+        Raises:
+            ProductionArchiveServiceException: If an error occurs while archiving.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        closed_before = self.closed_before(now)
+        try:
+            self.projection_runner.catch_up(trace_id=trace_id)
+        except ServiceException as e:
+            raise ProductionArchiveServiceException(e)
+        max_event_id, tenants = self.get_archivable_tenants(closed_before, trace_id=trace_id)
+
+        archived: dict[str, int] = {}
+        for tenant_id, oldest in tenants.items():
+            month = oldest.date().replace(day=1)
+            while month < closed_before.date():
+                with tenant_scope(tenant_id):
+                    rows = self.archive_month(tenant_id, month, max_event_id, trace_id=trace_id)
+                if rows:
+                    archived[tenant_id] = archived.get(tenant_id, 0) + rows
+                month = _add_months(month, 1)
+        if archived:
+            LoggerService.insert_log(self.origin, f"Archived production events: {archived}", self.user, trace_id)
+        return archived
+
+    @with_scoped_session
+    def get_archivable_tenants(self, session, closed_before: datetime, trace_id: str = None
+                               ) -> tuple[int, dict[str, datetime]]:
+        """
+        Returns the watermark of the read models and the tenants with events before the closed date.
+        """
+        try:
+            with all_tenants_scope():
+                max_event_id = self.projection_runner.get_watermark(session, trace_id)
+                return max_event_id, self.db_repository.get_archivable_tenants(session, closed_before,
+                                                                               max_event_id, trace_id)
+        except InfrastructureException as e:
+            raise ProductionArchiveServiceException(e)
+
+    @with_scoped_session
+    def archive_month(self, session, tenant_id: str, month: date, max_event_id: int, trace_id: str = None
+                      ) -> int:
+        """
+        Moves the events of the tenant in context in a month to the archive.
+
+        The file is staged while the events are streamed from the ledger, then the events are deleted and the
+        file is published right before the commit, and removed again if the commit fails.
+
+        Args:
+            session: Database session provided by the decorator.
+            tenant_id (str): The ID of the tenant.
+            month (date): The first day of the month.
+            max_event_id (int): The last position of the ledger that can be archived.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            int: The archived events.
+
+        Raises:
+            ProductionArchiveServiceException: If an error occurs while archiving the month.
+        """
+        occurred_from, occurred_to = _month_start(month), _month_start(_add_months(month, 1))
+        try:
+            events = self.db_repository.iter_period_events(session, occurred_from, occurred_to, max_event_id,
+                                                           self.fetch_size, trace_id)
+            partition = self.archive_repository.write_partition(tenant_id, month, events, trace_id)
+            if partition is None:
+                return 0
+            deleted = self.db_repository.delete_period_events(session, occurred_from, occurred_to,
+                                                              partition.last_event_id, trace_id)
+            if deleted != partition.rows:
+                # Events of the month were appended while it was written, the next run archives them together
+                session.rollback()
+                self.archive_repository.discard_partition(partition, trace_id)
+                LoggerService.insert_log(self.origin, f"Archive of {month} of tenant {tenant_id} postponed, "
+                                                      f"{deleted} events changed instead of {partition.rows}",
+                                         self.user, trace_id)
+                return 0
+            self.archive_repository.publish_partition(partition, trace_id)
+            try:
+                session.commit()
+            except Exception:
+                self.archive_repository.discard_partition(partition, trace_id)
+                raise
+            return partition.rows
+        except InfrastructureException as e:
+            raise ProductionArchiveServiceException(e)
+        except Exception as e:
+            error_message = f"Unexpected error archiving {month} of tenant {tenant_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionArchiveServiceException(error_message) from e
@@ -0,0 +1,309 @@
+import uuid
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+from pydantic import ValidationError
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry, \
+    ProductionRecordedEvent
+from apps.production.domain.entities.production_ledger_model import InsertProductionEventsModel, \
+    ProductionAggregateStateModel, ProductionAggregateType, ProductionEventsModel, ProductionEventType, \
+    ProductionSnapshotsModel
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.production.domain.services.production_ledger import ProductionAggregate, build_corrected_event, \
+    build_logged_event, build_voided_event, fold_record, settled_prefix
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionLedgerServiceConflictException, ProductionLedgerServiceException, \
+    ProductionLedgerServiceNotFoundException, ProductionLedgerServiceValidationException
+from apps.production.exceptions.infrastructure.orm.production_ledger_orm_repository_exceptions import \
+    ProductionLedgerOrmRepositoryConcurrencyException
+from shared.communication_bus.event_bus.event_bus import EventBus
+from shared.constants import PRODUCTION_SERVICE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException
+from shared.logger import LoggerService
+from shared.tenancy import tenant_scope
+from shared.tracing import get_trace_id
+
+
+class ProductionLedgerService:
+    """
+    Service to append production records to the ledger and rebuild the state of modules and references
+    """
+    def __init__(self, db_repository: ProductionLedgerDBInterface, database_manager: DataBaseManager,
+                 event_bus: Optional[EventBus] = None, snapshot_every: int = 200, settle_seconds: float = 60):
+        """
+        Constructor for the ProductionLedgerService class.
+
+        Args:
+            db_repository (ProductionLedgerDBInterface): The repository to handle the database operations.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            event_bus (Optional[EventBus]): The bus to publish the logged records to the alerts and dashboards.
+            snapshot_every (int): The events folded on top of a snapshot before a new one is stored.
+            settle_seconds (float): The seconds after which an event can no longer have a smaller id still
+                uncommitted, only the events older than that are stored in a snapshot.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.event_bus = event_bus
+        self.snapshot_every = snapshot_every
+        self.settle_seconds = settle_seconds
+
+    def record_production(self, record: dict, trace_id: str = None) -> ProductionEventsModel:
+        """
+        Appends a new production record to the ledger and publishes it.
+
+        Args:
+            record (dict): The tenant, record, module, reference, slot, person entries and optional author,
+                notes and date of the production.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended event.
+
+        Raises:
+            ProductionLedgerServiceException: If an error occurs while appending the record.
+            ProductionLedgerServiceConflictException: If the record already exists.
+            ProductionLedgerServiceValidationException: If the provided record is invalid.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            event = build_logged_event(
+                tenant_id=record['tenant_id'], record_id=record.get('record_id') or str(uuid.uuid4()),
+                module_id=record['module_id'], reference_id=record['reference_id'],
+                time_slot_id=record['time_slot_id'],
+                person_entries=[PersonMinutesEntry(**entry) for entry in record.get('person_entries', [])],
+                occurred_at=record.get('occurred_at') or datetime.now(UTC), logged_by=record.get('logged_by'),
+                notes=record.get('notes'),
+            )
+        except ValidationError as e:
+            LoggerService.insert_error(self.origin, f"Error validating production record: {str(e)}", self.user,
+                                       trace_id)
+            raise ProductionLedgerServiceValidationException(e)
+
+        with tenant_scope(event.tenant_id):
+            appended = self.append_event(event, trace_id=trace_id)
+        self._publish(appended, trace_id)
+        return appended
+
+    def correct_production(self, tenant_id: str, record_id: str, expected_version: int,
+                           person_entries: list[dict], logged_by: Optional[str] = None,
+                           notes: Optional[str] = None, trace_id: str = None) -> ProductionEventsModel:
+        """
+        Replaces the minutes of a record by appending a correction with the difference.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            record_id (str): The ID of the record.
+            expected_version (int): The version of the record the client edited.
+            person_entries (list[dict]): The new minutes per person.
+            logged_by (Optional[str]): The user that corrects the record.
+            notes (Optional[str]): The notes of the correction.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended correction.
+
+        Raises:
+            ProductionLedgerServiceException: If an error occurs while appending the correction.
+            ProductionLedgerServiceNotFoundException: If the record does not exist.
+            ProductionLedgerServiceConflictException: If the record changed since the expected version.
+            ProductionLedgerServiceValidationException: If the provided entries are invalid.
+        """
+        try:
+            entries = [PersonMinutesEntry(**entry) for entry in person_entries]
+        except ValidationError as e:
+            LoggerService.insert_error(self.origin, f"Error validating production correction: {str(e)}",
+                                       self.user, trace_id)
+            raise ProductionLedgerServiceValidationException(e)
+        with tenant_scope(tenant_id):
+            return self.append_record_change(
+                record_id, expected_version,
+                lambda current: build_corrected_event(current, entries, logged_by, notes), trace_id=trace_id)
+
+    def void_production(self, tenant_id: str, record_id: str, expected_version: int,
+                        logged_by: Optional[str] = None, notes: Optional[str] = None,
+                        trace_id: str = None) -> ProductionEventsModel:
+        """
+        Cancels a record by appending an event that subtracts everything it added.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            record_id (str): The ID of the record.
+            expected_version (int): The version of the record the client voided.
+            logged_by (Optional[str]): The user that voids the record.
+            notes (Optional[str]): The reason of the cancellation.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended event.
+
+        Raises:
+            ProductionLedgerServiceException: If an error occurs while appending the event.
+            ProductionLedgerServiceNotFoundException: If the record does not exist.
+            ProductionLedgerServiceConflictException: If the record changed since the expected version.
+        """
+        with tenant_scope(tenant_id):
+            return self.append_record_change(
+                record_id, expected_version, lambda current: build_voided_event(current, logged_by, notes),
+                trace_id=trace_id)
+
+    def _publish(self, event: ProductionEventsModel, trace_id: str = None):
+        """
+        Publishes a logged record to the alerts and the live dashboards. The record is already committed, so a
+        failing subscriber is logged instead of failing the request.
+        """
+        if self.event_bus is None or event.event_type != ProductionEventType.RECORD_LOGGED:
+            return
+        try:
+            self.event_bus.publish(ProductionRecordedEvent(
+                tenant_id=event.tenant_id, record_id=event.record_id, module_id=event.module_id,
+                reference_id=event.reference_id, time_slot_id=event.time_slot_id,
+                worked_minutes=event.worked_minutes, produced_minutes=event.produced_minutes,
+                person_entries=event.person_entries, logged_at=event.occurred_at,
+            ), trace_id=trace_id)
+        except Exception as e:
+            LoggerService.insert_error(self.origin, f"Error publishing production record {event.record_id}: "
+                                                    f"{str(e)}", self.user, trace_id)
+
+    @with_scoped_session
+    def append_event(self, session, event: InsertProductionEventsModel, trace_id: str = None
+                     ) -> ProductionEventsModel:
+        """
+        Appends an event to the ledger in its own transaction.
+
+        Args:
+            session: Database session provided by the decorator.
+            event (InsertProductionEventsModel): The event to append.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended event.
+
+        Raises:
+            ProductionLedgerServiceException: If an error occurs while appending the event.
+            ProductionLedgerServiceConflictException: If the version of the record already exists.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            appended = self.db_repository.append_events(session, [event], trace_id)[0]
+            session.commit()
+            return appended
+        except ProductionLedgerOrmRepositoryConcurrencyException as e:
+            raise ProductionLedgerServiceConflictException(e)
+        except InfrastructureException as e:
+            raise ProductionLedgerServiceException(e)
+        except Exception as e:
+            error_message = f"Unexpected error appending production record {event.record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerServiceException(error_message) from e
+
+    @with_scoped_session
+    def append_record_change(self, session, record_id: str, expected_version: int, build_event,
+                             trace_id: str = None) -> ProductionEventsModel:
+        """
+        Folds the events of a record and appends the change built from its current state.
+
+        Args:
+            session: Database session provided by the decorator.
+            record_id (str): The ID of the record.
+            expected_version (int): The version of the record the client edited.
+            build_event (Callable[[ProductionRecordStateModel], InsertProductionEventsModel]): Builds the event.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ProductionEventsModel: The appended event.
+
+        Raises:
+            ProductionLedgerServiceException: If an error occurs while appending the event.
+            ProductionLedgerServiceNotFoundException: If the record does not exist.
+            ProductionLedgerServiceConflictException: If the record changed since the expected version.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            current = fold_record(self.db_repository.get_record_events(session, record_id, trace_id))
+            if current is None:
+                raise ProductionLedgerServiceNotFoundException(f"Production record {record_id} not found")
+            if current.voided:
+                raise ProductionLedgerServiceConflictException(f"Production record {record_id} is voided")
+            if current.version != expected_version:
+                raise ProductionLedgerServiceConflictException(
+                    f"Production record {record_id} is at version {current.version}, not {expected_version}")
+            appended = self.db_repository.append_events(session, [build_event(current)], trace_id)[0]
+            session.commit()
+            return appended
+        except ProductionLedgerServiceException:
+            raise
+        except ProductionLedgerOrmRepositoryConcurrencyException as e:
+            raise ProductionLedgerServiceConflictException(e)
+        except InfrastructureException as e:
+            raise ProductionLedgerServiceException(e)
+        except Exception as e:
+            error_message = f"Unexpected error changing production record {record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerServiceException(error_message) from e
+
+    @with_scoped_session
+    def fetch_aggregate_state(self, session, tenant_id: str, aggregate_type: str, aggregate_id: str,
+                              trace_id: str = None) -> ProductionAggregateStateModel:
+        """
+        Rebuilds the state of a module or a reference from its last snapshot plus the events after it, and
+        stores a new snapshot when the tail grew longer than `snapshot_every` events.
+
+        The snapshot only folds the settled events of the tail, an event of a transaction still open could
+        otherwise commit behind it and be left out of the state for good.
+
+        Args:
+            session: Database session provided by the decorator.
+            tenant_id (str): The ID of the tenant.
+            aggregate_type (str): 'module' or 'reference'.
+            aggregate_id (str): The ID of the module or the reference.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            ProductionAggregateStateModel: The current state of the aggregate.
+
+        Raises:
+            ProductionLedgerServiceException: If the aggregate type is invalid or the state cannot be rebuilt.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            aggregate_type = ProductionAggregateType(aggregate_type)
+        except ValueError as e:
+            error_message = f"Invalid production aggregate type {aggregate_type}"
+            LoggerService.insert_error(self.origin, error_message, self.user, trace_id)
+            raise ProductionLedgerServiceException(error_message) from e
+        try:
+            with tenant_scope(tenant_id):
+                snapshot = self.db_repository.get_snapshot(session, aggregate_type.value, aggregate_id, trace_id)
+                if snapshot is not None:
+                    aggregate = ProductionAggregate.from_state(ProductionAggregateStateModel(**snapshot.state))
+                else:
+                    aggregate = ProductionAggregate(tenant_id, aggregate_type, aggregate_id)
+                tail = self.db_repository.get_aggregate_events(session, aggregate_type.value, aggregate_id,
+                                                               aggregate.last_event_id, trace_id)
+                settled = settled_prefix(tail, datetime.now(UTC) - timedelta(seconds=self.settle_seconds))
+                for event in settled:
+                    aggregate.apply(event)
+                if len(settled) >= self.snapshot_every:
+                    settled_state = aggregate.to_model()
+                    self.db_repository.save_snapshots(session, [ProductionSnapshotsModel(
+                        tenant_id=tenant_id, aggregate_type=aggregate_type, aggregate_id=aggregate_id,
+                        last_event_id=settled_state.last_event_id,
+                        state=settled_state.model_dump(mode='json'))], trace_id)
+                    session.commit()
+                for event in tail[len(settled):]:
+                    aggregate.apply(event)
+            return aggregate.to_model()
+        except InfrastructureException as e:
+            raise ProductionLedgerServiceException(e)
+        except Exception as e:
+            error_message = f"Unexpected error rebuilding the state of {aggregate_type.value} {aggregate_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerServiceException(error_message) from e
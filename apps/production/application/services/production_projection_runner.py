@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from apps.production.domain.projections.production_projection_interface import ProductionProjectionInterface
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.production.domain.services.production_ledger import gapless_prefix
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionProjectionRunnerException
+from shared.constants import PRODUCTION_SERVICE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException
+from shared.logger import LoggerService
+from shared.tenancy import all_tenants_scope
+from shared.tracing import get_trace_id
+
+
+class ProductionProjectionRunner:
+    """
+    Feeds the production ledger to the read models, in batches and from the checkpoint of every projection.
+
+    Every batch is applied and checkpointed in the same transaction, so a crash replays at most the batch that
+    was in progress and a projection can be rebuilt from the first event at any time. A batch stops before a
+    gap in the ids younger than `settle_seconds`, the event of a transaction still open would otherwise be
+    behind the checkpoint when it commits and never be applied.
+    """
+    def __init__(self, db_repository: ProductionLedgerDBInterface, database_manager: DataBaseManager,
+                 projections: list[ProductionProjectionInterface], batch_size: int = 10000,
+                 settle_seconds: float = 60):
+        """
+        Constructor for the ProductionProjectionRunner class.
+
+        Args:
+            db_repository (ProductionLedgerDBInterface): The repository that reads the ledger.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            projections (list[ProductionProjectionInterface]): The projections to keep up to date.
+            batch_size (int): The events read and applied per transaction.
+            settle_seconds (float): The seconds after which an event can no longer have a smaller id still
+                uncommitted, longer than any transaction appending events stays open.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.projections = {projection.name: projection for projection in projections}
+        self.batch_size = batch_size
+        self.settle_seconds = settle_seconds
+
+    def _select(self, name: Optional[str]) -> list[ProductionProjectionInterface]:
+        if name is None:
+            return list(self.projections.values())
+        if name not in self.projections:
+            raise ProductionProjectionRunnerException(f"Unknown production projection {name}")
+        return [self.projections[name]]
+
+    def catch_up(self, name: Optional[str] = None, max_batches: Optional[int] = None,
+                 trace_id: str = None) -> dict[str, int]:
+        """
+        Applies the events appended since the checkpoint of the projections.
+
+        Args:
+            name (Optional[str]): The projection to run. Defaults to all of them.
+            max_batches (Optional[int]): The maximum batches per projection, None runs until the end.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            dict[str, int]: The events applied per projection.
+
+        Raises:
+            ProductionProjectionRunnerException: If an error occurs while running a projection.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        applied = {}
+        for projection in self._select(name):
+            applied[projection.name] = 0
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                count = self.run_batch(projection, trace_id=trace_id)
+                applied[projection.name] += count
+                batches += 1
+                if count < self.batch_size:
+                    break
+        return applied
+
+    def rebuild(self, name: str, trace_id: str = None) -> int:
+        """
+        Deletes a read model and replays the whole ledger into it.
+
+        Args:
+            name (str): The projection to rebuild.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            int: The events applied.
+
+        Raises:
+            ProductionProjectionRunnerException: If an error occurs while rebuilding the projection.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        projection = self._select(name)[0]
+        self.reset(projection, trace_id=trace_id)
+        return self.catch_up(name, trace_id=trace_id)[name]
+
+    def get_watermark(self, session, trace_id: str = None) -> int:
+        """
+        Returns the last position of the ledger applied by every projection. The batches stop at the gaps that
+        may still be filled, so every event at or before it that exists now was applied and no other event can
+        commit there later.
+
+        Args:
+            session: Database session of the caller, in the scope of every tenant.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            int: The lowest checkpoint of the projections.
+        """
+        return min(self.db_repository.get_checkpoint(session, name, trace_id) for name in self.projections)
+
+    @with_scoped_session
+    def reset(self, session, projection: ProductionProjectionInterface, trace_id: str = None):
+        """
+        Deletes the read model of a projection and rewinds its checkpoint, in one transaction.
+        """
+        try:
+            with all_tenants_scope():
+                projection.reset(session, trace_id)
+                self.db_repository.save_checkpoint(session, projection.name, 0, trace_id)
+                session.commit()
+        except InfrastructureException as e:
+            raise ProductionProjectionRunnerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error resetting production projection {projection.name}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionProjectionRunnerException(error_message) from e
+
+    @with_scoped_session
+    def run_batch(self, session, projection: ProductionProjectionInterface, trace_id: str = None) -> int:
+        """
+        Applies the next batch of events to a projection and moves its checkpoint, in one transaction.
+
+        Returns:
+            int: The events applied, less than the batch size when the projection reached the end of the ledger.
+        """
+        try:
+            with all_tenants_scope():
+                checkpoint = self.db_repository.get_checkpoint(session, projection.name, trace_id)
+                events = self.db_repository.get_events_batch(session, checkpoint, self.batch_size, trace_id)
+                events = gapless_prefix(events, checkpoint,
+                                        datetime.now(UTC) - timedelta(seconds=self.settle_seconds))
+                if not events:
+                    return 0
+                projection.apply_batch(session, events, trace_id)
+                self.db_repository.save_checkpoint(session, projection.name, events[-1].id, trace_id)
+                session.commit()
+            return len(events)
+        except InfrastructureException as e:
+            raise ProductionProjectionRunnerException(e)
+        except Exception as e:
+            error_message = f"Unexpected error running production projection {projection.name}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionProjectionRunnerException(error_message) from e
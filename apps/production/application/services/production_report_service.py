@@ -0,0 +1,161 @@
+from datetime import date, datetime, time, timedelta, UTC
+from typing import Iterator, Optional
+
+from apps.production.domain.entities.production_ledger_model import ProductionEventsModel
+from apps.production.domain.repositories.production_archive_interface import ProductionArchiveInterface
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.production.exceptions.application.services.production_report_service_exceptions import \
+    ProductionReportServiceException, ProductionReportServiceUnsupportedException
+from shared.constants import PRODUCTION_REPORT_PEOPLE, PRODUCTION_REPORT_RECORDS, PRODUCTION_SERVICE
+from shared.database import DataBaseManager
+from shared.exceptions import InfrastructureException
+from shared.logger import LoggerService
+from shared.tabular import TabularColumn, TabularFileException, check_export_format, iter_tabular_bytes
+from shared.tenancy import tenant_scope
+from shared.tracing import get_trace_id
+
+PRODUCTION_REPORT_COLUMNS = {
+    PRODUCTION_REPORT_RECORDS: (
+        TabularColumn('record_id'), TabularColumn('record_version', 'int'),
+        TabularColumn('occurred_at', 'datetime'), TabularColumn('module_id'), TabularColumn('reference_id'),
+        TabularColumn('time_slot_id'), TabularColumn('people', 'int'), TabularColumn('worked_minutes', 'float'),
+        TabularColumn('produced_minutes', 'float'), TabularColumn('efficiency', 'float'),
+        TabularColumn('logged_by'), TabularColumn('notes'),
+    ),
+    PRODUCTION_REPORT_PEOPLE: (
+        TabularColumn('record_id'), TabularColumn('occurred_at', 'datetime'), TabularColumn('module_id'),
+        TabularColumn('reference_id'), TabularColumn('time_slot_id'), TabularColumn('person_id'),
+        TabularColumn('minutes_worked', 'float'), TabularColumn('produced_minutes', 'float'),
+        TabularColumn('efficiency', 'float'),
+    ),
+}
+
+
+def _efficiency(produced_minutes: float, worked_minutes: float) -> Optional[float]:
+    if worked_minutes <= 0:
+        return None
+    return round(produced_minutes / worked_minutes * 100, 2)
+
+
+def _record_rows(records: Iterator[ProductionEventsModel]) -> Iterator[tuple]:
+    for record in records:
+        yield (record.record_id, record.record_version, record.occurred_at, record.module_id,
+               record.reference_id, record.time_slot_id, len(record.person_entries), record.worked_minutes,
+               record.produced_minutes, _efficiency(record.produced_minutes, record.worked_minutes),
+               record.logged_by, record.notes)
+
+
+def _people_rows(records: Iterator[ProductionEventsModel]) -> Iterator[tuple]:
+    for record in records:
+        for entry in record.person_entries:
+            yield (record.record_id, record.occurred_at, record.module_id, record.reference_id,
+                   record.time_slot_id, entry.person_id, entry.minutes_worked, entry.produced_minutes,
+                   _efficiency(entry.produced_minutes, entry.minutes_worked))
+
+
+PRODUCTION_REPORT_ROWS = {
+    PRODUCTION_REPORT_RECORDS: _record_rows,
+    PRODUCTION_REPORT_PEOPLE: _people_rows,
+}
+
+
+class ProductionReportService:
+    """
+    Service to export the production reports as CSV, Excel or Parquet files.
+
+    Reports are streamed: the records are read from a cursor a batch at a time and written to the file as
+    they arrive, so the memory of a worker does not depend on the period of the report.
+
+    When there is a cold archive, the months it holds are read from it and the database is only queried from
+    the end of the last archived month, so a historical report does not touch the database at all. Records
+    logged into an archived month after it was archived show up once the next run archives them.
+    """
+    def __init__(self, db_repository: ProductionLedgerDBInterface, database_manager: DataBaseManager,
+                 fetch_size: int = 1000, archive_repository: Optional[ProductionArchiveInterface] = None):
+        """
+        Constructor for the ProductionReportService class.
+
+        Args:
+            db_repository (ProductionLedgerDBInterface): The repository to read the production ledger.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            fetch_size (int): The records fetched from the database at a time. Defaults to 1000.
+            archive_repository (Optional[ProductionArchiveInterface]): The cold archive of the closed months.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.fetch_size = fetch_size
+        self.archive_repository = archive_repository
+
+    def export_report(self, tenant_id: str, report: str, file_format: str, date_from: date, date_to: date,
+                      module_id: Optional[str] = None, trace_id: str = None) -> Iterator[bytes]:
+        """
+        Exports a production report of a period.
+
+        The report and the format are checked right away, so they can still be answered with an error. The
+        records are only read once the returned iterator is consumed, usually by the HTTP response.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            report (str): 'records' for a row per record or 'people' for a row per person and record.
+            file_format (str): 'csv', 'xlsx' or 'parquet'.
+            date_from (date): The first day of the report.
+            date_to (date): The last day of the report, included.
+            module_id (Optional[str]): The ID of the module to filter by.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            Iterator[bytes]: The chunks of the file.
+
+        Raises:
+            ProductionReportServiceUnsupportedException: If the report or the format cannot be exported.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        if report not in PRODUCTION_REPORT_COLUMNS:
+            raise ProductionReportServiceUnsupportedException(f"Unknown production report {report}")
+        try:
+            check_export_format(file_format)
+        except TabularFileException as e:
+            raise ProductionReportServiceUnsupportedException(str(e)) from e
+        return self._iter_report(tenant_id, report, file_format, date_from, date_to, module_id, trace_id)
+
+    def _iter_report(self, tenant_id: str, report: str, file_format: str, date_from: date, date_to: date,
+                     module_id: Optional[str], trace_id: str) -> Iterator[bytes]:
+        # The session is opened on the first chunk and closed when the response closes the iterator
+        session = self.database_manager.get_session()
+        try:
+            records = self._iter_records(session, tenant_id, datetime.combine(date_from, time.min, UTC),
+                                         datetime.combine(date_to + timedelta(days=1), time.min, UTC),
+                                         module_id, trace_id)
+            yield from iter_tabular_bytes(file_format, PRODUCTION_REPORT_COLUMNS[report],
+                                          PRODUCTION_REPORT_ROWS[report](records))
+        except InfrastructureException as e:
+            LoggerService.insert_error(self.origin, f"The {report} report of {tenant_id} was cut: {str(e)}",
+                                       self.user, trace_id)
+            raise ProductionReportServiceException(e)
+        finally:
+            self.database_manager.close_session(session)
+
+    def _iter_records(self, session, tenant_id: str, occurred_from: datetime, occurred_to: datetime,
+                      module_id: Optional[str], trace_id: str) -> Iterator[ProductionEventsModel]:
+        """
+        Reads the archived months of the period from the archive and the rest from the database.
+        """
+        if self.archive_repository is not None:
+            archived_months = self.archive_repository.archived_months(tenant_id)
+            if archived_months:
+                last_month = archived_months[-1]
+                archived_until = datetime.combine(date(last_month.year + last_month.month // 12,
+                                                       last_month.month % 12 + 1, 1), time.min, UTC)
+                if occurred_from < archived_until:
+                    yield from self.archive_repository.iter_current_records(
+                        tenant_id, occurred_from, min(occurred_to, archived_until), module_id, trace_id=trace_id)
+                    occurred_from = archived_until
+        if occurred_from >= occurred_to:
+            return
+        with tenant_scope(tenant_id):
+            records = self.db_repository.iter_current_records(session, occurred_from, occurred_to, module_id,
+                                                              self.fetch_size, trace_id)
+        yield from records
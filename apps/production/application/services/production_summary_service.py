@@ -0,0 +1,222 @@
+import threading
+import time
+from datetime import date, datetime, UTC
+from typing import Optional
+
+from apps.production.application.services.production_projection_runner import ProductionProjectionRunner
+from apps.production.domain.entities.production_summary_model import DailyModuleSummaryModel, \
+    DailyPersonSummaryModel
+from apps.production.domain.repositories.production_summaries_db_interface import ProductionSummariesDBInterface
+from apps.production.exceptions.application.services.production_summary_service_exceptions import \
+    ProductionSummaryServiceException
+from shared.cache import TenantPartitionedCache
+from shared.constants import PRODUCTION_DAILY_SUMMARIES_PROJECTION, PRODUCTION_MODULE_SUMMARIES_CACHE_NAMESPACE, \
+    PRODUCTION_PERSON_SUMMARIES_CACHE_NAMESPACE, PRODUCTION_SERVICE, PRODUCTION_SUMMARY_MODULES, \
+    PRODUCTION_SUMMARY_PEOPLE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException, ServiceException
+from shared.logger import LoggerService
+from shared.tenancy import tenant_scope
+from shared.tracing import get_trace_id
+
+_CACHE_NAMESPACES = {
+    PRODUCTION_SUMMARY_MODULES: PRODUCTION_MODULE_SUMMARIES_CACHE_NAMESPACE,
+    PRODUCTION_SUMMARY_PEOPLE: PRODUCTION_PERSON_SUMMARIES_CACHE_NAMESPACE,
+}
+
+
+class ProductionSummaryService:
+    """
+    Service to read the daily summaries of the production and keep them refreshed in the background.
+
+    A refresh runs the daily summaries projection from its checkpoint, so it only reads the events appended
+    since the previous one and running it twice is harmless. The scheduler runs it in one of the replicas.
+    Single process deployments without scheduler enable `background_refresh` instead: a worker of the process
+    refreshes every `refresh_seconds` and earlier when a production event asks for it; the requests that
+    arrive while it waits `refresh_delay_seconds` are served by the same refresh.
+
+    The summaries are kept per UTC day.
+
+    With a tenant cache the periods read are kept for `cache_seconds`. A refresh of this process invalidates
+    the summaries of the tenants it wrote when it commits, the ones written by another process are seen once
+    the entry expires, which the summaries, refreshed in the background, already tolerate. The dashboards
+    asking for the same period at once share a single read, and an expired period is still served for
+    `stale_seconds` while it is read again in the background.
+    """
+    def __init__(self, db_repository: ProductionSummariesDBInterface, database_manager: DataBaseManager,
+                 projection_runner: ProductionProjectionRunner, refresh_seconds: float = 60,
+                 refresh_delay_seconds: float = 2, tenant_cache: Optional[TenantPartitionedCache] = None,
+                 cache_seconds: float = 30, stale_seconds: float = 30, early_refresh_beta: float = 1.0,
+                 background_refresh: bool = False):
+        """
+        Constructor for the ProductionSummaryService class.
+
+        Args:
+            db_repository (ProductionSummariesDBInterface): The repository of the daily summaries.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            projection_runner (ProductionProjectionRunner): The runner of the daily summaries projection.
+            refresh_seconds (float): The seconds between two scheduled refreshes, 0 only refreshes on request.
+                Defaults to 60.
+            refresh_delay_seconds (float): The seconds a requested refresh waits for more requests. Defaults to 2.
+            tenant_cache (Optional[TenantPartitionedCache]): The cache of the periods read, None disables it.
+            cache_seconds (float): The seconds a period read stays cached. Defaults to 30.
+            stale_seconds (float): The seconds an expired period is served while it is read again. Defaults to 30.
+            early_refresh_beta (float): The eagerness of the background reads before a period expires, 0 disables
+                them. Defaults to 1.
+            background_refresh (bool): Whether the production events start the background worker of the
+                process. Defaults to False, the scheduler refreshes the summaries.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.projection_runner = projection_runner
+        self.refresh_seconds = refresh_seconds
+        self.refresh_delay_seconds = refresh_delay_seconds
+        self.tenant_cache = tenant_cache
+        self.cache_seconds = cache_seconds
+        self.stale_seconds = stale_seconds
+        self.early_refresh_beta = early_refresh_beta
+        self.background_refresh = background_refresh
+        self._refresh_requested = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def get_daily_summaries(self, tenant_id: str, summary: str, date_from: date, date_to: date,
+                            module_id: Optional[str] = None, trace_id: str = None
+                            ) -> list[DailyModuleSummaryModel] | list[DailyPersonSummaryModel]:
+        """
+        Retrieves the daily summaries of a tenant in a period.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            summary (str): 'modules' for a row per module and day or 'people' for a row per person, module and day.
+            date_from (date): The first day, included.
+            date_to (date): The last day, included.
+            module_id (Optional[str]): The ID of the module to filter by.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            list[DailyModuleSummaryModel] | list[DailyPersonSummaryModel]: The summaries of the period.
+
+        Raises:
+            ProductionSummaryServiceException: If an error occurs while reading the summaries.
+        """
+        if summary not in _CACHE_NAMESPACES:
+            raise ProductionSummaryServiceException(f"Unsupported production summary {summary}")
+        if self.tenant_cache is None:
+            return self.read_daily_summaries(tenant_id, summary, date_from, date_to, module_id, trace_id)
+
+        summaries = self.tenant_cache.get_or_load(
+            _CACHE_NAMESPACES[summary], (date_from, date_to, module_id),
+            lambda: self.read_daily_summaries(tenant_id, summary, date_from, date_to, module_id, trace_id),
+            self.cache_seconds, self.stale_seconds, self.early_refresh_beta, tenant_id=tenant_id)
+        return list(summaries)
+
+    @with_scoped_session
+    def read_daily_summaries(self, session, tenant_id: str, summary: str, date_from: date, date_to: date,
+                             module_id: Optional[str] = None, trace_id: str = None
+                             ) -> list[DailyModuleSummaryModel] | list[DailyPersonSummaryModel]:
+        """
+        Reads the daily summaries of a tenant in a period from the database, skipping the cache.
+
+        Raises:
+            ProductionSummaryServiceException: If an error occurs while reading the summaries.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        try:
+            with tenant_scope(tenant_id):
+                if summary == PRODUCTION_SUMMARY_MODULES:
+                    return self.db_repository.get_module_summaries_between(session, date_from, date_to,
+                                                                           module_id, trace_id)
+                if summary == PRODUCTION_SUMMARY_PEOPLE:
+                    return self.db_repository.get_person_summaries_between(session, date_from, date_to,
+                                                                           module_id, trace_id)
+        except InfrastructureException as e:
+            raise ProductionSummaryServiceException(e)
+        raise ProductionSummaryServiceException(f"Unsupported production summary {summary}")
+
+    def warm_up(self, tenant_id: str, trace_id: str = None):
+        """
+        Loads the summaries of today of a tenant into the cache, the period the live dashboards read.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            trace_id (Optional[str]): The trace ID for the request.
+        """
+        if self.tenant_cache is None:
+            return
+        today = datetime.now(UTC).date()
+        for summary, namespace in _CACHE_NAMESPACES.items():
+            self.tenant_cache.load(namespace, (today, today, None),
+                                   lambda: self.read_daily_summaries(tenant_id, summary, today, today, None, trace_id),
+                                   self.cache_seconds, self.stale_seconds, tenant_id=tenant_id)
+
+    def refresh(self, trace_id: str = None) -> int:
+        """
+        Folds the events appended since the last refresh into the daily summaries.
+
+        Args:
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            int: The events applied.
+
+        Raises:
+            ProductionSummaryServiceException: If an error occurs while refreshing.
+        """
+        try:
+            return self.projection_runner.catch_up(PRODUCTION_DAILY_SUMMARIES_PROJECTION,
+                                                   trace_id=trace_id)[PRODUCTION_DAILY_SUMMARIES_PROJECTION]
+        except ServiceException as e:
+            raise ProductionSummaryServiceException(e)
+
+    def request_refresh(self):
+        """
+        Asks the background worker to refresh soon, without waiting for it. Does nothing without
+        `background_refresh`, the scheduled refresh picks the events up.
+        """
+        if not self.background_refresh:
+            return
+        self._refresh_requested.set()
+        self.start()
+
+    def start(self):
+        """
+        Starts the background worker of the process, once.
+        """
+        with self._worker_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._stopped.clear()
+            self._worker = threading.Thread(target=self._run, name='production-summaries', daemon=True)
+            self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the background worker after the refresh in progress.
+        """
+        self._stopped.set()
+        self._refresh_requested.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if self._refresh_requested.wait(self.refresh_seconds or None) and not self._stopped.is_set():
+                # Records usually arrive in bursts, one refresh serves the whole burst
+                time.sleep(self.refresh_delay_seconds)
+            if self._stopped.is_set():
+                return
+            self._refresh_requested.clear()
+            try:
+                self.refresh()
+            except ProductionSummaryServiceException:
+                # Already logged, the next refresh starts again from the same checkpoint
+                pass
+            except Exception as e:
+                LoggerService.insert_error(self.origin, f"Unexpected error refreshing the daily summaries: "
+                                                        f"{str(e)}", self.user)
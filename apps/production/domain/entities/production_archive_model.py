@@ -0,0 +1,29 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class ProductionArchivePartitionModel(BaseModel):
+    """
+    ProductionArchivePartitionModel: Entity to represent a file of the cold archive with the events of a tenant
+    in a month.
+
+    The file is written to a staging path first and only published once the events are deleted from the
+    ledger, so the reports never read a half written file.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        month (date): The first day of the month of the events.
+        rows (int): The events in the file.
+        first_event_id (int): The position in the ledger of the first event of the file.
+        last_event_id (int): The position in the ledger of the last event of the file.
+        path (str): The path of the published file.
+        staged_path (str): The path the file is written to before it is published.
+    """
+    tenant_id: str
+    month: date
+    rows: int
+    first_event_id: int
+    last_event_id: int
+    path: str
+    staged_path: str
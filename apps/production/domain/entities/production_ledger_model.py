@@ -0,0 +1,170 @@
+import enum
+import uuid
+from datetime import datetime, UTC
+from pydantic import Field
+from typing import Optional
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry
+from shared.models import TPBaseModel, TPInsertBaseModel
+from shared import constants
+
+
+class ProductionEventType(enum.Enum):
+    RECORD_LOGGED = constants.PRODUCTION_EVENT_RECORD_LOGGED
+    RECORD_CORRECTED = constants.PRODUCTION_EVENT_RECORD_CORRECTED
+    RECORD_VOIDED = constants.PRODUCTION_EVENT_RECORD_VOIDED
+
+
+class ProductionAggregateType(enum.Enum):
+    MODULE = constants.PRODUCTION_AGGREGATE_MODULE
+    REFERENCE = constants.PRODUCTION_AGGREGATE_REFERENCE
+
+
+class ProductionEventsModel(TPBaseModel):
+    """
+    ProductionEventsModel: Entity to represent an event of the append-only production ledger.
+
+    Every event stores the change it makes to the totals of its module and reference, so the aggregates are
+    folded by adding the events and a correction never rewrites the previous ones.
+
+    Class Attributes:
+        id (int): The position of the event in the ledger.
+        uuid (str): The UUID of the event.
+        tenant_id (str): The ID of the tenant.
+        record_id (str): The ID of the production record the event belongs to.
+        record_version (int): The version of the record after the event, starting at 1.
+        event_type (ProductionEventType): The type of the event.
+        module_id (str): The ID of the module.
+        reference_id (str): The ID of the reference.
+        time_slot_id (str): The ID of the time slot.
+        worked_minutes (float): The minutes worked by the record after the event.
+        produced_minutes (float): The standard minutes produced by the record after the event.
+        worked_minutes_delta (float): The change of the worked minutes made by the event.
+        produced_minutes_delta (float): The change of the produced minutes made by the event.
+        person_entries (list[PersonMinutesEntry]): The minutes per person of the record after the event.
+        person_deltas (list[PersonMinutesEntry]): The change of the minutes per person made by the event.
+        logged_by (Optional[str]): The user that logged the event.
+        notes (Optional[str]): The notes of the record.
+        occurred_at (datetime): The date the production happened.
+        recorded_at (datetime): The date the event was appended.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    record_id: str
+    record_version: int
+    event_type: ProductionEventType
+    module_id: str
+    reference_id: str
+    time_slot_id: str
+    worked_minutes: float
+    produced_minutes: float
+    worked_minutes_delta: float
+    produced_minutes_delta: float
+    person_entries: list[PersonMinutesEntry] = Field(default_factory=list)
+    person_deltas: list[PersonMinutesEntry] = Field(default_factory=list)
+    logged_by: Optional[str] = None
+    notes: Optional[str] = None
+    occurred_at: datetime
+    recorded_at: datetime
+
+
+class InsertProductionEventsModel(TPInsertBaseModel):
+    """
+    InsertProductionEventsModel: Entity to represent the insertion of an event in the production ledger.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str
+    record_id: str
+    record_version: int
+    event_type: ProductionEventType
+    module_id: str
+    reference_id: str
+    time_slot_id: str
+    worked_minutes: float
+    produced_minutes: float
+    worked_minutes_delta: float
+    produced_minutes_delta: float
+    person_entries: list[PersonMinutesEntry] = Field(default_factory=list)
+    person_deltas: list[PersonMinutesEntry] = Field(default_factory=list)
+    logged_by: Optional[str] = None
+    notes: Optional[str] = None
+    occurred_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC))
+    recorded_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC))
+
+
+class ProductionRecordStateModel(TPBaseModel):
+    """
+    ProductionRecordStateModel: Entity to represent the current state of a production record, folded from
+    its events.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        record_id (str): The ID of the record.
+        version (int): The version of the last event of the record.
+        module_id (str): The ID of the module.
+        reference_id (str): The ID of the reference.
+        time_slot_id (str): The ID of the time slot.
+        worked_minutes (float): The minutes worked.
+        produced_minutes (float): The standard minutes produced.
+        person_entries (list[PersonMinutesEntry]): The minutes per person.
+        voided (bool): Whether the record was voided.
+        occurred_at (datetime): The date the production happened.
+    """
+    tenant_id: str
+    record_id: str
+    version: int
+    module_id: str
+    reference_id: str
+    time_slot_id: str
+    worked_minutes: float
+    produced_minutes: float
+    person_entries: list[PersonMinutesEntry] = Field(default_factory=list)
+    voided: bool = False
+    occurred_at: datetime
+
+
+class ProductionAggregateStateModel(TPBaseModel):
+    """
+    ProductionAggregateStateModel: Entity to represent the production totals of a module or a reference.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        aggregate_type (ProductionAggregateType): Whether the aggregate is a module or a reference.
+        aggregate_id (str): The ID of the module or the reference.
+        last_event_id (int): The position of the last event folded into the state.
+        records (int): The live (not voided) records of the aggregate.
+        worked_minutes (float): The minutes worked.
+        produced_minutes (float): The standard minutes produced.
+        efficiency (Optional[float]): The produced minutes over the worked minutes, in percent.
+        person_minutes (dict[str, PersonMinutesEntry]): The minutes per person.
+        last_occurred_at (Optional[datetime]): The date of the most recent production.
+    """
+    tenant_id: str
+    aggregate_type: ProductionAggregateType
+    aggregate_id: str
+    last_event_id: int = 0
+    records: int = 0
+    worked_minutes: float = 0
+    produced_minutes: float = 0
+    efficiency: Optional[float] = None
+    person_minutes: dict[str, PersonMinutesEntry] = Field(default_factory=dict)
+    last_occurred_at: Optional[datetime] = None
+
+
+class ProductionSnapshotsModel(TPBaseModel):
+    """
+    ProductionSnapshotsModel: Entity to represent a stored state of an aggregate.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        aggregate_type (ProductionAggregateType): Whether the aggregate is a module or a reference.
+        aggregate_id (str): The ID of the module or the reference.
+        last_event_id (int): The position of the last event folded into the state.
+        state (dict): The serialized state of the aggregate.
+    """
+    tenant_id: str
+    aggregate_type: ProductionAggregateType
+    aggregate_id: str
+    last_event_id: int
+    state: dict
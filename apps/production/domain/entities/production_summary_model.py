@@ -0,0 +1,52 @@
+from datetime import date
+from typing import Optional
+
+from shared.models import TPBaseModel
+
+
+class DailyModuleSummaryModel(TPBaseModel):
+    """
+    DailyModuleSummaryModel: Entity to represent the production totals of a module in a day.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        summary_date (date): The day the production happened, in UTC.
+        module_id (str): The ID of the module.
+        records (int): The live (not voided) records of the day.
+        worked_minutes (float): The minutes worked.
+        produced_minutes (float): The standard minutes produced.
+        efficiency (Optional[float]): The produced minutes over the worked minutes, in percent.
+        last_event_id (int): The position of the last event folded into the row.
+    """
+    tenant_id: str
+    summary_date: date
+    module_id: str
+    records: int = 0
+    worked_minutes: float = 0
+    produced_minutes: float = 0
+    efficiency: Optional[float] = None
+    last_event_id: int = 0
+
+
+class DailyPersonSummaryModel(TPBaseModel):
+    """
+    DailyPersonSummaryModel: Entity to represent the minutes of a person in a module in a day.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        summary_date (date): The day the production happened, in UTC.
+        module_id (str): The ID of the module.
+        person_id (str): The ID of the person.
+        worked_minutes (float): The minutes worked.
+        produced_minutes (float): The standard minutes produced.
+        efficiency (Optional[float]): The produced minutes over the worked minutes, in percent.
+        last_event_id (int): The position of the last event folded into the row.
+    """
+    tenant_id: str
+    summary_date: date
+    module_id: str
+    person_id: str
+    worked_minutes: float = 0
+    produced_minutes: float = 0
+    efficiency: Optional[float] = None
+    last_event_id: int = 0
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from sqlalchemy.orm import Session
+
+from apps.production.domain.entities.production_ledger_model import ProductionEventsModel
+
+
+class ProductionProjectionInterface(ABC):
+    """
+    ProductionProjectionInterface is an interface for the read models built from the production ledger.
+
+    The projection runner feeds the events in ledger order and in batches, and commits every batch together
+    with the checkpoint of the projection, so a projection only has to be idempotent per batch.
+    """
+    name: str
+
+    @abstractmethod
+    def reset(self, session: Session, trace_id: str = None):
+        """
+        reset is a method that deletes the read model before it is rebuilt from the first event
+
+        Args:
+            session (Session): SQLAlchemy session
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def apply_batch(self, session: Session, events: list[ProductionEventsModel], trace_id: str = None):
+        """
+        apply_batch is a method that applies a batch of events to the read model
+
+        Args:
+            session (Session): SQLAlchemy session
+            events (list[ProductionEventsModel]): The events of the batch, in ledger order
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
@@ -0,0 +1,87 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Iterable, Iterator, Optional
+
+from apps.production.domain.entities.production_archive_model import ProductionArchivePartitionModel
+from apps.production.domain.entities.production_ledger_model import ProductionEventsModel
+
+
+class ProductionArchiveInterface(ABC):
+    """
+    ProductionArchiveInterface is an interface that defines the methods of the cold archive of the production
+    ledger, which keeps the events of the closed months out of the database, by tenant and month
+    """
+
+    @abstractmethod
+    def archived_months(self, tenant_id: str) -> list[date]:
+        """
+        archived_months is a method that gets the months of a tenant that are in the archive
+
+        Args:
+            tenant_id (str): The ID of the tenant
+
+        Returns:
+            list[date]: The first day of every archived month, in order
+        """
+        pass
+
+    @abstractmethod
+    def write_partition(self, tenant_id: str, month: date, events: Iterable[tuple[ProductionEventsModel, bool]],
+                        trace_id: str = None) -> Optional[ProductionArchivePartitionModel]:
+        """
+        write_partition is a method that writes the events of a tenant in a month to a staged file
+
+        Args:
+            tenant_id (str): The ID of the tenant
+            month (date): The first day of the month
+            events (Iterable[tuple[ProductionEventsModel, bool]]): The events by date and whether they are the
+                last version of their record
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[ProductionArchivePartitionModel]: The staged file, None when there were no events
+        """
+        pass
+
+    @abstractmethod
+    def publish_partition(self, partition: ProductionArchivePartitionModel, trace_id: str = None):
+        """
+        publish_partition is a method that makes a staged file visible to the reports
+
+        Args:
+            partition (ProductionArchivePartitionModel): The staged file
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def discard_partition(self, partition: ProductionArchivePartitionModel, trace_id: str = None):
+        """
+        discard_partition is a method that deletes a staged or published file whose events stayed in the ledger
+
+        Args:
+            partition (ProductionArchivePartitionModel): The file to delete
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def iter_current_records(self, tenant_id: str, occurred_from: datetime, occurred_to: datetime,
+                             module_id: Optional[str] = None, batch_size: int = 10000, trace_id: str = None
+                             ) -> Iterator[ProductionEventsModel]:
+        """
+        iter_current_records is a method that streams the last version of the archived records of a tenant
+        that happened in a period, skipping the voided ones
+
+        Args:
+            tenant_id (str): The ID of the tenant
+            occurred_from (datetime): The start of the period, included
+            occurred_to (datetime): The end of the period, excluded
+            module_id (Optional[str]): The ID of the module to filter by
+            batch_size (int): The rows read from the files at a time
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Iterator[ProductionEventsModel]: The events of the last version of every record, by month and date
+        """
+        pass
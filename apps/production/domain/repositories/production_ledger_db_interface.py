@@ -0,0 +1,246 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterator, Optional, TypeVar
+from sqlalchemy.orm import Session
+
+from shared.models import TPBaseModel
+
+TPBaseModelType = TypeVar("TPBaseModelType", bound=TPBaseModel)
+
+
+class ProductionLedgerDBInterface(ABC):
+    """
+    ProductionLedgerDBInterface is an interface that defines the methods of the append-only production ledger,
+    its aggregate snapshots and the checkpoints of its projections
+    """
+
+    @abstractmethod
+    def append_events(self, session: Session, events: list[TPBaseModelType], trace_id: str = None
+                      ) -> list[TPBaseModelType]:
+        """
+        append_events is a method that appends events to the ledger. Appending a version of a record that
+        already exists must fail, so two concurrent edits of a record cannot both succeed
+
+        Args:
+            session (Session): SQLAlchemy session
+            events (list[TPBaseModelType]): Events to append
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The appended events with their position in the ledger
+        """
+        pass
+
+    @abstractmethod
+    def get_record_events(self, session: Session, record_id: str, trace_id: str = None) -> list[TPBaseModelType]:
+        """
+        get_record_events is a method that gets the events of a record in version order
+
+        Args:
+            session (Session): SQLAlchemy session
+            record_id (str): The ID of the record
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The events of the record
+        """
+        pass
+
+    @abstractmethod
+    def get_aggregate_events(self, session: Session, aggregate_type: str, aggregate_id: str,
+                             after_event_id: int = 0, trace_id: str = None) -> list[TPBaseModelType]:
+        """
+        get_aggregate_events is a method that gets the events of a module or a reference after a position
+
+        Args:
+            session (Session): SQLAlchemy session
+            aggregate_type (str): 'module' or 'reference'
+            aggregate_id (str): The ID of the module or the reference
+            after_event_id (int): The position of the last event already folded
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The events in ledger order
+        """
+        pass
+
+    @abstractmethod
+    def get_events_batch(self, session: Session, after_event_id: int, limit: int, trace_id: str = None
+                         ) -> list[TPBaseModelType]:
+        """
+        get_events_batch is a method that gets the next events of the ledger of every tenant, for replays. The
+        events committed so far are returned, an event with a smaller id may still commit afterwards
+
+        Args:
+            session (Session): SQLAlchemy session
+            after_event_id (int): The position of the last event already processed
+            limit (int): The maximum events to get
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The events in ledger order
+        """
+        pass
+
+    @abstractmethod
+    def iter_current_records(self, session: Session, occurred_from: datetime, occurred_to: datetime,
+                             module_id: Optional[str] = None, fetch_size: int = 1000, trace_id: str = None
+                             ) -> Iterator[TPBaseModelType]:
+        """
+        iter_current_records is a method that streams the last version of the records that happened in a
+        period, skipping the voided ones, for reports
+
+        Args:
+            session (Session): SQLAlchemy session, it must stay open while the records are read
+            occurred_from (datetime): The start of the period, included
+            occurred_to (datetime): The end of the period, excluded
+            module_id (Optional[str]): The ID of the module to filter by
+            fetch_size (int): The rows fetched from the database at a time
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Iterator[TPBaseModelType]: The events of the last version of every record, by date
+        """
+        pass
+
+    @abstractmethod
+    def get_archivable_tenants(self, session: Session, occurred_before: datetime, max_event_id: int,
+                               trace_id: str = None) -> dict[str, datetime]:
+        """
+        get_archivable_tenants is a method that gets the tenants with events older than a date, with the date
+        of their oldest one, across every tenant
+
+        Args:
+            session (Session): SQLAlchemy session
+            occurred_before (datetime): The date the events must be older than
+            max_event_id (int): The last position of the ledger that can be archived
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            dict[str, datetime]: The date of the oldest archivable event of every tenant
+        """
+        pass
+
+    @abstractmethod
+    def iter_period_events(self, session: Session, occurred_from: datetime, occurred_to: datetime,
+                           max_event_id: int, fetch_size: int = 1000, trace_id: str = None
+                           ) -> Iterator[tuple[TPBaseModelType, bool]]:
+        """
+        iter_period_events is a method that streams every event of a period of the tenant in context, with
+        whether it is the last version of its record, to move them to the archive
+
+        Args:
+            session (Session): SQLAlchemy session, it must stay open while the events are read
+            occurred_from (datetime): The start of the period, included
+            occurred_to (datetime): The end of the period, excluded
+            max_event_id (int): The last position of the ledger to read
+            fetch_size (int): The rows fetched from the database at a time
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Iterator[tuple[TPBaseModelType, bool]]: The events by date and whether they are current
+        """
+        pass
+
+    @abstractmethod
+    def delete_period_events(self, session: Session, occurred_from: datetime, occurred_to: datetime,
+                             max_event_id: int, trace_id: str = None) -> int:
+        """
+        delete_period_events is a method that deletes the events of a period of the tenant in context once
+        they are archived
+
+        Args:
+            session (Session): SQLAlchemy session
+            occurred_from (datetime): The start of the period, included
+            occurred_to (datetime): The end of the period, excluded
+            max_event_id (int): The last position of the ledger to delete
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            int: The deleted events
+        """
+        pass
+
+    @abstractmethod
+    def get_snapshot(self, session: Session, aggregate_type: str, aggregate_id: str, trace_id: str = None
+                     ) -> Optional[TPBaseModelType]:
+        """
+        get_snapshot is a method that gets the stored state of an aggregate
+
+        Args:
+            session (Session): SQLAlchemy session
+            aggregate_type (str): 'module' or 'reference'
+            aggregate_id (str): The ID of the module or the reference
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[TPBaseModelType]: The snapshot, None when the aggregate has none
+        """
+        pass
+
+    @abstractmethod
+    def get_snapshots(self, session: Session, keys: list[tuple[str, str, str]], trace_id: str = None
+                      ) -> list[TPBaseModelType]:
+        """
+        get_snapshots is a method that gets the stored states of some aggregates of any tenant with one query
+
+        Args:
+            session (Session): SQLAlchemy session
+            keys (list[tuple[str, str, str]]): The tenant, type and ID of every aggregate
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The snapshots found
+        """
+        pass
+
+    @abstractmethod
+    def save_snapshots(self, session: Session, snapshots: list[TPBaseModelType], trace_id: str = None):
+        """
+        save_snapshots is a method that creates or replaces the stored states of some aggregates
+
+        Args:
+            session (Session): SQLAlchemy session
+            snapshots (list[TPBaseModelType]): The snapshots to save
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def delete_snapshots(self, session: Session, trace_id: str = None):
+        """
+        delete_snapshots is a method that deletes the snapshots of every tenant, before rebuilding them
+
+        Args:
+            session (Session): SQLAlchemy session
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def get_checkpoint(self, session: Session, projection: str, trace_id: str = None) -> int:
+        """
+        get_checkpoint is a method that gets the position of the last event processed by a projection
+
+        Args:
+            session (Session): SQLAlchemy session
+            projection (str): The name of the projection
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            int: The position, 0 when the projection never ran
+        """
+        pass
+
+    @abstractmethod
+    def save_checkpoint(self, session: Session, projection: str, last_event_id: int, trace_id: str = None):
+        """
+        save_checkpoint is a method that stores the position of the last event processed by a projection
+
+        Args:
+            session (Session): SQLAlchemy session
+            projection (str): The name of the projection
+            last_event_id (int): The position of the last processed event
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
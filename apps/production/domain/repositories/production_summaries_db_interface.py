@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional, TypeVar
+from sqlalchemy.orm import Session
+
+from shared.models import TPBaseModel
+
+TPBaseModelType = TypeVar("TPBaseModelType", bound=TPBaseModel)
+
+
+class ProductionSummariesDBInterface(ABC):
+    """
+    ProductionSummariesDBInterface is an interface that defines the methods of the daily summaries materialized
+    from the production ledger, per module and per person
+    """
+
+    @abstractmethod
+    def get_module_summaries(self, session: Session, keys: list[tuple[str, date, str]], trace_id: str = None
+                             ) -> list[TPBaseModelType]:
+        """
+        get_module_summaries is a method that gets the daily summaries of some modules of any tenant
+
+        Args:
+            session (Session): SQLAlchemy session
+            keys (list[tuple[str, date, str]]): The tenant, day and module of every summary
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The summaries found
+        """
+        pass
+
+    @abstractmethod
+    def get_person_summaries(self, session: Session, keys: list[tuple[str, date, str, str]],
+                             trace_id: str = None) -> list[TPBaseModelType]:
+        """
+        get_person_summaries is a method that gets the daily summaries of some people of any tenant
+
+        Args:
+            session (Session): SQLAlchemy session
+            keys (list[tuple[str, date, str, str]]): The tenant, day, module and person of every summary
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The summaries found
+        """
+        pass
+
+    @abstractmethod
+    def save_summaries(self, session: Session, module_summaries: list[TPBaseModelType],
+                       person_summaries: list[TPBaseModelType], trace_id: str = None):
+        """
+        save_summaries is a method that creates or replaces daily summaries. A summary is only replaced by one
+        that folded a later event, so saving the same batch twice leaves the same rows
+
+        Args:
+            session (Session): SQLAlchemy session
+            module_summaries (list[TPBaseModelType]): The summaries of the modules
+            person_summaries (list[TPBaseModelType]): The summaries of the people
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def delete_summaries(self, session: Session, trace_id: str = None):
+        """
+        delete_summaries is a method that deletes the daily summaries of every tenant
+
+        Args:
+            session (Session): SQLAlchemy session
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def get_module_summaries_between(self, session: Session, date_from: date, date_to: date,
+                                     module_id: Optional[str] = None, trace_id: str = None
+                                     ) -> list[TPBaseModelType]:
+        """
+        get_module_summaries_between is a method that gets the daily summaries of the modules of the tenant in
+        context in a period
+
+        Args:
+            session (Session): SQLAlchemy session
+            date_from (date): The first day, included
+            date_to (date): The last day, included
+            module_id (Optional[str]): The ID of the module to filter by
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The summaries by module and day
+        """
+        pass
+
+    @abstractmethod
+    def get_person_summaries_between(self, session: Session, date_from: date, date_to: date,
+                                     module_id: Optional[str] = None, trace_id: str = None
+                                     ) -> list[TPBaseModelType]:
+        """
+        get_person_summaries_between is a method that gets the daily summaries of the people of the tenant in
+        context in a period
+
+        Args:
+            session (Session): SQLAlchemy session
+            date_from (date): The first day, included
+            date_to (date): The last day, included
+            module_id (Optional[str]): The ID of the module to filter by
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: The summaries by module, person and day
+        """
+        pass
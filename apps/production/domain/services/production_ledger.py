@@ -0,0 +1,206 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry
+from apps.production.domain.entities.production_ledger_model import InsertProductionEventsModel, \
+    ProductionAggregateStateModel, ProductionAggregateType, ProductionEventType, ProductionEventsModel, \
+    ProductionRecordStateModel
+
+_EPSILON = 1e-9
+
+
+def _sum_entries(person_entries: list[PersonMinutesEntry]) -> tuple[float, float]:
+    return (sum(entry.minutes_worked for entry in person_entries),
+            sum(entry.produced_minutes for entry in person_entries))
+
+
+def _person_deltas(previous: list[PersonMinutesEntry], current: list[PersonMinutesEntry]
+                   ) -> list[PersonMinutesEntry]:
+    totals: dict[str, list[float]] = {}
+    for sign, entries in ((-1, previous), (1, current)):
+        for entry in entries:
+            person_totals = totals.setdefault(entry.person_id, [0.0, 0.0])
+            person_totals[0] += sign * entry.minutes_worked
+            person_totals[1] += sign * entry.produced_minutes
+    return [PersonMinutesEntry(person_id=person_id, minutes_worked=worked, produced_minutes=produced)
+            for person_id, (worked, produced) in totals.items()
+            if abs(worked) > _EPSILON or abs(produced) > _EPSILON]
+
+
+def build_logged_event(tenant_id: str, record_id: str, module_id: str, reference_id: str, time_slot_id: str,
+                       person_entries: list[PersonMinutesEntry], occurred_at: datetime,
+                       logged_by: Optional[str] = None, notes: Optional[str] = None) -> InsertProductionEventsModel:
+    """
+    Builds the first event of a production record.
+    """
+    worked_minutes, produced_minutes = _sum_entries(person_entries)
+    return InsertProductionEventsModel(
+        tenant_id=tenant_id, record_id=record_id, record_version=1, event_type=ProductionEventType.RECORD_LOGGED,
+        module_id=module_id, reference_id=reference_id, time_slot_id=time_slot_id,
+        worked_minutes=worked_minutes, produced_minutes=produced_minutes,
+        worked_minutes_delta=worked_minutes, produced_minutes_delta=produced_minutes,
+        person_entries=person_entries, person_deltas=_person_deltas([], person_entries),
+        logged_by=logged_by, notes=notes, occurred_at=occurred_at,
+    )
+
+
+def build_corrected_event(record: ProductionRecordStateModel, person_entries: list[PersonMinutesEntry],
+                          logged_by: Optional[str] = None, notes: Optional[str] = None
+                          ) -> InsertProductionEventsModel:
+    """
+    Builds the event that replaces the minutes of a record, storing the difference with its current state.
+    """
+    worked_minutes, produced_minutes = _sum_entries(person_entries)
+    return InsertProductionEventsModel(
+        tenant_id=record.tenant_id, record_id=record.record_id, record_version=record.version + 1,
+        event_type=ProductionEventType.RECORD_CORRECTED, module_id=record.module_id,
+        reference_id=record.reference_id, time_slot_id=record.time_slot_id,
+        worked_minutes=worked_minutes, produced_minutes=produced_minutes,
+        worked_minutes_delta=worked_minutes - record.worked_minutes,
+        produced_minutes_delta=produced_minutes - record.produced_minutes,
+        person_entries=person_entries, person_deltas=_person_deltas(record.person_entries, person_entries),
+        logged_by=logged_by, notes=notes, occurred_at=record.occurred_at,
+    )
+
+
+def build_voided_event(record: ProductionRecordStateModel, logged_by: Optional[str] = None,
+                       notes: Optional[str] = None) -> InsertProductionEventsModel:
+    """
+    Builds the event that cancels a record, subtracting everything it added.
+    """
+    return InsertProductionEventsModel(
+        tenant_id=record.tenant_id, record_id=record.record_id, record_version=record.version + 1,
+        event_type=ProductionEventType.RECORD_VOIDED, module_id=record.module_id,
+        reference_id=record.reference_id, time_slot_id=record.time_slot_id,
+        worked_minutes=0, produced_minutes=0,
+        worked_minutes_delta=-record.worked_minutes, produced_minutes_delta=-record.produced_minutes,
+        person_entries=[], person_deltas=_person_deltas(record.person_entries, []),
+        logged_by=logged_by, notes=notes, occurred_at=record.occurred_at,
+    )
+
+
+def fold_record(events: Iterable[ProductionEventsModel]) -> Optional[ProductionRecordStateModel]:
+    """
+    Folds the events of a record, in version order, into its current state.
+    """
+    record = None
+    for event in events:
+        record = ProductionRecordStateModel(
+            tenant_id=event.tenant_id, record_id=event.record_id, version=event.record_version,
+            module_id=event.module_id, reference_id=event.reference_id, time_slot_id=event.time_slot_id,
+            worked_minutes=event.worked_minutes, produced_minutes=event.produced_minutes,
+            person_entries=event.person_entries, voided=event.event_type == ProductionEventType.RECORD_VOIDED,
+            occurred_at=event.occurred_at,
+        )
+    return record
+
+
+def settled_prefix(events: list[ProductionEventsModel], settled_before: datetime) -> list[ProductionEventsModel]:
+    """
+    Returns the events, in ledger order, up to the first one appended after `settled_before`.
+
+    The ids are taken when the events are inserted but become visible when their transaction commits, so an
+    event can show up after events with greater ids. Once an event is older than the longest a transaction
+    appending events stays open, the transactions that took smaller ids have either committed, and their
+    events are visible, or rolled back, so nothing can appear below it any more.
+    """
+    for position, event in enumerate(events):
+        if event.recorded_at >= settled_before:
+            return events[:position]
+    return events
+
+
+def gapless_prefix(events: list[ProductionEventsModel], after_event_id: int, settled_before: datetime
+                   ) -> list[ProductionEventsModel]:
+    """
+    Returns the events of a page of the whole ledger, in ledger order, up to the first gap in the ids that a
+    transaction still open may fill.
+
+    A gap before an event older than `settled_before` is an id that was rolled back (or archived) and is
+    skipped, a gap before a newer event stops the page so the missing event is folded once it commits.
+    """
+    previous_id = after_event_id
+    for position, event in enumerate(events):
+        if event.id != previous_id + 1 and event.recorded_at >= settled_before:
+            return events[:position]
+        previous_id = event.id
+    return events
+
+
+class ProductionAggregate:
+    """
+    Production totals of a module or a reference, folded from the ledger events.
+
+    It is a plain mutable object so replaying millions of events does not validate a model per event; it is
+    converted to a ProductionAggregateStateModel at the edges.
+    """
+    __slots__ = ("tenant_id", "aggregate_type", "aggregate_id", "last_event_id", "records", "worked_minutes",
+                 "produced_minutes", "person_minutes", "last_occurred_at")
+
+    def __init__(self, tenant_id: str, aggregate_type: ProductionAggregateType, aggregate_id: str):
+        self.tenant_id = tenant_id
+        self.aggregate_type = aggregate_type
+        self.aggregate_id = aggregate_id
+        self.last_event_id = 0
+        self.records = 0
+        self.worked_minutes = 0.0
+        self.produced_minutes = 0.0
+        self.person_minutes: dict[str, list[float]] = {}
+        self.last_occurred_at: Optional[datetime] = None
+
+    @classmethod
+    def from_state(cls, state: ProductionAggregateStateModel) -> "ProductionAggregate":
+        aggregate = cls(state.tenant_id, state.aggregate_type, state.aggregate_id)
+        aggregate.last_event_id = state.last_event_id
+        aggregate.records = state.records
+        aggregate.worked_minutes = state.worked_minutes
+        aggregate.produced_minutes = state.produced_minutes
+        aggregate.person_minutes = {person_id: [entry.minutes_worked, entry.produced_minutes]
+                                    for person_id, entry in state.person_minutes.items()}
+        aggregate.last_occurred_at = state.last_occurred_at
+        return aggregate
+
+    def apply(self, event: ProductionEventsModel):
+        """
+        Adds the change of an event to the totals. Events already folded are ignored, so replays are idempotent.
+        """
+        if event.id <= self.last_event_id:
+            return
+        self.last_event_id = event.id
+        if event.event_type == ProductionEventType.RECORD_LOGGED:
+            self.records += 1
+        elif event.event_type == ProductionEventType.RECORD_VOIDED:
+            self.records -= 1
+        self.worked_minutes += event.worked_minutes_delta
+        self.produced_minutes += event.produced_minutes_delta
+        for delta in event.person_deltas:
+            person_totals = self.person_minutes.setdefault(delta.person_id, [0.0, 0.0])
+            person_totals[0] += delta.minutes_worked
+            person_totals[1] += delta.produced_minutes
+            if abs(person_totals[0]) <= _EPSILON and abs(person_totals[1]) <= _EPSILON:
+                del self.person_minutes[delta.person_id]
+        if event.event_type != ProductionEventType.RECORD_VOIDED and (
+                self.last_occurred_at is None or event.occurred_at > self.last_occurred_at):
+            self.last_occurred_at = event.occurred_at
+
+    def to_model(self) -> ProductionAggregateStateModel:
+        efficiency = None
+        if self.worked_minutes > _EPSILON:
+            efficiency = round(self.produced_minutes / self.worked_minutes * 100, 2)
+        return ProductionAggregateStateModel(
+            tenant_id=self.tenant_id, aggregate_type=self.aggregate_type, aggregate_id=self.aggregate_id,
+            last_event_id=self.last_event_id, records=self.records, worked_minutes=self.worked_minutes,
+            produced_minutes=self.produced_minutes, efficiency=efficiency,
+            person_minutes={person_id: PersonMinutesEntry(person_id=person_id, minutes_worked=worked,
+                                                          produced_minutes=produced)
+                            for person_id, (worked, produced) in self.person_minutes.items()},
+            last_occurred_at=self.last_occurred_at,
+        )
+
+
+def aggregate_keys(event: ProductionEventsModel) -> tuple[tuple[ProductionAggregateType, str], ...]:
+    """
+    Returns the aggregates changed by an event: its module and its reference.
+    """
+    return ((ProductionAggregateType.MODULE, event.module_id),
+            (ProductionAggregateType.REFERENCE, event.reference_id))
@@ -0,0 +1,46 @@
+from shared.exceptions import HandlerException
+
+
+class RecordProductionHandlerException(HandlerException):
+    """ Base exception for RecordProductionHandler """
+    pass
+
+
+class CorrectProductionRecordHandlerException(HandlerException):
+    """ Base exception for CorrectProductionRecordHandler """
+    pass
+
+
+class VoidProductionRecordHandlerException(HandlerException):
+    """ Base exception for VoidProductionRecordHandler """
+    pass
+
+
+class FetchProductionAggregateHandlerException(HandlerException):
+    """ Base exception for FetchProductionAggregateHandler """
+    pass
+
+
+class ProductionRecordNotFoundHandlerException(HandlerException):
+    """ Raised by the production handlers when the record does not exist """
+    pass
+
+
+class ProductionRecordConflictHandlerException(HandlerException):
+    """ Raised by the production handlers when the record changed since the version the client edited """
+    pass
+
+
+class ExportProductionReportHandlerException(HandlerException):
+    """ Base exception for ExportProductionReportHandler """
+    pass
+
+
+class FetchProductionDailySummariesHandlerException(HandlerException):
+    """ Base exception for FetchProductionDailySummariesHandler """
+    pass
+
+
+class RefreshProductionSummariesHandlerException(HandlerException):
+    """ Base exception for RefreshProductionSummariesHandler """
+    pass
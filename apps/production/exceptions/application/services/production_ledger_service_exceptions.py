@@ -0,0 +1,33 @@
+from pydantic import ValidationError
+
+from shared.exceptions import ServiceException
+
+
+class ProductionLedgerServiceException(ServiceException):
+    """ Base exception for the production ledger service."""
+    pass
+
+
+class ProductionLedgerServiceValidationException(ProductionLedgerServiceException, ValidationError):
+    """Raised when a production record validation error occurs."""
+    pass
+
+
+class ProductionLedgerServiceNotFoundException(ProductionLedgerServiceException):
+    """Raised when the production record does not exist."""
+    pass
+
+
+class ProductionLedgerServiceConflictException(ProductionLedgerServiceException):
+    """Raised when the production record changed since the version the client edited."""
+    pass
+
+
+class ProductionProjectionRunnerException(ServiceException):
+    """ Base exception for the production projection runner."""
+    pass
+
+
+class ProductionArchiveServiceException(ServiceException):
+    """ Base exception for the production archive service."""
+    pass
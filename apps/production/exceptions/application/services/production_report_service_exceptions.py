@@ -0,0 +1,11 @@
+from shared.exceptions import ServiceException
+
+
+class ProductionReportServiceException(ServiceException):
+    """ Base exception for the production report service."""
+    pass
+
+
+class ProductionReportServiceUnsupportedException(ProductionReportServiceException):
+    """Raised when a report or a file format cannot be exported."""
+    pass
@@ -0,0 +1,6 @@
+from shared.exceptions import ServiceException
+
+
+class ProductionSummaryServiceException(ServiceException):
+    """ Base exception for the production summary service."""
+    pass
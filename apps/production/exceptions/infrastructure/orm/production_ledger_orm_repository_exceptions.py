@@ -0,0 +1,16 @@
+from shared.exceptions import InfrastructureException
+
+
+class ProductionLedgerOrmRepositoryException(InfrastructureException):
+    """Base exception for Production Ledger ORM Repository errors."""
+    pass
+
+
+class ProductionLedgerOrmRepositoryDBException(ProductionLedgerOrmRepositoryException):
+    """Raised when there is a database error in the Production Ledger ORM Repository."""
+    pass
+
+
+class ProductionLedgerOrmRepositoryConcurrencyException(ProductionLedgerOrmRepositoryException):
+    """Raised when a version of a record was already appended by another request."""
+    pass
@@ -0,0 +1,11 @@
+from shared.exceptions import InfrastructureException
+
+
+class ProductionSummariesOrmRepositoryException(InfrastructureException):
+    """Base exception for Production Summaries ORM Repository errors."""
+    pass
+
+
+class ProductionSummariesOrmRepositoryDBException(ProductionSummariesOrmRepositoryException):
+    """Raised when there is a database error in the Production Summaries ORM Repository."""
+    pass
@@ -0,0 +1,11 @@
+from shared.exceptions import InfrastructureException
+
+
+class ProductionArchiveParquetRepositoryException(InfrastructureException):
+    """Base exception for Production Archive Parquet Repository errors."""
+    pass
+
+
+class ProductionArchiveParquetRepositoryIOException(ProductionArchiveParquetRepositoryException):
+    """Raised when a file of the archive cannot be read or written."""
+    pass
@@ -0,0 +1,141 @@
+# Standard library imports
+from flask import Blueprint, Response, jsonify, request, current_app, make_response
+from werkzeug.exceptions import Conflict, NotFound
+
+# Local application/library specific imports
+from apps.production.application.commands.correct_production_record_command import CorrectProductionRecordCommand
+from apps.production.application.commands.record_production_command import RecordProductionCommand
+from apps.production.application.commands.void_production_record_command import VoidProductionRecordCommand
+from apps.production.application.queries.export_production_report_query import ExportProductionReportQuery
+from apps.production.application.queries.fetch_production_aggregate_query import FetchProductionAggregateQuery
+from apps.production.application.queries.fetch_production_daily_summaries_query import \
+    FetchProductionDailySummariesQuery
+from apps.production.exceptions.application.handlers.production_handlers_exceptions import \
+    ProductionRecordConflictHandlerException, ProductionRecordNotFoundHandlerException
+from apps.production.infrastructure.adapters.primary.framework.validator.production_validator import \
+    CorrectProductionRecordValidator, ExportProductionReportValidator, GetProductionAggregateValidator, \
+    GetProductionDailySummariesValidator, RecordProductionValidator, VoidProductionRecordValidator
+from shared.constants import PRODUCTION_EVENTS_CACHE_NAMESPACE, PRODUCTION_MODULE_SUMMARIES_CACHE_NAMESPACE, \
+    PRODUCTION_PERSON_SUMMARIES_CACHE_NAMESPACE, PRODUCTION_RESPONSES_CACHE_SECONDS
+from shared.decorators import cache_response, handle_exceptions, token_required
+from shared.tabular import TABULAR_MEDIA_TYPES
+from shared.tenancy import get_current_tenant_id
+from shared.tracing import trace_span
+
+
+# Create a new Blueprint for the production ledger
+production_blueprint = Blueprint('production', __name__)
+ORIGIN = 'production_urls'
+
+
+def _validate(validator, **data):
+    """
+    Validates the parameters of a request in a span of its trace.
+    """
+    with trace_span(f"validate {validator.__name__}"):
+        return validator(**data)
+
+
+def _execute(command):
+    """
+    Dispatches a ledger command, translating the missing and stale records to their HTTP errors.
+    """
+    try:
+        return current_app.config['command_bus'].execute(command)
+    except ProductionRecordNotFoundHandlerException as e:
+        raise NotFound(description=str(e))
+    except ProductionRecordConflictHandlerException as e:
+        raise Conflict(description=str(e))
+
+
+@production_blueprint.route('/production/records', methods=['POST'])
+@handle_exceptions
+@token_required
+def record_production(payload):
+    """
+    Log a production record of a module in a time slot.
+    """
+    validated_model = _validate(RecordProductionValidator, tenantId=get_current_tenant_id(),
+                                **(request.get_json(silent=True) or {}))
+    event = _execute(RecordProductionCommand(**validated_model.model_dump(), logged_by=payload.get('sub')))
+    return make_response(jsonify(event), 201)
+
+
+@production_blueprint.route('/production/records/<record_id>', methods=['PUT'])
+@handle_exceptions
+@token_required
+def correct_production_record(payload, record_id):
+    """
+    Replace the minutes of a production record.
+
+    The ledger keeps the previous versions, the request must send the version it edited and gets a 409 when
+    the record changed in the meantime.
+    """
+    validated_model = _validate(CorrectProductionRecordValidator, tenantId=get_current_tenant_id(),
+                                recordId=record_id, **(request.get_json(silent=True) or {}))
+    event = _execute(CorrectProductionRecordCommand(**validated_model.model_dump(), logged_by=payload.get('sub')))
+    return make_response(jsonify(event), 200)
+
+
+@production_blueprint.route('/production/records/<record_id>', methods=['DELETE'])
+@handle_exceptions
+@token_required
+def void_production_record(payload, record_id):
+    """
+    Void a production record, subtracting its minutes from the totals of its module and reference.
+    """
+    validated_model = _validate(VoidProductionRecordValidator, tenantId=get_current_tenant_id(),
+                                recordId=record_id, **request.args.to_dict())
+    event = _execute(VoidProductionRecordCommand(**validated_model.model_dump(), logged_by=payload.get('sub')))
+    return make_response(jsonify(event), 200)
+
+
+@production_blueprint.route('/production/aggregates/<aggregate_type>/<aggregate_id>', methods=['GET'])
+@handle_exceptions
+@token_required
+@cache_response(namespaces=(PRODUCTION_EVENTS_CACHE_NAMESPACE,), ttl_seconds=PRODUCTION_RESPONSES_CACHE_SECONDS)
+def get_production_aggregate(payload, aggregate_type, aggregate_id):
+    """
+    Get the production totals of a module or a reference, rebuilt from its last snapshot.
+    """
+    validated_model = _validate(GetProductionAggregateValidator, tenantId=get_current_tenant_id(),
+                                aggregateType=aggregate_type, aggregateId=aggregate_id)
+    state = current_app.config['query_bus'].ask(FetchProductionAggregateQuery(**validated_model.model_dump()))
+    return make_response(jsonify(state), 200)
+
+
+@production_blueprint.route('/production/summaries/daily/<summary>', methods=['GET'])
+@handle_exceptions
+@token_required
+@cache_response(namespaces=(PRODUCTION_MODULE_SUMMARIES_CACHE_NAMESPACE, PRODUCTION_PERSON_SUMMARIES_CACHE_NAMESPACE),
+                ttl_seconds=PRODUCTION_RESPONSES_CACHE_SECONDS)
+def get_production_daily_summaries(payload, summary):
+    """
+    Get the production totals per day of the modules or of the people in a period.
+
+    The totals are materialized in the background, a range reads one row per module (or person) and day.
+    The days are UTC days: a record counts in the UTC day its production happened.
+    """
+    validated_model = _validate(GetProductionDailySummariesValidator, tenantId=get_current_tenant_id(),
+                                summary=summary, **request.args.to_dict())
+    summaries = current_app.config['query_bus'].ask(
+        FetchProductionDailySummariesQuery(**validated_model.model_dump()))
+    return make_response(jsonify(summaries), 200)
+
+
+@production_blueprint.route('/production/reports/<report>', methods=['GET'])
+@handle_exceptions
+@token_required
+def export_production_report(payload, report):
+    """
+    Download a production report of a period as a CSV, Excel or Parquet file.
+
+    The file is streamed while the records are read, so its size is not bounded by the memory of the worker.
+    """
+    validated_model = _validate(ExportProductionReportValidator, tenantId=get_current_tenant_id(),
+                                report=report, **request.args.to_dict())
+    chunks = current_app.config['query_bus'].ask(ExportProductionReportQuery(**validated_model.model_dump()))
+    file_name = (f"production-{validated_model.report}-{validated_model.date_from.isoformat()}-"
+                 f"{validated_model.date_to.isoformat()}.{validated_model.file_format}")
+    return Response(chunks, content_type=TABULAR_MEDIA_TYPES[validated_model.file_format],
+                    headers={'Content-Disposition': f'attachment; filename="{file_name}"'})
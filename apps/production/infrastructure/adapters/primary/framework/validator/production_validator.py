@@ -0,0 +1,212 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from shared.constants import EXPORT_FORMAT_CSV, EXPORT_FORMAT_PARQUET, EXPORT_FORMAT_XLSX, \
+    PRODUCTION_AGGREGATE_MODULE, PRODUCTION_AGGREGATE_REFERENCE, PRODUCTION_REPORT_PEOPLE, PRODUCTION_REPORT_RECORDS, \
+    PRODUCTION_SUMMARY_MODULES, PRODUCTION_SUMMARY_PEOPLE
+from shared.tabular import TabularFileException, check_export_format
+
+# Longest period of a summaries request, a year of days
+MAX_SUMMARY_DAYS = 366
+
+
+def _check_tenant(value):
+    if not value or not value.strip():
+        raise ValueError("El token no pertenece a ningún tenant")
+    return value
+
+
+class PersonMinutesValidator(BaseModel):
+    """
+    PersonMinutesValidator: Entity to represent the minutes of a person in a production record.
+
+    Class Attributes:
+        personId (str): The ID of the person.
+        minutesWorked (float): The minutes the person was present in the module.
+        producedMinutes (float): The standard minutes produced by the person.
+    """
+    person_id: str = Field(..., alias='personId')
+    minutes_worked: float = Field(..., alias='minutesWorked', ge=0)
+    produced_minutes: float = Field(0, alias='producedMinutes', ge=0)
+
+
+class RecordProductionValidator(BaseModel):
+    """
+    RecordProductionValidator: Entity to represent the logging of a production record.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        recordId (Optional[str]): The ID of the record, sent by clients that retry the request.
+        moduleId (str): The ID of the module.
+        referenceId (str): The ID of the reference.
+        timeSlotId (str): The ID of the time slot.
+        personEntries (list[PersonMinutesValidator]): The minutes per person.
+        notes (Optional[str]): The notes of the record.
+        occurredAt (Optional[datetime]): The date the production happened.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    record_id: Optional[str] = Field(None, alias='recordId')
+    module_id: str = Field(..., alias='moduleId', min_length=1)
+    reference_id: str = Field(..., alias='referenceId', min_length=1)
+    time_slot_id: str = Field(..., alias='timeSlotId', min_length=1)
+    person_entries: list[PersonMinutesValidator] = Field(..., alias='personEntries', min_length=1)
+    notes: Optional[str] = Field(None, alias='notes')
+    occurred_at: Optional[datetime] = Field(None, alias='occurredAt')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        return _check_tenant(value)
+
+
+class CorrectProductionRecordValidator(BaseModel):
+    """
+    CorrectProductionRecordValidator: Entity to represent the correction of a production record.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        recordId (str): The ID of the record, taken from the URL.
+        expectedVersion (int): The version of the record the client edited.
+        personEntries (list[PersonMinutesValidator]): The new minutes per person.
+        notes (Optional[str]): The notes of the correction.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    record_id: str = Field(..., alias='recordId')
+    expected_version: int = Field(..., alias='expectedVersion', ge=1)
+    person_entries: list[PersonMinutesValidator] = Field(..., alias='personEntries', min_length=1)
+    notes: Optional[str] = Field(None, alias='notes')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        return _check_tenant(value)
+
+
+class VoidProductionRecordValidator(BaseModel):
+    """
+    VoidProductionRecordValidator: Entity to represent the cancellation of a production record.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        recordId (str): The ID of the record, taken from the URL.
+        expectedVersion (int): The version of the record the client voided.
+        notes (Optional[str]): The reason of the cancellation.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    record_id: str = Field(..., alias='recordId')
+    expected_version: int = Field(..., alias='expectedVersion', ge=1)
+    notes: Optional[str] = Field(None, alias='notes')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        return _check_tenant(value)
+
+
+class GetProductionAggregateValidator(BaseModel):
+    """
+    GetProductionAggregateValidator: Entity to represent the request of the totals of a module or a reference.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        aggregateType (str): 'module' or 'reference'.
+        aggregateId (str): The ID of the module or the reference.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    aggregate_type: str = Field(..., alias='aggregateType')
+    aggregate_id: str = Field(..., alias='aggregateId')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        return _check_tenant(value)
+
+    @field_validator('aggregate_type')
+    def check_aggregate_type(cls, value):
+        if value not in (PRODUCTION_AGGREGATE_MODULE, PRODUCTION_AGGREGATE_REFERENCE):
+            raise ValueError(f"El tipo de agregado debe ser '{PRODUCTION_AGGREGATE_MODULE}' o "
+                             f"'{PRODUCTION_AGGREGATE_REFERENCE}'")
+        return value
+
+
+class ExportProductionReportValidator(BaseModel):
+    """
+    ExportProductionReportValidator: Entity to represent the request of a production report file.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        report (str): 'records' for a row per record or 'people' for a row per person and record.
+        format (str): 'csv', 'xlsx' or 'parquet'. Defaults to 'csv'.
+        dateFrom (date): The first day of the report.
+        dateTo (date): The last day of the report, included.
+        moduleId (Optional[str]): The ID of the module to filter by.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    report: str = Field(..., alias='report')
+    file_format: str = Field(EXPORT_FORMAT_CSV, alias='format')
+    date_from: date = Field(..., alias='dateFrom')
+    date_to: date = Field(..., alias='dateTo')
+    module_id: Optional[str] = Field(None, alias='moduleId')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        return _check_tenant(value)
+
+    @field_validator('report')
+    def check_report(cls, value):
+        if value not in (PRODUCTION_REPORT_RECORDS, PRODUCTION_REPORT_PEOPLE):
+            raise ValueError(f"El informe debe ser '{PRODUCTION_REPORT_RECORDS}' o '{PRODUCTION_REPORT_PEOPLE}'")
+        return value
+
+    @field_validator('file_format')
+    def check_format(cls, value):
+        if value not in (EXPORT_FORMAT_CSV, EXPORT_FORMAT_XLSX, EXPORT_FORMAT_PARQUET):
+            raise ValueError(f"El formato debe ser '{EXPORT_FORMAT_CSV}', '{EXPORT_FORMAT_XLSX}' o "
+                             f"'{EXPORT_FORMAT_PARQUET}'")
+        try:
+            check_export_format(value)
+        except TabularFileException:
+            raise ValueError(f"El formato '{value}' no está disponible en este servidor")
+        return value
+
+    @field_validator('date_to')
+    def check_period(cls, value, info):
+        date_from = info.data.get('date_from')
+        if date_from is not None and value < date_from:
+            raise ValueError("La fecha 'dateTo' no puede ser anterior a 'dateFrom'")
+        return value
+
+
+class GetProductionDailySummariesValidator(BaseModel):
+    """
+    GetProductionDailySummariesValidator: Entity to represent the request of the daily summaries of a period.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        summary (str): 'modules' for a row per module and day or 'people' for a row per person, module and day.
+        dateFrom (date): The first UTC day of the period.
+        dateTo (date): The last UTC day of the period, included.
+        moduleId (Optional[str]): The ID of the module to filter by.
+    """
+    tenant_id: str = Field(None, alias='tenantId')
+    summary: str = Field(..., alias='summary')
+    date_from: date = Field(..., alias='dateFrom')
+    date_to: date = Field(..., alias='dateTo')
+    module_id: Optional[str] = Field(None, alias='moduleId')
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        return _check_tenant(value)
+
+    @field_validator('summary')
+    def check_summary(cls, value):
+        if value not in (PRODUCTION_SUMMARY_MODULES, PRODUCTION_SUMMARY_PEOPLE):
+            raise ValueError(f"El resumen debe ser '{PRODUCTION_SUMMARY_MODULES}' o '{PRODUCTION_SUMMARY_PEOPLE}'")
+        return value
+
+    @field_validator('date_to')
+    def check_period(cls, value, info):
+        date_from = info.data.get('date_from')
+        if date_from is not None and value < date_from:
+            raise ValueError("La fecha 'dateTo' no puede ser anterior a 'dateFrom'")
+        if date_from is not None and (value - date_from).days >= MAX_SUMMARY_DAYS:
+            raise ValueError(f"El periodo no puede superar los {MAX_SUMMARY_DAYS} días")
+        return value
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, String, Date, DateTime, Float, Integer, func
+from shared.models import TextileProBaseOrmModel
+
+
+class DailyPersonSummaryOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the daily_person_summary table, the minutes of every person in every module per day
+    materialized from the ledger.
+
+    Class Attributes:
+        module_id (Column): ID of the module.
+        summary_date (Column): Day the production happened, in UTC.
+        person_id (Column): ID of the person.
+        worked_minutes (Column): Minutes worked.
+        produced_minutes (Column): Standard minutes produced.
+        last_event_id (Column): Position of the last event folded into the row.
+        updated_at (Column): Date of the last refresh of the row.
+    """
+
+    __tablename__ = "daily_person_summary"
+    __tenant_indexes__ = (("summary_date",), ("person_id", "summary_date"))
+    __tenant_unique__ = (("module_id", "summary_date", "person_id"),)
+    module_id = Column(String(100), nullable=False)
+    summary_date = Column(Date, nullable=False)
+    person_id = Column(String(100), nullable=False)
+    worked_minutes = Column(Float, nullable=False, default=0)
+    produced_minutes = Column(Float, nullable=False, default=0)
+    last_event_id = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
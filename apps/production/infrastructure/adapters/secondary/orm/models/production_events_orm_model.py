@@ -0,0 +1,49 @@
+from sqlalchemy import Column, String, DateTime, Float, Integer, Text, func
+from shared.models import TextileProBaseOrmModel
+
+
+class ProductionEventsOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the production_events table, the append-only production ledger.
+
+    Rows are only inserted. The id is the position of the event in the ledger and (record_id, record_version)
+    is unique per tenant, which makes concurrent edits of a record fail instead of overwriting each other.
+
+    Class Attributes:
+        record_id (Column): ID of the production record.
+        record_version (Column): Version of the record after the event.
+        event_type (Column): Type of the event, using ProductionEventType enum.
+        module_id (Column): ID of the module.
+        reference_id (Column): ID of the reference.
+        time_slot_id (Column): ID of the time slot.
+        worked_minutes (Column): Minutes worked by the record after the event.
+        produced_minutes (Column): Standard minutes produced by the record after the event.
+        worked_minutes_delta (Column): Change of the worked minutes made by the event.
+        produced_minutes_delta (Column): Change of the produced minutes made by the event.
+        person_entries (Column): JSON list of the minutes per person after the event.
+        person_deltas (Column): JSON list of the change of the minutes per person.
+        logged_by (Column): User that logged the event.
+        notes (Column): Notes of the record.
+        occurred_at (Column): Date the production happened.
+        recorded_at (Column): Date the event was appended.
+    """
+
+    __tablename__ = "production_events"
+    __tenant_indexes__ = (("module_id", "id"), ("reference_id", "id"), ("occurred_at", "id"))
+    __tenant_unique__ = (("record_id", "record_version"),)
+    record_id = Column(String(100), nullable=False)
+    record_version = Column(Integer, nullable=False)
+    event_type = Column(String(30), nullable=False)
+    module_id = Column(String(100), nullable=False)
+    reference_id = Column(String(100), nullable=False)
+    time_slot_id = Column(String(100), nullable=False)
+    worked_minutes = Column(Float, nullable=False)
+    produced_minutes = Column(Float, nullable=False)
+    worked_minutes_delta = Column(Float, nullable=False)
+    produced_minutes_delta = Column(Float, nullable=False)
+    person_entries = Column(Text, nullable=False)
+    person_deltas = Column(Text, nullable=False)
+    logged_by = Column(String(255), nullable=True)
+    notes = Column(String(500), nullable=True)
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, func
+from shared.models import TextileProBaseOrmModel
+
+
+class ProductionSnapshotsOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the production_snapshots table, the last stored state of every module and reference.
+
+    Class Attributes:
+        aggregate_type (Column): 'module' or 'reference', using ProductionAggregateType enum.
+        aggregate_id (Column): ID of the module or the reference.
+        last_event_id (Column): Position of the last event folded into the state.
+        state (Column): JSON state of the aggregate.
+        updated_at (Column): Date the snapshot was taken.
+    """
+
+    __tablename__ = "production_snapshots"
+    __tenant_unique__ = (("aggregate_type", "aggregate_id"),)
+    aggregate_type = Column(String(20), nullable=False)
+    aggregate_id = Column(String(100), nullable=False)
+    last_event_id = Column(Integer, nullable=False)
+    state = Column(Text, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, String, DateTime, Integer, func
+from shared.models.base_orm_model import Base
+
+
+class ProjectionCheckpointsOrmModel(Base):
+    """
+    SQLAlchemy model for the projection_checkpoints table.
+
+    Projections read the ledger of every tenant in order, so their checkpoints are global and the table is not
+    tenant-scoped.
+
+    Class Attributes:
+        name (Column): Name of the projection.
+        last_event_id (Column): Position of the last event processed by the projection.
+        updated_at (Column): Date of the last processed batch.
+    """
+
+    __tablename__ = "projection_checkpoints"
+    name = Column(String(100), primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
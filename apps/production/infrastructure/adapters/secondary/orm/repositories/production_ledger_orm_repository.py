@@ -0,0 +1,624 @@
+import json
+import uuid
+from datetime import datetime, UTC
+from typing import Iterator, Optional
+
+import orjson
+from sqlalchemy import delete, exists, func, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, aliased
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry
+from apps.production.domain.entities.production_ledger_model import InsertProductionEventsModel, \
+    ProductionAggregateType, ProductionEventType, ProductionEventsModel, ProductionSnapshotsModel
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.production.exceptions.infrastructure.orm.production_ledger_orm_repository_exceptions import \
+    ProductionLedgerOrmRepositoryException, ProductionLedgerOrmRepositoryDBException, \
+    ProductionLedgerOrmRepositoryConcurrencyException
+from apps.production.infrastructure.adapters.secondary.orm.models.production_events_orm_model import \
+    ProductionEventsOrmModel
+from apps.production.infrastructure.adapters.secondary.orm.models.production_snapshots_orm_model import \
+    ProductionSnapshotsOrmModel
+from apps.production.infrastructure.adapters.secondary.orm.models.projection_checkpoints_orm_model import \
+    ProjectionCheckpointsOrmModel
+from shared.constants import PRODUCTION_AGGREGATE_MODULE, PRODUCTION_SERVICE
+from shared.logger import LoggerService
+from shared.tenancy import INCLUDE_ALL_TENANTS
+
+_EVENT_COLUMNS = (
+    ProductionEventsOrmModel.id, ProductionEventsOrmModel.uuid, ProductionEventsOrmModel.tenant_id,
+    ProductionEventsOrmModel.record_id, ProductionEventsOrmModel.record_version, ProductionEventsOrmModel.event_type,
+    ProductionEventsOrmModel.module_id, ProductionEventsOrmModel.reference_id, ProductionEventsOrmModel.time_slot_id,
+    ProductionEventsOrmModel.worked_minutes, ProductionEventsOrmModel.produced_minutes,
+    ProductionEventsOrmModel.worked_minutes_delta, ProductionEventsOrmModel.produced_minutes_delta,
+    ProductionEventsOrmModel.person_entries, ProductionEventsOrmModel.person_deltas,
+    ProductionEventsOrmModel.logged_by, ProductionEventsOrmModel.notes, ProductionEventsOrmModel.occurred_at,
+    ProductionEventsOrmModel.recorded_at,
+)
+
+
+class ProductionLedgerOrmRepository(ProductionLedgerDBInterface):
+
+    def __init__(self):
+        """
+        Constructor for the ProductionLedgerOrmRepository class.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+
+    @staticmethod
+    def _to_db_values(model) -> dict:
+        return {k: (v.value if hasattr(v, 'value') else v) for k, v in model.to_db_dict().items()}
+
+    @staticmethod
+    def _person_entries(value: str) -> list[PersonMinutesEntry]:
+        return [PersonMinutesEntry.model_construct(**entry) for entry in orjson.loads(value)]
+
+    @classmethod
+    def _row_to_event(cls, row) -> ProductionEventsModel:
+        """
+        Builds an event from a trusted ledger row without validating it, replays build millions of them.
+        """
+        return cls._values_to_event(row._asdict())
+
+    @classmethod
+    def _values_to_event(cls, values: dict) -> ProductionEventsModel:
+        values['event_type'] = ProductionEventType(values['event_type'])
+        values['person_entries'] = cls._person_entries(values['person_entries'])
+        values['person_deltas'] = cls._person_entries(values['person_deltas'])
+        for key in ('occurred_at', 'recorded_at'):
+            if values[key].tzinfo is None:
+                values[key] = values[key].replace(tzinfo=UTC)
+        return ProductionEventsModel.model_construct(**values)
+
+    def append_events(self, session: Session, events: list[InsertProductionEventsModel], trace_id: str = None
+                      ) -> list[ProductionEventsModel]:
+        """
+        Appends events to the ledger.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            events (list[InsertProductionEventsModel]): The events to append.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[ProductionEventsModel]: The appended events with their position in the ledger.
+
+        Raises:
+            ProductionLedgerOrmRepositoryConcurrencyException: If a version of a record was already appended.
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            events_to_insert = [ProductionEventsOrmModel(**self._to_db_values(event)) for event in events]
+            session.add_all(events_to_insert)
+            session.flush()
+            return [ProductionEventsModel(**event.__dict__) for event in events_to_insert]
+        except IntegrityError as e:
+            error_message = "The production record was modified by another request"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryConcurrencyException(error_message) from e
+        except SQLAlchemyError as e:
+            error_message = "Database error appending production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error appending production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def get_record_events(self, session: Session, record_id: str, trace_id: str = None
+                          ) -> list[ProductionEventsModel]:
+        """
+        Retrieves the events of a record in version order.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            record_id (str): The ID of the record.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[ProductionEventsModel]: The events of the record.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            events_query = session.execute(
+                select(*_EVENT_COLUMNS)
+                .where(ProductionEventsOrmModel.record_id == record_id)
+                .order_by(ProductionEventsOrmModel.record_version)
+            )
+            return [self._row_to_event(row) for row in events_query]
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting the events of record {record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting the events of record {record_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def get_aggregate_events(self, session: Session, aggregate_type: str, aggregate_id: str,
+                             after_event_id: int = 0, trace_id: str = None) -> list[ProductionEventsModel]:
+        """
+        Retrieves the events of a module or a reference after a position, using the (tenant, module_id, id) or
+        (tenant, reference_id, id) index.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            aggregate_type (str): 'module' or 'reference'.
+            aggregate_id (str): The ID of the module or the reference.
+            after_event_id (int): The position of the last event already folded.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[ProductionEventsModel]: The events in ledger order.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        aggregate_column = (ProductionEventsOrmModel.module_id if aggregate_type == PRODUCTION_AGGREGATE_MODULE
+                            else ProductionEventsOrmModel.reference_id)
+        try:
+            events_query = session.execute(
+                select(*_EVENT_COLUMNS)
+                .where(aggregate_column == aggregate_id, ProductionEventsOrmModel.id > after_event_id)
+                .order_by(ProductionEventsOrmModel.id)
+            )
+            return [self._row_to_event(row) for row in events_query]
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting the events of {aggregate_type} {aggregate_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting the events of {aggregate_type} {aggregate_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def get_events_batch(self, session: Session, after_event_id: int, limit: int, trace_id: str = None
+                         ) -> list[ProductionEventsModel]:
+        """
+        Retrieves the next events of the ledger of every tenant, paginating on the primary key.
+
+        The ids are taken at insert time and the rows become visible at commit, so the page can skip the event
+        of a transaction still open; callers moving a checkpoint keep the `gapless_prefix` of the page.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            after_event_id (int): The position of the last event already processed.
+            limit (int): The maximum events to get.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[ProductionEventsModel]: The events in ledger order.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            events_query = session.execute(
+                select(*_EVENT_COLUMNS)
+                .where(ProductionEventsOrmModel.id > after_event_id)
+                .order_by(ProductionEventsOrmModel.id)
+                .limit(limit)
+                .execution_options(**{INCLUDE_ALL_TENANTS: True})
+            )
+            return [self._row_to_event(row) for row in events_query]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting a batch of production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting a batch of production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def iter_current_records(self, session: Session, occurred_from: datetime, occurred_to: datetime,
+                             module_id: Optional[str] = None, fetch_size: int = 1000, trace_id: str = None
+                             ) -> Iterator[ProductionEventsModel]:
+        """
+        Streams the last version of the records that happened in a period, skipping the voided ones.
+
+        The query runs before returning and its rows are fetched `fetch_size` at a time, through a
+        server-side cursor on the databases that support it, so a report never holds the whole period in
+        memory. The later versions are looked up on the (tenant_id, record_id, record_version) unique index.
+
+        Args:
+            session (Session): SQLAlchemy session, it must stay open while the records are read.
+            occurred_from (datetime): The start of the period, included.
+            occurred_to (datetime): The end of the period, excluded.
+            module_id (Optional[str]): The ID of the module to filter by.
+            fetch_size (int): The rows fetched from the database at a time. Defaults to 1000.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Iterator[ProductionEventsModel]: The events of the last version of every record, by date.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        later = aliased(ProductionEventsOrmModel)
+        filters = [
+            ProductionEventsOrmModel.occurred_at >= occurred_from,
+            ProductionEventsOrmModel.occurred_at < occurred_to,
+            ProductionEventsOrmModel.event_type != ProductionEventType.RECORD_VOIDED.value,
+            ~exists().where(later.tenant_id == ProductionEventsOrmModel.tenant_id,
+                            later.record_id == ProductionEventsOrmModel.record_id,
+                            later.record_version > ProductionEventsOrmModel.record_version),
+        ]
+        if module_id is not None:
+            filters.append(ProductionEventsOrmModel.module_id == module_id)
+        try:
+            records_query = session.execute(
+                select(*_EVENT_COLUMNS)
+                .where(*filters)
+                .order_by(ProductionEventsOrmModel.occurred_at, ProductionEventsOrmModel.id)
+                .execution_options(yield_per=fetch_size)
+            )
+        except SQLAlchemyError as e:
+            error_message = "Database error getting the production records of a report"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting the production records of a report"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+        return self._iter_events(records_query, trace_id)
+
+    def _iter_events(self, rows, trace_id: str = None) -> Iterator[ProductionEventsModel]:
+        try:
+            for row in rows:
+                yield self._row_to_event(row)
+        except SQLAlchemyError as e:
+            error_message = "Database error reading the production records of a report"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+
+    def get_archivable_tenants(self, session: Session, occurred_before: datetime, max_event_id: int,
+                               trace_id: str = None) -> dict[str, datetime]:
+        """
+        Retrieves the tenants with events older than a date and the date of their oldest one, across every
+        tenant.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            occurred_before (datetime): The date the events must be older than.
+            max_event_id (int): The last position of the ledger that can be archived.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            dict[str, datetime]: The date of the oldest archivable event of every tenant.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            tenants_query = session.execute(
+                select(ProductionEventsOrmModel.tenant_id, func.min(ProductionEventsOrmModel.occurred_at))
+                .where(ProductionEventsOrmModel.occurred_at < occurred_before,
+                       ProductionEventsOrmModel.id <= max_event_id)
+                .group_by(ProductionEventsOrmModel.tenant_id)
+                .execution_options(**{INCLUDE_ALL_TENANTS: True})
+            )
+            return {tenant_id: (oldest if oldest.tzinfo else oldest.replace(tzinfo=UTC))
+                    for tenant_id, oldest in tenants_query}
+        except SQLAlchemyError as e:
+            error_message = "Database error getting the tenants with archivable production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting the tenants with archivable production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def iter_period_events(self, session: Session, occurred_from: datetime, occurred_to: datetime,
+                           max_event_id: int, fetch_size: int = 1000, trace_id: str = None
+                           ) -> Iterator[tuple[ProductionEventsModel, bool]]:
+        """
+        Streams every event of a period of the tenant in context, flagging the last version of every record,
+        which is what the reports read from the archive.
+
+        Args:
+            session (Session): SQLAlchemy session, it must stay open while the events are read.
+            occurred_from (datetime): The start of the period, included.
+            occurred_to (datetime): The end of the period, excluded.
+            max_event_id (int): The last position of the ledger to read.
+            fetch_size (int): The rows fetched from the database at a time. Defaults to 1000.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Iterator[tuple[ProductionEventsModel, bool]]: The events by date and whether they are current.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        later = aliased(ProductionEventsOrmModel)
+        is_current = (~exists().where(later.tenant_id == ProductionEventsOrmModel.tenant_id,
+                                      later.record_id == ProductionEventsOrmModel.record_id,
+                                      later.record_version > ProductionEventsOrmModel.record_version)
+                      ).label('is_current')
+        try:
+            events_query = session.execute(
+                select(*_EVENT_COLUMNS, is_current)
+                .where(ProductionEventsOrmModel.occurred_at >= occurred_from,
+                       ProductionEventsOrmModel.occurred_at < occurred_to,
+                       ProductionEventsOrmModel.id <= max_event_id)
+                .order_by(ProductionEventsOrmModel.occurred_at, ProductionEventsOrmModel.id)
+                .execution_options(yield_per=fetch_size)
+            )
+        except SQLAlchemyError as e:
+            error_message = "Database error getting the production events of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting the production events of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+        return self._iter_flagged_events(events_query, trace_id)
+
+    def _iter_flagged_events(self, rows, trace_id: str = None) -> Iterator[tuple[ProductionEventsModel, bool]]:
+        try:
+            for row in rows:
+                values = row._asdict()
+                current = bool(values.pop('is_current'))
+                yield self._values_to_event(values), current
+        except SQLAlchemyError as e:
+            error_message = "Database error reading the production events of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+
+    def delete_period_events(self, session: Session, occurred_from: datetime, occurred_to: datetime,
+                             max_event_id: int, trace_id: str = None) -> int:
+        """
+        Deletes the events of a period of the tenant in context once they are in the archive.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            occurred_from (datetime): The start of the period, included.
+            occurred_to (datetime): The end of the period, excluded.
+            max_event_id (int): The last position of the ledger to delete.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            int: The deleted events.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            return session.execute(
+                delete(ProductionEventsOrmModel)
+                .where(ProductionEventsOrmModel.occurred_at >= occurred_from,
+                       ProductionEventsOrmModel.occurred_at < occurred_to,
+                       ProductionEventsOrmModel.id <= max_event_id)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+        except SQLAlchemyError as e:
+            error_message = "Database error deleting the archived production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error deleting the archived production events"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def get_snapshot(self, session: Session, aggregate_type: str, aggregate_id: str, trace_id: str = None
+                     ) -> Optional[ProductionSnapshotsModel]:
+        """
+        Retrieves the stored state of an aggregate.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            aggregate_type (str): 'module' or 'reference'.
+            aggregate_id (str): The ID of the module or the reference.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Optional[ProductionSnapshotsModel]: The snapshot, None when the aggregate has none.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            snapshot = (
+                session.query(ProductionSnapshotsOrmModel)
+                .filter_by(aggregate_type=aggregate_type, aggregate_id=aggregate_id)
+                .first()
+            )
+            return self._to_snapshot(snapshot) if snapshot is not None else None
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting the snapshot of {aggregate_type} {aggregate_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting the snapshot of {aggregate_type} {aggregate_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def get_snapshots(self, session: Session, keys: list[tuple[str, str, str]], trace_id: str = None
+                      ) -> list[ProductionSnapshotsModel]:
+        """
+        Retrieves the stored states of some aggregates of any tenant with one query.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            keys (list[tuple[str, str, str]]): The tenant, type and ID of every aggregate.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[ProductionSnapshotsModel]: The snapshots found.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        if not keys:
+            return []
+        try:
+            wanted = set(keys)
+            return [
+                self._to_snapshot(row) for row in self._query_snapshots(session, keys)
+                if (row.tenant_id, row.aggregate_type, row.aggregate_id) in wanted
+            ]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting production snapshots"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting production snapshots"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    @staticmethod
+    def _query_snapshots(session: Session, keys) -> list[ProductionSnapshotsOrmModel]:
+        return (
+            session.query(ProductionSnapshotsOrmModel)
+            .filter(ProductionSnapshotsOrmModel.tenant_id.in_({key[0] for key in keys}),
+                    ProductionSnapshotsOrmModel.aggregate_id.in_({key[2] for key in keys}))
+            .execution_options(**{INCLUDE_ALL_TENANTS: True})
+            .all()
+        )
+
+    @staticmethod
+    def _to_snapshot(row: ProductionSnapshotsOrmModel) -> ProductionSnapshotsModel:
+        return ProductionSnapshotsModel(tenant_id=row.tenant_id,
+                                        aggregate_type=ProductionAggregateType(row.aggregate_type),
+                                        aggregate_id=row.aggregate_id, last_event_id=row.last_event_id,
+                                        state=orjson.loads(row.state))
+
+    def save_snapshots(self, session: Session, snapshots: list[ProductionSnapshotsModel], trace_id: str = None):
+        """
+        Creates or replaces the stored states of some aggregates, loading the existing rows with one query.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            snapshots (list[ProductionSnapshotsModel]): The snapshots to save.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        if not snapshots:
+            return
+        try:
+            existing = {
+                (row.tenant_id, row.aggregate_type, row.aggregate_id): row
+                for row in self._query_snapshots(session, [
+                    (snapshot.tenant_id, snapshot.aggregate_type.value, snapshot.aggregate_id)
+                    for snapshot in snapshots
+                ])
+            }
+            now = datetime.now(UTC)
+            for snapshot in snapshots:
+                aggregate_type = snapshot.aggregate_type.value
+                state = json.dumps(snapshot.state, default=str)
+                row = existing.get((snapshot.tenant_id, aggregate_type, snapshot.aggregate_id))
+                if row is None:
+                    session.add(ProductionSnapshotsOrmModel(
+                        uuid=str(uuid.uuid4()), tenant_id=snapshot.tenant_id,
+                        aggregate_type=aggregate_type, aggregate_id=snapshot.aggregate_id,
+                        last_event_id=snapshot.last_event_id, state=state, updated_at=now))
+                elif row.last_event_id < snapshot.last_event_id:
+                    row.last_event_id = snapshot.last_event_id
+                    row.state = state
+                    row.updated_at = now
+            session.flush()
+        except SQLAlchemyError as e:
+            error_message = "Database error saving production snapshots"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error saving production snapshots"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def delete_snapshots(self, session: Session, trace_id: str = None):
+        """
+        Deletes the snapshots of every tenant.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            session.execute(delete(ProductionSnapshotsOrmModel).execution_options(**{INCLUDE_ALL_TENANTS: True}))
+        except SQLAlchemyError as e:
+            error_message = "Database error deleting production snapshots"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error deleting production snapshots"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def get_checkpoint(self, session: Session, projection: str, trace_id: str = None) -> int:
+        """
+        Retrieves the position of the last event processed by a projection.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            projection (str): The name of the projection.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            int: The position, 0 when the projection never ran.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            checkpoint = session.get(ProjectionCheckpointsOrmModel, projection)
+            return checkpoint.last_event_id if checkpoint else 0
+        except SQLAlchemyError as e:
+            error_message = f"Database error getting the checkpoint of projection {projection}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error getting the checkpoint of projection {projection}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
+
+    def save_checkpoint(self, session: Session, projection: str, last_event_id: int, trace_id: str = None):
+        """
+        Stores the position of the last event processed by a projection.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            projection (str): The name of the projection.
+            last_event_id (int): The position of the last processed event.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            ProductionLedgerOrmRepositoryDBException: If there is a database error.
+            ProductionLedgerOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            checkpoint = session.get(ProjectionCheckpointsOrmModel, projection)
+            if checkpoint is None:
+                session.add(ProjectionCheckpointsOrmModel(name=projection, last_event_id=last_event_id))
+            else:
+                checkpoint.last_event_id = last_event_id
+            session.flush()
+        except SQLAlchemyError as e:
+            error_message = f"Database error saving the checkpoint of projection {projection}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error saving the checkpoint of projection {projection}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionLedgerOrmRepositoryException(error_message) from e
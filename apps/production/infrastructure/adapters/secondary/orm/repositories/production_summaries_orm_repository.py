@@ -0,0 +1,307 @@
+import uuid
+from datetime import date, datetime, UTC
+from typing import Optional
+
+from sqlalchemy import delete, or_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from apps.production.domain.entities.production_summary_model import DailyModuleSummaryModel, \
+    DailyPersonSummaryModel
+from apps.production.domain.repositories.production_summaries_db_interface import ProductionSummariesDBInterface
+from apps.production.exceptions.infrastructure.orm.production_summaries_orm_repository_exceptions import \
+    ProductionSummariesOrmRepositoryDBException, ProductionSummariesOrmRepositoryException
+from apps.production.infrastructure.adapters.secondary.orm.models.daily_module_summary_orm_model import \
+    DailyModuleSummaryOrmModel
+from apps.production.infrastructure.adapters.secondary.orm.models.daily_person_summary_orm_model import \
+    DailyPersonSummaryOrmModel
+from shared.constants import PRODUCTION_SERVICE
+from shared.logger import LoggerService
+from shared.tenancy import INCLUDE_ALL_TENANTS
+
+_EPSILON = 1e-9
+
+
+def _efficiency(worked_minutes: float, produced_minutes: float) -> Optional[float]:
+    if worked_minutes <= _EPSILON:
+        return None
+    return round(produced_minutes / worked_minutes * 100, 2)
+
+
+class ProductionSummariesOrmRepository(ProductionSummariesDBInterface):
+
+    def __init__(self):
+        """
+        Constructor for the ProductionSummariesOrmRepository class.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+
+    @staticmethod
+    def _to_module_summary(row: DailyModuleSummaryOrmModel) -> DailyModuleSummaryModel:
+        return DailyModuleSummaryModel(
+            tenant_id=row.tenant_id, summary_date=row.summary_date, module_id=row.module_id, records=row.records,
+            worked_minutes=row.worked_minutes, produced_minutes=row.produced_minutes,
+            efficiency=_efficiency(row.worked_minutes, row.produced_minutes), last_event_id=row.last_event_id)
+
+    @staticmethod
+    def _to_person_summary(row: DailyPersonSummaryOrmModel) -> DailyPersonSummaryModel:
+        return DailyPersonSummaryModel(
+            tenant_id=row.tenant_id, summary_date=row.summary_date, module_id=row.module_id,
+            person_id=row.person_id, worked_minutes=row.worked_minutes, produced_minutes=row.produced_minutes,
+            efficiency=_efficiency(row.worked_minutes, row.produced_minutes), last_event_id=row.last_event_id)
+
+    @staticmethod
+    def _query_by_keys(session: Session, orm_model, keys) -> list:
+        """
+        Loads the rows of some keys of any tenant with one query, bounded by the tenants, modules and days of
+        the keys. The caller drops the rows of other combinations.
+        """
+        days = [key[1] for key in keys]
+        return (
+            session.query(orm_model)
+            .filter(orm_model.tenant_id.in_({key[0] for key in keys}),
+                    orm_model.module_id.in_({key[2] for key in keys}),
+                    orm_model.summary_date.between(min(days), max(days)))
+            .execution_options(**{INCLUDE_ALL_TENANTS: True})
+            .all()
+        )
+
+    def get_module_summaries(self, session: Session, keys: list[tuple[str, date, str]], trace_id: str = None
+                             ) -> list[DailyModuleSummaryModel]:
+        """
+        Retrieves the daily summaries of some modules of any tenant with one query.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            keys (list[tuple[str, date, str]]): The tenant, day and module of every summary.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[DailyModuleSummaryModel]: The summaries found.
+
+        Raises:
+            ProductionSummariesOrmRepositoryDBException: If there is a database error.
+            ProductionSummariesOrmRepositoryException: If there is an unexpected error.
+        """
+        if not keys:
+            return []
+        try:
+            wanted = set(keys)
+            return [
+                self._to_module_summary(row) for row in self._query_by_keys(session, DailyModuleSummaryOrmModel, keys)
+                if (row.tenant_id, row.summary_date, row.module_id) in wanted
+            ]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting daily module summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting daily module summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryException(error_message) from e
+
+    def get_person_summaries(self, session: Session, keys: list[tuple[str, date, str, str]],
+                             trace_id: str = None) -> list[DailyPersonSummaryModel]:
+        """
+        Retrieves the daily summaries of some people of any tenant with one query.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            keys (list[tuple[str, date, str, str]]): The tenant, day, module and person of every summary.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[DailyPersonSummaryModel]: The summaries found.
+
+        Raises:
+            ProductionSummariesOrmRepositoryDBException: If there is a database error.
+            ProductionSummariesOrmRepositoryException: If there is an unexpected error.
+        """
+        if not keys:
+            return []
+        try:
+            wanted = set(keys)
+            return [
+                self._to_person_summary(row) for row in self._query_by_keys(session, DailyPersonSummaryOrmModel, keys)
+                if (row.tenant_id, row.summary_date, row.module_id, row.person_id) in wanted
+            ]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting daily person summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting daily person summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryException(error_message) from e
+
+    def save_summaries(self, session: Session, module_summaries: list[DailyModuleSummaryModel],
+                       person_summaries: list[DailyPersonSummaryModel], trace_id: str = None):
+        """
+        Creates or replaces daily summaries, loading the existing rows with one query per table. A row is only
+        replaced by a summary that folded a later event, so a replayed batch does not count twice.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            module_summaries (list[DailyModuleSummaryModel]): The summaries of the modules.
+            person_summaries (list[DailyPersonSummaryModel]): The summaries of the people.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            ProductionSummariesOrmRepositoryDBException: If there is a database error.
+            ProductionSummariesOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            now = datetime.now(UTC)
+            if module_summaries:
+                existing = {
+                    (row.tenant_id, row.summary_date, row.module_id): row
+                    for row in self._query_by_keys(session, DailyModuleSummaryOrmModel, [
+                        (summary.tenant_id, summary.summary_date, summary.module_id) for summary in module_summaries
+                    ])
+                }
+                for summary in module_summaries:
+                    row = existing.get((summary.tenant_id, summary.summary_date, summary.module_id))
+                    if row is None:
+                        session.add(DailyModuleSummaryOrmModel(
+                            uuid=str(uuid.uuid4()), tenant_id=summary.tenant_id, module_id=summary.module_id,
+                            summary_date=summary.summary_date, records=summary.records,
+                            worked_minutes=summary.worked_minutes, produced_minutes=summary.produced_minutes,
+                            last_event_id=summary.last_event_id, updated_at=now))
+                    elif row.last_event_id < summary.last_event_id:
+                        row.records = summary.records
+                        row.worked_minutes = summary.worked_minutes
+                        row.produced_minutes = summary.produced_minutes
+                        row.last_event_id = summary.last_event_id
+                        row.updated_at = now
+            if person_summaries:
+                existing = {
+                    (row.tenant_id, row.summary_date, row.module_id, row.person_id): row
+                    for row in self._query_by_keys(session, DailyPersonSummaryOrmModel, [
+                        (summary.tenant_id, summary.summary_date, summary.module_id, summary.person_id)
+                        for summary in person_summaries
+                    ])
+                }
+                for summary in person_summaries:
+                    row = existing.get((summary.tenant_id, summary.summary_date, summary.module_id,
+                                        summary.person_id))
+                    if row is None:
+                        session.add(DailyPersonSummaryOrmModel(
+                            uuid=str(uuid.uuid4()), tenant_id=summary.tenant_id, module_id=summary.module_id,
+                            summary_date=summary.summary_date, person_id=summary.person_id,
+                            worked_minutes=summary.worked_minutes, produced_minutes=summary.produced_minutes,
+                            last_event_id=summary.last_event_id, updated_at=now))
+                    elif row.last_event_id < summary.last_event_id:
+                        row.worked_minutes = summary.worked_minutes
+                        row.produced_minutes = summary.produced_minutes
+                        row.last_event_id = summary.last_event_id
+                        row.updated_at = now
+            session.flush()
+        except SQLAlchemyError as e:
+            error_message = "Database error saving daily summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error saving daily summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryException(error_message) from e
+
+    def delete_summaries(self, session: Session, trace_id: str = None):
+        """
+        Deletes the daily summaries of every tenant.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            ProductionSummariesOrmRepositoryDBException: If there is a database error.
+            ProductionSummariesOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            for orm_model in (DailyModuleSummaryOrmModel, DailyPersonSummaryOrmModel):
+                session.execute(delete(orm_model).execution_options(**{INCLUDE_ALL_TENANTS: True}))
+        except SQLAlchemyError as e:
+            error_message = "Database error deleting daily summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error deleting daily summaries"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryException(error_message) from e
+
+    def get_module_summaries_between(self, session: Session, date_from: date, date_to: date,
+                                     module_id: Optional[str] = None, trace_id: str = None
+                                     ) -> list[DailyModuleSummaryModel]:
+        """
+        Retrieves the daily summaries of the modules of the tenant in context in a period.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            date_from (date): The first day, included.
+            date_to (date): The last day, included.
+            module_id (Optional[str]): The ID of the module to filter by.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[DailyModuleSummaryModel]: The summaries by module and day.
+
+        Raises:
+            ProductionSummariesOrmRepositoryDBException: If there is a database error.
+            ProductionSummariesOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            query = session.query(DailyModuleSummaryOrmModel).filter(
+                DailyModuleSummaryOrmModel.summary_date.between(date_from, date_to))
+            if module_id is not None:
+                query = query.filter(DailyModuleSummaryOrmModel.module_id == module_id)
+            rows = query.order_by(DailyModuleSummaryOrmModel.module_id, DailyModuleSummaryOrmModel.summary_date)
+            return [self._to_module_summary(row) for row in rows]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting the daily module summaries of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting the daily module summaries of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryException(error_message) from e
+
+    def get_person_summaries_between(self, session: Session, date_from: date, date_to: date,
+                                     module_id: Optional[str] = None, trace_id: str = None
+                                     ) -> list[DailyPersonSummaryModel]:
+        """
+        Retrieves the daily summaries of the people of the tenant in context in a period.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            date_from (date): The first day, included.
+            date_to (date): The last day, included.
+            module_id (Optional[str]): The ID of the module to filter by.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[DailyPersonSummaryModel]: The summaries by module, person and day.
+
+        Raises:
+            ProductionSummariesOrmRepositoryDBException: If there is a database error.
+            ProductionSummariesOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            # Corrections leave the people removed from a record with zero minutes, they are not listed
+            query = session.query(DailyPersonSummaryOrmModel).filter(
+                DailyPersonSummaryOrmModel.summary_date.between(date_from, date_to),
+                or_(DailyPersonSummaryOrmModel.worked_minutes > _EPSILON,
+                    DailyPersonSummaryOrmModel.produced_minutes > _EPSILON))
+            if module_id is not None:
+                query = query.filter(DailyPersonSummaryOrmModel.module_id == module_id)
+            rows = query.order_by(DailyPersonSummaryOrmModel.module_id, DailyPersonSummaryOrmModel.person_id,
+                                  DailyPersonSummaryOrmModel.summary_date)
+            return [self._to_person_summary(row) for row in rows]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting the daily person summaries of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting the daily person summaries of a period"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionSummariesOrmRepositoryException(error_message) from e
@@ -0,0 +1,271 @@
+import os
+import uuid
+from datetime import date, datetime, UTC
+from typing import Iterable, Iterator, Optional
+from urllib.parse import quote
+
+import orjson
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+    import pyarrow.fs
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - the archive is optional
+    pyarrow = None
+
+from apps.production.application.events.production_recorded_event import PersonMinutesEntry
+from apps.production.domain.entities.production_archive_model import ProductionArchivePartitionModel
+from apps.production.domain.entities.production_ledger_model import ProductionEventType, ProductionEventsModel
+from apps.production.domain.repositories.production_archive_interface import ProductionArchiveInterface
+from apps.production.exceptions.infrastructure.parquet.production_archive_parquet_repository_exceptions import \
+    ProductionArchiveParquetRepositoryException, ProductionArchiveParquetRepositoryIOException
+from shared.constants import PRODUCTION_SERVICE
+from shared.logger import LoggerService
+
+ARCHIVE_TABLE = 'production_events'
+_MONTH_FORMAT = '%Y-%m'
+_PART_PREFIX = 'part-'
+_PARQUET_SUFFIX = '.parquet'
+
+
+def _archive_schema():
+    timestamp = pyarrow.timestamp('us', tz='UTC')
+    return pyarrow.schema([
+        ('id', pyarrow.int64()), ('uuid', pyarrow.string()), ('record_id', pyarrow.string()),
+        ('record_version', pyarrow.int64()), ('event_type', pyarrow.string()), ('module_id', pyarrow.string()),
+        ('reference_id', pyarrow.string()), ('time_slot_id', pyarrow.string()),
+        ('worked_minutes', pyarrow.float64()), ('produced_minutes', pyarrow.float64()),
+        ('worked_minutes_delta', pyarrow.float64()), ('produced_minutes_delta', pyarrow.float64()),
+        ('person_entries', pyarrow.string()), ('person_deltas', pyarrow.string()),
+        ('logged_by', pyarrow.string()), ('notes', pyarrow.string()), ('occurred_at', timestamp),
+        ('recorded_at', timestamp), ('is_current', pyarrow.bool_()),
+    ])
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+class ProductionArchiveParquetRepository(ProductionArchiveInterface):
+    """
+    Cold archive of the production ledger in Parquet files, partitioned Hive-style by tenant and month:
+    `<base_dir>/production_events/tenant_id=<tenant>/month=<YYYY-MM>/part-<first id>-<last id>.parquet`.
+
+    Files are sorted by date and written in row groups that keep min/max statistics, so a read only decodes
+    the row groups of the period and the module it asks for. Reads go through memory-mapped files, which
+    leaves the caching of the cold data to the page cache of the OS instead of the heap of the worker.
+    """
+    def __init__(self, base_dir: str, row_group_size: int = 50000, compression: str = 'zstd'):
+        """
+        Constructor for the ProductionArchiveParquetRepository class.
+
+        Args:
+            base_dir (str): The directory of the archive.
+            row_group_size (int): The events per row group of the files. Defaults to 50000.
+            compression (str): The compression codec of the columns. Defaults to 'zstd'.
+
+        Raises:
+            ProductionArchiveParquetRepositoryException: If pyarrow is not installed.
+        """
+        if pyarrow is None:
+            raise ProductionArchiveParquetRepositoryException(
+                "The pyarrow package is required to archive the production ledger")
+        self.origin = self.__class__.__name__
+        self.user: str = PRODUCTION_SERVICE
+        self.base_dir = base_dir
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.schema = _archive_schema()
+        self.filesystem = pyarrow.fs.LocalFileSystem(use_mmap=True)
+
+    def _tenant_dir(self, tenant_id: str) -> str:
+        return os.path.join(self.base_dir, ARCHIVE_TABLE, f"tenant_id={quote(tenant_id, safe='')}")
+
+    def _month_dir(self, tenant_id: str, month: date) -> str:
+        return os.path.join(self._tenant_dir(tenant_id), f"month={month.strftime(_MONTH_FORMAT)}")
+
+    def _part_files(self, tenant_id: str, month: date) -> list[str]:
+        month_dir = self._month_dir(tenant_id, month)
+        try:
+            names = os.listdir(month_dir)
+        except FileNotFoundError:
+            return []
+        # The ledger positions are zero padded, so the files sort in ledger order
+        return sorted(os.path.join(month_dir, name) for name in names
+                      if name.startswith(_PART_PREFIX) and name.endswith(_PARQUET_SUFFIX))
+
+    def archived_months(self, tenant_id: str) -> list[date]:
+        """
+        Retrieves the months of a tenant with at least one published file.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+
+        Returns:
+            list[date]: The first day of every archived month, in order.
+        """
+        try:
+            names = os.listdir(self._tenant_dir(tenant_id))
+        except FileNotFoundError:
+            return []
+        months = []
+        for name in names:
+            if not name.startswith('month='):
+                continue
+            month = datetime.strptime(name[len('month='):], _MONTH_FORMAT).date()
+            if self._part_files(tenant_id, month):
+                months.append(month)
+        return sorted(months)
+
+    def _to_table(self, columns: dict[str, list]):
+        return pyarrow.Table.from_pydict(columns, schema=self.schema)
+
+    @staticmethod
+    def _dump_entries(entries: list[PersonMinutesEntry]) -> str:
+        return orjson.dumps([entry.model_dump() for entry in entries]).decode()
+
+    def write_partition(self, tenant_id: str, month: date, events: Iterable[tuple[ProductionEventsModel, bool]],
+                        trace_id: str = None) -> Optional[ProductionArchivePartitionModel]:
+        """
+        Writes the events of a tenant in a month to a staged file, one row group every `row_group_size`
+        events, keeping only one row group in memory.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            month (date): The first day of the month.
+            events (Iterable[tuple[ProductionEventsModel, bool]]): The events by date and whether they are the
+                last version of their record.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Optional[ProductionArchivePartitionModel]: The staged file, None when there were no events.
+
+        Raises:
+            ProductionArchiveParquetRepositoryIOException: If the file cannot be written.
+        """
+        month_dir = self._month_dir(tenant_id, month)
+        staged_path = os.path.join(month_dir, f".staged-{uuid.uuid4().hex}{_PARQUET_SUFFIX}")
+        columns: dict[str, list] = {name: [] for name in self.schema.names}
+        writer = None
+        rows = 0
+        first_event_id = last_event_id = None
+        try:
+            for event, is_current in events:
+                if writer is None:
+                    os.makedirs(month_dir, exist_ok=True)
+                    writer = pyarrow.parquet.ParquetWriter(staged_path, self.schema, compression=self.compression)
+                    first_event_id = event.id
+                last_event_id = max(last_event_id or 0, event.id)
+                first_event_id = min(first_event_id, event.id)
+                values = event.__dict__
+                for name in self.schema.names:
+                    columns[name].append(values.get(name))
+                columns['event_type'][-1] = event.event_type.value
+                columns['person_entries'][-1] = self._dump_entries(event.person_entries)
+                columns['person_deltas'][-1] = self._dump_entries(event.person_deltas)
+                columns['is_current'][-1] = is_current
+                rows += 1
+                if len(columns['id']) >= self.row_group_size:
+                    writer.write_table(self._to_table(columns))
+                    columns = {name: [] for name in self.schema.names}
+            if writer is None:
+                return None
+            if columns['id']:
+                writer.write_table(self._to_table(columns))
+            writer.close()
+        except Exception as e:
+            if writer is not None:
+                writer.close()
+            self._remove(staged_path)
+            error_message = f"Error writing the archive of {month.strftime(_MONTH_FORMAT)} of tenant {tenant_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionArchiveParquetRepositoryIOException(error_message) from e
+        return ProductionArchivePartitionModel(
+            tenant_id=tenant_id, month=month, rows=rows, first_event_id=first_event_id,
+            last_event_id=last_event_id, staged_path=staged_path,
+            path=os.path.join(month_dir, f"{_PART_PREFIX}{first_event_id:012d}-{last_event_id:012d}"
+                                         f"{_PARQUET_SUFFIX}"))
+
+    def publish_partition(self, partition: ProductionArchivePartitionModel, trace_id: str = None):
+        """
+        Renames a staged file to its final name, which is atomic on a local filesystem. Archiving the same
+        events again replaces the file instead of duplicating them.
+
+        Raises:
+            ProductionArchiveParquetRepositoryIOException: If the file cannot be renamed.
+        """
+        try:
+            os.replace(partition.staged_path, partition.path)
+        except OSError as e:
+            error_message = f"Error publishing the archive file {partition.path}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionArchiveParquetRepositoryIOException(error_message) from e
+
+    def discard_partition(self, partition: ProductionArchivePartitionModel, trace_id: str = None):
+        self._remove(partition.staged_path)
+        self._remove(partition.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _to_event(tenant_id: str, values: dict) -> ProductionEventsModel:
+        values.pop('is_current', None)
+        values['tenant_id'] = tenant_id
+        values['event_type'] = ProductionEventType(values['event_type'])
+        for key in ('person_entries', 'person_deltas'):
+            values[key] = [PersonMinutesEntry.model_construct(**entry) for entry in orjson.loads(values[key])]
+        return ProductionEventsModel.model_construct(**values)
+
+    def iter_current_records(self, tenant_id: str, occurred_from: datetime, occurred_to: datetime,
+                             module_id: Optional[str] = None, batch_size: int = 10000, trace_id: str = None
+                             ) -> Iterator[ProductionEventsModel]:
+        """
+        Streams the last version of the archived records of a tenant that happened in a period, skipping the
+        voided ones.
+
+        Only the files of the months of the period are opened, and the filter is pushed down to the
+        Parquet reader, which skips the row groups whose statistics fall outside of it.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            occurred_from (datetime): The start of the period, included.
+            occurred_to (datetime): The end of the period, excluded.
+            module_id (Optional[str]): The ID of the module to filter by.
+            batch_size (int): The rows decoded at a time. Defaults to 10000.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Iterator[ProductionEventsModel]: The events of the last version of every record, by month and date.
+
+        Raises:
+            ProductionArchiveParquetRepositoryIOException: If a file cannot be read.
+        """
+        timestamp = pyarrow.timestamp('us', tz='UTC')
+        field = pyarrow.dataset.field
+        expression = ((field('is_current') == pyarrow.scalar(True))
+                      & (field('event_type') != ProductionEventType.RECORD_VOIDED.value)
+                      & (field('occurred_at') >= pyarrow.scalar(occurred_from, type=timestamp))
+                      & (field('occurred_at') < pyarrow.scalar(occurred_to, type=timestamp)))
+        if module_id is not None:
+            expression = expression & (field('module_id') == module_id)
+        months = [month for month in self.archived_months(tenant_id)
+                  if datetime.combine(month, datetime.min.time(), UTC) < occurred_to
+                  and datetime.combine(_next_month(month), datetime.min.time(), UTC) > occurred_from]
+        try:
+            for month in months:
+                dataset = pyarrow.dataset.dataset(self._part_files(tenant_id, month), schema=self.schema,
+                                                  format='parquet', filesystem=self.filesystem)
+                # Without threads the batches keep the order of the files
+                for batch in dataset.to_batches(filter=expression, batch_size=batch_size, use_threads=False):
+                    for values in batch.to_pylist():
+                        yield self._to_event(tenant_id, values)
+        except (OSError, pyarrow.ArrowException) as e:
+            error_message = f"Error reading the production archive of tenant {tenant_id}"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise ProductionArchiveParquetRepositoryIOException(error_message) from e
@@ -0,0 +1,201 @@
+import threading
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from apps.tenants.domain.entities.tenants_model import TenantApiUsageModel, TenantsModel, TenantStatus
+from apps.tenants.domain.repositories.tenants_db_interface import TenantsDBInterface
+from apps.tenants.exceptions.application.services.tenants_service_exceptions import PlanLimitsServiceException
+from shared.constants import PLAN_LIMIT_API_CALLS, PLAN_LIMIT_MODULES, PLAN_LIMIT_UNKNOWN_TENANT, PLAN_LIMIT_USERS, \
+    PLAN_RESOURCE_MODULES, PLAN_RESOURCE_USERS, TENANTS_SERVICE
+from shared.database import DataBaseManager
+from shared.decorators import with_scoped_session
+from shared.exceptions import InfrastructureException
+from shared.limits import PlanUsageCounters
+from shared.logger import LoggerService
+from shared.tenancy import all_tenants_scope
+from shared.tracing import get_trace_id
+
+# Limit of the plan that bounds every countable resource
+RESOURCE_PLAN_LIMITS = {
+    PLAN_RESOURCE_USERS: PLAN_LIMIT_USERS,
+    PLAN_RESOURCE_MODULES: PLAN_LIMIT_MODULES,
+}
+
+
+class PlanLimitsService:
+    """
+    Service to enforce the limits of the plan of every tenant on the request path.
+
+    Checks only read the in-memory counters of the worker. The database is touched by the periodic sync,
+    which adds the API calls metered by the worker and reloads the plans, the API usage of every worker and
+    the resource counts with one grouped query per resource. The sync runs in a background thread, a check
+    that finds it due only starts it.
+
+    Only the tenants with a plan are metered: once the plans are loaded, the calls of any other tenant are
+    refused before they reach the counters, so they never grow with tenants that do not exist. A new tenant
+    is known from the next sync.
+    """
+    def __init__(self, db_repository: TenantsDBInterface, database_manager: DataBaseManager,
+                 counters: Optional[PlanUsageCounters] = None, sync_seconds: float = 30):
+        """
+        Constructor for the PlanLimitsService class.
+
+        Args:
+            db_repository (TenantsDBInterface): The repository to handle the database operations.
+            database_manager (DataBaseManager): The database manager to manage the database connections.
+            counters (Optional[PlanUsageCounters]): The in-memory usage counters of the worker.
+            sync_seconds (float): The seconds between two syncs with the database. Defaults to 30.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = TENANTS_SERVICE
+        self.db_repository = db_repository
+        self.database_manager = database_manager
+        self.counters = counters or PlanUsageCounters()
+        self.sync_seconds = sync_seconds
+        self._plan_limits: dict[str, dict[str, int]] = {}
+        self._active_tenant_ids: list[str] = []
+        self._plans_loaded = False
+        self._last_sync = 0.0
+        self._sync_lock = threading.Lock()
+
+    def check_api_call(self, tenant_id: str) -> Optional[str]:
+        """
+        Meters an API call of a tenant unless its monthly quota is already spent.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+
+        Returns:
+            Optional[str]: The name of the exceeded limit, PLAN_LIMIT_UNKNOWN_TENANT for a tenant without a plan,
+                or None when the call is allowed.
+        """
+        self.maybe_sync()
+        plan_limits = self._plan_limits.get(tenant_id)
+        if plan_limits is None:
+            # Before the first sync no tenant is known, the calls are let through without metering them
+            return PLAN_LIMIT_UNKNOWN_TENANT if self._plans_loaded else None
+        limit = plan_limits.get(PLAN_LIMIT_API_CALLS)
+        if limit is not None and self.counters.api_calls(tenant_id) >= limit:
+            return PLAN_LIMIT_API_CALLS
+        self.counters.record_api_call(tenant_id)
+        return None
+
+    def reserve_resource(self, tenant_id: str, resource: str, amount: int) -> int:
+        """
+        Reserves the rows of a resource a tenant is about to create, up to the limit of its plan. The check and
+        the count are one step, so the concurrent writers of the worker cannot overrun the limit together.
+        Every reservation must be ended with `finish_reservation`.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            resource (str): The name of the resource, e.g. 'modules'.
+            amount (int): The rows to create.
+
+        Returns:
+            int: The rows the tenant can create, fewer than asked when the plan is exhausted.
+        """
+        self.maybe_sync()
+        limit = self._plan_limits.get(tenant_id, {}).get(RESOURCE_PLAN_LIMITS.get(resource))
+        return self.counters.reserve_resource(resource, tenant_id, amount, limit)
+
+    def get_active_tenant_ids(self) -> list[str]:
+        """
+        Returns the active and trial tenants loaded by the last sync.
+        """
+        return list(self._active_tenant_ids)
+
+    def finish_reservation(self, tenant_id: str, resource: str, reserved: int, created: int):
+        """
+        Keeps the created rows of a reservation counted until the next sync reloads the real count, and gives
+        the rest back.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            resource (str): The name of the resource.
+            reserved (int): The rows returned by `reserve_resource`.
+            created (int): The rows committed, 0 when the transaction failed.
+        """
+        self.counters.finish_reservation(resource, tenant_id, reserved, created)
+
+    def maybe_sync(self):
+        """
+        Starts a sync with the database in a background thread when the sync interval is over.
+
+        Only one thread syncs at a time, the callers keep checking against the current counters instead of
+        waiting for it.
+        """
+        if time.monotonic() - self._last_sync < self.sync_seconds:
+            return
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        self._last_sync = time.monotonic()
+        try:
+            threading.Thread(target=self._sync_in_background, name='plan-limits-sync', daemon=True).start()
+        except Exception:
+            self._sync_lock.release()
+            raise
+
+    def _sync_in_background(self):
+        try:
+            self.sync()
+        except PlanLimitsServiceException:
+            # The counters keep working with the last loaded values until the next sync
+            pass
+        finally:
+            self._sync_lock.release()
+
+    @with_scoped_session
+    def sync(self, session, trace_id: str = None):
+        """
+        Adds the metered API calls to the database and reloads the plans and the usage of every tenant.
+
+        Args:
+            session: Database session provided by the decorator.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Raises:
+            PlanLimitsServiceException: If an error occurs while syncing.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        pending = self.counters.drain_pending_api_calls()
+        try:
+            with all_tenants_scope():
+                if pending:
+                    self.db_repository.add_api_usage(session, [
+                        TenantApiUsageModel(tenant_id=tenant_id, usage_date=usage_date, api_calls=calls)
+                        for (tenant_id, usage_date), calls in pending.items()
+                    ], trace_id)
+                    session.commit()
+                pending = {}
+
+                since = datetime.now(UTC).date() - timedelta(days=self.counters.window_days - 1)
+                usage = self.db_repository.get_api_usage_since(session, since, trace_id)
+                tenants = self.db_repository.get_all(session, trace_id)
+                resource_counts = {resource: self.db_repository.count_resources(session, resource, trace_id)
+                                   for resource in RESOURCE_PLAN_LIMITS}
+
+            self.counters.load_api_usage((row.tenant_id, row.usage_date, row.api_calls) for row in usage)
+            for resource, counts in resource_counts.items():
+                self.counters.load_resource_counts(resource, counts)
+            self._plan_limits = {tenant.tenant_id: self._build_plan_limits(tenant) for tenant in tenants}
+            self._plans_loaded = True
+            self._active_tenant_ids = [tenant.tenant_id for tenant in tenants
+                                       if tenant.status in (TenantStatus.ACTIVE, TenantStatus.TRIAL)]
+        except InfrastructureException as e:
+            self.counters.restore_pending_api_calls(pending)
+            raise PlanLimitsServiceException(e)
+        except Exception as e:
+            self.counters.restore_pending_api_calls(pending)
+            error_message = "Unexpected error syncing the plan limits"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise PlanLimitsServiceException(error_message) from e
+
+    @staticmethod
+    def _build_plan_limits(tenant: TenantsModel) -> dict[str, int]:
+        return {
+            PLAN_LIMIT_API_CALLS: tenant.api_calls_per_month,
+            PLAN_LIMIT_USERS: tenant.max_users,
+            PLAN_LIMIT_MODULES: tenant.max_modules,
+        }
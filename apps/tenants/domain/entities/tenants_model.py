@@ -0,0 +1,88 @@
+import enum
+import uuid
+from datetime import date, datetime, UTC
+from pydantic import Field
+from typing import Optional
+
+from shared.models import TPBaseModel, TPInsertBaseModel
+from shared import constants
+
+
+class TenantStatus(enum.Enum):
+    ACTIVE = constants.TENANT_STATUS_ACTIVE
+    SUSPENDED = constants.TENANT_STATUS_SUSPENDED
+    TRIAL = constants.TENANT_STATUS_TRIAL
+    INACTIVE = constants.TENANT_STATUS_INACTIVE
+
+
+class TenantPlan(enum.Enum):
+    BASIC = constants.TENANT_PLAN_BASIC
+    STANDARD = constants.TENANT_PLAN_STANDARD
+    PREMIUM = constants.TENANT_PLAN_PREMIUM
+    ENTERPRISE = constants.TENANT_PLAN_ENTERPRISE
+
+
+class TenantsModel(TPBaseModel):
+    """
+    TenantsModel: Entity to represent a tenant and the limits of its plan.
+
+    Class Attributes:
+        id (int): The ID of the row.
+        uuid (str): The UUID of the row.
+        tenant_id (str): The ID of the tenant, as sent in the X-Tenant-ID header.
+        name (str): The name of the tenant.
+        slug (str): The URL-friendly identifier of the tenant.
+        status (TenantStatus): The status of the tenant.
+        plan_type (TenantPlan): The plan of the tenant.
+        max_users (int): The maximum number of users of the plan.
+        max_modules (int): The maximum number of modules of the plan.
+        max_storage_gb (int): The maximum storage of the plan.
+        api_calls_per_month (int): The maximum API calls in a rolling month.
+        created_at (datetime): The creation date of the record.
+        updated_at (datetime): The update date of the record.
+    """
+    id: int
+    uuid: str
+    tenant_id: str
+    name: str
+    slug: str
+    status: TenantStatus
+    plan_type: TenantPlan
+    max_users: int
+    max_modules: int
+    max_storage_gb: int
+    api_calls_per_month: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class InsertTenantsModel(TPInsertBaseModel):
+    """
+    InsertTenantsModel: Entity to represent the insertion of a tenant.
+    """
+    uuid: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str = Field(..., alias='tenantId')
+    name: str
+    slug: str
+    status: TenantStatus = TenantStatus.ACTIVE
+    plan_type: TenantPlan = Field(TenantPlan.BASIC, alias='planType')
+    max_users: int = Field(..., alias='maxUsers')
+    max_modules: int = Field(..., alias='maxModules')
+    max_storage_gb: int = Field(..., alias='maxStorageGB')
+    api_calls_per_month: int = Field(..., alias='apiCallsPerMonth')
+    created_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC), alias='createdAt')
+    updated_at: Optional[datetime] = Field(default_factory=lambda: datetime.now(UTC), alias="updatedAt")
+
+
+class TenantApiUsageModel(TPBaseModel):
+    """
+    TenantApiUsageModel: Entity to represent the API calls of a tenant in a day.
+
+    Class Attributes:
+        tenant_id (str): The ID of the tenant.
+        usage_date (date): The day of the usage.
+        api_calls (int): The API calls made in the day.
+    """
+    tenant_id: str
+    usage_date: date
+    api_calls: int
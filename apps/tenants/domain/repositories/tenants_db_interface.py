@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional, TypeVar
+from sqlalchemy.orm import Session
+
+from shared.models import TPBaseModel
+
+TPBaseModelType = TypeVar("TPBaseModelType", bound=TPBaseModel)
+
+
+class TenantsDBInterface(ABC):
+    """
+    TenantsDBInterface is an interface that defines the methods to read the tenants and persist their usage
+    """
+
+    @abstractmethod
+    def get_all(self, session: Session, trace_id: str = None) -> Optional[list[TPBaseModelType]]:
+        """
+        get_all is a method that gets every tenant
+
+        Args:
+            session (Session): SQLAlchemy session
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[list[TPBaseModelType]]: List of tenants
+        """
+        pass
+
+    @abstractmethod
+    def get_api_usage_since(self, session: Session, since: date, trace_id: str = None) -> list[TPBaseModelType]:
+        """
+        get_api_usage_since is a method that gets the daily API usage of every tenant since a day
+
+        Args:
+            session (Session): SQLAlchemy session
+            since (date): First day of usage to get
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            list[TPBaseModelType]: Daily API usage rows
+        """
+        pass
+
+    @abstractmethod
+    def add_api_usage(self, session: Session, usage: list[TPBaseModelType], trace_id: str = None):
+        """
+        add_api_usage is a method that adds API calls to the daily usage rows, creating them when needed
+
+        Args:
+            session (Session): SQLAlchemy session
+            usage (list[TPBaseModelType]): API calls to add per tenant and day
+            trace_id (Optional[str]): The id of the trace
+        """
+        pass
+
+    @abstractmethod
+    def count_resources(self, session: Session, resource: str, trace_id: str = None) -> dict[str, int]:
+        """
+        count_resources is a method that counts the rows of a plan-limited resource per tenant
+
+        Args:
+            session (Session): SQLAlchemy session
+            resource (str): Name of the resource, e.g. 'users'
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            dict[str, int]: Number of rows per tenant
+        """
+        pass
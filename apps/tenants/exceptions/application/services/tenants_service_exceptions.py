@@ -0,0 +1,6 @@
+from shared.exceptions import ServiceException
+
+
+class PlanLimitsServiceException(ServiceException):
+    """ Base exception for the plan limits service."""
+    pass
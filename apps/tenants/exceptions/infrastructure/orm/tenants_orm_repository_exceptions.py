@@ -0,0 +1,11 @@
+from shared.exceptions import InfrastructureException
+
+
+class TenantsOrmRepositoryException(InfrastructureException):
+    """Base exception for Tenants ORM Repository errors."""
+    pass
+
+
+class TenantsOrmRepositoryDBException(TenantsOrmRepositoryException):
+    """Raised when there is a database error in the Tenants ORM Repository."""
+    pass
@@ -0,0 +1,72 @@
+from typing import Optional
+
+from flask import Flask, jsonify, request
+
+from apps.tenants.application.services.plan_limits_service import PlanLimitsService
+from shared.asgi import AsgiRequest, AsgiResponse, BeforeRequestHook
+from shared.constants import PLAN_LIMIT_UNKNOWN_TENANT, TENANT_PLAN_LIMIT_CODE
+from shared.tenancy import get_current_tenant_id
+
+
+def _plan_limit_body(limit: str) -> tuple[dict, int]:
+    if limit == PLAN_LIMIT_UNKNOWN_TENANT:
+        return {"error": "The tenant has no plan"}, 403
+    return {"error": "Plan limit exceeded", "code": TENANT_PLAN_LIMIT_CODE, "limit": limit}, 402
+
+
+def _plan_limit_response(limit: str):
+    body, status_code = _plan_limit_body(limit)
+    return jsonify(body), status_code
+
+
+def register_plan_limits_hooks(app: Flask, plan_limits_service: PlanLimitsService):
+    """
+    Enforces the plan limits of the tenant of every request.
+
+    Every request with a tenant is metered against the monthly API calls of its plan. The exceeded quota is
+    answered with a 402 and the TENANT_PLAN_LIMIT code handled by the frontend, and the tenants without a plan
+    with a 403. The tenant is the one bound from the verified token. The limits of the resources are enforced
+    by the bulk import, the only way the API creates them.
+
+    Args:
+        app (Flask): The Flask application instance.
+        plan_limits_service (PlanLimitsService): The service that holds the usage counters of the worker.
+    """
+
+    @app.before_request
+    def check_plan_limits():
+        tenant_id = get_current_tenant_id()
+        if not tenant_id or request.endpoint is None:
+            return None
+
+        exceeded_limit = plan_limits_service.check_api_call(tenant_id)
+        if exceeded_limit:
+            return _plan_limit_response(exceeded_limit)
+        return None
+
+
+def plan_limits_asgi_hook(plan_limits_service: PlanLimitsService) -> BeforeRequestHook:
+    """
+    Builds the hook that meters the requests of the native async endpoints of the AsgiApp against the monthly
+    API calls of the plan of their tenant, answering the exceeded quota like `register_plan_limits_hooks`.
+
+    The check only reads the counters of the worker, the syncs with the database run in their own thread, so
+    it runs in the event loop.
+
+    Args:
+        plan_limits_service (PlanLimitsService): The service that holds the usage counters of the worker.
+
+    Returns:
+        BeforeRequestHook: The hook to pass to the AsgiApp.
+    """
+
+    async def check_plan_limits(asgi_request: AsgiRequest) -> Optional[AsgiResponse]:
+        tenant_id = get_current_tenant_id()
+        if not tenant_id:
+            return None
+        exceeded_limit = plan_limits_service.check_api_call(tenant_id)
+        if exceeded_limit:
+            return AsgiResponse.json(*_plan_limit_body(exceeded_limit))
+        return None
+
+    return check_plan_limits
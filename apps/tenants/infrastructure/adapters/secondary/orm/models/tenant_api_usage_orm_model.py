@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Date, BigInteger, DateTime, func
+from shared.models import TextileProBaseOrmModel
+
+
+class TenantApiUsageOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the tenant_api_usage table, one row per tenant and day.
+
+    Class Attributes:
+        usage_date (Column): Day of the usage.
+        api_calls (Column): API calls made by the tenant in the day.
+        updated_at (Column): Date of the last synchronization of the row.
+    """
+
+    __tablename__ = "tenant_api_usage"
+    __tenant_unique__ = (("usage_date",),)
+    usage_date = Column(Date, nullable=False)
+    api_calls = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
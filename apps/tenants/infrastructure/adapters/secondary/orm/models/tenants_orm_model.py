@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, DateTime, Integer, BigInteger, func
+from shared.models import TextileProBaseOrmModel
+
+
+class TenantsOrmModel(TextileProBaseOrmModel):
+    """
+    SQLAlchemy model for the tenants table.
+
+    Class Attributes:
+        name (Column): Name of the tenant.
+        slug (Column): URL-friendly identifier of the tenant.
+        status (Column): Status of the tenant, using TenantStatus enum.
+        plan_type (Column): Plan of the tenant, using TenantPlan enum.
+        max_users (Column): Maximum number of users of the plan.
+        max_modules (Column): Maximum number of modules of the plan.
+        max_storage_gb (Column): Maximum storage of the plan.
+        api_calls_per_month (Column): Maximum API calls in a rolling month.
+        created_at (Column): Created at column for the tenant, using DateTime.
+        updated_at (Column): Updated at column for the tenant, using DateTime.
+    """
+
+    __tablename__ = "tenants"
+    __tenant_unique__ = (("slug",),)
+    name = Column(String(150), nullable=False)
+    slug = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)
+    plan_type = Column(String(20), nullable=False)
+    max_users = Column(Integer, nullable=False)
+    max_modules = Column(Integer, nullable=False)
+    max_storage_gb = Column(Integer, nullable=False)
+    api_calls_per_month = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,178 @@
+import uuid
+from datetime import date
+from typing import Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from apps.tenants.domain.entities.tenants_model import TenantApiUsageModel, TenantsModel
+from apps.tenants.domain.repositories.tenants_db_interface import TenantsDBInterface
+from apps.tenants.exceptions.infrastructure.orm.tenants_orm_repository_exceptions import \
+    TenantsOrmRepositoryException, TenantsOrmRepositoryDBException
+from apps.tenants.infrastructure.adapters.secondary.orm.models.tenant_api_usage_orm_model import \
+    TenantApiUsageOrmModel
+from apps.tenants.infrastructure.adapters.secondary.orm.models.tenants_orm_model import TenantsOrmModel
+from shared.constants import TENANTS_SERVICE
+from shared.logger import LoggerService
+from shared.tenancy import INCLUDE_ALL_TENANTS
+
+
+class TenantsOrmRepository(TenantsDBInterface):
+
+    def __init__(self, resource_models: Optional[dict] = None):
+        """
+        Constructor for the TenantsOrmRepository class.
+
+        Args:
+            resource_models (Optional[dict]): ORM model of every plan-limited resource, by resource name.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = TENANTS_SERVICE
+        self.resource_models = dict(resource_models or {})
+
+    def get_all(self, session: Session, trace_id: str = None) -> list[TenantsModel]:
+        """
+        Retrieves every tenant.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[TenantsModel]: List of tenants.
+
+        Raises:
+            TenantsOrmRepositoryDBException: If there is a database error.
+            TenantsOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            tenants_query = (
+                session.query(TenantsOrmModel)
+                .execution_options(**{INCLUDE_ALL_TENANTS: True})
+                .all()
+            )
+            return [TenantsModel(**tenant.__dict__) for tenant in tenants_query]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting tenants"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting tenants"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryException(error_message) from e
+
+    def get_api_usage_since(self, session: Session, since: date, trace_id: str = None
+                            ) -> list[TenantApiUsageModel]:
+        """
+        Retrieves the daily API usage of every tenant since a day.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            since (date): First day of usage to get.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            list[TenantApiUsageModel]: Daily API usage rows.
+
+        Raises:
+            TenantsOrmRepositoryDBException: If there is a database error.
+            TenantsOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            usage_query = session.execute(
+                select(TenantApiUsageOrmModel.tenant_id, TenantApiUsageOrmModel.usage_date,
+                       TenantApiUsageOrmModel.api_calls)
+                .where(TenantApiUsageOrmModel.usage_date >= since)
+                .execution_options(**{INCLUDE_ALL_TENANTS: True})
+            )
+            return [TenantApiUsageModel(tenant_id=tenant_id, usage_date=usage_date, api_calls=api_calls)
+                    for tenant_id, usage_date, api_calls in usage_query]
+        except SQLAlchemyError as e:
+            error_message = "Database error getting tenants API usage"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting tenants API usage"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryException(error_message) from e
+
+    def add_api_usage(self, session: Session, usage: list[TenantApiUsageModel], trace_id: str = None):
+        """
+        Adds API calls to the daily usage rows with an atomic increment, creating the rows when needed.
+
+        Every worker only adds its own deltas, so concurrent workers never overwrite each other.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            usage (list[TenantApiUsageModel]): API calls to add per tenant and day.
+            trace_id (Optional[str]): The id of the trace.
+
+        Raises:
+            TenantsOrmRepositoryDBException: If there is a database error.
+            TenantsOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            for row in usage:
+                if self._increment_api_usage(session, row):
+                    continue
+                try:
+                    with session.begin_nested():
+                        session.add(TenantApiUsageOrmModel(uuid=str(uuid.uuid4()), tenant_id=row.tenant_id,
+                                                           usage_date=row.usage_date, api_calls=row.api_calls))
+                except IntegrityError:
+                    # Another worker created the row in the meantime
+                    self._increment_api_usage(session, row)
+        except SQLAlchemyError as e:
+            error_message = "Database error adding tenants API usage"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error adding tenants API usage"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryException(error_message) from e
+
+    @staticmethod
+    def _increment_api_usage(session: Session, row: TenantApiUsageModel) -> bool:
+        result = session.execute(
+            update(TenantApiUsageOrmModel)
+            .where(TenantApiUsageOrmModel.tenant_id == row.tenant_id,
+                   TenantApiUsageOrmModel.usage_date == row.usage_date)
+            .values(api_calls=TenantApiUsageOrmModel.api_calls + row.api_calls)
+            .execution_options(**{INCLUDE_ALL_TENANTS: True})
+        )
+        return result.rowcount > 0
+
+    def count_resources(self, session: Session, resource: str, trace_id: str = None) -> dict[str, int]:
+        """
+        Counts the rows of a plan-limited resource per tenant with a single grouped query.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            resource (str): Name of the resource, e.g. 'users'.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            dict[str, int]: Number of rows per tenant.
+
+        Raises:
+            TenantsOrmRepositoryDBException: If there is a database error.
+            TenantsOrmRepositoryException: If there is an unexpected error.
+        """
+        model = self.resource_models.get(resource)
+        if model is None:
+            return {}
+        try:
+            count_query = session.execute(
+                select(model.tenant_id, func.count(model.id))
+                .group_by(model.tenant_id)
+                .execution_options(**{INCLUDE_ALL_TENANTS: True})
+            )
+            return {tenant_id: count for tenant_id, count in count_query}
+        except SQLAlchemyError as e:
+            error_message = f"Database error counting {resource} per tenant"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error counting {resource} per tenant"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise TenantsOrmRepositoryException(error_message) from e
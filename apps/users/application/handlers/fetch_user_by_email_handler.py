@@ -1,4 +1,3 @@
-import uuid
 from typing import Optional
 
 from apps.users.application.queries.fetch_user_by_email_query import FetchUserByEmailQuery
@@ -9,6 +8,7 @@ from shared.communication_bus.query_bus.query_handler_interface import QueryHand
 from shared.constants import USERS_SERVICE
 from shared.exceptions import ServiceException
 from shared.logger import LoggerService
+from shared.tracing import get_trace_id
 
 
 class FetchUserByEmailHandler(QueryHandlerInterface):
@@ -40,9 +40,9 @@ class FetchUserByEmailHandler(QueryHandlerInterface):
             FetchUserByEmailHandlerException: If an error occurs while fetching the user.
         """
         if not trace_id:
-            trace_id = str(uuid.uuid4())
+            trace_id = get_trace_id()
         try:
-            return self.fetch_service.fetch_user_by_email(query.email)
+            return self.fetch_service.fetch_user_by_email(query.email, trace_id)
         except ServiceException as e:
             raise FetchUserByEmailHandlerException(e)
         except Exception as e:
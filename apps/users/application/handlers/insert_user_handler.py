@@ -1,5 +1,3 @@
-import uuid
-
 from apps.users.exceptions.application.handlers.users_handlers_exceptions import InsertUserHandlerException
 from shared.communication_bus.command_bus.command_handler_interface import CommandHandlerInterface
 from apps.users.application.commands.insert_user_command import InsertUserCommand
@@ -8,6 +6,7 @@ from apps.users.domain.entities.users_model import UsersModel
 from shared.exceptions import ServiceException
 from shared.constants import USERS_SERVICE
 from shared.logger import LoggerService
+from shared.tracing import get_trace_id
 
 
 class InsertUserHandler(CommandHandlerInterface):
@@ -39,9 +38,9 @@ class InsertUserHandler(CommandHandlerInterface):
             InsertUserHandlerException: If an error occurs while inserting the user.
         """
         if not trace_id:
-            trace_id = str(uuid.uuid4())
+            trace_id = get_trace_id()
         try:
-            return self.insert_service.insert_user(command.model_dump())
+            return self.insert_service.insert_user(command.model_dump(), trace_id)
         except ServiceException as e:
             raise InsertUserHandlerException(e)
         except Exception as e:
@@ -1,4 +1,3 @@
-import uuid
 from typing import Optional
 from pydantic import ValidationError
 
@@ -11,6 +10,7 @@ from shared.database import DataBaseManager
 from shared.decorators import with_scoped_session
 from shared.exceptions import InfrastructureException
 from shared.logger import LoggerService
+from shared.tracing import get_trace_id
 
 
 class UsersService:
@@ -48,7 +48,7 @@ class UsersService:
             UsersServiceValidationException: If the provided email is invalid.
         """
         if not trace_id:
-            trace_id = str(uuid.uuid4())
+            trace_id = get_trace_id()
         try:
             return self.db_repository.get_by_email(session, email, trace_id)
         except ValidationError as e:
@@ -79,7 +79,7 @@ class UsersService:
             UsersServiceValidationException: If the provided user is invalid.
         """
         if not trace_id:
-            trace_id = str(uuid.uuid4())
+            trace_id = get_trace_id()
         try:
             insert_model = InsertUsersModel(**user)
             is_inserted = self.db_repository.insert(session, insert_model, trace_id)
@@ -113,7 +113,7 @@ class UsersService:
             UsersServiceValidationException: If the provided user is invalid.
         """
         if not trace_id:
-            trace_id = str(uuid.uuid4())
+            trace_id = get_trace_id()
         try:
             update_model = UpdateUsersModel(**user)
             is_updated = self.db_repository.update(session, update_model, trace_id)
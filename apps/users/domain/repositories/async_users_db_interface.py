@@ -0,0 +1,95 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+from apps.users.domain.repositories.users_db_interface import TPBaseModelType
+from shared.models import TPGetBaseModel, TPInsertBaseModel, TPUpdateBaseModel
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AsyncUsersDBInterface(ABC):
+    """
+    AsyncUsersDBInterface is the asyncio version of the UsersDBInterface, for the services that await the
+    database instead of blocking a thread
+    """
+
+    @abstractmethod
+    async def get_by_filter(self, session: 'AsyncSession', filters: TPGetBaseModel, trace_id: str = None
+                            ) -> Optional[list[TPBaseModelType]]:
+        """
+        get_by_filter is a method that gets data by filter
+
+        Args:
+            session (AsyncSession): SQLAlchemy asyncio session
+            filters (TPGetBaseModel): Filters to get data
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[list[TPBaseModelType]]: List of TPBaseModelType
+        """
+        pass
+
+    @abstractmethod
+    async def get_one_by_filter(self, session: 'AsyncSession', filters: TPGetBaseModel, trace_id: str = None
+                                ) -> Optional[TPBaseModelType]:
+        """
+        get_one_by_filter is a method that gets one data by filter
+
+        Args:
+            session (AsyncSession): SQLAlchemy asyncio session
+            filters (TPGetBaseModel): Filters to get data
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[TPBaseModelType]: Data of the database
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, session: 'AsyncSession', email: str, trace_id: str = None
+                           ) -> Optional[TPBaseModelType]:
+        """
+        get_by_email is a method that gets data by email
+
+        Args:
+            session (AsyncSession): SQLAlchemy asyncio session
+            email (str): Email to get data
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            Optional[TPBaseModelType]: Data of the database
+        """
+        pass
+
+    @abstractmethod
+    async def insert(self, session: 'AsyncSession', params: TPInsertBaseModel, trace_id: str = None
+                     ) -> TPBaseModelType:
+        """
+        insert is a method that inserts data in the database
+
+        Args:
+            session (AsyncSession): SQLAlchemy asyncio session
+            params (TPInsertBaseModel): Data to insert in the database
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            TPBaseModelType: Data inserted in the database
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, session: 'AsyncSession', params: TPUpdateBaseModel, trace_id: str = None
+                     ) -> TPBaseModelType:
+        """
+        update is a method that updates data in the database
+
+        Args:
+            session (AsyncSession): SQLAlchemy asyncio session
+            params (TPUpdateBaseModel): Data to update in the database
+            trace_id (Optional[str]): The id of the trace
+
+        Returns:
+            TPBaseModelType: Data updated in the database
+        """
+        pass
@@ -0,0 +1,17 @@
+# Standard library imports
+import os
+
+# Related third party imports
+from dotenv import load_dotenv
+from apps.users.infrastructure.adapters.primary.framework.asgi_app import create_asgi_app
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Create the ASGI application with the environment specified in the FLASK_ENV variable
+# If the FLASK_ENV variable is not set, the default environment is used
+#
+# Served by any ASGI server, e.g.:
+#   uvicorn apps.users.infrastructure.adapters.primary.asgi:app --workers 4
+#   gunicorn -k uvicorn.workers.UvicornWorker apps.users.infrastructure.adapters.primary.asgi:app
+app = create_asgi_app(os.getenv('FLASK_ENV', 'default'))
@@ -1,31 +1,199 @@
+from apps.alerts.application.services.alerts_service import AlertsService
+from apps.alerts.domain.services.alert_rules_engine import AlertRulesEngine
+from apps.alerts.infrastructure.adapters.secondary.orm.repositories.alerts_orm_repository import AlertsOrmRepository
+from apps.dashboard.infrastructure.adapters.secondary.realtime.broadcast_hub_live_updates_repository import \
+    BroadcastHubLiveUpdatesRepository
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.plant.infrastructure.adapters.secondary.orm.models.modules_orm_model import ModulesOrmModel
+from apps.plant.infrastructure.adapters.secondary.orm.repositories.plant_orm_repository import PlantOrmRepository
+from apps.production.application.projections.aggregate_snapshots_projection import AggregateSnapshotsProjection
+from apps.production.application.projections.daily_summaries_projection import DailySummariesProjection
+from apps.production.application.services.production_archive_service import ProductionArchiveService
+from apps.production.application.services.production_projection_runner import ProductionProjectionRunner
+from apps.production.application.services.production_summary_service import ProductionSummaryService
+from apps.production.infrastructure.adapters.secondary.orm.repositories.production_ledger_orm_repository import \
+    ProductionLedgerOrmRepository
+from apps.production.infrastructure.adapters.secondary.orm.repositories.production_summaries_orm_repository import \
+    ProductionSummariesOrmRepository
+from apps.production.infrastructure.adapters.secondary.parquet.repositories.production_archive_parquet_repository \
+    import ProductionArchiveParquetRepository
+from apps.tenants.application.services.plan_limits_service import PlanLimitsService
+from apps.tenants.infrastructure.adapters.secondary.orm.repositories.tenants_orm_repository import \
+    TenantsOrmRepository
 from apps.users.infrastructure.adapters.primary.bus.command_bus_config import CommandBusConfig
 from apps.users.infrastructure.adapters.primary.bus.event_bus_config import EventBusConfig
 from apps.users.infrastructure.adapters.primary.bus.query_bus_config import QueryBusConfig
+from apps.users.infrastructure.adapters.secondary.orm.models.users_orm_model import UsersOrmModel
 from apps.users.infrastructure.adapters.secondary.orm.repositories.users_orm_repository import UsersOrmRepository
+from shared.cache import CacheWarmer, CacheWarmupTask, TenantPartitionedCache
+from shared.constants import PLAN_RESOURCE_MODULES, PLAN_RESOURCE_USERS
 from shared.database import DataBaseManager
+from shared.realtime import BroadcastHub
+
+
+def bus_settings(config) -> dict:
+    """
+    Reads the arguments of the BusConfig that are plain settings from the configuration of the app, so every
+    process of the service (web, scheduler and its workers) builds the same bus.
+
+    Args:
+        config (Mapping): The configuration of the app.
+
+    Returns:
+        dict: The keyword arguments of the BusConfig, without the in-memory hub and cache.
+    """
+    return dict(
+        database_url=config['DATABASE_URI'],
+        plan_limits_sync_seconds=config['PLAN_LIMITS_SYNC_SECONDS'],
+        production_snapshot_every=config['PRODUCTION_SNAPSHOT_EVERY'],
+        production_projection_batch_size=config['PRODUCTION_PROJECTION_BATCH_SIZE'],
+        production_ledger_settle_seconds=config['PRODUCTION_LEDGER_SETTLE_SECONDS'],
+        import_chunk_size=config['IMPORT_CHUNK_SIZE'],
+        import_max_errors=config['IMPORT_MAX_ERRORS'],
+        import_max_workers=config['IMPORT_MAX_WORKERS'],
+        import_stale_seconds=config['IMPORT_STALE_SECONDS'],
+        export_fetch_size=config['EXPORT_FETCH_SIZE'],
+        production_archive_dir=config['PRODUCTION_ARCHIVE_DIR'],
+        production_archive_after_months=config['PRODUCTION_ARCHIVE_AFTER_MONTHS'],
+        production_archive_row_group_size=config['PRODUCTION_ARCHIVE_ROW_GROUP_SIZE'],
+        production_summary_refresh_seconds=config['PRODUCTION_SUMMARY_REFRESH_SECONDS'],
+        production_summary_refresh_delay_seconds=config['PRODUCTION_SUMMARY_REFRESH_DELAY_SECONDS'],
+        production_summary_background_refresh=config['PRODUCTION_SUMMARY_BACKGROUND_REFRESH'],
+        production_summary_cache_seconds=config['PRODUCTION_SUMMARY_CACHE_SECONDS'],
+        cache_warmup_jitter_seconds=config['CACHE_WARMUP_JITTER_SECONDS'],
+        cache_warmup_max_workers=config['CACHE_WARMUP_MAX_WORKERS'],
+        production_summary_stale_seconds=config['PRODUCTION_SUMMARY_STALE_SECONDS'],
+        cache_early_refresh_beta=config['CACHE_EARLY_REFRESH_BETA'],
+    )
 
 
 class BusConfig:
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, broadcast_hub: BroadcastHub = None,
+                 tenant_cache: TenantPartitionedCache = None, plan_limits_sync_seconds: float = 30,
+                 production_snapshot_every: int = 200, production_projection_batch_size: int = 10000,
+                 import_chunk_size: int = 2000, import_max_errors: int = 500, import_max_workers: int = 2,
+                 export_fetch_size: int = 1000, production_archive_dir: str = None,
+                 production_archive_after_months: int = 6, production_archive_row_group_size: int = 50000,
+                 production_summary_refresh_seconds: float = 60, production_summary_refresh_delay_seconds: float = 2,
+                 production_summary_cache_seconds: float = 30, cache_warmup_jitter_seconds: float = 10,
+                 cache_warmup_max_workers: int = 2, production_summary_stale_seconds: float = 30,
+                 cache_early_refresh_beta: float = 1.0, production_ledger_settle_seconds: float = 60,
+                 import_stale_seconds: float = 300, production_summary_background_refresh: bool = False):
 
         # Database
-        self.database_manager = DataBaseManager(database_url)
+        self.tenant_cache = tenant_cache or TenantPartitionedCache()
+        self.database_manager = DataBaseManager(database_url, self.tenant_cache)
 
         # Repositories
         self.users_orm_repository = UsersOrmRepository()
+        self.alerts_orm_repository = AlertsOrmRepository()
+        self.production_ledger_orm_repository = ProductionLedgerOrmRepository()
+        self.production_summaries_orm_repository = ProductionSummariesOrmRepository()
+        # The cold archive of the closed months is optional, it needs a directory and pyarrow
+        self.production_archive_repository = (
+            ProductionArchiveParquetRepository(production_archive_dir, production_archive_row_group_size)
+            if production_archive_dir else None
+        )
+        self.plant_orm_repository = PlantOrmRepository()
+        self.tenants_orm_repository = TenantsOrmRepository({
+            PLAN_RESOURCE_USERS: UsersOrmModel,
+            PLAN_RESOURCE_MODULES: ModulesOrmModel,
+        })
+        self.broadcast_hub = broadcast_hub or BroadcastHub()
+        self.live_updates_repository = BroadcastHubLiveUpdatesRepository(self.broadcast_hub)
 
-        self.command_bus_config = CommandBusConfig(
+        # In-memory engines shared by the handlers of the process
+        self.alert_rules_engine = AlertRulesEngine()
+        self.alerts_service = AlertsService(self.alerts_orm_repository, self.database_manager,
+                                            self.alert_rules_engine, self.live_updates_repository)
+        self.plan_limits_service = PlanLimitsService(self.tenants_orm_repository, self.database_manager,
+                                                     sync_seconds=plan_limits_sync_seconds)
+        self.production_projection_runner = ProductionProjectionRunner(
+            self.production_ledger_orm_repository,
             self.database_manager,
-            self.users_orm_repository,
+            [
+                AggregateSnapshotsProjection(self.production_ledger_orm_repository),
+                DailySummariesProjection(self.production_summaries_orm_repository),
+            ],
+            production_projection_batch_size,
+            production_ledger_settle_seconds,
         )
-        self.query_bus_config = QueryBusConfig(
+        self.production_summary_service = ProductionSummaryService(
+            self.production_summaries_orm_repository,
             self.database_manager,
-            self.users_orm_repository,
+            self.production_projection_runner,
+            production_summary_refresh_seconds,
+            production_summary_refresh_delay_seconds,
+            self.tenant_cache,
+            production_summary_cache_seconds,
+            production_summary_stale_seconds,
+            cache_early_refresh_beta,
+            production_summary_background_refresh,
+        )
+        self.production_archive_service = (
+            ProductionArchiveService(
+                self.production_ledger_orm_repository,
+                self.production_archive_repository,
+                self.database_manager,
+                self.production_projection_runner,
+                production_archive_after_months,
+                export_fetch_size,
+            )
+            if self.production_archive_repository is not None else None
+        )
+        self.plant_import_service = PlantImportService(
+            self.plant_orm_repository,
+            self.database_manager,
+            self.plan_limits_service,
+            import_chunk_size,
+            import_max_errors,
+            import_max_workers,
+            import_stale_seconds,
         )
 
+        # Reads preloaded at boot and before the shifts, the plans first since they list the tenants
+        self.cache_warmer = CacheWarmer(
+            [
+                CacheWarmupTask('plan_limits', self.plan_limits_service.sync, per_tenant=False),
+                CacheWarmupTask('production_daily_summaries', self.production_summary_service.warm_up),
+            ],
+            self.plan_limits_service.get_active_tenant_ids,
+            cache_warmup_jitter_seconds,
+            cache_warmup_max_workers,
+        )
+
+        # The event bus goes first, the production commands publish the logged records on it
         self.event_bus_config = EventBusConfig(
             self.database_manager,
             self.users_orm_repository,
+            self.alerts_orm_repository,
+            self.alert_rules_engine,
+            self.live_updates_repository,
+            self.production_summary_service,
+        )
+
+        self.command_bus_config = CommandBusConfig(
+            self.database_manager,
+            self.users_orm_repository,
+            self.production_ledger_orm_repository,
+            self.event_bus_config.get_event_bus(),
+            production_snapshot_every,
+            self.plant_import_service,
+        )
+        self.query_bus_config = QueryBusConfig(
+            self.database_manager,
+            self.users_orm_repository,
+            self.alerts_orm_repository,
+            self.alert_rules_engine,
+            self.production_ledger_orm_repository,
+            production_snapshot_every,
+            self.plant_import_service,
+            export_fetch_size,
+            self.production_archive_repository,
+            self.production_summary_service,
+            self.tenant_cache.single_flight,
+            production_ledger_settle_seconds,
+            self.plant_orm_repository,
         )
 
     def get_command_bus(self):
@@ -36,3 +204,30 @@ class BusConfig:
 
     def get_event_bus(self):
         return self.event_bus_config.get_event_bus()
+
+    def get_broadcast_hub(self):
+        return self.broadcast_hub
+
+    def get_tenant_cache(self):
+        return self.tenant_cache
+
+    def get_alerts_service(self):
+        return self.alerts_service
+
+    def get_plan_limits_service(self):
+        return self.plan_limits_service
+
+    def get_production_projection_runner(self):
+        return self.production_projection_runner
+
+    def get_production_summary_service(self):
+        return self.production_summary_service
+
+    def get_production_archive_service(self):
+        return self.production_archive_service
+
+    def get_plant_import_service(self):
+        return self.plant_import_service
+
+    def get_cache_warmer(self):
+        return self.cache_warmer
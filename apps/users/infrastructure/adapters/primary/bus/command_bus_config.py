@@ -1,5 +1,15 @@
+from apps.plant.application.commands.start_plant_import_command import StartPlantImportCommand
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.production.application.commands.correct_production_record_command import CorrectProductionRecordCommand
+from apps.production.application.commands.record_production_command import RecordProductionCommand
+from apps.production.application.commands.void_production_record_command import VoidProductionRecordCommand
+from apps.production.infrastructure.adapters.secondary.orm.repositories.production_ledger_orm_repository import \
+    ProductionLedgerOrmRepository
+from apps.users.application.commands.insert_user_command import InsertUserCommand
+from apps.users.infrastructure.adapters.primary.bus.handler_factory import HandlerFactory
 from apps.users.infrastructure.adapters.secondary.orm.repositories.users_orm_repository import UsersOrmRepository
 from shared.communication_bus.command_bus.command_bus import CommandBus
+from shared.communication_bus.event_bus.event_bus import EventBus
 from shared.database import DataBaseManager
 
 
@@ -8,9 +18,15 @@ class CommandBusConfig:
     CommandBusConfig is a class that encapsulates the configuration of the command bus.
     """
 
-    def __init__(self, database_manager: DataBaseManager, users_orm_repository: UsersOrmRepository):
+    def __init__(self, database_manager: DataBaseManager, users_orm_repository: UsersOrmRepository,
+                 production_ledger_orm_repository: ProductionLedgerOrmRepository, event_bus: EventBus = None,
+                 production_snapshot_every: int = 200, plant_import_service: PlantImportService = None):
         self.command_bus = CommandBus()
+        self.plant_import_service = plant_import_service
         self.users_orm_repository = users_orm_repository
+        self.production_ledger_orm_repository = production_ledger_orm_repository
+        self.event_bus = event_bus
+        self.production_snapshot_every = production_snapshot_every
         self.database_manager = database_manager
         self.instance_command_bus()
 
@@ -21,9 +37,21 @@ class CommandBusConfig:
         return self.command_bus
 
     def instance_command_bus(self):
-        self.command_bus.register_handler(UpdateLeadsRecommendedCommand,
-                                          HandlerFactory.update_leads_recommended_handler(self.leads_mapping, self.database_manager))
-
-        self.command_bus.register_handler(InsertCustomerInfoCommand,
-                                          HandlerFactory.insert_customer_info_handler(
-                                              self.mapping_repositories["customer_info"], self.database_manager))
+        self.command_bus.register_handler(InsertUserCommand,
+                                          HandlerFactory.insert_user_handler(self.users_orm_repository,
+                                                                             self.database_manager))
+        self.command_bus.register_handler(RecordProductionCommand,
+                                          HandlerFactory.record_production_handler(
+                                              self.production_ledger_orm_repository, self.database_manager,
+                                              self.event_bus, self.production_snapshot_every))
+        self.command_bus.register_handler(CorrectProductionRecordCommand,
+                                          HandlerFactory.correct_production_record_handler(
+                                              self.production_ledger_orm_repository, self.database_manager,
+                                              self.event_bus, self.production_snapshot_every))
+        self.command_bus.register_handler(VoidProductionRecordCommand,
+                                          HandlerFactory.void_production_record_handler(
+                                              self.production_ledger_orm_repository, self.database_manager,
+                                              self.event_bus, self.production_snapshot_every))
+        if self.plant_import_service is not None:
+            self.command_bus.register_handler(StartPlantImportCommand,
+                                              HandlerFactory.start_plant_import_handler(self.plant_import_service))
@@ -1,46 +1,26 @@
-from typing import Dict, Any
-
-from refactor.apps.masConsigliere.application.events.halcon_recommendator_event import HalconRecommendatorEvent
-from refactor.apps.masConsigliere.application.events.ipex.ipex_ip_processor_event import IpexIpProcessorEvent
-from refactor.apps.masConsigliere.application.events.lookalike_recommendator_event import LookALikeRecommendatorEvent
-from refactor.apps.masConsigliere.domain.repositories.ipex.ip_matcher_provider_interface import IpMatcherProviderInterface
-from refactor.apps.masConsigliere.domain.repositories.ipex.ipex_providers_interface import IpexProvidersInterface
-from refactor.apps.masConsigliere.domain.repositories.lookalike_providers_interface import LookALikeProvidersInterface
-from refactor.apps.masConsigliere.domain.repositories.notify_interface import NotifyInterface
-from refactor.apps.masConsigliere.domain.repositories.parser_interface import ParserInterface
-from refactor.apps.masConsigliere.infrastructure.primary_adapters.config.bus.handler_factory import HandlerFactory
-from refactor.apps.masConsigliere.infrastructure.secondary_adapters.bubble_front_repository import BubbleFrontRepository
-from refactor.apps.masConsigliere.infrastructure.secondary_adapters.halcon_providers.apollo_repository import HalconApolloRepository
-from refactor.apps.shared.communicationBus.eventBus.event_bus import EventBus
-from refactor.apps.shared.utils.database_manager import DataBaseManager
+from apps.alerts.domain.services.alert_rules_engine import AlertRulesEngine
+from apps.alerts.infrastructure.adapters.secondary.orm.repositories.alerts_orm_repository import AlertsOrmRepository
+from apps.dashboard.domain.repositories.live_updates_interface import LiveUpdatesInterface
+from apps.production.application.events.production_recorded_event import ProductionRecordedEvent
+from apps.production.application.services.production_summary_service import ProductionSummaryService
+from apps.users.infrastructure.adapters.primary.bus.handler_factory import HandlerFactory
+from apps.users.infrastructure.adapters.secondary.orm.repositories.users_orm_repository import UsersOrmRepository
+from shared.communication_bus.event_bus.event_bus import EventBus
+from shared.database import DataBaseManager
 
 
 class EventBusConfig:
-    def __init__(self, mapping_repositories: Dict[str, Any],
-                 lookalike_leads_provider: LookALikeProvidersInterface,
-                 ipex_leads_provider: IpexProvidersInterface,
-                 lookalike_companies_provider: LookALikeProvidersInterface,
-                 parser_provider: ParserInterface,
-                 bubble_repository: NotifyInterface,
-                 slack_repository: NotifyInterface,
-                 leads_from_target_provider: HalconApolloRepository,
-                 bubble_frontend_repository: BubbleFrontRepository,
-                 ip_matcher_provider: IpMatcherProviderInterface,
-                 notifications_repository: NotifyInterface,
-                 database_manager: DataBaseManager):
+    def __init__(self, database_manager: DataBaseManager, users_orm_repository: UsersOrmRepository,
+                 alerts_orm_repository: AlertsOrmRepository, alert_rules_engine: AlertRulesEngine,
+                 live_updates_repository: LiveUpdatesInterface,
+                 production_summary_service: ProductionSummaryService = None):
 
         self.event_bus = EventBus()
-        self.mapping_repositories_ = mapping_repositories
-        self.lookalike_leads_provider = lookalike_leads_provider
-        self.ipex_leads_provider = ipex_leads_provider
-        self.lookalike_companies_provider = lookalike_companies_provider
-        self.parser_provider = parser_provider
-        self.bubble_repository = bubble_repository
-        self.leads_from_target_provider = leads_from_target_provider
-        self.bubble_frontend_reposirory_ = bubble_frontend_repository
-        self.ip_matcher_provider_ = ip_matcher_provider
-        self.notifications_repository_ = notifications_repository
-        self.slack_repository_ = slack_repository
+        self.users_orm_repository = users_orm_repository
+        self.alerts_orm_repository = alerts_orm_repository
+        self.alert_rules_engine = alert_rules_engine
+        self.live_updates_repository = live_updates_repository
+        self.production_summary_service = production_summary_service
         self.database_manager = database_manager
         self.instance_event_bus()
 
@@ -48,50 +28,44 @@ class EventBusConfig:
         """
         Initializes the services and use cases for the event bus.
         """
-        self.event_bus.register_handler(LookALikeRecommendatorEvent,
-                                        HandlerFactory.lookalike_recommendator_handler(
-                                            self.mapping_repositories_,
-                                            self.lookalike_leads_provider,
-                                            self.lookalike_companies_provider,
-                                            self.parser_provider,
-                                            self.bubble_repository,
-                                            self.database_manager))
-
-        self._register_halcon_handler()
-        self._register_ipex_handlers()
+        self._register_alerts_handlers()
+        self._register_dashboard_handlers()
+        self._register_production_handlers()
 
-    def _register_halcon_handler(self):
-        halcon_recommendator_handler = HandlerFactory.halcon_recommendator_handler(
-            mapping_repositories=self.mapping_repositories_,
-            halcon_parser_provider=self.parser_provider,
-            halcon_provider=self.leads_from_target_provider,
-            database_manager=self.database_manager
+    def _register_alerts_handlers(self):
+        """
+        Registers the handler that evaluates the alert rules on every production record.
+        """
+        evaluate_production_alerts_handler = HandlerFactory.evaluate_production_alerts_handler(
+            alerts_repository=self.alerts_orm_repository,
+            database_manager=self.database_manager,
+            rules_engine=self.alert_rules_engine,
+            live_updates_repository=self.live_updates_repository
         )
 
-        self.event_bus.register_handler(HalconRecommendatorEvent, halcon_recommendator_handler)
+        self.event_bus.register_handler(ProductionRecordedEvent, evaluate_production_alerts_handler)
 
-    def _register_ipex_handlers(self):
+    def _register_dashboard_handlers(self):
         """
-        Registers the Ipex IP processor handler.
+        Registers the handler that pushes the KPI deltas to the live dashboards.
         """
-        self._register_ip_processor_handler()
+        broadcast_production_kpis_handler = HandlerFactory.broadcast_production_kpis_handler(
+            live_updates_repository=self.live_updates_repository
+        )
+
+        self.event_bus.register_handler(ProductionRecordedEvent, broadcast_production_kpis_handler)
 
-    def _register_ip_processor_handler(self):
+    def _register_production_handlers(self):
         """
-        Registers the Ipex IP processor handler with the event bus.
+        Registers the handler that refreshes the daily summaries after the logged records.
         """
-        ipex_recommendator_handler = HandlerFactory.ipex_ip_processor_handler(
-            front_end_repository=self.bubble_frontend_reposirory_,
-            mapping_repositories=self.mapping_repositories_,
-            ip_matcher_provider=self.ip_matcher_provider_,
-            notifications_repository=self.notifications_repository_,
-            ipex_leads_provider=self.ipex_leads_provider,
-            ipex_parser_provider=self.parser_provider,
-            slack_repository=self.slack_repository_,
-            database_manager=self.database_manager
+        if self.production_summary_service is None:
+            return
+        refresh_production_summaries_handler = HandlerFactory.refresh_production_summaries_handler(
+            production_summary_service=self.production_summary_service
         )
 
-        self.event_bus.register_handler(IpexIpProcessorEvent, ipex_recommendator_handler)
+        self.event_bus.register_handler(ProductionRecordedEvent, refresh_production_summaries_handler)
 
     def get_event_bus(self):
         return self.event_bus
@@ -1,3 +1,36 @@
+from apps.alerts.application.handlers.evaluate_production_alerts_handler import EvaluateProductionAlertsHandler
+from apps.alerts.application.handlers.fetch_alerts_by_filter_handler import FetchAlertsByFilterHandler
+from apps.alerts.application.services.alerts_service import AlertsService
+from apps.alerts.domain.repositories.alerts_db_interface import AlertsDBInterface
+from apps.alerts.domain.services.alert_rules_engine import AlertRulesEngine
+from apps.dashboard.application.handlers.broadcast_production_kpis_handler import BroadcastProductionKpisHandler
+from apps.dashboard.domain.repositories.live_updates_interface import LiveUpdatesInterface
+from apps.plant.application.handlers.fetch_plant_entities_handler import FetchPlantEntitiesHandler
+from apps.plant.application.handlers.fetch_plant_import_job_handler import FetchPlantImportJobHandler
+from apps.plant.application.handlers.start_plant_import_handler import StartPlantImportHandler
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.plant.application.services.plant_service import PlantService
+from apps.plant.domain.repositories.plant_db_interface import PlantDBInterface
+from apps.production.application.handlers.correct_production_record_handler import CorrectProductionRecordHandler
+from apps.production.application.handlers.export_production_report_handler import ExportProductionReportHandler
+from apps.production.application.handlers.fetch_production_aggregate_handler import FetchProductionAggregateHandler
+from apps.production.application.handlers.fetch_production_daily_summaries_handler import \
+    FetchProductionDailySummariesHandler
+from apps.production.application.handlers.record_production_handler import RecordProductionHandler
+from apps.production.application.handlers.refresh_production_summaries_handler import \
+    RefreshProductionSummariesHandler
+from apps.production.application.handlers.void_production_record_handler import VoidProductionRecordHandler
+from apps.production.application.services.production_ledger_service import ProductionLedgerService
+from apps.production.application.services.production_report_service import ProductionReportService
+from apps.production.application.services.production_summary_service import ProductionSummaryService
+from apps.production.domain.repositories.production_archive_interface import ProductionArchiveInterface
+from apps.production.domain.repositories.production_ledger_db_interface import ProductionLedgerDBInterface
+from apps.users.application.handlers.fetch_user_by_email_handler import FetchUserByEmailHandler
+from apps.users.application.handlers.insert_user_handler import InsertUserHandler
+from apps.users.application.services.users_service import UsersService
+from apps.users.domain.repositories.users_db_interface import UsersDBInterface
+from shared.communication_bus.event_bus.event_bus import EventBus
+from shared.database import DataBaseManager
 
 
 class HandlerFactory:
@@ -6,36 +39,248 @@ class HandlerFactory:
     """
 
     @staticmethod
-    def check_quantity_leads_handler(mapping_repository, database_manager) -> CheckQuantityLeadsHandler:
+    def insert_user_handler(users_repository: UsersDBInterface, database_manager: DataBaseManager
+                            ) -> InsertUserHandler:
         """
-        Creates a CheckQuantityLeadsHandler instance.
+        Creates an InsertUserHandler instance.
 
         Args:
-            mapping_repository: The repository to be used by the handler.
+            users_repository: The repository to be used by the handler.
             database_manager: The database manager to be used by the handler.
 
         Returns:
-            CheckQuantityLeadsHandler: The handler instance.
+            InsertUserHandler: The handler instance.
         """
-        check_quantity_leads_service = CheckQuantityLeadsService(mapping_repository, database_manager)
-        return CheckQuantityLeadsHandler(check_quantity_leads_service=check_quantity_leads_service)
+        return InsertUserHandler(UsersService(users_repository, database_manager))
 
     @staticmethod
-    def fetch_leads_recommended_by_filter_handler(repositories: list[DBRecommendatorInterface],
-                                                  mapping_repositories: dict, database_manager) -> (
-            FetchLeadsRecommendedByFilterHandler):
+    def fetch_user_by_email_handler(users_repository: UsersDBInterface, database_manager: DataBaseManager
+                                    ) -> FetchUserByEmailHandler:
         """
-        Creates a fetch lead recommended by the filter handler.
+        Creates a FetchUserByEmailHandler instance.
 
         Args:
-            repositories: The repositories to be used by the handler.
-            mapping_repositories: The mapping repositories to be used by the handler.
+            users_repository: The repository to be used by the handler.
             database_manager: The database manager to be used by the handler.
 
         Returns:
-            FetchLeadsRecommendedByFilterHandler: The handler instance.
+            FetchUserByEmailHandler: The handler instance.
         """
-        fetch_leads_recommended_by_filter_service = FetchLeadsRecommendedByFilterService(repositories,
-                                                                                         mapping_repositories,
-                                                                                         database_manager)
-        return FetchLeadsRecommendedByFilterHandler(fetch_leads_recommended_by_filter_service)
+        return FetchUserByEmailHandler(UsersService(users_repository, database_manager))
+
+    @staticmethod
+    def evaluate_production_alerts_handler(alerts_repository: AlertsDBInterface, database_manager: DataBaseManager,
+                                           rules_engine: AlertRulesEngine,
+                                           live_updates_repository: LiveUpdatesInterface = None
+                                           ) -> EvaluateProductionAlertsHandler:
+        """
+        Creates an EvaluateProductionAlertsHandler instance.
+
+        Args:
+            alerts_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            rules_engine: The alert rules engine shared by the alert handlers.
+            live_updates_repository: The repository to push the alert transitions to the live dashboards.
+
+        Returns:
+            EvaluateProductionAlertsHandler: The handler instance.
+        """
+        return EvaluateProductionAlertsHandler(AlertsService(alerts_repository, database_manager, rules_engine,
+                                                             live_updates_repository))
+
+    @staticmethod
+    def fetch_alerts_by_filter_handler(alerts_repository: AlertsDBInterface, database_manager: DataBaseManager,
+                                       rules_engine: AlertRulesEngine) -> FetchAlertsByFilterHandler:
+        """
+        Creates a FetchAlertsByFilterHandler instance.
+
+        Args:
+            alerts_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            rules_engine: The alert rules engine shared by the alert handlers.
+
+        Returns:
+            FetchAlertsByFilterHandler: The handler instance.
+        """
+        return FetchAlertsByFilterHandler(AlertsService(alerts_repository, database_manager, rules_engine))
+
+    @staticmethod
+    def broadcast_production_kpis_handler(live_updates_repository: LiveUpdatesInterface
+                                          ) -> BroadcastProductionKpisHandler:
+        """
+        Creates a BroadcastProductionKpisHandler instance.
+
+        Args:
+            live_updates_repository: The repository to push the live updates.
+
+        Returns:
+            BroadcastProductionKpisHandler: The handler instance.
+        """
+        return BroadcastProductionKpisHandler(live_updates_repository)
+
+    @staticmethod
+    def record_production_handler(production_ledger_repository: ProductionLedgerDBInterface,
+                                  database_manager: DataBaseManager, event_bus: EventBus = None,
+                                  snapshot_every: int = 200) -> RecordProductionHandler:
+        """
+        Creates a RecordProductionHandler instance.
+
+        Args:
+            production_ledger_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            event_bus: The bus to publish the logged records to the alerts and the live dashboards.
+            snapshot_every: The events folded on top of a snapshot before a new one is stored.
+
+        Returns:
+            RecordProductionHandler: The handler instance.
+        """
+        return RecordProductionHandler(ProductionLedgerService(production_ledger_repository, database_manager,
+                                                               event_bus, snapshot_every))
+
+    @staticmethod
+    def correct_production_record_handler(production_ledger_repository: ProductionLedgerDBInterface,
+                                          database_manager: DataBaseManager, event_bus: EventBus = None,
+                                          snapshot_every: int = 200) -> CorrectProductionRecordHandler:
+        """
+        Creates a CorrectProductionRecordHandler instance.
+
+        Args:
+            production_ledger_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            event_bus: The bus to publish the logged records to the alerts and the live dashboards.
+            snapshot_every: The events folded on top of a snapshot before a new one is stored.
+
+        Returns:
+            CorrectProductionRecordHandler: The handler instance.
+        """
+        return CorrectProductionRecordHandler(ProductionLedgerService(production_ledger_repository,
+                                                                      database_manager, event_bus, snapshot_every))
+
+    @staticmethod
+    def void_production_record_handler(production_ledger_repository: ProductionLedgerDBInterface,
+                                       database_manager: DataBaseManager, event_bus: EventBus = None,
+                                       snapshot_every: int = 200) -> VoidProductionRecordHandler:
+        """
+        Creates a VoidProductionRecordHandler instance.
+
+        Args:
+            production_ledger_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            event_bus: The bus to publish the logged records to the alerts and the live dashboards.
+            snapshot_every: The events folded on top of a snapshot before a new one is stored.
+
+        Returns:
+            VoidProductionRecordHandler: The handler instance.
+        """
+        return VoidProductionRecordHandler(ProductionLedgerService(production_ledger_repository,
+                                                                   database_manager, event_bus, snapshot_every))
+
+    @staticmethod
+    def fetch_production_aggregate_handler(production_ledger_repository: ProductionLedgerDBInterface,
+                                           database_manager: DataBaseManager, snapshot_every: int = 200,
+                                           settle_seconds: float = 60) -> FetchProductionAggregateHandler:
+        """
+        Creates a FetchProductionAggregateHandler instance.
+
+        Args:
+            production_ledger_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            snapshot_every: The events folded on top of a snapshot before a new one is stored.
+            settle_seconds: The seconds after which the events can be stored in a snapshot.
+
+        Returns:
+            FetchProductionAggregateHandler: The handler instance.
+        """
+        return FetchProductionAggregateHandler(ProductionLedgerService(production_ledger_repository,
+                                                                       database_manager,
+                                                                       snapshot_every=snapshot_every,
+                                                                       settle_seconds=settle_seconds))
+
+    @staticmethod
+    def export_production_report_handler(production_ledger_repository: ProductionLedgerDBInterface,
+                                         database_manager: DataBaseManager, fetch_size: int = 1000,
+                                         archive_repository: ProductionArchiveInterface = None
+                                         ) -> ExportProductionReportHandler:
+        """
+        Creates an ExportProductionReportHandler instance.
+
+        Args:
+            production_ledger_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+            fetch_size: The records fetched from the database at a time while a report is streamed.
+            archive_repository: The cold archive of the closed months, if any.
+
+        Returns:
+            ExportProductionReportHandler: The handler instance.
+        """
+        return ExportProductionReportHandler(ProductionReportService(production_ledger_repository, database_manager,
+                                                                     fetch_size, archive_repository))
+
+    @staticmethod
+    def fetch_production_daily_summaries_handler(production_summary_service: ProductionSummaryService
+                                                 ) -> FetchProductionDailySummariesHandler:
+        """
+        Creates a FetchProductionDailySummariesHandler instance.
+
+        Args:
+            production_summary_service: The summary service shared by the handlers.
+
+        Returns:
+            FetchProductionDailySummariesHandler: The handler instance.
+        """
+        return FetchProductionDailySummariesHandler(production_summary_service)
+
+    @staticmethod
+    def refresh_production_summaries_handler(production_summary_service: ProductionSummaryService
+                                             ) -> RefreshProductionSummariesHandler:
+        """
+        Creates a RefreshProductionSummariesHandler instance.
+
+        Args:
+            production_summary_service: The summary service shared by the handlers, which owns the refresh worker.
+
+        Returns:
+            RefreshProductionSummariesHandler: The handler instance.
+        """
+        return RefreshProductionSummariesHandler(production_summary_service)
+
+    @staticmethod
+    def start_plant_import_handler(plant_import_service: PlantImportService) -> StartPlantImportHandler:
+        """
+        Creates a StartPlantImportHandler instance.
+
+        Args:
+            plant_import_service: The import service shared by the handlers, which owns the import workers.
+
+        Returns:
+            StartPlantImportHandler: The handler instance.
+        """
+        return StartPlantImportHandler(plant_import_service)
+
+    @staticmethod
+    def fetch_plant_import_job_handler(plant_import_service: PlantImportService) -> FetchPlantImportJobHandler:
+        """
+        Creates a FetchPlantImportJobHandler instance.
+
+        Args:
+            plant_import_service: The import service shared by the handlers.
+
+        Returns:
+            FetchPlantImportJobHandler: The handler instance.
+        """
+        return FetchPlantImportJobHandler(plant_import_service)
+
+    @staticmethod
+    def fetch_plant_entities_handler(plant_repository: PlantDBInterface, database_manager: DataBaseManager
+                                     ) -> FetchPlantEntitiesHandler:
+        """
+        Creates a FetchPlantEntitiesHandler instance.
+
+        Args:
+            plant_repository: The repository to be used by the handler.
+            database_manager: The database manager to be used by the handler.
+
+        Returns:
+            FetchPlantEntitiesHandler: The handler instance.
+        """
+        return FetchPlantEntitiesHandler(PlantService(plant_repository, database_manager))
@@ -1,12 +1,46 @@
+from apps.alerts.application.queries.fetch_alerts_by_filter_query import FetchAlertsByFilterQuery
+from apps.alerts.domain.services.alert_rules_engine import AlertRulesEngine
+from apps.alerts.infrastructure.adapters.secondary.orm.repositories.alerts_orm_repository import AlertsOrmRepository
+from apps.plant.application.queries.fetch_plant_entities_query import FetchPlantEntitiesQuery
+from apps.plant.application.queries.fetch_plant_import_job_query import FetchPlantImportJobQuery
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.plant.infrastructure.adapters.secondary.orm.repositories.plant_orm_repository import PlantOrmRepository
+from apps.production.application.queries.export_production_report_query import ExportProductionReportQuery
+from apps.production.application.queries.fetch_production_aggregate_query import FetchProductionAggregateQuery
+from apps.production.application.queries.fetch_production_daily_summaries_query import \
+    FetchProductionDailySummariesQuery
+from apps.production.application.services.production_summary_service import ProductionSummaryService
+from apps.production.domain.repositories.production_archive_interface import ProductionArchiveInterface
+from apps.production.infrastructure.adapters.secondary.orm.repositories.production_ledger_orm_repository import \
+    ProductionLedgerOrmRepository
+from apps.users.application.queries.fetch_user_by_email_query import FetchUserByEmailQuery
+from apps.users.infrastructure.adapters.primary.bus.handler_factory import HandlerFactory
+from apps.users.infrastructure.adapters.secondary.orm.repositories.users_orm_repository import UsersOrmRepository
+from shared.cache import SingleFlight
 from shared.communication_bus.query_bus.query_bus import QueryBus
+from shared.database import DataBaseManager
 
 
 class QueryBusConfig:
-    def __init__(self, repositories_recommendator, mapping_repositories, parser_provider: ParserInterface, database_manager: DataBaseManager):
-        self.query_bus = QueryBus()
-        self.repositories_recommendator = repositories_recommendator
-        self.mapping_repositories = mapping_repositories
-        self.parser_provider = parser_provider,
+    def __init__(self, database_manager: DataBaseManager, users_orm_repository: UsersOrmRepository,
+                 alerts_orm_repository: AlertsOrmRepository, alert_rules_engine: AlertRulesEngine,
+                 production_ledger_orm_repository: ProductionLedgerOrmRepository,
+                 production_snapshot_every: int = 200, plant_import_service: PlantImportService = None,
+                 export_fetch_size: int = 1000, production_archive_repository: ProductionArchiveInterface = None,
+                 production_summary_service: ProductionSummaryService = None, single_flight: SingleFlight = None,
+                 production_ledger_settle_seconds: float = 60, plant_orm_repository: PlantOrmRepository = None):
+        self.query_bus = QueryBus(single_flight)
+        self.plant_orm_repository = plant_orm_repository
+        self.plant_import_service = plant_import_service
+        self.export_fetch_size = export_fetch_size
+        self.production_archive_repository = production_archive_repository
+        self.production_summary_service = production_summary_service
+        self.production_ledger_orm_repository = production_ledger_orm_repository
+        self.production_snapshot_every = production_snapshot_every
+        self.production_ledger_settle_seconds = production_ledger_settle_seconds
+        self.users_orm_repository = users_orm_repository
+        self.alerts_orm_repository = alerts_orm_repository
+        self.alert_rules_engine = alert_rules_engine
         self.database_manager = database_manager
         self.instance_query_bus()
 
@@ -14,56 +48,42 @@ class QueryBusConfig:
         """
         Initializes the services and use cases for the query bus.
         """
-        self.query_bus.register_handler(FetchLeadsRecommendedByFilterQuery,
-                                        HandlerFactory.fetch_leads_recommended_by_filter_handler(
-                                            self.repositories_recommendator,
-                                            self.mapping_repositories, self.database_manager))
+        self.query_bus.register_handler(FetchUserByEmailQuery,
+                                        HandlerFactory.fetch_user_by_email_handler(
+                                            self.users_orm_repository, self.database_manager))
 
-        self.query_bus.register_handler(FetchCustomerInfoQuery,
-                                        HandlerFactory.fetch_customer_info_handler(
-                                            self.mapping_repositories["customer_info"], self.database_manager))
+        self.query_bus.register_handler(FetchAlertsByFilterQuery,
+                                        HandlerFactory.fetch_alerts_by_filter_handler(
+                                            self.alerts_orm_repository, self.database_manager,
+                                            self.alert_rules_engine),
+                                        coalesce=True)
 
-        self.query_bus.register_handler(FetchCustomerLeadsFiltersQuery,
-                                        HandlerFactory.fetch_customer_lead_filters_handler(
-                                            self.mapping_repositories["customer_lead_filters"],
-                                            self.parser_provider, self.database_manager))
+        self.query_bus.register_handler(FetchProductionAggregateQuery,
+                                        HandlerFactory.fetch_production_aggregate_handler(
+                                            self.production_ledger_orm_repository, self.database_manager,
+                                            self.production_snapshot_every,
+                                            self.production_ledger_settle_seconds),
+                                        coalesce=True)
 
-        self.query_bus.register_handler(FetchCompanyUserQuery,
-                                        HandlerFactory.fetch_company_user_handler(
-                                            self.mapping_repositories["company_users"], self.database_manager))
+        self.query_bus.register_handler(ExportProductionReportQuery,
+                                        HandlerFactory.export_production_report_handler(
+                                            self.production_ledger_orm_repository, self.database_manager,
+                                            self.export_fetch_size, self.production_archive_repository))
+        if self.production_summary_service is not None:
+            self.query_bus.register_handler(FetchProductionDailySummariesQuery,
+                                            HandlerFactory.fetch_production_daily_summaries_handler(
+                                                self.production_summary_service),
+                                            coalesce=True)
 
-        self.query_bus.register_handler(GetByFilterCompanyUserQuery,
-                                        HandlerFactory.get_by_filter_company_user_handler(
-                                            self.mapping_repositories["company_users"], self.database_manager))
+        if self.plant_import_service is not None:
+            self.query_bus.register_handler(FetchPlantImportJobQuery,
+                                            HandlerFactory.fetch_plant_import_job_handler(self.plant_import_service))
 
-        self.query_bus.register_handler(GetCompanyStrategicDataQuery,
-                                        HandlerFactory.get_company_strategic_data_handler(
-                                            self.mapping_repositories["company_strategic_data"], self.database_manager))
-
-        self.query_bus.register_handler(FetchDomainsByFilterQuery,
-                                        HandlerFactory.fetch_domains_list_by_filter_handler(
-                                            self.mapping_repositories["ipex_companies"], self.database_manager))
-
-        self.query_bus.register_handler(FetchQuantityJobTitlesQuery,
-                                        HandlerFactory.fetch_quantity_job_titles_handler(
-                                            self.mapping_repositories["customer_lead_filters"],
-                                            self.parser_provider,
-                                            self.database_manager))
-
-        self.query_bus.register_handler(FetchIpexCustomerconfigQuery,
-                                        HandlerFactory.fetch_ipex_customer_config_handler(
-                                            self.mapping_repositories["ipex_customer_config"],
-                                            self.database_manager
-                                        ))
-
-        self.query_bus.register_handler(GetLeadsByDateByFilterQuery,
-                                        HandlerFactory.get_leads_by_date_by_filter_handler(self.database_manager))
-        self.query_bus.register_handler(GetFiltersByIdsQuery,
-                                        HandlerFactory.get_filters_by_ids_handler(self.database_manager))
-        self.query_bus.register_handler(GetCompanyDomainByLookalikeQuery,
-                                        HandlerFactory.get_company_domain_by_lookalike_handler(self.database_manager))
-        self.query_bus.register_handler(GetCustomerCompanyDomainQuery,
-                                        HandlerFactory.get_customer_company_domain_handler(self.database_manager))
+        if self.plant_orm_repository is not None:
+            self.query_bus.register_handler(FetchPlantEntitiesQuery,
+                                            HandlerFactory.fetch_plant_entities_handler(
+                                                self.plant_orm_repository, self.database_manager),
+                                            coalesce=True)
 
     def get_query_bus(self):
         return self.query_bus
@@ -0,0 +1,162 @@
+import functools
+from datetime import datetime
+from typing import Iterable, Optional
+
+from apps.alerts.application.services.alerts_service import AlertsService
+from apps.users.infrastructure.adapters.primary.bus.bus_config import BusConfig
+from shared.cache import CacheWarmer
+from shared.constants import CACHE_WARMUP_SHIFT, JOB_ALERTS_INACTIVITY_SWEEP, JOB_CACHE_WARMUP, \
+    JOB_PRODUCTION_ARCHIVE, JOB_PRODUCTION_PROJECTIONS, JOB_PRODUCTION_SUMMARIES
+from shared.scheduler import CATCH_UP_ONCE, CATCH_UP_SKIP, CronSchedule, JobScheduler, ScheduledJob, \
+    SqlJobLeaseBackend, parse_schedule
+from shared.scheduler.scheduler_exceptions import InvalidScheduleException
+
+# Bus of the scheduler process pool workers, built by the first job each worker runs
+_process_bus_config: Optional[BusConfig] = None
+
+
+def scheduler_schedules(config) -> dict[str, str]:
+    """
+    Reads the schedule of every job from the configuration of the app.
+
+    Args:
+        config (Mapping): The configuration of the app.
+
+    Returns:
+        dict[str, str]: The schedule expression of each job name.
+    """
+    return {
+        JOB_PRODUCTION_PROJECTIONS: config['SCHEDULE_PRODUCTION_PROJECTIONS'],
+        JOB_PRODUCTION_ARCHIVE: config['SCHEDULE_PRODUCTION_ARCHIVE'],
+        JOB_PRODUCTION_SUMMARIES: config['SCHEDULE_PRODUCTION_SUMMARIES'],
+        JOB_ALERTS_INACTIVITY_SWEEP: config['SCHEDULE_ALERTS_INACTIVITY_SWEEP'],
+    }
+
+
+def shift_warmup_schedule(shift_start: str, lead_minutes: int) -> CronSchedule:
+    """
+    Builds the daily schedule of the warm-up that runs some minutes before a shift starts.
+
+    Args:
+        shift_start (str): The start of the shift in UTC, as HH:MM.
+        lead_minutes (int): The minutes the warm-up runs before the start.
+
+    Returns:
+        CronSchedule: The daily schedule of the warm-up.
+
+    Raises:
+        InvalidScheduleException: If the start of the shift is not a valid HH:MM time.
+    """
+    hours, _, minutes = shift_start.strip().partition(':')
+    if not (hours.isdigit() and minutes.isdigit() and int(hours) < 24 and int(minutes) < 60):
+        raise InvalidScheduleException(f"The shift start '{shift_start}' must be a HH:MM time")
+    start = (int(hours) * 60 + int(minutes) - lead_minutes) % (24 * 60)
+    return CronSchedule(f"{start % 60} {start // 60} * * *")
+
+
+def archive_production_in_process(bus_settings: dict, scheduled_at: datetime) -> dict[str, int]:
+    """
+    Archives the closed production months from a worker of the process pool, which has no bus of its own.
+
+    Args:
+        bus_settings (dict): The arguments of the BusConfig of the worker.
+        scheduled_at (datetime): The scheduled date of the run.
+
+    Returns:
+        dict[str, int]: The events archived per tenant.
+    """
+    global _process_bus_config
+    if _process_bus_config is None:
+        _process_bus_config = BusConfig(**bus_settings)
+    return _process_bus_config.get_production_archive_service().archive_closed_months()
+
+
+class SchedulerConfig:
+    """
+    Recurring jobs of the service:
+
+    - production projections: catches the snapshots and the daily summaries up with the ledger, once per
+      occurrence across the replicas.
+    - production summaries: folds the logged records into the daily summaries, more often than the other
+      projections so the dashboards see them soon, once per occurrence across the replicas.
+    - production archive: moves the closed months to the cold archive, in the process pool when available
+      since encoding the Parquet files is CPU-bound. Only registered with an archive directory.
+    - alerts inactivity sweep: evaluates the idle rules of the in-memory engine, which every process owns, so
+      it runs in every process.
+    - cache warm-up: preloads the caches of the process before every shift start, in every process. Only
+      registered with a cache warmer, the web workers pass theirs.
+    """
+
+    def __init__(self, bus_config: BusConfig, schedules: dict[str, str], bus_settings: Optional[dict] = None,
+                 max_workers: int = 2, process_workers: int = 0, tick_seconds: float = 1,
+                 cache_warmer: Optional[CacheWarmer] = None, shift_starts: Iterable[str] = (),
+                 warmup_lead_minutes: int = 5):
+        """
+        Constructor for the SchedulerConfig class.
+
+        Args:
+            bus_config (BusConfig): The bus whose services the jobs run.
+            schedules (dict[str, str]): The schedule expression of each job name, a job without one is disabled.
+            bus_settings (Optional[dict]): The arguments of the BusConfig, needed to run the archive in the
+                process pool.
+            max_workers (int): The threads running the jobs. Defaults to 2.
+            process_workers (int): The processes running the CPU-bound jobs. Defaults to 0.
+            tick_seconds (float): The seconds between two checks of the due jobs. Defaults to 1.
+            cache_warmer (Optional[CacheWarmer]): The warmer of the caches of the process.
+            shift_starts (Iterable[str]): The starts of the shifts in UTC, as HH:MM.
+            warmup_lead_minutes (int): The minutes the warm-up runs before a shift starts. Defaults to 5.
+        """
+        self.bus_config = bus_config
+        self.job_scheduler = JobScheduler(SqlJobLeaseBackend(bus_config.database_manager), max_workers=max_workers,
+                                          process_workers=process_workers, tick_seconds=tick_seconds)
+        self.alerts_service = AlertsService(bus_config.alerts_orm_repository, bus_config.database_manager,
+                                            bus_config.alert_rules_engine, bus_config.live_updates_repository)
+
+        if schedules.get(JOB_PRODUCTION_PROJECTIONS):
+            projection_runner = bus_config.get_production_projection_runner()
+            self.job_scheduler.add_job(ScheduledJob(
+                JOB_PRODUCTION_PROJECTIONS, parse_schedule(schedules[JOB_PRODUCTION_PROJECTIONS]),
+                lambda scheduled_at: projection_runner.catch_up(),
+                catch_up=CATCH_UP_ONCE,
+            ))
+
+        if schedules.get(JOB_PRODUCTION_SUMMARIES):
+            summary_service = bus_config.get_production_summary_service()
+            self.job_scheduler.add_job(ScheduledJob(
+                JOB_PRODUCTION_SUMMARIES, parse_schedule(schedules[JOB_PRODUCTION_SUMMARIES]),
+                lambda scheduled_at: summary_service.refresh(),
+                catch_up=CATCH_UP_SKIP,
+            ))
+
+        archive_service = bus_config.get_production_archive_service()
+        if archive_service is not None and schedules.get(JOB_PRODUCTION_ARCHIVE):
+            in_process = process_workers > 0 and bus_settings is not None
+            self.job_scheduler.add_job(ScheduledJob(
+                JOB_PRODUCTION_ARCHIVE, parse_schedule(schedules[JOB_PRODUCTION_ARCHIVE]),
+                functools.partial(archive_production_in_process, bus_settings) if in_process
+                else lambda scheduled_at: archive_service.archive_closed_months(),
+                cpu_bound=in_process,
+                lease_seconds=3600,
+            ))
+
+        if schedules.get(JOB_ALERTS_INACTIVITY_SWEEP):
+            self.job_scheduler.add_job(ScheduledJob(
+                JOB_ALERTS_INACTIVITY_SWEEP, parse_schedule(schedules[JOB_ALERTS_INACTIVITY_SWEEP]),
+                lambda scheduled_at: self.alerts_service.sweep_inactivity(),
+                distributed=False,
+                catch_up=CATCH_UP_SKIP,
+            ))
+
+        if cache_warmer is not None:
+            for shift_start in shift_starts:
+                self.job_scheduler.add_job(ScheduledJob(
+                    f"{JOB_CACHE_WARMUP}_{shift_start.strip().replace(':', '')}",
+                    shift_warmup_schedule(shift_start, warmup_lead_minutes),
+                    lambda scheduled_at: cache_warmer.warm_with_jitter(CACHE_WARMUP_SHIFT),
+                    distributed=False,
+                    catch_up=CATCH_UP_SKIP,
+                    misfire_grace_seconds=warmup_lead_minutes * 60,
+                ))
+
+    def get_job_scheduler(self) -> JobScheduler:
+        return self.job_scheduler
@@ -0,0 +1,47 @@
+# Local application/library specific imports
+from apps.dashboard.infrastructure.adapters.primary.framework.controllers.live_updates_async_controller import \
+    live_updates_async_routes
+from apps.tenants.infrastructure.adapters.primary.framework.hooks.plan_limits_hook import plan_limits_asgi_hook
+from apps.users.application.services.async_users_service import AsyncUsersService
+from apps.users.infrastructure.adapters.primary.framework.controllers.users_async_controller import \
+    users_async_routes
+from apps.users.infrastructure.adapters.primary.framework.flask_app import create_app
+from apps.users.infrastructure.adapters.secondary.orm.repositories.async_users_orm_repository import \
+    AsyncUsersOrmRepository
+from shared.asgi import AsgiApp
+from shared.database import AsyncDataBaseManager
+
+
+def create_asgi_app(config_name='default') -> AsgiApp:
+    """
+    Create the ASGI application of the service using the given configuration.
+
+    The live updates are served natively in the event loop, so the open streams and long polls of the
+    dashboards only cost a suspended task each, and so are the users lookups when the asyncio engine is
+    enabled. Every other route is served by the Flask application on the thread pool of the worker, sharing
+    its buses, hub and caches.
+
+    Args:
+        config_name (str, optional): The name of the configuration to use. Defaults to 'default'.
+
+    Returns:
+        AsgiApp: The initialized ASGI application.
+    """
+    app = create_app(config_name)
+
+    routes = dict(live_updates_async_routes)
+    on_shutdown = [app.config['broadcast_hub'].close]
+    app.config['async_database_manager'] = None
+    app.config['async_users_service'] = None
+    if app.config['ASYNC_DATABASE_ENABLED']:
+        app.config['async_database_manager'] = AsyncDataBaseManager(
+            app.config['ASYNC_DATABASE_URI'] or app.config['DATABASE_URI'], app.config['tenant_cache'])
+        app.config['async_users_service'] = AsyncUsersService(AsyncUsersOrmRepository(),
+                                                               app.config['async_database_manager'])
+        routes.update(users_async_routes)
+        on_shutdown.append(app.config['async_database_manager'].dispose_engine)
+
+    return AsgiApp(app, app.config, routes,
+                   max_workers=app.config['ASGI_WSGI_THREADS'],
+                   before_request=[plan_limits_asgi_hook(app.config['plan_limits_service'])],
+                   on_shutdown=on_shutdown)
@@ -0,0 +1,37 @@
+from flask import Blueprint, jsonify, request, current_app, make_response
+
+# Local application/library specific imports
+from apps.users.application.queries.fetch_user_by_email_query import FetchUserByEmailQuery
+from apps.users.domain.entities.users_model import UserStatus
+from apps.users.infrastructure.adapters.primary.framework.validator.login_validator import LoginValidator
+from shared.constants import LOGIN_RATE_LIMIT_BURST, LOGIN_RATE_LIMIT_RATE
+from shared.decorators import handle_exceptions, rate_limited
+from shared.security import create_access_token, verify_password
+from shared.tenancy import TENANT_CLAIM, tenant_scope
+
+
+# Create a new Blueprint for the users
+users_blueprint = Blueprint('users', __name__)
+ORIGIN = 'users_urls'
+
+
+@users_blueprint.route('/auth/login', methods=['POST'])
+@rate_limited(LOGIN_RATE_LIMIT_RATE, LOGIN_RATE_LIMIT_BURST)
+@handle_exceptions
+def login():
+    """
+    Sign in a user of a tenant with its email and password.
+
+    The response carries the access token of the user, with its tenant and role. The route is anonymous, so
+    its strict bucket is keyed on the address of the client.
+    """
+    validated_model = LoginValidator(**(request.get_json(silent=True) or {}))
+    # The users are rows of their tenant, the request has none bound until it carries a token
+    with tenant_scope(validated_model.tenant_id):
+        user = current_app.config['query_bus'].ask(FetchUserByEmailQuery(email=validated_model.email))
+    if user is None or user.status != UserStatus.ACTIVE \
+            or not verify_password(validated_model.password, user.password):
+        return jsonify({"error": "Invalid credentials"}), 401
+    access_token = create_access_token({'sub': user.email, TENANT_CLAIM: validated_model.tenant_id,
+                                        'role': user.role.value})
+    return make_response(jsonify({"accessToken": access_token}), 200)
@@ -0,0 +1,33 @@
+# Local application/library specific imports
+from apps.users.infrastructure.adapters.primary.framework.validator.users_lookup_validator import \
+    UsersLookupValidator
+from shared.asgi import AsgiRequest, AsgiResponse
+from shared.decorators import async_handle_exceptions, async_token_required
+from shared.tenancy import get_current_tenant_id
+
+ORIGIN = 'users_async_urls'
+
+
+@async_handle_exceptions
+@async_token_required
+async def lookup_users(payload, request: AsgiRequest):
+    """
+    Resolve the users of the tenant with the given comma separated emails, e.g. the authors of the records of a
+    report, from the event loop.
+
+    The lookups are independent, so they are awaited together on their own connections: the request takes as
+    long as the slowest one instead of their sum. The emails of no user of the tenant are answered with null.
+    """
+    validated_model = UsersLookupValidator(tenantId=get_current_tenant_id(), emails=request.args.get('emails'))
+    users = await request.config['async_users_service'].fetch_users_by_email(validated_model.emails)
+    return AsgiResponse.json({"Users": {
+        email: {"uuid": user.uuid, "name": user.name, "email": user.email, "role": user.role.value,
+                "status": user.status.value} if user is not None else None
+        for email, user in zip(validated_model.emails, users)
+    }})
+
+
+# The native async endpoints of the users, served when the asyncio engine is enabled
+users_async_routes = {
+    ('GET', '/users/lookup'): lookup_users,
+}
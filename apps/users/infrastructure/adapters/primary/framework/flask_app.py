@@ -1,15 +1,36 @@
 # Standard library imports
 import os
 import yaml
-from flask import Flask, jsonify
+from flask import Flask, g, jsonify, request
 from flasgger import Swagger
 from prometheus_flask_exporter import PrometheusMetrics
+from werkzeug.middleware.proxy_fix import ProxyFix
 
-from apps.users.infrastructure.adapters.primary.bus.bus_config import BusConfig
+from apps.tenants.infrastructure.adapters.primary.framework.hooks.plan_limits_hook import \
+    register_plan_limits_hooks
+from apps.users.infrastructure.adapters.primary.bus.bus_config import BusConfig, bus_settings
+from apps.users.infrastructure.adapters.primary.bus.scheduler_config import SchedulerConfig, scheduler_schedules
 from apps.users.infrastructure.adapters.primary.framework.routes import register_blueprints
 from deploy.framework.config import config
-from shared.constants import USERS_SERVICE
+from shared.constants import CACHE_WARMUP_BOOT, USERS_SERVICE
 from shared.logger import LoggerService
+from shared.cache import RedisNamespaceVersionsBackend, RedisSingleFlightBackend, SingleFlight, \
+    TenantPartitionedCache
+from shared.compression import register_compression_hooks
+from shared.decorators import get_request_token
+from shared.exceptions import ServiceException
+from shared.database.sql_audit_hooks import register_sql_audit_hooks
+from shared.profiling import StackSampler
+from shared.profiling.profiling_hooks import register_profiling_hooks
+from shared.rate_limit import AdmissionController, InMemoryTokenBucketBackend, RateLimitRule, \
+    RedisTokenBucketBackend, TokenBucketRateLimiter
+from shared.rate_limit.rate_limit_hooks import register_rate_limit_hooks
+from shared.realtime import BroadcastHub, RedisBroadcastBackend
+from shared.serialization import OrjsonProvider
+from shared.tenancy import TenantNotAllowedException, reset_current_tenant_id, resolve_request_tenant, \
+    set_current_tenant_id
+from shared.tracing import ConsoleSpanExporter, OtlpHttpSpanExporter, OtlpJsonFileSpanExporter, Tracer, set_tracer
+from shared.tracing.tracing_hooks import register_tracing_hooks
 
 
 def create_app(config_name='default'):
@@ -28,18 +49,24 @@ def create_app(config_name='default'):
     origin = "users_flask_app"
     user = USERS_SERVICE
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     metrics: PrometheusMetrics = PrometheusMetrics(app)
     metrics.info('users_metrics',
                  'Metrics for the Users service', version='0.0.1')
 
     app.config.from_object(config[config_name])
+    if app.config['PROXY_FIX_X_FOR']:
+        # Only the hops of the trusted proxies are read, a client cannot spoof its address with the header
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
 
     swagger_config_path = os.path.join(os.path.dirname(__file__), 'templates/swagger/swagger_config.yml')
     components_config_path = os.path.join(os.path.dirname(__file__), 'templates/swagger/components.yml')
+    # The API docs are optional, the application serves its routes without their templates
+    swagger_template = {}
     try:
         with open(swagger_config_path, 'r') as file:
-            swagger_template = yaml.safe_load(file)
+            swagger_template = yaml.safe_load(file) or {}
     except FileNotFoundError as e:
         LoggerService.insert_error(origin, f'File {swagger_config_path} not found: {str(e)}', user)
 
@@ -50,13 +77,133 @@ def create_app(config_name='default'):
     except FileNotFoundError as e:
         LoggerService.insert_error(origin, f'File {components_config_path} not found: {str(e)}', user)
 
-    bus_config = BusConfig()
+    exporters = {
+        'console': ConsoleSpanExporter,
+        'file': lambda: OtlpJsonFileSpanExporter(app.config['TRACING_FILE_PATH']),
+        'otlp': lambda: OtlpHttpSpanExporter(app.config['TRACING_OTLP_ENDPOINT']),
+    }
+    exporter = exporters.get(app.config['TRACING_EXPORTER'])
+    set_tracer(Tracer(exporter() if exporter is not None else None,
+                      sample_ratio=app.config['TRACING_SAMPLE_RATIO'],
+                      service_name=app.config['TRACING_SERVICE_NAME'],
+                      sql_statement_spans=app.config['TRACING_SQL_STATEMENTS']))
+
+    broadcast_hub = BroadcastHub(buffer_size=app.config['LIVE_UPDATES_BUFFER_SIZE'],
+                                 history_size=app.config['LIVE_UPDATES_HISTORY_SIZE'],
+                                 max_clients=app.config['LIVE_UPDATES_MAX_CLIENTS'],
+                                 backend=RedisBroadcastBackend(app.config['LIVE_UPDATES_REDIS_URL'])
+                                 if app.config['LIVE_UPDATES_REDIS_URL'] else None)
+    # Identical reads asked at once are computed once per worker, and once for all of them with a shared lock
+    single_flight = SingleFlight(
+        RedisSingleFlightBackend(app.config['SINGLE_FLIGHT_REDIS_URL'])
+        if app.config['SINGLE_FLIGHT_REDIS_URL'] else None,
+        lock_seconds=app.config['SINGLE_FLIGHT_LOCK_SECONDS'],
+        wait_seconds=app.config['SINGLE_FLIGHT_WAIT_SECONDS'],
+        result_seconds=app.config['SINGLE_FLIGHT_RESULT_SECONDS'],
+    )
+    tenant_cache = TenantPartitionedCache(max_entries_per_tenant=app.config['TENANT_CACHE_MAX_ENTRIES'],
+                                          max_tenants=app.config['TENANT_CACHE_MAX_TENANTS'],
+                                          ttl_seconds=app.config['TENANT_CACHE_TTL_SECONDS'],
+                                          single_flight=single_flight,
+                                          versions_backend=RedisNamespaceVersionsBackend(
+                                              app.config['CACHE_VERSIONS_REDIS_URL'])
+                                          if app.config['CACHE_VERSIONS_REDIS_URL'] else None)
+    bus_config = BusConfig(broadcast_hub=broadcast_hub, tenant_cache=tenant_cache, **bus_settings(app.config))
     app.config['command_bus'] = bus_config.get_command_bus()
     app.config['query_bus'] = bus_config.get_query_bus()
     app.config['event_bus'] = bus_config.get_event_bus()
+    app.config['broadcast_hub'] = bus_config.get_broadcast_hub()
+    app.config['tenant_cache'] = bus_config.get_tenant_cache()
+    try:
+        # The engine of the worker starts with the alerts already active, so it resolves them instead of
+        # raising them again; the database rejects the duplicates anyway if it cannot be read now
+        bus_config.get_alerts_service().restore_active_alerts()
+    except ServiceException as e:
+        LoggerService.insert_error(origin, f'Error restoring the active alerts: {str(e)}', user)
+    app.config['production_projection_runner'] = bus_config.get_production_projection_runner()
+    app.config['production_summary_service'] = bus_config.get_production_summary_service()
+    app.config['production_archive_service'] = bus_config.get_production_archive_service()
+    app.config['plant_import_service'] = bus_config.get_plant_import_service()
+    try:
+        # The jobs of the workers that stopped would stay pending or running forever, with their uploads
+        app.config['plant_import_service'].recover_stale_jobs()
+    except ServiceException as e:
+        LoggerService.insert_error(origin, f'Error failing the stale import jobs: {str(e)}', user)
+    app.config['job_scheduler'] = None
+    if app.config['SCHEDULER_ENABLED']:
+        # Replicas share the leases of the jobs in the database, each occurrence runs in one of them
+        app.config['job_scheduler'] = SchedulerConfig(
+            bus_config, scheduler_schedules(app.config), bus_settings(app.config),
+            app.config['SCHEDULER_MAX_WORKERS'], app.config['SCHEDULER_PROCESS_WORKERS'],
+            app.config['SCHEDULER_TICK_SECONDS'],
+            bus_config.get_cache_warmer() if app.config['CACHE_WARMUP_ENABLED'] else None,
+            [start for start in app.config['CACHE_WARMUP_SHIFT_STARTS'].split(',') if start.strip()],
+            app.config['CACHE_WARMUP_LEAD_MINUTES'],
+        ).get_job_scheduler()
+        app.config['job_scheduler'].start()
+    app.config['stack_sampler'] = None
+    if app.config['PROFILING_ENABLED']:
+        # Every worker samples its own threads and shares the counts through the profiling directory
+        app.config['stack_sampler'] = StackSampler(app.config['PROFILING_SAMPLE_SECONDS'],
+                                                   max_stacks=app.config['PROFILING_MAX_STACKS'],
+                                                   window_seconds=app.config['PROFILING_WINDOW_SECONDS'],
+                                                   directory=app.config['PROFILING_DIR'],
+                                                   flush_seconds=app.config['PROFILING_FLUSH_SECONDS'],
+                                                   cpu_only=app.config['PROFILING_CPU_ONLY'])
+        app.config['stack_sampler'].start()
+    if app.config['CACHE_WARMUP_ENABLED']:
+        # Every worker boots with cold caches, the jitter keeps them from reading the database at once
+        bus_config.get_cache_warmer().warm_in_background(CACHE_WARMUP_BOOT)
 
     register_blueprints(app)
     Swagger(app, template=swagger_template)
+    # First, so the span of the request covers the other hooks
+    register_tracing_hooks(app)
+    register_profiling_hooks(app, app.config['PROFILING_DIR'], app.config['PROFILING_REQUESTS_ENABLED'])
+    if app.config['SQL_AUDIT_ENABLED']:
+        register_sql_audit_hooks(app, app.config['SQL_AUDIT_REPEAT_THRESHOLD'],
+                                 app.config['SQL_AUDIT_REQUEST_BUDGET'] or None)
+
+    @app.before_request
+    def bind_tenant():
+        # Every query of the request is scoped to the tenant of its verified token, never to a bare header
+        payload, _ = get_request_token()
+        try:
+            tenant_id = resolve_request_tenant(payload, request.headers.get('X-Tenant-ID'))
+        except TenantNotAllowedException as e:
+            return jsonify({'error': str(e)}), 403
+        g.tenant_token = set_current_tenant_id(tenant_id)
+        span = g.get('trace_span')
+        if span is not None:
+            span.set_attribute('tenant.id', tenant_id or '')
+        return None
+
+    @app.teardown_request
+    def unbind_tenant(error=None):
+        tenant_token = g.pop('tenant_token', None)
+        if tenant_token is not None:
+            reset_current_tenant_id(tenant_token)
+
+    if app.config['COMPRESSION_ENABLED']:
+        register_compression_hooks(app, app.config['COMPRESSION_MIN_SIZE'])
+
+    if app.config['RATE_LIMIT_ENABLED']:
+        if app.config['RATE_LIMIT_REDIS_URL']:
+            rate_limit_backend = RedisTokenBucketBackend(app.config['RATE_LIMIT_REDIS_URL'])
+        else:
+            rate_limit_backend = InMemoryTokenBucketBackend()
+        rate_limiter = TokenBucketRateLimiter(
+            rate_limit_backend,
+            RateLimitRule(app.config['RATE_LIMIT_ROUTE_RATE'], app.config['RATE_LIMIT_ROUTE_BURST']),
+            RateLimitRule(app.config['RATE_LIMIT_TENANT_RATE'], app.config['RATE_LIMIT_TENANT_BURST']))
+        admission_controller = AdmissionController(app.config['ADMISSION_MAX_CONCURRENT'],
+                                                   app.config['ADMISSION_MAX_QUEUE'],
+                                                   app.config['ADMISSION_QUEUE_TIMEOUT_SECONDS'])
+        register_rate_limit_hooks(app, rate_limiter, admission_controller,
+                                  app.config['RATE_LIMIT_EXEMPT_ENDPOINTS'])
+
+    app.config['plan_limits_service'] = bus_config.get_plan_limits_service()
+    register_plan_limits_hooks(app, app.config['plan_limits_service'])
 
     @app.route("/")
     def helloworld():
@@ -71,6 +218,10 @@ def create_app(config_name='default'):
         error_messages = error.description.split('\n')
         return jsonify({'error': 'Bad request', 'messages': error_messages}), 400
 
+    @app.errorhandler(413)
+    def request_entity_too_large(error):
+        return jsonify({'error': 'Request entity too large', 'message': error.description}), 413
+
     @app.errorhandler(500)
     def internal_server_error(error):
         return jsonify({'error': 'Internal server error', 'message': error.description}), 500
@@ -1,5 +1,15 @@
 from flask import Flask
 
+from apps.alerts.infrastructure.adapters.primary.framework.controllers.alerts_controller import alerts_blueprint
+from apps.dashboard.infrastructure.adapters.primary.framework.controllers.live_updates_controller import \
+    live_updates_blueprint
+from apps.plant.infrastructure.adapters.primary.framework.controllers.plant_controller import plant_blueprint
+from apps.plant.infrastructure.adapters.primary.framework.controllers.plant_import_controller import \
+    plant_imports_blueprint
+from apps.production.infrastructure.adapters.primary.framework.controllers.production_controller import \
+    production_blueprint
+from apps.users.infrastructure.adapters.primary.framework.controllers.user_controller import users_blueprint
+
 
 def register_blueprints(app: Flask):
     """
@@ -9,10 +19,9 @@ def register_blueprints(app: Flask):
         app (Flask): The Flask application instance.
 
     """
-    app.register_blueprint(mas_consigliere_service_blueprint)
-    app.register_blueprint(mas_consigliere_company_users_blueprint)
-    app.register_blueprint(mas_consigliere_customer_info_blueprint)
-    app.register_blueprint(mas_consigliere_customer_lead_filters_blueprint)
-    app.register_blueprint(mas_consigliere_company_strategic_data_blueprint)
-    app.register_blueprint(mas_consigliere_ipex_customer_config_blueprint)
-    app.register_blueprint(mas_consigliere_dashboard_blueprint)
+    app.register_blueprint(alerts_blueprint)
+    app.register_blueprint(live_updates_blueprint)
+    app.register_blueprint(plant_imports_blueprint)
+    app.register_blueprint(plant_blueprint)
+    app.register_blueprint(production_blueprint)
+    app.register_blueprint(users_blueprint)
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field, field_validator
+
+
+class LoginValidator(BaseModel):
+    """
+    LoginValidator: Entity to represent the credentials of a user signing in.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant the user belongs to.
+        email (str): The email of the user.
+        password (str): The password of the user.
+    """
+    tenant_id: str = Field(None, alias='tenantId', validate_default=True)
+    email: str = Field(None, alias='email', validate_default=True)
+    password: str = Field(None, alias='password', validate_default=True)
+
+    @field_validator('tenant_id', 'email', 'password')
+    def check_not_empty(cls, value, info):
+        if not value or not value.strip():
+            raise ValueError(f"El parámetro '{info.field_name}' es obligatorio y no puede estar vacío")
+        return value
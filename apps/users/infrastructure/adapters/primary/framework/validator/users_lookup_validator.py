@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field, field_validator
+
+# Emails resolved by one lookup, every one of them holds a connection of the pool while it is awaited
+MAX_LOOKUP_EMAILS = 20
+
+
+class UsersLookupValidator(BaseModel):
+    """
+    UsersLookupValidator: Entity to represent the emails of the users to resolve.
+
+    Class Attributes:
+        tenantId (str): The ID of the tenant, taken from the verified token.
+        emails (list[str]): The emails of the users, taken from the comma separated 'emails' parameter.
+    """
+    tenant_id: str = Field(None, alias='tenantId', validate_default=True)
+    emails: list[str] = Field(None, alias='emails', validate_default=True)
+
+    @field_validator('tenant_id')
+    def check_not_empty(cls, value):
+        if not value or not value.strip():
+            raise ValueError("El token no pertenece a ningún tenant")
+        return value
+
+    @field_validator('emails', mode='before')
+    def check_emails(cls, value):
+        emails = list(dict.fromkeys(email.strip() for email in (value or '').split(',') if email.strip()))
+        if not emails:
+            raise ValueError("El parámetro 'emails' es obligatorio y no puede estar vacío")
+        if len(emails) > MAX_LOOKUP_EMAILS:
+            raise ValueError(f"Solo se pueden buscar {MAX_LOOKUP_EMAILS} emails a la vez")
+        return emails
@@ -0,0 +1,29 @@
+# Standard library imports
+import os
+import signal
+
+# Related third party imports
+from dotenv import load_dotenv
+from apps.users.infrastructure.adapters.primary.bus.bus_config import BusConfig, bus_settings
+from apps.users.infrastructure.adapters.primary.bus.scheduler_config import SchedulerConfig, scheduler_schedules
+from deploy.framework.config import config
+
+if __name__ == "__main__":
+    """
+    Main entry point of the scheduler process.
+
+    Runs the recurring jobs outside the web workers, with the configuration of the environment in the FLASK_ENV
+    variable. Several scheduler processes can run side by side, the leases in the database keep each occurrence
+    of the shared jobs in one of them. SIGTERM and SIGINT stop it after the runs in progress.
+    """
+    load_dotenv()
+    settings = config[os.getenv('FLASK_ENV', 'default')]
+    settings = {name: getattr(settings, name) for name in dir(settings) if name.isupper()}
+    # The daily summaries are refreshed by their job, the scheduler gets no logged records to refresh after
+    bus_config = BusConfig(**bus_settings(settings))
+    job_scheduler = SchedulerConfig(bus_config, scheduler_schedules(settings), bus_settings(settings),
+                                    settings['SCHEDULER_MAX_WORKERS'], settings['SCHEDULER_PROCESS_WORKERS'],
+                                    settings['SCHEDULER_TICK_SECONDS']).get_job_scheduler()
+    signal.signal(signal.SIGTERM, lambda signum, frame: job_scheduler.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: job_scheduler.stop())
+    job_scheduler.run_forever()
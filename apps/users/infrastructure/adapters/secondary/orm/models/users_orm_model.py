@@ -19,8 +19,9 @@ class UsersOrmModel(TextileProBaseOrmModel):
     """
 
     __tablename__ = "users"
+    __tenant_unique__ = (("email",),)
     name = Column(String(150), nullable=False)
-    email = Column(String(150), nullable=False, unique=True, index=True)
+    email = Column(String(150), nullable=False)
     password = Column(String(200), nullable=False)
     role = Column(String(100), nullable=False)
     status = Column(String(100), nullable=False)
@@ -21,6 +21,10 @@ class UsersOrmRepository(UsersDBInterface):
         self.origin = self.__class__.__name__
         self.user: str = USERS_SERVICE
 
+    @staticmethod
+    def _to_db_values(model) -> dict:
+        return {k: (v.value if hasattr(v, 'value') else v) for k, v in model.to_db_dict().items()}
+
     def get_one_by_filter(self, session: Session, filters: GetUsersByFilterModel, trace_id: str = None
                           ) -> Optional[UsersModel]:
         """
@@ -105,7 +109,34 @@ class UsersOrmRepository(UsersDBInterface):
             raise UsersOrmRepositoryException(error_message) from e
 
     def get_by_email(self, session: Session, email: str, trace_id: str = None) -> Optional[TPBaseModelType]:
-        pass
+        """
+        Retrieves the user with an email.
+
+        Args:
+            session (Session): SQLAlchemy session.
+            email (str): The email of the user.
+            trace_id (Optional[str]): The id of the trace.
+
+        Returns:
+            Optional[UsersModel]: The user, or None if not found.
+
+        Raises:
+            UsersOrmRepositoryDBException: If there is a database error.
+            UsersOrmRepositoryException: If there is an unexpected error.
+        """
+        try:
+            user_query = session.query(UsersOrmModel).filter_by(email=email).first()
+            if not user_query:
+                return None
+            return UsersModel(**user_query.__dict__)
+        except SQLAlchemyError as e:
+            error_message = "Database error getting user by email"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise UsersOrmRepositoryDBException(error_message) from e
+        except Exception as e:
+            error_message = "Unexpected error getting user by email"
+            LoggerService.insert_error(self.origin, f"{error_message}: {str(e)}", self.user, trace_id)
+            raise UsersOrmRepositoryException(error_message) from e
 
     def insert(self, session: Session, params: InsertUsersModel, trace_id: str = None) -> UsersModel:
         """
@@ -124,8 +155,11 @@ class UsersOrmRepository(UsersDBInterface):
             UsersOrmRepositoryException: If there is an unexpected error, insert the user.
         """
         try:
-            user_to_insert = UsersOrmModel(**params.to_db_dict())
+            user_to_insert = UsersOrmModel(**self._to_db_values(params))
             session.add(user_to_insert)
+            # Assigns the ID and the server defaults the model needs
+            session.flush()
+            session.refresh(user_to_insert)
             return UsersModel(**user_to_insert.__dict__)
         except SQLAlchemyError as e:
             error_message = "Database error inserting user"
@@ -161,7 +195,7 @@ class UsersOrmRepository(UsersDBInterface):
                 LoggerService.insert_error(self.origin, error_message, self.user, trace_id)
                 raise UsersOrmRepositoryNotFoundException(error_message)
 
-            for key, value in params.to_db_dict().items():
+            for key, value in self._to_db_values(params).items():
                 setattr(user_to_update, key, value)
 
             return UsersModel(**user_to_update.__dict__)
@@ -0,0 +1,84 @@
+"""
+Benchmark of the JSON serialization of a large list response.
+
+Serializes the same payload of pydantic rows through the stdlib provider of Flask (after dumping the
+models to JSON-mode dictionaries, as the controllers used to do), through the orjson provider (passing the
+models directly) and through the streamed array, and reports the latency and the peak of the memory
+allocated by every path.
+
+Usage:
+    python -m benchmarks.json_serialization_bench --rows 10000 --repeat 20
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, UTC
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from apps.alerts.domain.entities.alerts_model import AlertScope, AlertSeverity, AlertStatus, AlertsModel
+from shared.serialization import OrjsonProvider, iter_json_array
+
+
+def _build_rows(rows: int) -> list[AlertsModel]:
+    now = datetime.now(UTC)
+    return [
+        AlertsModel(id=i, uuid=str(uuid.uuid4()), tenant_id="tenant-1", rule_code="module_low_efficiency",
+                    fingerprint=f"tenant-1:module_low_efficiency:{i}", severity=AlertSeverity.WARNING,
+                    status=AlertStatus.ACTIVE, scope=AlertScope.MODULE, scope_id=str(i % 40),
+                    title="Module efficiency below 85%", message=f"Efficiency {70 + i % 15}% in the last hour",
+                    value=70.0 + i % 15, threshold=85.0, raised_at=now - timedelta(minutes=i),
+                    resolved_at=None, created_at=now, updated_at=now)
+        for i in range(rows)
+    ]
+
+
+def _measure(label: str, func, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} median {statistics.median(timings) * 1000:8.2f} ms   "
+          f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1] * 1000:8.2f} ms   "
+          f"peak alloc {peak / 1024 / 1024:7.2f} MiB   body {size / 1024:8.1f} KiB")
+
+
+def run(rows: int, repeat: int):
+    payload = _build_rows(rows)
+    stdlib_app = Flask("stdlib")
+    stdlib_app.json = DefaultJSONProvider(stdlib_app)
+    orjson_app = Flask("orjson")
+    orjson_app.json = OrjsonProvider(orjson_app)
+
+    def stdlib_jsonify():
+        with stdlib_app.app_context():
+            return len(stdlib_app.json.response({"Alerts": [row.model_dump(mode='json') for row in payload]})
+                       .get_data())
+
+    def orjson_jsonify():
+        with orjson_app.app_context():
+            return len(orjson_app.json.response({"Alerts": payload}).get_data())
+
+    def orjson_stream():
+        return sum(len(chunk) for chunk in iter_json_array(payload, "Alerts"))
+
+    print(f"{rows} rows, {repeat} runs")
+    _measure("stdlib jsonify + model_dump", stdlib_jsonify, repeat)
+    _measure("orjson provider", orjson_jsonify, repeat)
+    _measure("orjson streamed array", orjson_stream, repeat)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.repeat)
@@ -0,0 +1,110 @@
+"""
+Benchmark of the bulk import of people.
+
+Writes a CSV of people, then imports it through the chunked pipeline of the import service (one
+validation call, one code lookup and one multi-row insert per chunk) and compares its throughput with
+the row-by-row path the import replaces (validating every row on its own, looking its code up and adding
+it through the ORM), measured on a sample of the file. Reports the rows per second and the peak of the
+memory allocated by every path.
+
+Usage:
+    python -m benchmarks.plant_import_bench --rows 100000 --chunk-size 2000 --sample 5000
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+from apps.plant.application.services.plant_import_service import PlantImportService
+from apps.plant.domain.entities.plant_import_model import ImportEntity, ImportFormat, InsertImportJobsModel, \
+    PersonImportRow
+from apps.plant.infrastructure.adapters.secondary.orm.models.people_orm_model import PeopleOrmModel
+from apps.plant.infrastructure.adapters.secondary.orm.repositories.plant_orm_repository import PlantOrmRepository
+from shared.database import DataBaseManager
+from shared.models.base_orm_model import Base
+from shared.tenancy import tenant_scope
+
+TENANT_ID = "tenant-bench"
+
+
+def _write_people(path: str, rows: int, prefix: str = "P"):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["code", "name", "status", "department", "dailyMinutes", "assignedModule", "joinDate"])
+        for i in range(rows):
+            writer.writerow([f"{prefix}{i:07d}", f"Person {i}", "Active", f"Department {i % 12}", 480,
+                             f"M{i % 40}", "2024-01-15"])
+
+
+def _row_by_row(database_manager: DataBaseManager, path: str, rows: int) -> int:
+    session = database_manager.get_session()
+    inserted = 0
+    try:
+        with open(path, newline="", encoding="utf-8") as file:
+            for i, raw in enumerate(csv.DictReader(file)):
+                if i >= rows:
+                    break
+                row = PersonImportRow.model_validate({k: v for k, v in raw.items() if v})
+                if session.query(PeopleOrmModel.id).filter_by(code=row.code).first() is not None:
+                    continue
+                session.add(PeopleOrmModel(uuid=str(uuid.uuid4()), code=row.code, name=row.name,
+                                           status=row.status.value, department=row.department,
+                                           daily_minutes=row.daily_minutes, module_code=row.module_code,
+                                           join_date=row.join_date))
+                session.commit()
+                inserted += 1
+    finally:
+        database_manager.close_session(session)
+    return inserted
+
+
+def _measure(label: str, func, rows: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    inserted = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<24} {rows:>8} rows   {elapsed:8.2f} s   {rows / elapsed:10.0f} rows/s   "
+          f"peak alloc {peak / 1024 / 1024:7.2f} MiB   inserted {inserted}")
+
+
+def run(rows: int, chunk_size: int, sample: int, database_url: str = None):
+    directory = tempfile.mkdtemp(prefix="plant-import-bench-")
+    database_manager = DataBaseManager(database_url or f"sqlite:///{os.path.join(directory, 'bench.db')}")
+    Base.metadata.create_all(database_manager.engine)
+    service = PlantImportService(PlantOrmRepository(), database_manager, chunk_size=chunk_size, max_workers=1)
+    bulk_path = os.path.join(directory, "people.csv")
+    sample_path = os.path.join(directory, "people_sample.csv")
+    _write_people(bulk_path, rows)
+    _write_people(sample_path, sample, prefix="S")
+
+    print(f"{rows} rows, chunks of {chunk_size}, row-by-row sample of {sample}")
+    with tenant_scope(TENANT_ID):
+        _measure("row by row (sample)", lambda: _row_by_row(database_manager, sample_path, sample), sample)
+        job = service.insert_import_job(InsertImportJobsModel(tenant_id=TENANT_ID, entity=ImportEntity.PEOPLE,
+                                                              file_format=ImportFormat.CSV, file_name="people.csv"))
+        _measure("chunked import", lambda: service.import_file(job.uuid, TENANT_ID, ImportEntity.PEOPLE,
+                                                               ImportFormat.CSV, bulk_path)['inserted_rows'],
+                 rows)
+        # Every code already exists, so the second pass only measures the validation and the lookups
+        job = service.insert_import_job(InsertImportJobsModel(tenant_id=TENANT_ID, entity=ImportEntity.PEOPLE,
+                                                              file_format=ImportFormat.CSV, file_name="people.csv"))
+        _measure("chunked re-import", lambda: service.import_file(job.uuid, TENANT_ID, ImportEntity.PEOPLE,
+                                                                  ImportFormat.CSV, bulk_path)['inserted_rows'],
+                 rows)
+    service.shutdown()
+    database_manager.dispose_engine()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--sample', type=int, default=5000)
+    parser.add_argument('--database-url', default=None, help='Defaults to a temporary SQLite file')
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.chunk_size, arguments.sample, arguments.database_url)
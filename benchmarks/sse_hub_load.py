@@ -0,0 +1,80 @@
+"""
+Load test of the BroadcastHub behind the /live/stream endpoint.
+
+Opens thousands of idle subscriptions, each one served by its own task in a single event loop exactly like
+the ASGI workers serve an SSE response, measures the CPU consumed by the process while the clients are idle
+and then the fan-out latency of a burst of messages published from another thread, as the Flask routes do.
+
+Usage:
+    python -m benchmarks.sse_hub_load --clients 5000 --idle-seconds 10
+"""
+import argparse
+import asyncio
+import resource
+import time
+
+from shared.realtime import BroadcastHub
+
+
+async def _client(hub: BroadcastHub, channel: str, heartbeat: float, expected: int, delivered: list,
+                  subscribed: asyncio.Event, clients: int):
+    subscription = hub.subscribe(channel)
+    if hub.stats()["clients"] >= clients:
+        subscribed.set()
+    received = 0
+    try:
+        while not subscription.closed and received < expected:
+            received += len(await subscription.drain_async(heartbeat))
+        delivered.append(time.perf_counter())
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def _publish(hub: BroadcastHub, channels: int, burst: int) -> float:
+    for sequence in range(burst):
+        for channel in range(channels):
+            hub.publish(f"tenant-{channel}", "kpi_delta", {"sequence": sequence, "moduleId": "M-01"})
+    return time.perf_counter()
+
+
+async def run(clients: int, channels: int, idle_seconds: float, burst: int, heartbeat: float):
+    hub = BroadcastHub(buffer_size=max(burst, 1), max_clients=clients)
+    delivered: list[float] = []
+    subscribed = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_client(hub, f"tenant-{i % channels}", heartbeat, burst, delivered, subscribed,
+                                    clients))
+        for i in range(clients)
+    ]
+    await subscribed.wait()
+
+    cpu_start = time.process_time()
+    await asyncio.sleep(idle_seconds)
+    idle_cpu = time.process_time() - cpu_start
+
+    publish_start = time.perf_counter()
+    publish_end = await asyncio.to_thread(_publish, hub, channels, burst)
+    publish_elapsed = publish_end - publish_start
+    await asyncio.wait(tasks, timeout=30)
+
+    latencies = sorted(t - publish_start for t in delivered)
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"clients={clients} channels={channels} idle_seconds={idle_seconds}")
+    print(f"idle cpu: {idle_cpu:.3f}s ({idle_cpu / idle_seconds * 100:.2f}% of one core)")
+    print(f"publish {burst * channels} messages: {publish_elapsed * 1000:.1f} ms")
+    if latencies:
+        print(f"delivery to all clients: p50={latencies[len(latencies) // 2] * 1000:.1f} ms "
+              f"max={latencies[-1] * 1000:.1f} ms ({len(latencies)}/{clients} clients)")
+    print(f"max rss: {rss_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--channels", type=int, default=10)
+    parser.add_argument("--idle-seconds", type=float, default=10)
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--heartbeat", type=float, default=15)
+    arguments = parser.parse_args()
+    asyncio.run(run(arguments.clients, arguments.channels, arguments.idle_seconds, arguments.burst,
+                    arguments.heartbeat))
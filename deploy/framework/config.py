@@ -10,6 +10,113 @@ class Config:
     Base configuration class.
     Defines the common configuration used in all environments.
     """
+    LIVE_UPDATES_BUFFER_SIZE = int(os.getenv("LIVE_UPDATES_BUFFER_SIZE", 100))
+    LIVE_UPDATES_HISTORY_SIZE = int(os.getenv("LIVE_UPDATES_HISTORY_SIZE", 100))
+    LIVE_UPDATES_MAX_CLIENTS = int(os.getenv("LIVE_UPDATES_MAX_CLIENTS", 10000))
+    LIVE_UPDATES_HEARTBEAT_SECONDS = int(os.getenv("LIVE_UPDATES_HEARTBEAT_SECONDS", 15))
+    LIVE_UPDATES_POLL_TIMEOUT_SECONDS = int(os.getenv("LIVE_UPDATES_POLL_TIMEOUT_SECONDS", 25))
+    # Pub/sub and event ids shared by every worker, unset only reaches the dashboards connected to the worker
+    # that published the update, so the service must then run in a single process
+    LIVE_UPDATES_REDIS_URL = os.getenv("LIVE_UPDATES_REDIS_URL")
+    TENANT_CACHE_MAX_ENTRIES = int(os.getenv("TENANT_CACHE_MAX_ENTRIES", 1000))
+    TENANT_CACHE_MAX_TENANTS = int(os.getenv("TENANT_CACHE_MAX_TENANTS", 1000))
+    TENANT_CACHE_TTL_SECONDS = int(os.getenv("TENANT_CACHE_TTL_SECONDS", 300))
+    PLAN_LIMITS_SYNC_SECONDS = int(os.getenv("PLAN_LIMITS_SYNC_SECONDS", 30))
+    PRODUCTION_SNAPSHOT_EVERY = int(os.getenv("PRODUCTION_SNAPSHOT_EVERY", 200))
+    PRODUCTION_PROJECTION_BATCH_SIZE = int(os.getenv("PRODUCTION_PROJECTION_BATCH_SIZE", 10000))
+    # Seconds after which no transaction appending to the ledger can still be open, the projections and the
+    # snapshots wait that long before skipping a gap in the event ids
+    PRODUCTION_LEDGER_SETTLE_SECONDS = float(os.getenv("PRODUCTION_LEDGER_SETTLE_SECONDS", 60))
+    IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", 2000))
+    IMPORT_MAX_WORKERS = int(os.getenv("IMPORT_MAX_WORKERS", 2))
+    IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", 500))
+    IMPORT_UPLOAD_DIR = os.getenv("IMPORT_UPLOAD_DIR")
+    # Seconds without heartbeat after which the import jobs of a stopped worker are failed at boot
+    IMPORT_STALE_SECONDS = float(os.getenv("IMPORT_STALE_SECONDS", 300))
+    # Largest request body accepted, the import uploads above it are answered with a 413
+    MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", 50 * 1024 * 1024))
+    EXPORT_FETCH_SIZE = int(os.getenv("EXPORT_FETCH_SIZE", 1000))
+    PRODUCTION_ARCHIVE_DIR = os.getenv("PRODUCTION_ARCHIVE_DIR")
+    PRODUCTION_ARCHIVE_AFTER_MONTHS = int(os.getenv("PRODUCTION_ARCHIVE_AFTER_MONTHS", 6))
+    PRODUCTION_ARCHIVE_ROW_GROUP_SIZE = int(os.getenv("PRODUCTION_ARCHIVE_ROW_GROUP_SIZE", 50000))
+    PRODUCTION_SUMMARY_REFRESH_SECONDS = float(os.getenv("PRODUCTION_SUMMARY_REFRESH_SECONDS", 60))
+    PRODUCTION_SUMMARY_REFRESH_DELAY_SECONDS = float(os.getenv("PRODUCTION_SUMMARY_REFRESH_DELAY_SECONDS", 2))
+    # Refreshes the summaries in a thread of every worker after its logged records, for the single process
+    # deployments without scheduler; otherwise the scheduled job refreshes them
+    PRODUCTION_SUMMARY_BACKGROUND_REFRESH = os.getenv("PRODUCTION_SUMMARY_BACKGROUND_REFRESH",
+                                                      "false").lower() == "true"
+    PRODUCTION_SUMMARY_CACHE_SECONDS = float(os.getenv("PRODUCTION_SUMMARY_CACHE_SECONDS", 30))
+    PRODUCTION_SUMMARY_STALE_SECONDS = float(os.getenv("PRODUCTION_SUMMARY_STALE_SECONDS", 30))
+    # Eagerness of the background reloads before a cached read expires, 0 only reloads once it expired
+    CACHE_EARLY_REFRESH_BETA = float(os.getenv("CACHE_EARLY_REFRESH_BETA", 1.0))
+    # Shared lock of the identical reads of every worker, unset only coalesces them inside each worker
+    SINGLE_FLIGHT_REDIS_URL = os.getenv("SINGLE_FLIGHT_REDIS_URL")
+    SINGLE_FLIGHT_LOCK_SECONDS = float(os.getenv("SINGLE_FLIGHT_LOCK_SECONDS", 30))
+    SINGLE_FLIGHT_WAIT_SECONDS = float(os.getenv("SINGLE_FLIGHT_WAIT_SECONDS", 5))
+    SINGLE_FLIGHT_RESULT_SECONDS = float(os.getenv("SINGLE_FLIGHT_RESULT_SECONDS", 1))
+    # Versions of the cached namespaces shared by every worker, unset only invalidates the ETags of the worker
+    # that committed the write, the others serve theirs up to the TTL of the response
+    CACHE_VERSIONS_REDIS_URL = os.getenv("CACHE_VERSIONS_REDIS_URL")
+    CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+    CACHE_WARMUP_JITTER_SECONDS = float(os.getenv("CACHE_WARMUP_JITTER_SECONDS", 10))
+    CACHE_WARMUP_MAX_WORKERS = int(os.getenv("CACHE_WARMUP_MAX_WORKERS", 2))
+    # Shift starts in UTC (HH:MM, comma separated), warmed up by the scheduler of the web workers
+    CACHE_WARMUP_SHIFT_STARTS = os.getenv("CACHE_WARMUP_SHIFT_STARTS", "06:00")
+    CACHE_WARMUP_LEAD_MINUTES = int(os.getenv("CACHE_WARMUP_LEAD_MINUTES", 5))
+    SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+    SCHEDULER_MAX_WORKERS = int(os.getenv("SCHEDULER_MAX_WORKERS", 2))
+    SCHEDULER_PROCESS_WORKERS = int(os.getenv("SCHEDULER_PROCESS_WORKERS", 1))
+    SCHEDULER_TICK_SECONDS = float(os.getenv("SCHEDULER_TICK_SECONDS", 1))
+    SCHEDULE_PRODUCTION_PROJECTIONS = os.getenv("SCHEDULE_PRODUCTION_PROJECTIONS", "@every 1m")
+    SCHEDULE_PRODUCTION_ARCHIVE = os.getenv("SCHEDULE_PRODUCTION_ARCHIVE", "0 3 * * *")
+    # Refresh of the daily summaries, run by one scheduler of the replicas at every occurrence
+    SCHEDULE_PRODUCTION_SUMMARIES = os.getenv("SCHEDULE_PRODUCTION_SUMMARIES", "@every 15s")
+    SCHEDULE_ALERTS_INACTIVITY_SWEEP = os.getenv("SCHEDULE_ALERTS_INACTIVITY_SWEEP", "@every 1m")
+    # Where the sampled traces go: none (only propagates the trace IDs), console, file or otlp
+    TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+    TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "traces/traces.jsonl")
+    TRACING_OTLP_ENDPOINT = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+    TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", 1.0))
+    TRACING_SQL_STATEMENTS = os.getenv("TRACING_SQL_STATEMENTS", "true").lower() == "true"
+    TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "textile-pro")
+    SQL_AUDIT_ENABLED = os.getenv("SQL_AUDIT_ENABLED", "true").lower() == "true"
+    # Executions of the same statement in a request reported as a likely N+1
+    SQL_AUDIT_REPEAT_THRESHOLD = int(os.getenv("SQL_AUDIT_REPEAT_THRESHOLD", 5))
+    # Statements a request may run before it is reported, 0 does not limit them
+    SQL_AUDIT_REQUEST_BUDGET = int(os.getenv("SQL_AUDIT_REQUEST_BUDGET", 50))
+    # Samples the stacks of the threads using the CPU, per route and bus message, see /admin/profiling/stacks
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "true").lower() == "true"
+    PROFILING_SAMPLE_SECONDS = float(os.getenv("PROFILING_SAMPLE_SECONDS", 0.1))
+    PROFILING_WINDOW_SECONDS = float(os.getenv("PROFILING_WINDOW_SECONDS", 600))
+    PROFILING_FLUSH_SECONDS = float(os.getenv("PROFILING_FLUSH_SECONDS", 15))
+    PROFILING_MAX_STACKS = int(os.getenv("PROFILING_MAX_STACKS", 20000))
+    PROFILING_CPU_ONLY = os.getenv("PROFILING_CPU_ONLY", "true").lower() == "true"
+    # Shared by the workers of a host: their sampled stacks and the reports of the profiled requests
+    PROFILING_DIR = os.getenv("PROFILING_DIR", "profiles")
+    # Lets the administrators profile a request with an X-Profile: cprofile|tracemalloc header
+    PROFILING_REQUESTS_ENABLED = os.getenv("PROFILING_REQUESTS_ENABLED", "true").lower() == "true"
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+    # Proxies in front of the workers that append the address of the client to X-Forwarded-For, the anonymous
+    # requests are limited on the address they saw. 0 trusts no header and uses the address of the connection
+    PROXY_FIX_X_FOR = int(os.getenv("PROXY_FIX_X_FOR", 0))
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+    RATE_LIMIT_ROUTE_RATE = float(os.getenv("RATE_LIMIT_ROUTE_RATE", 10))
+    RATE_LIMIT_ROUTE_BURST = float(os.getenv("RATE_LIMIT_ROUTE_BURST", 20))
+    RATE_LIMIT_TENANT_RATE = float(os.getenv("RATE_LIMIT_TENANT_RATE", 50))
+    RATE_LIMIT_TENANT_BURST = float(os.getenv("RATE_LIMIT_TENANT_BURST", 100))
+    ADMISSION_MAX_CONCURRENT = int(os.getenv("ADMISSION_MAX_CONCURRENT", 64))
+    ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", 64))
+    ADMISSION_QUEUE_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", 0.5))
+    RATE_LIMIT_EXEMPT_ENDPOINTS = ('live_updates.stream_live_updates', 'live_updates.poll_live_updates',
+                                   'prometheus_metrics', 'static')
+    # Threads of an ASGI worker serving the Flask routes, the native async routes run in its event loop
+    ASGI_WSGI_THREADS = int(os.getenv("ASGI_WSGI_THREADS", 32))
+    # Asyncio engine of the ASGI workers, it needs the asyncio extension of SQLAlchemy and the driver
+    ASYNC_DATABASE_ENABLED = os.getenv("ASYNC_DATABASE_ENABLED", "false").lower() == "true"
+    # Unset uses the DATABASE_URI with its asyncio driver, e.g. postgresql+asyncpg
+    ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URI")
 
 
 class DevelopmentConfig(Config):
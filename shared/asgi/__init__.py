@@ -0,0 +1,3 @@
+from .asgi_http import AsgiRequest, AsgiResponse, AsgiStream
+from .wsgi_bridge import WsgiBridge, build_environ
+from .asgi_app import AsgiApp, AsyncEndpoint, BeforeRequestHook
@@ -0,0 +1,122 @@
+import inspect
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Optional, Union
+
+from shared.asgi.asgi_http import AsgiRequest, AsgiResponse
+from shared.asgi.wsgi_bridge import WsgiBridge
+from shared.constants import ASGI_SERVICE
+from shared.decorators.token_required import check_access_token
+from shared.logger.logger_service import LoggerService
+from shared.tenancy import TenantNotAllowedException, reset_current_tenant_id, resolve_request_tenant, \
+    set_current_tenant_id
+from shared.tracing import SPAN_KIND_SERVER, get_tracer
+from shared.tracing.tracing_hooks import incoming_trace
+
+AsyncEndpoint = Callable[[AsgiRequest], Awaitable[AsgiResponse]]
+BeforeRequestHook = Callable[[AsgiRequest], Awaitable[Optional[AsgiResponse]]]
+
+
+class AsgiApp:
+    """
+    ASGI application that serves the I/O-bound endpoints natively in the event loop, where an idle connection
+    only costs a suspended task, and every other request through the WSGI application on a thread pool.
+
+    The native endpoints run with the tenant of the verified token in context and in the root span of a trace,
+    like the requests handled by the Flask hooks, and a request asking for another tenant is answered with a 403.
+    """
+
+    def __init__(self, wsgi_app: Callable, config: Mapping[str, Any], routes: Mapping[tuple[str, str], AsyncEndpoint],
+                 max_workers: int = 32, before_request: Iterable[BeforeRequestHook] = (),
+                 on_shutdown: Iterable[Callable[[], Union[None, Awaitable[None]]]] = ()):
+        """
+        Constructor for the AsgiApp class.
+
+        Args:
+            wsgi_app (Callable): The WSGI application serving the routes that are not native.
+            config (Mapping[str, Any]): The configuration passed to the native endpoints in the request.
+            routes (Mapping[tuple[str, str], AsyncEndpoint]): The native endpoints by method and path.
+            max_workers (int): The WSGI requests served at a time. Defaults to 32.
+            before_request (Iterable[BeforeRequestHook]): Hooks run before the native endpoints, the first one
+                returning a response answers the request instead of the endpoint.
+            on_shutdown (Iterable[Callable]): Functions or coroutine functions called when the server stops.
+        """
+        self.config = config
+        self.routes = dict(routes)
+        self.bridge = WsgiBridge(wsgi_app, max_workers)
+        self.before_request = tuple(before_request)
+        self.on_shutdown = tuple(on_shutdown)
+        self.origin = self.__class__.__name__
+
+    async def __call__(self, scope: dict, receive: Callable[[], Awaitable[dict]],
+                       send: Callable[[dict], Awaitable[None]]):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            # The websockets are not served, the connection is refused
+            await send({'type': 'websocket.close', 'code': 1000})
+            return
+        endpoint = self.routes.get((scope['method'], scope['path']))
+        if endpoint is None:
+            await self.bridge(scope, receive, send)
+            return
+        response = await self._dispatch(endpoint, AsgiRequest(scope, self.config))
+        await response.send(send, receive)
+
+    async def _dispatch(self, endpoint: AsyncEndpoint, request: AsgiRequest) -> AsgiResponse:
+        payload, _ = check_access_token(request.headers.get('authorization'))
+        try:
+            tenant_id = resolve_request_tenant(payload, request.headers.get('x-tenant-id'))
+        except TenantNotAllowedException as e:
+            return AsgiResponse.json({'error': str(e)}, 403)
+        trace_id, parent_span_id = incoming_trace(request.headers)
+        tenant_token = set_current_tenant_id(tenant_id)
+        try:
+            with get_tracer().start_span(f"{request.method} {request.path}", {
+                'http.method': request.method,
+                'http.route': request.path,
+                'tenant.id': tenant_id or '',
+            }, SPAN_KIND_SERVER, trace_id, parent_span_id) as span:
+                try:
+                    response = None
+                    for hook in self.before_request:
+                        response = await hook(request)
+                        if response is not None:
+                            break
+                    if response is None:
+                        response = await endpoint(request)
+                except Exception as e:
+                    LoggerService.insert_error(self.origin, f"Error handling {request.method} {request.path}: "
+                                                            f"{str(e)}", ASGI_SERVICE)
+                    span.record_exception(e)
+                    response = AsgiResponse.json({'error': 'Internal server error'}, 500)
+                span.set_attribute('http.status_code', response.status)
+                if response.status >= 500:
+                    span.status = 'error'
+                response.headers['X-Trace-ID'] = span.trace_id
+                # A stream is sent after the span ends, the span times the work done to open it
+                return response
+        finally:
+            reset_current_tenant_id(tenant_token)
+
+    async def _lifespan(self, receive: Callable[[], Awaitable[dict]], send: Callable[[dict], Awaitable[None]]):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def shutdown(self):
+        """
+        Calls the shutdown functions and stops the threads of the WSGI requests.
+        """
+        for function in self.on_shutdown:
+            try:
+                result = function()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                LoggerService.insert_error(self.origin, f"Error shutting down: {str(e)}", ASGI_SERVICE)
+        self.bridge.shutdown()
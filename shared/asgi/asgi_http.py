@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Mapping, Optional
+from urllib.parse import parse_qsl
+
+from shared.serialization import json_dumps
+
+
+class AsgiRequest:
+    """
+    HTTP request received by a native async endpoint of the AsgiApp.
+
+    The headers are keyed by their lowercase names, repeated headers are joined with commas, and the query
+    string keeps the first value of every parameter, like `request.args.get` in Flask.
+    """
+    __slots__ = ("scope", "method", "path", "headers", "args", "config")
+
+    def __init__(self, scope: dict, config: Mapping[str, Any]):
+        """
+        Constructor for the AsgiRequest class.
+
+        Args:
+            scope (dict): The ASGI scope of the HTTP connection.
+            config (Mapping[str, Any]): The configuration of the application, i.e. the Flask `app.config`.
+        """
+        self.scope = scope
+        self.method: str = scope['method']
+        self.path: str = scope['path']
+        self.headers: dict[str, str] = {}
+        for raw_name, raw_value in scope.get('headers', ()):
+            name, value = raw_name.decode('latin-1').lower(), raw_value.decode('latin-1')
+            self.headers[name] = f"{self.headers[name]},{value}" if name in self.headers else value
+        self.args: dict[str, str] = {}
+        for name, value in parse_qsl(scope.get('query_string', b'').decode('latin-1'), keep_blank_values=True):
+            self.args.setdefault(name, value)
+        self.config = config
+
+
+class AsgiResponse:
+    """
+    Complete HTTP response of a native async endpoint, sent in a single body message.
+    """
+    __slots__ = ("status", "body", "headers")
+
+    def __init__(self, body: bytes = b'', status: int = 200, headers: Optional[dict[str, str]] = None,
+                 content_type: str = 'application/json'):
+        self.status = status
+        self.body = body
+        self.headers = {'Content-Type': content_type, **(headers or {})}
+
+    @classmethod
+    def json(cls, payload: Any, status: int = 200, headers: Optional[dict[str, str]] = None) -> "AsgiResponse":
+        return cls(json_dumps(payload), status, headers)
+
+    def _start_message(self) -> dict:
+        headers = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in self.headers.items()]
+        return {'type': 'http.response.start', 'status': self.status, 'headers': headers}
+
+    async def send(self, send: Callable[[dict], Awaitable[None]], receive: Callable[[], Awaitable[dict]]):
+        self.headers['Content-Length'] = str(len(self.body))
+        await send(self._start_message())
+        await send({'type': 'http.response.body', 'body': self.body})
+
+
+class AsgiStream(AsgiResponse):
+    """
+    Streamed HTTP response of a native async endpoint, e.g. Server-Sent Events.
+
+    The chunks are sent as soon as they are produced. When the client disconnects the iteration of the chunks
+    is cancelled and the generator is closed, so its `finally` blocks release what the stream holds.
+    """
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks: AsyncIterator[bytes], status: int = 200, headers: Optional[dict[str, str]] = None,
+                 content_type: str = 'application/octet-stream'):
+        super().__init__(b'', status, headers, content_type)
+        self.chunks = chunks
+
+    async def send(self, send: Callable[[dict], Awaitable[None]], receive: Callable[[], Awaitable[dict]]):
+        async def stream():
+            await send(self._start_message())
+            async for chunk in self.chunks:
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        async def wait_for_disconnect():
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+
+        streaming = asyncio.ensure_future(stream())
+        disconnect = asyncio.ensure_future(wait_for_disconnect())
+        try:
+            await asyncio.wait((streaming, disconnect), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (streaming, disconnect):
+                task.cancel()
+            await asyncio.gather(streaming, disconnect, return_exceptions=True)
+            aclose = getattr(self.chunks, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+        if streaming.done() and not streaming.cancelled() and streaming.exception() is not None:
+            raise streaming.exception()
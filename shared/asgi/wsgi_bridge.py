@@ -0,0 +1,191 @@
+import asyncio
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Optional
+
+from shared.constants import ASGI_SERVICE
+from shared.logger.logger_service import LoggerService
+
+# The request bodies larger than this are spooled to a temporary file instead of being kept in memory
+MAX_BODY_IN_MEMORY = 1024 * 1024
+
+
+class _ClientDisconnected(Exception):
+    pass
+
+
+def build_environ(scope: dict, body) -> dict:
+    """
+    Builds the PEP 3333 environ of an ASGI HTTP request.
+
+    Args:
+        scope (dict): The ASGI scope of the HTTP connection.
+        body (IO[bytes]): The whole request body, rewound.
+
+    Returns:
+        dict: The WSGI environ.
+    """
+    root_path = scope.get('root_path', '')
+    path = scope['path']
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client')
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf-8').decode('latin-1'),
+        'PATH_INFO': path.encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0] if client else '',
+        'REMOTE_PORT': str(client[1]) if client else '',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for raw_name, raw_value in scope.get('headers', ()):
+        name, value = raw_name.decode('latin-1').upper().replace('-', '_'), raw_value.decode('latin-1')
+        if name == 'CONTENT_LENGTH':
+            continue
+        key = name if name == 'CONTENT_TYPE' else f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    # The body was read whole, its length is known even when it was sent in chunks
+    body.seek(0, 2)
+    environ['CONTENT_LENGTH'] = str(body.tell())
+    body.seek(0)
+    return environ
+
+
+class WsgiBridge:
+    """
+    Serves a WSGI application from an ASGI server, running every request in a thread of a bounded pool.
+
+    The requests are not serialized on a single thread: the pool runs as many at a time as it has threads,
+    like the threads of a gunicorn worker. A streamed response is sent chunk by chunk as the application
+    yields it, and its iteration stops when the client disconnects.
+    """
+
+    def __init__(self, wsgi_app: Callable, max_workers: int = 32):
+        """
+        Constructor for the WsgiBridge class.
+
+        Args:
+            wsgi_app (Callable): The WSGI application, e.g. the Flask application.
+            max_workers (int): The requests served at a time, the others wait for a thread. Defaults to 32.
+        """
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='wsgi-bridge')
+
+    async def __call__(self, scope: dict, receive: Callable[[], Awaitable[dict]],
+                       send: Callable[[dict], Awaitable[None]]):
+        body = await self._read_body(receive)
+        if body is None:
+            return
+        loop = asyncio.get_running_loop()
+        disconnected = threading.Event()
+
+        async def wait_for_disconnect():
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+            disconnected.set()
+
+        watcher = asyncio.ensure_future(wait_for_disconnect())
+        try:
+            await loop.run_in_executor(self.executor, self._run, build_environ(scope, body), loop, send,
+                                       disconnected)
+        finally:
+            watcher.cancel()
+            body.close()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    async def _read_body(receive: Callable[[], Awaitable[dict]]):
+        body = tempfile.SpooledTemporaryFile(max_size=MAX_BODY_IN_MEMORY)
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                body.close()
+                return None
+            body.write(message.get('body', b''))
+            if not message.get('more_body', False):
+                break
+        return body
+
+    def _run(self, environ: dict, loop: asyncio.AbstractEventLoop, send: Callable[[dict], Awaitable[None]],
+             disconnected: threading.Event):
+        """
+        Runs the WSGI application in a thread of the pool and sends its response from there, waiting for every
+        message to be sent so a slow client slows down the application instead of filling the memory.
+        """
+        state = {'start': None, 'sent': False}
+
+        def send_message(message: dict):
+            if disconnected.is_set():
+                raise _ClientDisconnected()
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def send_start():
+            if not state['sent']:
+                state['sent'] = True
+                send_message(state['start'])
+
+        def start_response(status: str, headers: list, exc_info=None):
+            if exc_info is not None and state['sent']:
+                raise exc_info[1].with_traceback(exc_info[2])
+            state['start'] = {
+                'type': 'http.response.start',
+                'status': int(status.split(' ', 1)[0]),
+                'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+            }
+            return write
+
+        def write(data: bytes):
+            send_start()
+            if data:
+                send_message({'type': 'http.response.body', 'body': data, 'more_body': True})
+
+        iterable = None
+        try:
+            iterable = self.wsgi_app(environ, start_response)
+            if isinstance(iterable, (list, tuple)):
+                # A buffered response goes in a single message, with its headers
+                send_start()
+                send_message({'type': 'http.response.body', 'body': b''.join(iterable)})
+                return
+            for chunk in iterable:
+                if chunk:
+                    send_start()
+                    send_message({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                elif disconnected.is_set():
+                    raise _ClientDisconnected()
+            send_start()
+            send_message({'type': 'http.response.body', 'body': b''})
+        except _ClientDisconnected:
+            pass
+        except Exception as e:
+            self._fail(e, state, send_message)
+        finally:
+            close: Optional[Callable] = getattr(iterable, 'close', None)
+            if close is not None:
+                close()
+
+    def _fail(self, error: Exception, state: dict, send_message: Callable[[dict], None]):
+        LoggerService.insert_error(self.__class__.__name__, f"WSGI application failed: {str(error)}", ASGI_SERVICE)
+        if state['sent']:
+            return
+        try:
+            send_message({'type': 'http.response.start', 'status': 500,
+                          'headers': [(b'content-type', b'text/plain; charset=utf-8')]})
+            send_message({'type': 'http.response.body', 'body': b'Internal Server Error'})
+        except Exception:
+            pass
@@ -0,0 +1,7 @@
+from .lru_cache import LRUCache
+from .single_flight_backends import SingleFlightBackend, InMemorySingleFlightBackend, RedisSingleFlightBackend
+from .single_flight import SingleFlight
+from .namespace_versions_backends import NamespaceVersionsBackend, InMemoryNamespaceVersionsBackend, \
+    RedisNamespaceVersionsBackend
+from .tenant_partitioned_cache import TenantPartitionedCache
+from .cache_warmer import CacheWarmer, CacheWarmupTask
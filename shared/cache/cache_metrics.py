@@ -0,0 +1,38 @@
+from prometheus_client import Counter, Histogram
+
+CACHE_WARMUP_RUNS = Counter(
+    'textile_pro_cache_warmup_runs_total',
+    'Cache warm-ups of the process by trigger',
+    ['reason'],
+)
+CACHE_WARMUP_TASKS = Counter(
+    'textile_pro_cache_warmup_tasks_total',
+    'Warm-up tasks run by outcome, once per tenant for the tenant tasks',
+    ['task', 'status'],
+)
+CACHE_WARMUP_SECONDS = Histogram(
+    'textile_pro_cache_warmup_seconds',
+    'Seconds a warm-up task took for all the tenants',
+    ['task'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0),
+)
+SINGLE_FLIGHT_CALLS = Counter(
+    'textile_pro_single_flight_calls_total',
+    'Coalesced computations by how the caller got the result: computed it, waited for a thread of the worker '
+    'or received it from another worker',
+    ['role'],
+)
+SINGLE_FLIGHT_BACKEND_ERRORS = Counter(
+    'textile_pro_single_flight_backend_errors_total',
+    'Computations not coalesced across the workers because the shared backend failed',
+)
+CACHE_BACKGROUND_REFRESHES = Counter(
+    'textile_pro_cache_background_refreshes_total',
+    'Cache entries reloaded in the background, before expiring (early) or while served stale (stale)',
+    ['reason'],
+)
+CACHE_VERSIONS_BACKEND_ERRORS = Counter(
+    'textile_pro_cache_versions_backend_errors_total',
+    'Failed reads and bumps of the namespace versions shared by the workers, a failed read skips the cache',
+    ['operation'],
+)
@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+from shared.cache.cache_metrics import CACHE_WARMUP_RUNS, CACHE_WARMUP_SECONDS, CACHE_WARMUP_TASKS
+from shared.constants import CACHE_WARMER_SERVICE
+from shared.logger import LoggerService
+from shared.tenancy.tenant_context import tenant_scope
+from shared.tracing import get_trace_id
+
+
+class CacheWarmupTask(NamedTuple):
+    """
+    A read that fills a process cache.
+
+    Attributes:
+        name (str): Name of the task in the logs and metrics.
+        func (Callable): Called with the tenant ID, in its tenant scope, for the tenant tasks and without
+            arguments for the global ones.
+        per_tenant (bool): Runs the task once per tenant. Global tasks run first, e.g. the one loading the
+            tenants.
+    """
+    name: str
+    func: Callable[..., Any]
+    per_tenant: bool = True
+
+
+class CacheWarmer:
+    """
+    Preloads the process caches before the traffic needs them: at worker boot, when every cache is cold, and
+    before the shifts start, when every dashboard of a plant opens at once.
+
+    Workers of every replica warm up at the same moments, so each one waits a random jitter first to spread
+    their reads over the database. The tenants are warmed by a few threads at a time for the same reason.
+    A failed task is logged and skipped, warming up never fails the caller.
+    """
+
+    def __init__(self, tasks: Iterable[CacheWarmupTask], tenants_provider: Callable[[], Iterable[str]],
+                 jitter_seconds: float = 10, max_workers: int = 2):
+        """
+        Constructor for the CacheWarmer class.
+
+        Args:
+            tasks (Iterable[CacheWarmupTask]): The tasks, the global ones run before the tenant ones.
+            tenants_provider (Callable[[], Iterable[str]]): Returns the tenants to warm, read after the global
+                tasks.
+            jitter_seconds (float): The maximum random wait before a delayed warm-up. Defaults to 10.
+            max_workers (int): The tenants warmed at the same time. Defaults to 2.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = CACHE_WARMER_SERVICE
+        self.tasks = list(tasks)
+        self.tenants_provider = tenants_provider
+        self.jitter_seconds = jitter_seconds
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+
+    def _run_task(self, task: CacheWarmupTask, tenant_id: Optional[str], trace_id: str) -> bool:
+        try:
+            if tenant_id is None:
+                task.func()
+            else:
+                with tenant_scope(tenant_id):
+                    task.func(tenant_id)
+            CACHE_WARMUP_TASKS.labels(task=task.name, status='succeeded').inc()
+            return True
+        except Exception as e:
+            CACHE_WARMUP_TASKS.labels(task=task.name, status='failed').inc()
+            LoggerService.insert_warning(self.origin, f"Cache warm-up task {task.name} failed for tenant "
+                                                      f"{tenant_id}: {str(e)}", self.user, trace_id)
+            return False
+
+    def warm(self, reason: str, trace_id: str = None) -> dict[str, int]:
+        """
+        Runs every task now. A warm-up that starts while another one runs is skipped.
+
+        Args:
+            reason (str): What triggered the warm-up, e.g. 'boot' or 'shift'.
+            trace_id (Optional[str]): The trace ID for the request.
+
+        Returns:
+            dict[str, int]: The successful runs per task.
+        """
+        if not trace_id:
+            trace_id = get_trace_id()
+        if not self._lock.acquire(blocking=False):
+            return {}
+        try:
+            CACHE_WARMUP_RUNS.labels(reason=reason).inc()
+            warmed = {}
+            for task in (task for task in self.tasks if not task.per_tenant):
+                with CACHE_WARMUP_SECONDS.labels(task=task.name).time():
+                    warmed[task.name] = int(self._run_task(task, None, trace_id))
+
+            tenant_tasks = [task for task in self.tasks if task.per_tenant]
+            if tenant_tasks:
+                try:
+                    tenant_ids = list(self.tenants_provider())
+                except Exception as e:
+                    LoggerService.insert_warning(self.origin, f"Cannot read the tenants to warm up: {str(e)}",
+                                                 self.user, trace_id)
+                    tenant_ids = []
+                with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='cache-warmup') as pool:
+                    for task in tenant_tasks:
+                        with CACHE_WARMUP_SECONDS.labels(task=task.name).time():
+                            warmed[task.name] = sum(pool.map(
+                                lambda tenant_id: self._run_task(task, tenant_id, trace_id), tenant_ids))
+
+            LoggerService.insert_log(self.origin, f"Warmed up the caches on {reason}: {warmed}", self.user,
+                                     trace_id)
+            return warmed
+        finally:
+            self._lock.release()
+
+    def warm_with_jitter(self, reason: str, trace_id: str = None) -> dict[str, int]:
+        """
+        Waits a random jitter and runs every task, blocking the caller.
+        """
+        time.sleep(random.uniform(0, self.jitter_seconds))
+        return self.warm(reason, trace_id)
+
+    def warm_in_background(self, reason: str):
+        """
+        Waits a random jitter and runs every task in a daemon thread, without blocking the caller.
+        """
+        threading.Thread(target=self.warm_with_jitter, args=(reason,), name='cache-warmup', daemon=True).start()
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe least recently used cache with an optional time to live per entry.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        """
+        Constructor for the LRUCache class.
+
+        Args:
+            max_entries (int): The maximum number of entries kept.
+            ttl_seconds (Optional[float]): The default time to live of the entries, None means no expiration.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value of a key and marks it as recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned when the key is missing or expired.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        Stores a value, evicting the least recently used entry when the cache is full.
+
+        Args:
+            key (Hashable): The key to store.
+            value (Any): The value to store.
+            ttl_seconds (Optional[float]): The time to live of the entry. Defaults to the cache TTL.
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate) -> int:
+        """
+        Deletes the entries whose key matches the predicate.
+
+        Args:
+            predicate (Callable[[Hashable], bool]): The predicate applied to the keys.
+
+        Returns:
+            int: The number of deleted entries.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
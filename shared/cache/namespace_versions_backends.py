@@ -0,0 +1,100 @@
+import threading
+import uuid
+from abc import ABC, abstractmethod
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - the shared backend is optional
+    redis = None
+
+
+class NamespaceVersionsBackend(ABC):
+    """
+    Storage of the versions of the cache namespaces of every tenant, bumped when their rows change, and of the
+    epoch that keeps the versions of a store that lost them from matching the ones handed out before.
+    """
+
+    # Whether every worker reads the same versions, so a write seen by one worker invalidates all of them
+    shared: bool = False
+
+    @abstractmethod
+    def read(self, tenant_id: str, namespaces: tuple[str, ...]) -> tuple[str, tuple[int, ...]]:
+        """
+        Reads the epoch of the store and the versions of some namespaces of a tenant.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            namespaces (tuple[str, ...]): The namespaces to read.
+
+        Returns:
+            tuple[str, tuple[int, ...]]: The epoch and the version of every namespace, in the given order.
+        """
+        pass
+
+    @abstractmethod
+    def bump(self, tenant_id: str, namespace: str):
+        """
+        Increments the version of a namespace of a tenant.
+        """
+        pass
+
+
+class InMemoryNamespaceVersionsBackend(NamespaceVersionsBackend):
+    """
+    Versions of a single worker: the writes committed by other workers do not bump them.
+    """
+
+    def __init__(self):
+        self._versions: dict[tuple[str, str], int] = {}
+        # Versions restart with the process, the epoch keeps them from matching the ones of a previous run
+        self.epoch = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+
+    def read(self, tenant_id: str, namespaces: tuple[str, ...]) -> tuple[str, tuple[int, ...]]:
+        with self._lock:
+            return self.epoch, tuple(self._versions.get((tenant_id, namespace), 0) for namespace in namespaces)
+
+    def bump(self, tenant_id: str, namespace: str):
+        with self._lock:
+            self._versions[(tenant_id, namespace)] = self._versions.get((tenant_id, namespace), 0) + 1
+
+
+class RedisNamespaceVersionsBackend(NamespaceVersionsBackend):
+    """
+    Versions shared by every worker and host, stored in Redis or any server speaking its protocol (Valkey,
+    KeyDB, Dragonfly...) as one hash per tenant.
+
+    The epoch is stored next to them and read with them, so a server restarted without persistence hands out
+    a new epoch together with the versions that restarted from zero.
+    """
+
+    shared = True
+
+    def __init__(self, url: str, key_prefix: str = "cache_versions:", socket_timeout: float = 0.05):
+        """
+        Constructor for the RedisNamespaceVersionsBackend class.
+
+        Args:
+            url (str): The URL of the server, e.g. redis://localhost:6379/0.
+            key_prefix (str): The prefix of the epoch and version keys.
+            socket_timeout (float): The seconds to wait for the server before failing the call.
+        """
+        if redis is None:
+            raise ImportError("The redis package is required to share the cache versions between workers")
+        self.key_prefix = key_prefix
+        self._epoch_key = f"{key_prefix}epoch"
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout,
+                                            socket_connect_timeout=socket_timeout)
+
+    def read(self, tenant_id: str, namespaces: tuple[str, ...]) -> tuple[str, tuple[int, ...]]:
+        pipeline = self._client.pipeline(transaction=False)
+        pipeline.get(self._epoch_key)
+        pipeline.hmget(f"{self.key_prefix}{tenant_id}", namespaces)
+        epoch, versions = pipeline.execute()
+        if epoch is None:
+            self._client.set(self._epoch_key, uuid.uuid4().hex[:12], nx=True)
+            epoch = self._client.get(self._epoch_key)
+        return epoch.decode(), tuple(int(version or 0) for version in versions)
+
+    def bump(self, tenant_id: str, namespace: str):
+        self._client.hincrby(f"{self.key_prefix}{tenant_id}", namespace, 1)
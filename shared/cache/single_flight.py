@@ -0,0 +1,188 @@
+import contextvars
+import pickle
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from shared.cache.cache_metrics import SINGLE_FLIGHT_BACKEND_ERRORS, SINGLE_FLIGHT_CALLS
+from shared.cache.single_flight_backends import SingleFlightBackend
+
+T = TypeVar('T')
+
+
+class _Call:
+    """
+    A computation in flight in the worker and the threads waiting for it.
+    """
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces the concurrent computations of the same key: the first caller computes and the others wait
+    for its result instead of running the same query again.
+
+    Inside a worker the followers wait on the thread computing. With a shared backend the workers also
+    coalesce among them: the worker holding the lock of the key computes and publishes the result for
+    `result_seconds`, the others wait for it up to `wait_seconds` and compute themselves when it does not
+    arrive, so a slow or dead worker never blocks the rest. Results crossing workers must be picklable, and
+    they can be up to `result_seconds` older than a write made by another worker.
+    """
+
+    def __init__(self, backend: Optional[SingleFlightBackend] = None, lock_seconds: float = 30,
+                 wait_seconds: float = 5, result_seconds: float = 1, poll_seconds: float = 0.02,
+                 max_background_workers: int = 2):
+        """
+        Constructor for the SingleFlight class.
+
+        Args:
+            backend (Optional[SingleFlightBackend]): The backend shared by the workers, None only coalesces
+                inside the worker.
+            lock_seconds (float): The seconds a worker holds the lock of a key if it dies. Defaults to 30.
+            wait_seconds (float): The seconds a worker waits for the result of another. Defaults to 5.
+            result_seconds (float): The seconds a published result is served to the workers. Defaults to 1.
+            poll_seconds (float): The seconds between two checks of a published result. Defaults to 0.02.
+            max_background_workers (int): The threads running the background computations. Defaults to 2.
+        """
+        self.backend = backend
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        self.result_seconds = result_seconds
+        self.poll_seconds = poll_seconds
+        self.max_background_workers = max_background_workers
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def do(self, key: str, func: Callable[[], T]) -> T:
+        """
+        Returns the result of a computation, sharing it with the concurrent callers of the same key.
+
+        Args:
+            key (str): The key of the computation, it must identify everything the result depends on,
+                including the tenant.
+            func (Callable[[], T]): The computation.
+
+        Returns:
+            T: The result, which is shared by the callers and must not be modified.
+
+        Raises:
+            Exception: The error raised by the computation, to every caller waiting for it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            SINGLE_FLIGHT_CALLS.labels(role='follower').inc()
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._compute(key, func)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self, key: str) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do_in_background(self, key: str, func: Callable[[], Any]) -> bool:
+        """
+        Starts a computation in a background thread unless the key is already in flight, without waiting
+        for it. The context variables of the caller, such as the tenant, are kept.
+
+        Returns:
+            bool: Whether the computation was started.
+        """
+        if self.in_flight(key):
+            return False
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_background_workers,
+                                                    thread_name_prefix='single-flight')
+        context = contextvars.copy_context()
+        self._executor.submit(context.run, self._do_quietly, key, func)
+        return True
+
+    def _do_quietly(self, key: str, func: Callable[[], Any]):
+        try:
+            self.do(key, func)
+        except Exception:
+            # The caller served the value it had, the next read tries again
+            pass
+
+    def _compute(self, key: str, func: Callable[[], T]) -> T:
+        if self.backend is None:
+            SINGLE_FLIGHT_CALLS.labels(role='leader').inc()
+            return func()
+
+        owner = uuid.uuid4().hex
+        try:
+            payload = self.backend.fetch(key)
+            if payload is not None:
+                SINGLE_FLIGHT_CALLS.labels(role='remote').inc()
+                return pickle.loads(payload)
+            acquired = self.backend.acquire(key, owner, self.lock_seconds)
+        except Exception:
+            SINGLE_FLIGHT_BACKEND_ERRORS.inc()
+            SINGLE_FLIGHT_CALLS.labels(role='leader').inc()
+            return func()
+
+        if not acquired:
+            value = self._wait_remote(key)
+            if value is not None:
+                SINGLE_FLIGHT_CALLS.labels(role='remote').inc()
+                return value[0]
+            SINGLE_FLIGHT_CALLS.labels(role='leader').inc()
+            return func()
+
+        SINGLE_FLIGHT_CALLS.labels(role='leader').inc()
+        try:
+            value = func()
+            try:
+                self.backend.publish(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                                     self.result_seconds)
+            except Exception:
+                SINGLE_FLIGHT_BACKEND_ERRORS.inc()
+            return value
+        finally:
+            try:
+                self.backend.release(key, owner)
+            except Exception:
+                SINGLE_FLIGHT_BACKEND_ERRORS.inc()
+
+    def _wait_remote(self, key: str) -> Optional[tuple[Any]]:
+        """
+        Waits for the result published by the worker holding the lock, None when it fails, gives up or is
+        too slow.
+        """
+        deadline = time.monotonic() + self.wait_seconds
+        try:
+            while time.monotonic() < deadline:
+                payload = self.backend.fetch(key)
+                if payload is not None:
+                    return (pickle.loads(payload),)
+                if not self.backend.is_locked(key):
+                    # Released without a result, the computation failed there
+                    return None
+                time.sleep(self.poll_seconds)
+        except Exception:
+            SINGLE_FLIGHT_BACKEND_ERRORS.inc()
+        return None
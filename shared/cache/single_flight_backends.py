@@ -0,0 +1,152 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - the shared backend is optional
+    redis = None
+
+
+class SingleFlightBackend(ABC):
+    """
+    Storage shared by the workers to coalesce the same computation across them: a lock per key, taken by the
+    worker that computes, and the result it publishes for the others for a few seconds.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        """
+        Takes the lock of a key unless another worker holds it.
+
+        Args:
+            key (str): The key of the computation.
+            owner (str): A token unique to the caller, needed to release the lock.
+            ttl_seconds (float): The seconds the lock lasts if its owner dies.
+
+        Returns:
+            bool: Whether the lock was taken.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str, owner: str):
+        """
+        Frees the lock of a key if the owner still holds it.
+        """
+        pass
+
+    @abstractmethod
+    def is_locked(self, key: str) -> bool:
+        """
+        Returns whether a worker is computing a key.
+        """
+        pass
+
+    @abstractmethod
+    def publish(self, key: str, payload: bytes, ttl_seconds: float):
+        """
+        Stores the serialized result of a key for the workers waiting for it.
+        """
+        pass
+
+    @abstractmethod
+    def fetch(self, key: str) -> Optional[bytes]:
+        """
+        Returns the serialized result of a key, None when there is none.
+        """
+        pass
+
+
+class InMemorySingleFlightBackend(SingleFlightBackend):
+    """
+    Locks and results of a single worker, for development and for the tests of the callers.
+    """
+
+    def __init__(self):
+        self._locks: dict[str, tuple[str, float]] = {}
+        self._results: dict[str, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            current = self._locks.get(key)
+            if current is not None and current[1] > now:
+                return False
+            self._locks[key] = (owner, now + ttl_seconds)
+            return True
+
+    def release(self, key: str, owner: str):
+        with self._lock:
+            current = self._locks.get(key)
+            if current is not None and current[0] == owner:
+                del self._locks[key]
+
+    def is_locked(self, key: str) -> bool:
+        with self._lock:
+            current = self._locks.get(key)
+            return current is not None and current[1] > time.monotonic()
+
+    def publish(self, key: str, payload: bytes, ttl_seconds: float):
+        with self._lock:
+            self._results[key] = (payload, time.monotonic() + ttl_seconds)
+
+    def fetch(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                return None
+            if result[1] <= time.monotonic():
+                del self._results[key]
+                return None
+            return result[0]
+
+
+# Deletes the lock only if it still belongs to the caller, a lock that expired may already be someone else's
+_REDIS_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisSingleFlightBackend(SingleFlightBackend):
+    """
+    Locks and results shared by every worker and host, stored in Redis or any server speaking its protocol
+    (Valkey, KeyDB, Dragonfly...).
+    """
+
+    def __init__(self, url: str, key_prefix: str = "single_flight:", socket_timeout: float = 0.05):
+        """
+        Constructor for the RedisSingleFlightBackend class.
+
+        Args:
+            url (str): The URL of the server, e.g. redis://localhost:6379/0.
+            key_prefix (str): The prefix of the lock and result keys.
+            socket_timeout (float): The seconds to wait for the server before failing the call.
+        """
+        if redis is None:
+            raise ImportError("The redis package is required to coalesce the computations between workers")
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout,
+                                            socket_connect_timeout=socket_timeout)
+        self._release_script = self._client.register_script(_REDIS_RELEASE_SCRIPT)
+
+    def acquire(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        return bool(self._client.set(f"{self.key_prefix}lock:{key}", owner, nx=True,
+                                     px=max(int(ttl_seconds * 1000), 1)))
+
+    def release(self, key: str, owner: str):
+        self._release_script(keys=[f"{self.key_prefix}lock:{key}"], args=[owner])
+
+    def is_locked(self, key: str) -> bool:
+        return bool(self._client.exists(f"{self.key_prefix}lock:{key}"))
+
+    def publish(self, key: str, payload: bytes, ttl_seconds: float):
+        self._client.set(f"{self.key_prefix}result:{key}", payload, px=max(int(ttl_seconds * 1000), 1))
+
+    def fetch(self, key: str) -> Optional[bytes]:
+        return self._client.get(f"{self.key_prefix}result:{key}")
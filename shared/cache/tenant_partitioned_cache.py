@@ -0,0 +1,257 @@
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, NamedTuple, Optional
+
+from shared.cache.cache_metrics import CACHE_BACKGROUND_REFRESHES, CACHE_VERSIONS_BACKEND_ERRORS
+from shared.cache.lru_cache import LRUCache
+from shared.cache.namespace_versions_backends import InMemoryNamespaceVersionsBackend, NamespaceVersionsBackend
+from shared.cache.single_flight import SingleFlight
+from shared.tenancy.tenant_context import get_current_tenant_id
+from shared.tenancy.tenant_exceptions import TenantContextMissingException
+
+
+class _LoadedEntry(NamedTuple):
+    """
+    Value stored by `get_or_load`, with the monotonic time it stops being fresh, the seconds it took to load,
+    which weighs the early refresh, and the version of its namespace when it was loaded.
+    """
+    value: Any
+    fresh_until: float
+    load_seconds: float
+    version: int
+
+
+class TenantPartitionedCache:
+    """
+    Process cache split in one bounded LRU partition per tenant.
+
+    Every tenant has its own entry budget, so a big tenant only evicts its own entries and never the hot data
+    of a small tenant. Inside a partition the keys are grouped in namespaces (usually a table or an aggregate)
+    that can be invalidated at once when their rows change. Every invalidation also bumps the version of the
+    namespace, which lets callers such as the HTTP response cache build validators without reading the rows.
+
+    The entries are kept by every worker, the versions by the versions backend. With a shared backend a write
+    committed by any worker bumps the versions seen by all of them, so their validators change and the values
+    of `get_or_load` loaded before it are not served again. When the shared backend cannot be reached the
+    versions are unknown and nothing is served from the cache.
+
+    `get_or_load` reads through the cache: the loads of a key are coalesced by the single flight, so a hot
+    key that expires is loaded once however many requests miss it.
+    """
+
+    def __init__(self, max_entries_per_tenant: int = 1000, max_tenants: int = 1000,
+                 ttl_seconds: Optional[float] = 300, tenant_max_entries: Optional[dict[str, int]] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 versions_backend: Optional[NamespaceVersionsBackend] = None):
+        """
+        Constructor for the TenantPartitionedCache class.
+
+        Args:
+            max_entries_per_tenant (int): The default entry budget of a tenant partition. Defaults to 1000.
+            max_tenants (int): The maximum partitions kept, the least recently used tenant is dropped first.
+            ttl_seconds (Optional[float]): The default time to live of the entries. Defaults to 300.
+            tenant_max_entries (Optional[dict[str, int]]): Entry budgets that override the default per tenant.
+            single_flight (Optional[SingleFlight]): Coalesces the loads of `get_or_load`. Defaults to one that
+                only coalesces inside the worker.
+            versions_backend (Optional[NamespaceVersionsBackend]): Stores the versions of the namespaces.
+                Defaults to one that only tracks the writes of the worker.
+        """
+        self.max_entries_per_tenant = max_entries_per_tenant
+        self.max_tenants = max_tenants
+        self.ttl_seconds = ttl_seconds
+        self.tenant_max_entries = dict(tenant_max_entries or {})
+        self._partitions: OrderedDict[str, LRUCache] = OrderedDict()
+        self.versions_backend = versions_backend or InMemoryNamespaceVersionsBackend()
+        self.single_flight = single_flight or SingleFlight()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _resolve_tenant(tenant_id: Optional[str]) -> str:
+        tenant_id = tenant_id or get_current_tenant_id()
+        if not tenant_id:
+            raise TenantContextMissingException("A tenant is required to use the tenant cache")
+        return tenant_id
+
+    def partition(self, tenant_id: Optional[str] = None) -> LRUCache:
+        """
+        Returns the partition of a tenant, creating it when needed.
+
+        Args:
+            tenant_id (Optional[str]): The ID of the tenant. Defaults to the tenant in context.
+
+        Returns:
+            LRUCache: The partition of the tenant.
+        """
+        tenant_id = self._resolve_tenant(tenant_id)
+        with self._lock:
+            partition = self._partitions.get(tenant_id)
+            if partition is None:
+                partition = LRUCache(self.tenant_max_entries.get(tenant_id, self.max_entries_per_tenant),
+                                     self.ttl_seconds)
+                self._partitions[tenant_id] = partition
+                while len(self._partitions) > self.max_tenants:
+                    self._partitions.popitem(last=False)
+            else:
+                self._partitions.move_to_end(tenant_id)
+            return partition
+
+    def get(self, namespace: str, key: Hashable, default: Any = None, tenant_id: Optional[str] = None) -> Any:
+        return self.partition(tenant_id).get((namespace, key), default)
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl_seconds: Optional[float] = None,
+            tenant_id: Optional[str] = None):
+        self.partition(tenant_id).set((namespace, key), value, ttl_seconds)
+
+    def delete(self, namespace: str, key: Hashable, tenant_id: Optional[str] = None):
+        self.partition(tenant_id).delete((namespace, key))
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any],
+                    ttl_seconds: Optional[float] = None, stale_seconds: float = 0, early_refresh_beta: float = 1.0,
+                    tenant_id: Optional[str] = None) -> Any:
+        """
+        Returns the cached value of a key, loading it once for all the concurrent callers when it is missing.
+
+        A fresh value is reloaded in the background before it expires with a probability that grows as the
+        expiry approaches and with the time the load takes (probabilistic early expiration, `beta` > 1 refreshes
+        earlier, 0 disables it), so a hot key is rarely seen expired. Once expired the value is still served
+        for `stale_seconds` while a background load replaces it. An invalidated namespace is always loaded
+        again before answering.
+
+        Args:
+            namespace (str): The namespace of the key.
+            key (Hashable): The key.
+            loader (Callable[[], Any]): Loads the value, it runs in the context of the first caller.
+            ttl_seconds (Optional[float]): The seconds the value is fresh. Defaults to the cache TTL.
+            stale_seconds (float): The seconds an expired value is served while it reloads. Defaults to 0.
+            early_refresh_beta (float): The eagerness of the early refresh. Defaults to 1.
+            tenant_id (Optional[str]): The ID of the tenant. Defaults to the tenant in context.
+
+        Returns:
+            Any: The value, shared by every caller, it must not be modified.
+        """
+        tenant_id = self._resolve_tenant(tenant_id)
+        entry = self.get(namespace, key, tenant_id=tenant_id)
+        # An entry loaded before a write committed by another worker is loaded again
+        if isinstance(entry, _LoadedEntry) and (entry.version,) == self.namespace_versions((namespace,), tenant_id):
+            now = time.monotonic()
+            if now >= entry.fresh_until:
+                self._load_in_background(namespace, key, loader, ttl_seconds, stale_seconds, tenant_id, 'stale')
+            elif early_refresh_beta > 0 and \
+                    now - entry.load_seconds * early_refresh_beta * math.log(1.0 - random.random()) \
+                    >= entry.fresh_until:
+                self._load_in_background(namespace, key, loader, ttl_seconds, stale_seconds, tenant_id, 'early')
+            return entry.value
+        return self.load(namespace, key, loader, ttl_seconds, stale_seconds, tenant_id)
+
+    def load(self, namespace: str, key: Hashable, loader: Callable[[], Any], ttl_seconds: Optional[float] = None,
+             stale_seconds: float = 0, tenant_id: Optional[str] = None) -> Any:
+        """
+        Loads the value of a key and caches it for `get_or_load`, joining the load in flight if any.
+        """
+        tenant_id = self._resolve_tenant(tenant_id)
+        return self.single_flight.do(self._flight_key(namespace, key, tenant_id),
+                                     lambda: self._load(namespace, key, loader, ttl_seconds, stale_seconds, tenant_id))
+
+    def _flight_key(self, namespace: str, key: Hashable, tenant_id: str) -> str:
+        # The version keeps a load started before an invalidation from being joined after it
+        version = self.namespace_versions((namespace,), tenant_id=tenant_id)
+        return f"{tenant_id}\x1f{namespace}\x1f{version}\x1f{key!r}"
+
+    def _load(self, namespace: str, key: Hashable, loader: Callable[[], Any], ttl_seconds: Optional[float],
+              stale_seconds: float, tenant_id: str) -> Any:
+        versions = self.namespace_versions((namespace,), tenant_id=tenant_id)
+        started_at = time.monotonic()
+        value = loader()
+        loaded_at = time.monotonic()
+        if versions is None or self.namespace_versions((namespace,), tenant_id=tenant_id) != versions:
+            # Invalidated while loading, the value may predate the write, or the version is unknown
+            return value
+        ttl_seconds = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        fresh_until = loaded_at + ttl_seconds if ttl_seconds is not None else math.inf
+        self.set(namespace, key, _LoadedEntry(value, fresh_until, loaded_at - started_at, versions[0]),
+                 ttl_seconds + stale_seconds if ttl_seconds is not None else None, tenant_id=tenant_id)
+        return value
+
+    def _load_in_background(self, namespace: str, key: Hashable, loader: Callable[[], Any],
+                            ttl_seconds: Optional[float], stale_seconds: float, tenant_id: str, reason: str):
+        if self.single_flight.do_in_background(
+                self._flight_key(namespace, key, tenant_id),
+                lambda: self._load(namespace, key, loader, ttl_seconds, stale_seconds, tenant_id)):
+            CACHE_BACKGROUND_REFRESHES.labels(reason=reason).inc()
+
+    def invalidate_namespace(self, namespace: str, tenant_id: Optional[str] = None) -> int:
+        """
+        Drops every entry of a namespace in the partition of a tenant.
+
+        Args:
+            namespace (str): The namespace to invalidate.
+            tenant_id (Optional[str]): The ID of the tenant. Defaults to the tenant in context.
+
+        Returns:
+            int: The number of dropped entries.
+        """
+        tenant_id = self._resolve_tenant(tenant_id)
+        try:
+            self.versions_backend.bump(tenant_id, namespace)
+        except Exception:
+            CACHE_VERSIONS_BACKEND_ERRORS.labels(operation='bump').inc()
+        with self._lock:
+            partition = self._partitions.get(tenant_id)
+        if partition is None:
+            return 0
+        return partition.delete_where(lambda key: key[0] == namespace)
+
+    def namespace_validator(self, namespaces: Iterable[str], tenant_id: Optional[str] = None
+                            ) -> Optional[tuple[str, tuple[int, ...]]]:
+        """
+        Returns the epoch of the versions backend and the versions of some namespaces of a tenant, bumped every
+        time they are invalidated.
+
+        Args:
+            namespaces (Iterable[str]): The namespaces to read.
+            tenant_id (Optional[str]): The ID of the tenant. Defaults to the tenant in context.
+
+        Returns:
+            Optional[tuple[str, tuple[int, ...]]]: The epoch and the version of every namespace, in the given
+                order, None when the versions backend failed.
+        """
+        tenant_id = self._resolve_tenant(tenant_id)
+        try:
+            return self.versions_backend.read(tenant_id, tuple(namespaces))
+        except Exception:
+            CACHE_VERSIONS_BACKEND_ERRORS.labels(operation='read').inc()
+            return None
+
+    def namespace_versions(self, namespaces: Iterable[str], tenant_id: Optional[str] = None
+                           ) -> Optional[tuple[int, ...]]:
+        """
+        Returns the versions of some namespaces of a tenant, None when the versions backend failed.
+        """
+        validator = self.namespace_validator(namespaces, tenant_id)
+        return validator[1] if validator is not None else None
+
+    @property
+    def versions_shared(self) -> bool:
+        """
+        Whether the versions are shared by every worker.
+        """
+        return self.versions_backend.shared
+
+    def clear_tenant(self, tenant_id: str):
+        with self._lock:
+            self._partitions.pop(tenant_id, None)
+
+    def stats(self) -> dict:
+        """
+        Returns the size, hits, misses and evictions of every tenant partition.
+        """
+        with self._lock:
+            partitions = list(self._partitions.items())
+        return {
+            tenant_id: {"entries": len(partition), "max_entries": partition.max_entries, "hits": partition.hits,
+                        "misses": partition.misses, "evictions": partition.evictions}
+            for tenant_id, partition in partitions
+        }
@@ -0,0 +1,207 @@
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Iterator, Optional
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+
+from shared.exceptions import ApplicationException, DomainException, HandlerException, InfrastructureException, \
+    RepositoryException, ServiceException, TextileProException
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Layers of the exception hierarchy, the most specific first
+_ERROR_LAYERS = (HandlerException, ServiceException, RepositoryException, InfrastructureException,
+                 DomainException, ApplicationException, TextileProException)
+
+
+def _error_labels(error: BaseException) -> tuple[str, str]:
+    """
+    Returns the class and the layer of an error. Only the classes of the application hierarchy are named,
+    so the label values stay bounded.
+    """
+    for layer in _ERROR_LAYERS:
+        if isinstance(error, layer):
+            return type(error).__name__, layer.__name__
+    return 'unexpected', 'unexpected'
+
+
+class LatencyStats:
+    """
+    Latency histogram, in-flight count and errors of a message type, written by a single thread.
+    """
+    __slots__ = ("buckets", "count", "sum", "in_flight", "errors")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.in_flight = 0
+        self.errors: dict[tuple[str, str], int] = {}
+
+    def observe(self, seconds: float):
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def error(self, error: BaseException):
+        labels = _error_labels(error)
+        self.errors[labels] = self.errors.get(labels, 0) + 1
+
+    def merge(self, other: "LatencyStats"):
+        for index, value in enumerate(other.buckets):
+            self.buckets[index] += value
+        self.count += other.count
+        self.sum += other.sum
+        self.in_flight += other.in_flight
+        for labels, value in other.errors.items():
+            self.errors[labels] = self.errors.get(labels, 0) + value
+
+
+class BusMetrics:
+    """
+    Latency, in-flight and error metrics of the messages dispatched by a bus, per message type, and the lag
+    and latency of the event handlers.
+
+    Recording a dispatch must cost well under a microsecond, which the locks of the Prometheus metrics do
+    not allow, so every thread writes its own plain counters and the collector adds them up when the metrics
+    are scraped. The counters of the finished threads are folded into a retired set to keep the totals.
+    The labels are the names of the registered message and handler classes, which are bounded.
+    """
+
+    def __init__(self, bus: str):
+        self.bus = bus
+        self._local = threading.local()
+        self._shards: list[tuple[weakref.ref, dict]] = []
+        self._retired: dict[tuple, LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        shard = self._local.__dict__.get('stats')
+        if shard is None:
+            shard = self._local.stats = {}
+            with self._lock:
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+        return shard
+
+    def stats(self, message: str) -> LatencyStats:
+        """
+        Returns the statistics of a message type for the current thread.
+        """
+        shard = self._local.__dict__.get('stats') or self._shard()
+        stats = shard.get(message)
+        if stats is None:
+            stats = shard[message] = LatencyStats()
+        return stats
+
+    def handler_stats(self, event: str, handler: str) -> tuple[LatencyStats, LatencyStats]:
+        """
+        Returns the lag and latency statistics of an event handler for the current thread.
+        """
+        shard = self._local.__dict__.get('stats') or self._shard()
+        stats = shard.get((event, handler))
+        if stats is None:
+            stats = shard[(event, handler)] = (LatencyStats(), LatencyStats())
+        return stats
+
+    def snapshot(self) -> dict:
+        """
+        Returns the statistics of every thread added up, folding the ones of the finished threads.
+        """
+        totals: dict = {}
+        with self._lock:
+            alive = []
+            for thread_ref, shard in self._shards:
+                if thread_ref() is None or not thread_ref().is_alive():
+                    for key, stats in list(shard.items()):
+                        self._merge(self._retired, key, stats)
+                else:
+                    alive.append((thread_ref, shard))
+            self._shards = alive
+            for key, stats in self._retired.items():
+                self._merge(totals, key, stats)
+            for _, shard in alive:
+                for key, stats in list(shard.items()):
+                    self._merge(totals, key, stats)
+        return totals
+
+    @staticmethod
+    def _merge(target: dict, key, stats):
+        if isinstance(stats, tuple):
+            current = target.get(key)
+            if current is None:
+                current = target[key] = (LatencyStats(), LatencyStats())
+            current[0].merge(stats[0])
+            current[1].merge(stats[1])
+        else:
+            current = target.get(key)
+            if current is None:
+                current = target[key] = LatencyStats()
+            current.merge(stats)
+
+
+COMMAND_BUS_METRICS = BusMetrics('command')
+QUERY_BUS_METRICS = BusMetrics('query')
+EVENT_BUS_METRICS = BusMetrics('event')
+
+
+def _histogram_buckets(stats: LatencyStats) -> list[tuple[str, float]]:
+    buckets, cumulative = [], 0
+    for bound, value in zip(LATENCY_BUCKETS + (float('inf'),), stats.buckets):
+        cumulative += value
+        buckets.append(('+Inf' if bound == float('inf') else str(bound), cumulative))
+    return buckets
+
+
+class BusMetricsCollector:
+    """
+    Exposes the bus metrics to Prometheus, computed from the per-thread counters when scraped.
+    """
+
+    def __init__(self, bus_metrics: tuple[BusMetrics, ...]):
+        self.bus_metrics = bus_metrics
+
+    def collect(self) -> Iterator:
+        dispatch = HistogramMetricFamily('textile_pro_bus_dispatch_seconds',
+                                         'Seconds the bus took to handle a message, per message type',
+                                         labels=['bus', 'message'])
+        in_flight = GaugeMetricFamily('textile_pro_bus_in_flight', 'Messages being handled, per message type',
+                                      labels=['bus', 'message'])
+        errors = CounterMetricFamily('textile_pro_bus_errors', 'Messages whose handler failed, per error class',
+                                     labels=['bus', 'message', 'error', 'layer'])
+        lag = HistogramMetricFamily('textile_pro_bus_event_handler_lag_seconds',
+                                    'Seconds between the publication of an event and the start of a handler',
+                                    labels=['event', 'handler'])
+        handler_latency = HistogramMetricFamily('textile_pro_bus_event_handler_seconds',
+                                                'Seconds an event handler took', labels=['event', 'handler'])
+        for metrics in self.bus_metrics:
+            for key, stats in metrics.snapshot().items():
+                if isinstance(stats, tuple):
+                    lag.add_metric(list(key), _histogram_buckets(stats[0]), stats[0].sum)
+                    handler_latency.add_metric(list(key), _histogram_buckets(stats[1]), stats[1].sum)
+                    continue
+                dispatch.add_metric([metrics.bus, key], _histogram_buckets(stats), stats.sum)
+                in_flight.add_metric([metrics.bus, key], stats.in_flight)
+                for (error, layer), value in stats.errors.items():
+                    errors.add_metric([metrics.bus, key, error, layer], value)
+        yield from (dispatch, in_flight, errors, lag, handler_latency)
+
+    def describe(self) -> Iterator:
+        return iter(())
+
+
+_collector: Optional[BusMetricsCollector] = None
+
+
+def register_bus_metrics_collector():
+    """
+    Registers the collector of the bus metrics in the default Prometheus registry, once.
+    """
+    global _collector
+    if _collector is None:
+        _collector = BusMetricsCollector((COMMAND_BUS_METRICS, QUERY_BUS_METRICS, EVENT_BUS_METRICS))
+        REGISTRY.register(_collector)
+
+
+register_bus_metrics_collector()
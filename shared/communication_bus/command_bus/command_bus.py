@@ -1,6 +1,10 @@
 # Import local modules
+from time import perf_counter
+
+from shared.communication_bus.bus_metrics import COMMAND_BUS_METRICS
 from shared.communication_bus.command_bus.command_dto import CommandDTO
 from shared.communication_bus.command_bus.command_handler_interface import CommandHandlerInterface
+from shared.tracing import get_trace_id, trace_span
 
 
 class CommandBus:
@@ -30,7 +34,9 @@ class CommandBus:
 
     def execute(self, command: CommandDTO, trace_id: str = None):
         """
-        Executes the handler for a specific command.
+        Executes the handler for a specific command, in a span of the trace in progress whose trace ID is
+        passed to the handler when none is given. The latency, the commands in flight and the errors are
+        recorded per command type.
 
         Args:
             command (CommandDTO): The command to be executed.
@@ -41,5 +47,16 @@ class CommandBus:
         """
         command_type = type(command)
         if command_type in self.handlers:
-            return self.handlers[command_type].execute(command, trace_id=trace_id)
+            stats = COMMAND_BUS_METRICS.stats(command_type.__name__)
+            stats.in_flight += 1
+            started = perf_counter()
+            try:
+                with trace_span(f"command {command_type.__name__}", {'bus': 'command'}):
+                    return self.handlers[command_type].execute(command, trace_id=trace_id or get_trace_id())
+            except Exception as e:
+                stats.error(e)
+                raise
+            finally:
+                stats.in_flight -= 1
+                stats.observe(perf_counter() - started)
         raise Exception(f"No handler registered for command {command_type}")
@@ -1,5 +1,9 @@
+from time import perf_counter
+
+from shared.communication_bus.bus_metrics import EVENT_BUS_METRICS
 from shared.communication_bus.event_bus.event_dto import EventDTO
 from shared.communication_bus.event_bus.event_handler_interface import EventHandlerInterface
+from shared.tracing import get_trace_id, trace_span
 
 
 class EventBus:
@@ -24,7 +28,8 @@ class EventBus:
 
     def publish(self, event: EventDTO, trace_id: str = None):
         """
-        Publishes the event to the appropriate handler.
+        Publishes the event to the appropriate handler. Besides the latency and errors per event type, the
+        lag between the publication and the start of each handler and the latency of the handler are recorded.
 
         Args:
             event (EventDTO): The event to be published.
@@ -35,7 +40,26 @@ class EventBus:
         """
         event_type = type(event)
         if event_type in self.handlers:
-            for handler in self.handlers[event_type]:
-                handler.publish(event, trace_id=trace_id)
+            event_name = event_type.__name__
+            stats = EVENT_BUS_METRICS.stats(event_name)
+            stats.in_flight += 1
+            published = perf_counter()
+            try:
+                with trace_span(f"event {event_name}", {'bus': 'event'}):
+                    trace_id = trace_id or get_trace_id()
+                    for handler in self.handlers[event_type]:
+                        lag, latency = EVENT_BUS_METRICS.handler_stats(event_name, type(handler).__name__)
+                        started = perf_counter()
+                        lag.observe(started - published)
+                        try:
+                            handler.publish(event, trace_id=trace_id)
+                        finally:
+                            latency.observe(perf_counter() - started)
+            except Exception as e:
+                stats.error(e)
+                raise
+            finally:
+                stats.in_flight -= 1
+                stats.observe(perf_counter() - published)
         else:
             raise Exception(f"No handler registered for dispatch event {event_type}")
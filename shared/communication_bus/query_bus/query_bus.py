@@ -1,28 +1,49 @@
+from time import perf_counter
+from typing import Optional
+
+from shared.cache.single_flight import SingleFlight
+from shared.communication_bus.bus_metrics import QUERY_BUS_METRICS
 from shared.communication_bus.communication_dto import CommunicationDTO
 from shared.communication_bus.communication_handler_interface import CommunicationHandlerInterface
+from shared.tenancy.tenant_context import get_current_tenant_id
+from shared.tracing import get_trace_id, trace_span
 
 
 class QueryBus:
-    def __init__(self):
+    def __init__(self, single_flight: Optional[SingleFlight] = None):
         """
         Constructor for the QueryBus class.
         Initializes the handlers' dictionary.
+
+        Args:
+            single_flight (Optional[SingleFlight]): Coalesces the identical queries asked at the same time for
+                the query types registered with `coalesce`. Defaults to one that only coalesces inside the worker.
         """
         self.handlers = {}
+        self.coalesced_types = set()
+        self.single_flight = single_flight or SingleFlight()
 
-    def register_handler(self, query_type, handler: CommunicationHandlerInterface):
+    def register_handler(self, query_type, handler: CommunicationHandlerInterface, coalesce: bool = False):
         """
         Registers a handler for a specific query type.
 
         Args:
             query_type: The type of the query for which the handler is being registered.
             handler (CommunicationHandlerInterface): The handler to be registered.
+            coalesce (bool): Whether the identical queries asked at the same time share one answer. Only for
+                read-only queries whose answer is not modified by the callers. Defaults to False.
         """
         self.handlers[query_type] = handler
+        if coalesce:
+            self.coalesced_types.add(query_type)
+        else:
+            self.coalesced_types.discard(query_type)
 
     def ask(self, query: CommunicationDTO, trace_id: str = None):
         """
-        Asks the handler for a specific query.
+        Asks the handler for a specific query, in a span of the trace in progress whose trace ID is passed to
+        the handler when none is given. The latency, the queries in flight and the errors are recorded per
+        query type.
 
         Args:
             query (CommunicationDTO): The query to be asked.
@@ -33,5 +54,22 @@ class QueryBus:
         """
         query_type = type(query)
         if query_type in self.handlers:
-            return self.handlers[query_type].ask(query, trace_id=trace_id)
+            handler = self.handlers[query_type]
+            stats = QUERY_BUS_METRICS.stats(query_type.__name__)
+            stats.in_flight += 1
+            started = perf_counter()
+            try:
+                with trace_span(f"query {query_type.__name__}", {'bus': 'query'}):
+                    trace_id = trace_id or get_trace_id()
+                    if query_type in self.coalesced_types:
+                        key = f"{query_type.__module__}.{query_type.__qualname__}:{get_current_tenant_id()}:" \
+                              f"{query.model_dump_json()}"
+                        return self.single_flight.do(key, lambda: handler.ask(query, trace_id=trace_id))
+                    return handler.ask(query, trace_id=trace_id)
+            except Exception as e:
+                stats.error(e)
+                raise
+            finally:
+                stats.in_flight -= 1
+                stats.observe(perf_counter() - started)
         raise Exception(f"No handler registered for ask {query_type}")
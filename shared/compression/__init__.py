@@ -0,0 +1 @@
+from .response_compression import register_compression_hooks, available_encodings, DEFAULT_COMPRESSION_LEVELS
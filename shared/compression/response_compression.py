@@ -0,0 +1,103 @@
+import gzip
+from typing import Optional
+
+from flask import Flask, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+ENCODING_ZSTD = "zstd"
+ENCODING_BROTLI = "br"
+ENCODING_GZIP = "gzip"
+
+# Compression level of every encoding per content type. JSON is served to tablets over weak factory Wi-Fi, so it
+# pays a few more CPU cycles for smaller bodies
+DEFAULT_COMPRESSION_LEVELS: dict[str, dict[str, int]] = {
+    "application/json": {ENCODING_ZSTD: 6, ENCODING_BROTLI: 5, ENCODING_GZIP: 6},
+    "text/csv": {ENCODING_ZSTD: 3, ENCODING_BROTLI: 4, ENCODING_GZIP: 5},
+    "text/html": {ENCODING_ZSTD: 3, ENCODING_BROTLI: 4, ENCODING_GZIP: 5},
+    "text/plain": {ENCODING_ZSTD: 3, ENCODING_BROTLI: 4, ENCODING_GZIP: 5},
+    "application/javascript": {ENCODING_ZSTD: 6, ENCODING_BROTLI: 5, ENCODING_GZIP: 6},
+    "image/svg+xml": {ENCODING_ZSTD: 6, ENCODING_BROTLI: 5, ENCODING_GZIP: 6},
+}
+
+
+def _compress(encoding: str, body: bytes, level: int) -> bytes:
+    if encoding == ENCODING_ZSTD:
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def available_encodings() -> list[str]:
+    """
+    Returns the encodings supported by the installed libraries, in order of preference.
+    """
+    encodings = []
+    if zstandard is not None:
+        encodings.append(ENCODING_ZSTD)
+    if brotli is not None:
+        encodings.append(ENCODING_BROTLI)
+    encodings.append(ENCODING_GZIP)
+    return encodings
+
+
+def register_compression_hooks(app: Flask, min_size: int = 1024,
+                               levels: Optional[dict[str, dict[str, int]]] = None):
+    """
+    Compresses the responses of the application according to the Accept-Encoding of the client.
+
+    Only the bodies of at least `min_size` bytes with a compressible content type are compressed, with the
+    level configured for the content type. Streamed responses (SSE, exports) are left untouched. When the
+    response comes from the response cache, the compressed body is kept next to the cached one and reused by
+    the next hits, so hot endpoints are compressed once per version instead of once per request.
+
+    Args:
+        app (Flask): The Flask application instance.
+        min_size (int): The minimum body size to compress, in bytes. Defaults to 1024.
+        levels (Optional[dict[str, dict[str, int]]]): The levels per content type and encoding.
+    """
+    levels = levels or DEFAULT_COMPRESSION_LEVELS
+    encodings = available_encodings()
+
+    @app.after_request
+    def compress_response(response):
+        if (response.direct_passthrough or response.is_streamed or response.status_code < 200
+                or response.status_code in (204, 206, 304) or 'Content-Encoding' in response.headers):
+            return response
+        content_levels = levels.get(response.mimetype)
+        if content_levels is None:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = request.accept_encodings.best_match(encodings)
+        if encoding is None or response.content_length is not None and response.content_length < min_size:
+            return response
+
+        cached = getattr(response, 'cached_response', None)
+        level = content_levels[encoding]
+        encoded_key = f"{encoding}:{level}"
+        compressed = cached.encoded.get(encoded_key) if cached is not None else None
+        if compressed is None:
+            body = response.get_data()
+            if len(body) < min_size:
+                return response
+            compressed = _compress(encoding, body, level)
+            if cached is not None:
+                cached.encoded[encoded_key] = compressed
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            # The compressed bytes differ from the identity ones, so the validator is weak from now on
+            response.set_etag(etag, weak=True)
+        return response
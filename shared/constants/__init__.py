@@ -1 +1 @@
-from general_constants import *
+from .general_constants import *
@@ -4,6 +4,16 @@ TEXTILE_PRO_WINDOWS_LOGS = 'C:/tmp/application.log'
 USER_LOGGER_SERVICE = 'textile_pro_logger'
 USER_HANDLE_EXCEPTIONS = 'textile_pro_handle_exceptions'
 USERS_SERVICE = 'textile_pro_users_service'
+ALERTS_SERVICE = 'textile_pro_alerts_service'
+DASHBOARD_SERVICE = 'textile_pro_dashboard_service'
+TENANTS_SERVICE = 'textile_pro_tenants_service'
+RATE_LIMIT_SERVICE = 'textile_pro_rate_limit'
+PRODUCTION_SERVICE = 'textile_pro_production_service'
+PLANT_SERVICE = 'textile_pro_plant_service'
+SCHEDULER_SERVICE = 'textile_pro_scheduler'
+CACHE_WARMER_SERVICE = 'textile_pro_cache_warmer'
+SQL_AUDIT_SERVICE = 'textile_pro_sql_audit'
+ASGI_SERVICE = 'textile_pro_asgi'
 
 # USER ROLE
 USER_ROLE_ADMIN = 'admin'
@@ -14,3 +24,125 @@ USER_STATUS_ACTIVE = 'active'
 USER_STATUS_INACTIVE = 'inactive'
 USER_STATUS_DELETED = 'deleted'
 USER_STATUS_BLOCKED = 'blocked'
+
+# ALERT SEVERITY
+ALERT_SEVERITY_CRITICAL = 'critical'
+ALERT_SEVERITY_WARNING = 'warning'
+ALERT_SEVERITY_INFO = 'info'
+
+# ALERT STATUS
+ALERT_STATUS_ACTIVE = 'active'
+ALERT_STATUS_RESOLVED = 'resolved'
+
+# ALERT SCOPE
+ALERT_SCOPE_MODULE = 'module'
+ALERT_SCOPE_PERSON = 'person'
+ALERT_SCOPE_REFERENCE = 'reference'
+
+# LIVE UPDATES EVENTS
+LIVE_EVENT_KPI_DELTA = 'kpi_delta'
+LIVE_EVENT_ALERT_RAISED = 'alert_raised'
+LIVE_EVENT_ALERT_RESOLVED = 'alert_resolved'
+
+# TENANT STATUS
+TENANT_STATUS_ACTIVE = 'active'
+TENANT_STATUS_SUSPENDED = 'suspended'
+TENANT_STATUS_TRIAL = 'trial'
+TENANT_STATUS_INACTIVE = 'inactive'
+
+# TENANT PLAN
+TENANT_PLAN_BASIC = 'basic'
+TENANT_PLAN_STANDARD = 'standard'
+TENANT_PLAN_PREMIUM = 'premium'
+TENANT_PLAN_ENTERPRISE = 'enterprise'
+
+# PLAN LIMITS
+TENANT_PLAN_LIMIT_CODE = 'TENANT_PLAN_LIMIT'
+PLAN_LIMIT_API_CALLS = 'apiCallsPerMonth'
+PLAN_LIMIT_USERS = 'maxUsers'
+PLAN_LIMIT_MODULES = 'maxModules'
+# Reported instead of a limit for the tenants without a plan, which are not metered
+PLAN_LIMIT_UNKNOWN_TENANT = 'unknownTenant'
+PLAN_RESOURCE_USERS = 'users'
+PLAN_RESOURCE_MODULES = 'modules'
+
+# RATE LIMITS
+RATE_LIMITED_CODE = 'RATE_LIMITED'
+# Bucket of every address on the login: 5 attempts at once, then one every 12 seconds
+LOGIN_RATE_LIMIT_RATE = 5 / 60
+LOGIN_RATE_LIMIT_BURST = 5
+SERVER_BUSY_CODE = 'SERVER_BUSY'
+
+# HTTP CACHE
+HTTP_RESPONSES_CACHE_NAMESPACE = 'http_responses'
+# Namespaces named after a table are invalidated when a transaction writing the table commits
+PRODUCTION_MODULE_SUMMARIES_CACHE_NAMESPACE = 'daily_module_summary'
+PRODUCTION_PERSON_SUMMARIES_CACHE_NAMESPACE = 'daily_person_summary'
+PRODUCTION_EVENTS_CACHE_NAMESPACE = 'production_events'
+PLANT_PEOPLE_CACHE_NAMESPACE = 'people'
+PLANT_MODULES_CACHE_NAMESPACE = 'modules'
+PLANT_REFERENCES_CACHE_NAMESPACE = 'production_references'
+# Seconds a worker serves a production response whose versions it did not see change: the summaries are written
+# by the scheduler and the events by every worker, so without shared versions their writes are not seen here
+PRODUCTION_RESPONSES_CACHE_SECONDS = 30
+
+# PRODUCTION LEDGER
+PRODUCTION_EVENT_RECORD_LOGGED = 'record_logged'
+PRODUCTION_EVENT_RECORD_CORRECTED = 'record_corrected'
+PRODUCTION_EVENT_RECORD_VOIDED = 'record_voided'
+PRODUCTION_AGGREGATE_MODULE = 'module'
+PRODUCTION_AGGREGATE_REFERENCE = 'reference'
+PRODUCTION_SNAPSHOTS_PROJECTION = 'production_aggregate_snapshots'
+PRODUCTION_DAILY_SUMMARIES_PROJECTION = 'production_daily_summaries'
+PRODUCTION_SUMMARY_MODULES = 'modules'
+PRODUCTION_SUMMARY_PEOPLE = 'people'
+PRODUCTION_REPORT_RECORDS = 'records'
+PRODUCTION_REPORT_PEOPLE = 'people'
+
+# PLANT ENTITIES
+PLANT_ENTITY_PEOPLE = 'people'
+PLANT_ENTITY_MODULES = 'modules'
+PLANT_ENTITY_REFERENCES = 'references'
+
+# PERSON STATUS
+PERSON_STATUS_ACTIVE = 'Active'
+PERSON_STATUS_INACTIVE = 'Inactive'
+
+# MODULE STATUS
+MODULE_STATUS_ACTIVE = 'Active'
+MODULE_STATUS_INACTIVE = 'Inactive'
+MODULE_STATUS_MAINTENANCE = 'Maintenance'
+
+# REFERENCE STATUS
+REFERENCE_STATUS_PENDING = 'Pendiente'
+REFERENCE_STATUS_IN_PROGRESS = 'En proceso'
+REFERENCE_STATUS_FINISHED = 'Terminado'
+
+# REFERENCE PRIORITY
+REFERENCE_PRIORITY_HIGH = 'High'
+REFERENCE_PRIORITY_MEDIUM = 'Medium'
+REFERENCE_PRIORITY_LOW = 'Low'
+
+# PLANT IMPORTS
+IMPORT_FORMAT_CSV = 'csv'
+IMPORT_FORMAT_XLSX = 'xlsx'
+IMPORT_STATUS_PENDING = 'pending'
+IMPORT_STATUS_RUNNING = 'running'
+IMPORT_STATUS_COMPLETED = 'completed'
+IMPORT_STATUS_FAILED = 'failed'
+
+# REPORT EXPORTS
+EXPORT_FORMAT_CSV = 'csv'
+EXPORT_FORMAT_XLSX = 'xlsx'
+EXPORT_FORMAT_PARQUET = 'parquet'
+
+# SCHEDULED JOBS
+JOB_PRODUCTION_PROJECTIONS = 'production_projections'
+JOB_PRODUCTION_ARCHIVE = 'production_archive'
+JOB_PRODUCTION_SUMMARIES = 'production_summaries'
+JOB_ALERTS_INACTIVITY_SWEEP = 'alerts_inactivity_sweep'
+JOB_CACHE_WARMUP = 'cache_warmup'
+
+# CACHE WARM-UP
+CACHE_WARMUP_BOOT = 'boot'
+CACHE_WARMUP_SHIFT = 'shift'
@@ -1 +1,5 @@
 from .database_manager import DataBaseManager
+from .sql_audit import SqlAudit, SqlAuditReport, EndpointSqlStats, StatementStats, sql_audit, sql_budget, \
+    get_sql_audit_report, register_sql_audit_events
+from .sql_audit_exceptions import SqlBudgetExceededException
+from .async_database_manager import AsyncDataBaseManager, async_database_url
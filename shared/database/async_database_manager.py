@@ -0,0 +1,107 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+from shared.cache import TenantPartitionedCache
+from shared.database.sql_audit import register_sql_audit_events
+from shared.tenancy import register_tenant_session_events
+from shared.tracing import register_sql_tracing_events
+
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+except ImportError:  # pragma: no cover - the asyncio extension needs greenlet
+    AsyncSession = async_sessionmaker = create_async_engine = None
+
+# The asyncio driver used for the URLs that name a blocking one, or none
+ASYNC_DRIVERS = {
+    'postgresql': 'asyncpg',
+    'sqlite': 'aiosqlite',
+    'mysql': 'aiomysql',
+}
+_ASYNC_DRIVER_NAMES = {'asyncpg', 'psycopg', 'psycopg_async', 'aiosqlite', 'aiomysql', 'asyncmy'}
+
+
+def async_database_url(database_url: str) -> str:
+    """
+    Returns the URL of the same database with its asyncio driver, e.g. `postgresql+asyncpg://` for
+    `postgresql://` or `postgresql+psycopg2://`. The URLs that already name an asyncio driver are kept.
+
+    Args:
+        database_url (str): URL of the database.
+
+    Returns:
+        str: The URL for the asyncio engine.
+    """
+    url = make_url(database_url)
+    backend, _, driver = url.drivername.partition('+')
+    if driver in _ASYNC_DRIVER_NAMES or backend not in ASYNC_DRIVERS:
+        return database_url
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+class AsyncDataBaseManager:
+    """
+    Class that manages the asyncio database connection, for the endpoints that await the database instead of
+    holding a worker thread while it answers.
+    """
+
+    def __init__(self, database_url: str, tenant_cache: TenantPartitionedCache = None):
+        """
+        Constructor for the AsyncDataBaseManager class.
+
+        The sessions behave like the ones of the DataBaseManager: they are tenant-aware, and their statements
+        and connection checkouts are timed in the trace in progress and counted by the SQL audits in progress.
+        The tenant and the trace are read from the context of the awaiting task.
+
+        Args:
+            database_url (str): URL of the database, its blocking driver is replaced with the asyncio one.
+            tenant_cache (Optional[TenantPartitionedCache]): Cache whose namespaces are invalidated when a
+                transaction writes the table with the same name.
+
+        Raises:
+            ImportError: If the SQLAlchemy asyncio extension or its greenlet dependency is not installed.
+        """
+        if create_async_engine is None:
+            raise ImportError("The AsyncDataBaseManager needs the SQLAlchemy asyncio extension: "
+                              "pip install 'sqlalchemy[asyncio]'")
+        self.origin = self.__class__.__name__
+        self.engine = create_async_engine(
+            async_database_url(database_url),
+            echo=False,
+            pool_size=10,
+            max_overflow=20,
+            pool_recycle=60 * 5,
+            pool_pre_ping=True,
+        )
+        # The ORM events are dispatched by the synchronous session every AsyncSession proxies
+        sync_session_factory = sessionmaker()
+        register_tenant_session_events(sync_session_factory, tenant_cache)
+        register_sql_tracing_events(self.engine.sync_engine, sync_session_factory)
+        register_sql_audit_events(self.engine.sync_engine)
+        self.Session = async_sessionmaker(bind=self.engine, expire_on_commit=False,
+                                          sync_session_class=sync_session_factory.class_)
+        self.tenant_cache = tenant_cache
+
+    def get_session(self) -> "AsyncSession":
+        """
+        Method that returns an asyncio session.
+
+        Returns:
+            AsyncSession: SQLAlchemy asyncio session.
+        """
+        return self.Session()
+
+    @staticmethod
+    async def close_session(session: "AsyncSession"):
+        """
+        Method that closes an asyncio session.
+
+        Args:
+            session (AsyncSession): SQLAlchemy asyncio session.
+        """
+        await session.close()
+
+    async def dispose_engine(self):
+        """
+        Method that disposes the engine.
+        """
+        await self.engine.dispose()
@@ -1,18 +1,29 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
+from shared.cache import TenantPartitionedCache
+from shared.database.sql_audit import register_sql_audit_events
+from shared.tenancy import register_tenant_session_events
+from shared.tracing import register_sql_tracing_events
+
 
 class DataBaseManager:
     """
     Class that manages the database connection.
     """
 
-    def __init__(self, database_url: str):
+    def __init__(self, database_url: str, tenant_cache: TenantPartitionedCache = None):
         """
         Constructor for the DataBaseManager class.
 
+        The sessions are tenant-aware: they only read and write the rows of the tenant in context. Their
+        statements and connection checkouts are timed in the trace in progress, and counted by the SQL audits
+        in progress.
+
         Args:
             database_url (str): URL of the database.
+            tenant_cache (Optional[TenantPartitionedCache]): Cache whose namespaces are invalidated when a
+                transaction writes the table with the same name.
         """
         self.origin = self.__class__.__name__
         self.engine = create_engine(
@@ -24,6 +35,10 @@ class DataBaseManager:
             pool_pre_ping=True,
         )
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=True)
+        self.tenant_cache = tenant_cache
+        register_tenant_session_events(self.Session, tenant_cache)
+        register_sql_tracing_events(self.engine, self.Session)
+        register_sql_audit_events(self.engine)
 
     def get_session(self):
         """
@@ -0,0 +1,18 @@
+from prometheus_client import Counter, Histogram
+
+SQL_STATEMENTS_PER_REQUEST = Histogram(
+    'textile_pro_sql_statements_per_request',
+    'SQL statements run by a request, per endpoint',
+    ['endpoint'],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 250, 1000),
+)
+SQL_REPEATED_STATEMENTS = Counter(
+    'textile_pro_sql_repeated_statements_total',
+    'Requests that ran a statement more times than the repeat threshold, a likely N+1, per endpoint',
+    ['endpoint'],
+)
+SQL_BUDGET_EXCEEDED = Counter(
+    'textile_pro_sql_budget_exceeded_total',
+    'Requests that ran more statements than the request budget, per endpoint',
+    ['endpoint'],
+)
@@ -0,0 +1,254 @@
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from shared.database.sql_audit_exceptions import SqlBudgetExceededException
+
+_WHITESPACE = re.compile(r'\s+')
+# The application code, the first frame of it in the stack is the caller reported for a statement
+_APPS_PATH = f"{os.sep}apps{os.sep}"
+
+# The audits in progress in the current thread or task, the innermost last
+_current_audits: ContextVar[tuple["SqlAudit", ...]] = ContextVar('current_sql_audits', default=())
+
+
+def _caller() -> str:
+    frame = sys._getframe(2)
+    while frame is not None:
+        if _APPS_PATH in frame.f_code.co_filename:
+            return f"{frame.f_code.co_filename.rsplit(_APPS_PATH, 1)[1]}:{frame.f_lineno} " \
+                   f"({frame.f_code.co_name})"
+        frame = frame.f_back
+    return 'unknown'
+
+
+class StatementStats:
+    """
+    Executions of a statement in an audit.
+    """
+    __slots__ = ("statement", "executions", "duration_ms", "parameters", "caller")
+
+    def __init__(self, statement: str, caller: str):
+        self.statement = statement
+        self.executions = 0
+        self.duration_ms = 0.0
+        self.parameters: set[int] = set()
+        self.caller = caller
+
+    @property
+    def distinct_parameters(self) -> int:
+        return len(self.parameters)
+
+
+class SqlAudit:
+    """
+    Counts the SQL statements run by a unit of work, e.g. a request or a job, grouping the executions of the
+    same statement. A statement run `repeat_threshold` times or more is reported as repeated: with different
+    parameters it usually is a relationship loaded row by row (N+1), with the same ones a read that should be
+    reused.
+    """
+
+    def __init__(self, name: str, repeat_threshold: int = 5):
+        """
+        Constructor for the SqlAudit class.
+
+        Args:
+            name (str): The name of the unit of work in the reports, e.g. the endpoint.
+            repeat_threshold (int): The executions from which a statement is reported as repeated. Defaults to 5.
+        """
+        self.name = name
+        self.repeat_threshold = repeat_threshold
+        self.statement_count = 0
+        self.duration_ms = 0.0
+        self.statements: dict[str, StatementStats] = {}
+
+    def record(self, statement: str, parameters: Any, duration_ms: float):
+        key = _WHITESPACE.sub(' ', statement).strip()
+        stats = self.statements.get(key)
+        if stats is None:
+            stats = self.statements[key] = StatementStats(key, _caller())
+        stats.executions += 1
+        stats.duration_ms += duration_ms
+        try:
+            stats.parameters.add(hash(repr(parameters)))
+        except Exception:
+            pass
+        self.statement_count += 1
+        self.duration_ms += duration_ms
+
+    def repeated_statements(self) -> list[StatementStats]:
+        """
+        Returns the statements run at least `repeat_threshold` times, the most executed first.
+        """
+        return sorted((stats for stats in self.statements.values() if stats.executions >= self.repeat_threshold),
+                      key=lambda stats: stats.executions, reverse=True)
+
+    def report(self, limit: int = 5) -> str:
+        """
+        Describes the statements of the audit, the most executed first, for the logs and the failed budgets.
+        """
+        lines = [f"{self.name}: {self.statement_count} statements in {self.duration_ms:.1f}ms"]
+        for stats in sorted(self.statements.values(), key=lambda stats: stats.executions, reverse=True)[:limit]:
+            flag = ' [repeated]' if stats.executions >= self.repeat_threshold else ''
+            lines.append(f"  {stats.executions}x ({stats.distinct_parameters} distinct parameters, "
+                         f"{stats.duration_ms:.1f}ms){flag} at {stats.caller}: {stats.statement[:300]}")
+        return '\n'.join(lines)
+
+
+@contextmanager
+def sql_audit(name: str = 'sql audit', repeat_threshold: int = 5) -> Iterator[SqlAudit]:
+    """
+    Context manager that audits the statements run by the block, in the current thread or task. Audits can
+    be nested, a statement counts in every audit in progress.
+
+    Example:
+        with sql_audit('list modules') as audit:
+            ...
+        audit.repeated_statements()
+
+    Args:
+        name (str): The name of the block in the report.
+        repeat_threshold (int): The executions from which a statement is reported as repeated. Defaults to 5.
+
+    Yields:
+        SqlAudit: The audit, filled while the block runs.
+    """
+    audit = SqlAudit(name, repeat_threshold)
+    token = _current_audits.set(_current_audits.get() + (audit,))
+    try:
+        yield audit
+    finally:
+        _current_audits.reset(token)
+
+
+@contextmanager
+def sql_budget(max_statements: Optional[int] = None, max_repeats: Optional[int] = None,
+               name: str = 'sql budget') -> Iterator[SqlAudit]:
+    """
+    Context manager that fails when the block runs more statements, or repeats a statement more times, than
+    allowed. Meant for the tests of the endpoints and services, it raises `SqlBudgetExceededException`, an
+    `AssertionError`, with the report of the statements.
+
+    Example:
+        with sql_budget(max_statements=4, max_repeats=1):
+            client.get('/production/summaries/daily/modules', headers=headers)
+
+    Args:
+        max_statements (Optional[int]): The statements the block may run, None does not limit them.
+        max_repeats (Optional[int]): The times the block may run the same statement, None does not limit them.
+        name (str): The name of the block in the report.
+
+    Yields:
+        SqlAudit: The audit, filled while the block runs.
+
+    Raises:
+        SqlBudgetExceededException: If the block exceeds the budget.
+    """
+    with sql_audit(name, max_repeats + 1 if max_repeats is not None else 5) as audit:
+        yield audit
+    if max_statements is not None and audit.statement_count > max_statements:
+        raise SqlBudgetExceededException(f"Ran {audit.statement_count} SQL statements, the budget is "
+                                         f"{max_statements}\n{audit.report()}")
+    if max_repeats is not None and audit.repeated_statements():
+        raise SqlBudgetExceededException(f"Ran a SQL statement more than {max_repeats} times, a likely N+1\n"
+                                         f"{audit.report()}")
+
+
+class EndpointSqlStats(NamedTuple):
+    """
+    Statements of the audited units of work with the same name.
+    """
+    name: str
+    runs: int
+    statements: int
+    max_statements: int
+    repeated_runs: int
+    worst_statement: Optional[str]
+    worst_statement_executions: int
+    worst_statement_caller: Optional[str]
+
+    @property
+    def mean_statements(self) -> float:
+        return self.statements / self.runs if self.runs else 0.0
+
+
+class SqlAuditReport:
+    """
+    Keeps the statements of the finished audits per name, e.g. per endpoint, to list the worst offenders of
+    the process.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, EndpointSqlStats] = {}
+        self._lock = threading.Lock()
+
+    def add(self, audit: SqlAudit):
+        repeated = audit.repeated_statements()
+        with self._lock:
+            stats = self._stats.get(audit.name) or EndpointSqlStats(audit.name, 0, 0, 0, 0, None, 0, None)
+            worst = (stats.worst_statement, stats.worst_statement_executions, stats.worst_statement_caller)
+            if repeated and repeated[0].executions > stats.worst_statement_executions:
+                worst = (repeated[0].statement, repeated[0].executions, repeated[0].caller)
+            self._stats[audit.name] = EndpointSqlStats(
+                audit.name, stats.runs + 1, stats.statements + audit.statement_count,
+                max(stats.max_statements, audit.statement_count), stats.repeated_runs + bool(repeated), *worst)
+
+    def worst_offenders(self, limit: int = 10) -> list[EndpointSqlStats]:
+        """
+        Returns the names that repeat statements the most, then the ones running the most statements.
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+        return sorted(stats, key=lambda item: (item.worst_statement_executions, item.max_statements),
+                      reverse=True)[:limit]
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+
+# The report of the audits of the requests of the process
+_report = SqlAuditReport()
+
+
+def get_sql_audit_report() -> SqlAuditReport:
+    return _report
+
+
+def register_sql_audit_events(engine: Engine):
+    """
+    Records the statements of an engine in the audits in progress. Without an audit in progress the cost of
+    a statement is a context variable read.
+
+    Args:
+        engine (Engine): The engine to audit.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_statement(conn, cursor, statement, parameters, context, executemany):
+        if _current_audits.get():
+            conn.info.setdefault('sql_audit_starts', []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def end_statement(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('sql_audit_starts')
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+        audits = _current_audits.get()
+        for audit in audits:
+            audit.record(statement, parameters, duration_ms)
+
+    @event.listens_for(engine, "handle_error")
+    def fail_statement(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('sql_audit_starts'):
+            connection.info['sql_audit_starts'].pop()
@@ -0,0 +1,6 @@
+from shared.exceptions import InfrastructureException
+
+
+class SqlBudgetExceededException(InfrastructureException, AssertionError):
+    """Raised when a block runs more SQL statements, or repeats one more times, than its budget allows."""
+    pass
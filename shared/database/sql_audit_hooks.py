@@ -0,0 +1,59 @@
+from typing import Optional
+
+from flask import Flask, g, request
+
+from shared.constants import SQL_AUDIT_SERVICE
+from shared.database.database_metrics import SQL_BUDGET_EXCEEDED, SQL_REPEATED_STATEMENTS, \
+    SQL_STATEMENTS_PER_REQUEST
+from shared.database.sql_audit import SqlAuditReport, get_sql_audit_report, sql_audit
+from shared.logger import LoggerService
+from shared.tracing import get_current_trace_id
+
+
+def register_sql_audit_hooks(app: Flask, repeat_threshold: int = 5, request_budget: Optional[int] = None,
+                             report: Optional[SqlAuditReport] = None):
+    """
+    Audits the SQL statements of every request, per endpoint.
+
+    The statements of each request are observed in a histogram and added to the report of the process,
+    whose worst offenders point to the endpoints to fix. A request that repeats a statement
+    `repeat_threshold` times, usually a relationship loaded row by row, or that runs more than
+    `request_budget` statements is counted and logged as a warning with the statements it ran.
+
+    Args:
+        app (Flask): The Flask application instance.
+        repeat_threshold (int): The executions from which a statement is reported as repeated. Defaults to 5.
+        request_budget (Optional[int]): The statements a request may run before it is reported, None does not
+            limit them.
+        report (Optional[SqlAuditReport]): The report of the audits. Defaults to the one of the process.
+    """
+    report = report or get_sql_audit_report()
+    origin = 'sql_audit_hooks'
+
+    @app.before_request
+    def start_sql_audit():
+        scope = sql_audit(request.endpoint or request.path, repeat_threshold)
+        g.sql_audit = scope.__enter__()
+        g.sql_audit_scope = scope
+
+    @app.teardown_request
+    def end_sql_audit(error=None):
+        scope = g.pop('sql_audit_scope', None)
+        audit = g.pop('sql_audit', None)
+        if scope is None:
+            return
+        scope.__exit__(None, None, None)
+        if not audit.statement_count:
+            return
+        report.add(audit)
+        SQL_STATEMENTS_PER_REQUEST.labels(endpoint=audit.name).observe(audit.statement_count)
+        problems = []
+        if audit.repeated_statements():
+            SQL_REPEATED_STATEMENTS.labels(endpoint=audit.name).inc()
+            problems.append(f"repeated a statement {repeat_threshold} times or more")
+        if request_budget is not None and audit.statement_count > request_budget:
+            SQL_BUDGET_EXCEEDED.labels(endpoint=audit.name).inc()
+            problems.append(f"ran more than {request_budget} statements")
+        if problems:
+            LoggerService.insert_warning(origin, f"Request {' and '.join(problems)}\n{audit.report()}",
+                                         SQL_AUDIT_SERVICE, get_current_trace_id())
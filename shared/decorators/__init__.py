@@ -1,3 +1,7 @@
 from .handle_exceptions import handle_exceptions
-from .token_required import token_required
-from .with_scoped_session import with_scoped_session
+from .token_required import token_required, get_request_token
+from .with_scoped_session import with_scoped_session, async_with_scoped_session
+from .rate_limited import rate_limited
+from .cache_response import cache_response, CachedResponse
+from .admin_required import admin_required
+from .async_endpoint import async_handle_exceptions, async_token_required
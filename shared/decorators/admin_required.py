@@ -0,0 +1,33 @@
+from functools import wraps
+from typing import Optional
+
+from flask import jsonify
+
+from shared.constants import USER_ROLE_ADMIN
+from shared.decorators.token_required import get_request_token
+
+
+def get_admin_payload() -> Optional[dict]:
+    """
+    Returns the payload of the token of the request when it belongs to an administrator, None otherwise.
+    """
+    payload, _ = get_request_token()
+    if not payload or payload.get("role") != USER_ROLE_ADMIN:
+        return None
+    return payload
+
+
+def admin_required(f):
+    """
+    Decorator that only lets the administrators run the view, which receives the payload of the token like
+    with `token_required`.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        payload, error = get_request_token()
+        if error:
+            return jsonify({"error": error}), 401
+        if payload.get("role") != USER_ROLE_ADMIN:
+            return jsonify({"error": "Administrator token required"}), 403
+        return f(payload, *args, **kwargs)
+    return decorated
@@ -0,0 +1,60 @@
+import traceback
+from functools import wraps
+
+from pydantic import ValidationError
+
+from shared.asgi import AsgiRequest, AsgiResponse
+from shared.constants import USER_HANDLE_EXCEPTIONS
+from shared.decorators.handle_exceptions import build_bad_request_exception
+from shared.decorators.token_required import check_access_token
+from shared.logger import LoggerService
+
+
+def async_handle_exceptions(func):
+    """
+    Decorator to handle the exceptions of a native async endpoint, answering them like the error handlers of
+    the Flask application.
+
+    Args:
+        func (callable): The coroutine function to be wrapped.
+
+    Returns:
+        callable: The wrapped coroutine function.
+    """
+    @wraps(func)
+    async def wrapper(request: AsgiRequest, *args, **kwargs):
+        origin = func.__name__
+        user = USER_HANDLE_EXCEPTIONS
+
+        try:
+            return await func(request, *args, **kwargs)
+        except ValidationError as e:
+            messages = build_bad_request_exception(e.errors())
+            LoggerService.insert_error(origin, f'Invalid request: {messages}', user)
+            return AsgiResponse.json({'error': 'Bad request', 'messages': messages}, 400)
+        except Exception as e:
+            error_message = f'Error: {str(e)}'
+            traceback_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
+            LoggerService.insert_error(origin, f'{error_message}\nTraceback: {traceback_str}', user)
+
+            response = {'error': 'Internal server error', 'message': str(e)}
+            if request.config['DEBUG']:
+                response.update(message=error_message, traceback=traceback_str)
+            return AsgiResponse.json(response, 500)
+
+    return wrapper
+
+
+def async_token_required(f):
+    """
+    Decorator that checks the bearer token of a native async endpoint, which receives the payload of the token
+    before the request like with `token_required`.
+    """
+    @wraps(f)
+    async def decorated(request: AsgiRequest, *args, **kwargs):
+        payload, error = check_access_token(request.headers.get("authorization"))
+        if error:
+            return AsgiResponse.json({"error": error}, 401)
+
+        return await f(payload, request, *args, **kwargs)
+    return decorated
@@ -0,0 +1,110 @@
+import hashlib
+import time
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
+
+from flask import current_app, make_response, request
+
+from shared.constants import HTTP_RESPONSES_CACHE_NAMESPACE
+from shared.tenancy import get_current_tenant_id
+
+
+class CachedResponse:
+    """
+    Serialized body of a cached response. The encoded variants of the body (gzip, br...) are kept next to it
+    so they are only computed once per version.
+    """
+    __slots__ = ("body", "mimetype", "encoded")
+
+    def __init__(self, body: bytes, mimetype: str):
+        self.body = body
+        self.mimetype = mimetype
+        self.encoded: dict[str, bytes] = {}
+
+
+def _build_etag(tenant_cache, tenant_id: str, namespaces: tuple[str, ...], vary_headers: tuple[str, ...],
+                version_func: Optional[Callable[[], Any]], ttl_seconds: Optional[float]) -> Optional[str]:
+    validator = tenant_cache.namespace_validator(namespaces, tenant_id)
+    if validator is None:
+        return None
+    epoch, versions = validator
+    parts = [epoch, tenant_id, request.full_path, repr(versions)]
+    if not tenant_cache.versions_shared and ttl_seconds:
+        # The writes of the other workers do not bump the versions, the ETag changes every TTL to bound its age
+        parts.append(str(int(time.time() // ttl_seconds)))
+    parts.extend(request.headers.get(header, '') for header in vary_headers)
+    if version_func is not None:
+        parts.append(repr(version_func()))
+    return hashlib.blake2b('\x1f'.join(parts).encode(), digest_size=12).hexdigest()
+
+
+def cache_response(namespaces: Iterable[str], max_age: int = 0, ttl_seconds: Optional[float] = None,
+                   vary_headers: Iterable[str] = (), version_func: Optional[Callable[[], Any]] = None):
+    """
+    Decorator that caches the responses of a GET view per tenant and answers conditional GETs.
+
+    The ETag is built from the versions of the namespaces (tables) the view reads, which are bumped when a
+    transaction writing them commits, so a matching `If-None-Match` is answered with a 304 and an unchanged
+    version is answered from the serialized body, in both cases without running the view. `version_func` can
+    add another validator, e.g. the last `updated_at` of the aggregate, when the data changes outside the ORM.
+
+    The versions are shared by the workers when the tenant cache has a shared versions backend
+    (CACHE_VERSIONS_REDIS_URL), so a write committed by any worker changes the ETag everywhere. Otherwise they
+    are tracked per worker: a worker that did not see a write keeps answering 304s and its cached body until
+    `ttl_seconds` runs out, so keep it short for data written often. When the shared backend cannot be reached
+    the view runs uncached.
+
+    It must wrap the view inside the authentication decorators.
+
+    Args:
+        namespaces (Iterable[str]): The namespaces whose changes invalidate the response.
+        max_age (int): The seconds the clients can reuse the response without revalidating. Defaults to 0.
+        ttl_seconds (Optional[float]): The seconds the server keeps the body. Defaults to the cache TTL.
+        vary_headers (Iterable[str]): The request headers that change the response.
+        version_func (Optional[Callable[[], Any]]): Extra validator included in the ETag.
+
+    Returns:
+        callable: The decorator that caches the view.
+    """
+    namespaces = tuple(namespaces)
+    vary_headers = tuple(vary_headers)
+    cache_control = f"private, max-age={max_age}, must-revalidate" if max_age else "private, no-cache"
+    vary = ', '.join(('X-Tenant-ID', 'Authorization') + vary_headers)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tenant_cache = current_app.config.get('tenant_cache')
+            tenant_id = get_current_tenant_id()
+            if request.method not in ('GET', 'HEAD') or tenant_cache is None or not tenant_id:
+                return func(*args, **kwargs)
+
+            etag = _build_etag(tenant_cache, tenant_id, namespaces, vary_headers, version_func,
+                               ttl_seconds if ttl_seconds is not None else tenant_cache.ttl_seconds)
+            if etag is None:
+                return func(*args, **kwargs)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+            else:
+                cached: Optional[CachedResponse] = tenant_cache.get(HTTP_RESPONSES_CACHE_NAMESPACE, etag,
+                                                                    tenant_id=tenant_id)
+                if cached is None:
+                    response = make_response(func(*args, **kwargs))
+                    if response.status_code != 200 or response.is_streamed:
+                        return response
+                    cached = CachedResponse(response.get_data(), response.mimetype)
+                    tenant_cache.set(HTTP_RESPONSES_CACHE_NAMESPACE, etag, cached, ttl_seconds,
+                                     tenant_id=tenant_id)
+                else:
+                    response = make_response(cached.body, 200)
+                    response.mimetype = cached.mimetype
+                response.cached_response = cached
+
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = cache_control
+            response.headers['Vary'] = vary
+            return response
+
+        return wrapper
+
+    return decorator
@@ -2,7 +2,7 @@
 from functools import wraps
 from flask import current_app, jsonify
 from pydantic import ValidationError
-from werkzeug.exceptions import BadRequest, InternalServerError, NotFound
+from werkzeug.exceptions import BadRequest, Conflict, InternalServerError, NotFound, RequestEntityTooLarge
 import traceback
 
 # Importing local modules
@@ -33,6 +33,12 @@ def handle_exceptions(func):
         except NotFound as e:
             LoggerService.insert_error(origin, str(e.description), user)
             raise NotFound(description=str(e.description))
+        except Conflict as e:
+            LoggerService.insert_error(origin, str(e.description), user)
+            raise Conflict(description=str(e.description))
+        except RequestEntityTooLarge as e:
+            LoggerService.insert_error(origin, str(e.description), user)
+            raise RequestEntityTooLarge(description=str(e.description))
         except Exception as e:
             error_message = f'Error: {str(e)}'
             traceback_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
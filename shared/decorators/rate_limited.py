@@ -0,0 +1,19 @@
+from shared.rate_limit import RateLimitRule
+
+
+def rate_limited(rate: float, burst: float):
+    """
+    Decorator that overrides the rate limit of the route of a view, e.g. a stricter one for the login.
+
+    Args:
+        rate (float): The requests per second allowed to every tenant and user on the route.
+        burst (float): The requests allowed at once after an idle period.
+
+    Returns:
+        callable: The decorator that marks the view.
+    """
+    def decorator(func):
+        func.rate_limit_rule = RateLimitRule(rate, burst)
+        return func
+
+    return decorator
@@ -1,22 +1,51 @@
 from functools import wraps
-from flask import request, jsonify
+from typing import Optional
+
+from flask import g, request, jsonify
 from shared.security import decode_access_token
 
 
+def check_access_token(auth_header: Optional[str]) -> tuple[Optional[dict], Optional[str]]:
+    """
+    Decodes the token of an `Authorization: Bearer <token>` header.
+
+    Args:
+        auth_header (Optional[str]): The value of the Authorization header.
+
+    Returns:
+        tuple[Optional[dict], Optional[str]]: The payload of the token, or the error answered with a 401.
+    """
+    if not auth_header:
+        return None, "Token is missing"
+
+    try:
+        token = auth_header.split(" ")[1]
+        payload = decode_access_token(token)
+        if not payload:
+            return None, "Invalid token"
+    except Exception as e:
+        return None, f"Invalid token format, error: {str(e)}"
+    return payload, None
+
+
+def get_request_token() -> tuple[Optional[dict], Optional[str]]:
+    """
+    Checks the token of the current request once, the hooks and the decorators reuse the outcome.
+
+    Returns:
+        tuple[Optional[dict], Optional[str]]: The payload of the token, or the error answered with a 401.
+    """
+    if 'access_token_check' not in g:
+        g.access_token_check = check_access_token(request.headers.get("Authorization"))
+    return g.access_token_check
+
+
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            return jsonify({"error": "Token is missing"}), 401
-
-        try:
-            token = auth_header.split(" ")[1]
-            payload = decode_access_token(token)
-            if not payload:
-                return jsonify({"error": "Invalid token"}), 401
-        except Exception as e:
-            return jsonify({"error": f"Invalid token format, error: {str(e)}"}), 401
+        payload, error = get_request_token()
+        if error:
+            return jsonify({"error": error}), 401
 
         return f(payload, *args, **kwargs)
     return decorated
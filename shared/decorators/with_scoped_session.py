@@ -1,17 +1,53 @@
+from functools import wraps
+
+from shared.tracing import trace_span
+
+
 def with_scoped_session(func):
     """
     Decorator that creates an SQLAlchemy session before calling the function and closes it afterward.
+
+    The call runs in a span named after the function, which gets the statements run with the session.
     """
+    span_name = func.__qualname__
 
+    @wraps(func)
     def wrapper(self, *args, **kwargs):
-        session = self.database_manager.get_session()
-        try:
-            result = func(self, session, *args, **kwargs)
-            return result
-        except Exception as e:
-            session.rollback()
-            raise e
-        finally:
-            self.database_manager.close_session(session)
+        with trace_span(span_name):
+            session = self.database_manager.get_session()
+            try:
+                result = func(self, session, *args, **kwargs)
+                return result
+            except Exception as e:
+                session.rollback()
+                raise e
+            finally:
+                self.database_manager.close_session(session)
+
+    return wrapper
+
+
+def async_with_scoped_session(func):
+    """
+    Decorator that creates an SQLAlchemy asyncio session before awaiting the coroutine function and closes it
+    afterward, the async equivalent of `with_scoped_session` for the services of an AsyncDataBaseManager.
+
+    Every call gets its own session and connection, so independent calls can be awaited concurrently with
+    `asyncio.gather`: an asyncio session must not be shared by concurrent tasks.
+    """
+    span_name = func.__qualname__
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        with trace_span(span_name):
+            session = self.database_manager.get_session()
+            try:
+                result = await func(self, session, *args, **kwargs)
+                return result
+            except Exception as e:
+                await session.rollback()
+                raise e
+            finally:
+                await self.database_manager.close_session(session)
 
     return wrapper
@@ -0,0 +1 @@
+from .plan_usage_counters import PlanUsageCounters, API_USAGE_WINDOW_DAYS
@@ -0,0 +1,175 @@
+import threading
+import time
+from datetime import date, datetime, UTC
+from typing import Iterable, Optional
+
+from shared.metrics import SlidingWindowAggregate
+
+_DAY_SECONDS = 86400
+API_USAGE_WINDOW_DAYS = 30
+
+
+class PlanUsageCounters:
+    """
+    Thread-safe in-memory counters of the plan usage of every tenant.
+
+    API calls are metered in a 30-day sliding window with one bucket per UTC day, so checking the monthly quota
+    costs a dictionary lookup. The calls counted since the last sync are also kept as per-day deltas that are
+    added to the database by the sync, which then reloads the totals of every worker. Resource counts (users,
+    modules...) are loaded with a grouped COUNT at every sync. In between, the rows about to be created are
+    reserved against the limit first, so two writers of the worker cannot both take its last free rows.
+    """
+
+    def __init__(self, window_days: int = API_USAGE_WINDOW_DAYS):
+        """
+        Constructor for the PlanUsageCounters class.
+
+        Args:
+            window_days (int): The days of the API call window. Defaults to 30.
+        """
+        self.window_days = window_days
+        self._api_windows: dict[str, SlidingWindowAggregate] = {}
+        self._pending_api_calls: dict[tuple[str, date], int] = {}
+        self._resources: dict[tuple[str, str], int] = {}
+        # Rows reserved and not committed yet, a sync keeps them on top of the counts it loads
+        self._reserved_resources: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _new_window(self) -> SlidingWindowAggregate:
+        return SlidingWindowAggregate(self.window_days * _DAY_SECONDS, self.window_days)
+
+    def record_api_call(self, tenant_id: str, timestamp: Optional[float] = None) -> int:
+        """
+        Counts an API call of a tenant.
+
+        Args:
+            tenant_id (str): The ID of the tenant.
+            timestamp (Optional[float]): The POSIX timestamp of the call. Defaults to now.
+
+        Returns:
+            int: The API calls of the tenant in the window, including this one.
+        """
+        timestamp = timestamp if timestamp is not None else time.time()
+        usage_date = datetime.fromtimestamp(timestamp, UTC).date()
+        with self._lock:
+            window = self._api_windows.get(tenant_id)
+            if window is None:
+                window = self._api_windows[tenant_id] = self._new_window()
+            window.add(timestamp, 1)
+            key = (tenant_id, usage_date)
+            self._pending_api_calls[key] = self._pending_api_calls.get(key, 0) + 1
+            return int(window.total)
+
+    def api_calls(self, tenant_id: str, timestamp: Optional[float] = None) -> int:
+        """
+        Returns the API calls of a tenant in the window.
+        """
+        with self._lock:
+            window = self._api_windows.get(tenant_id)
+            if window is None:
+                return 0
+            window.expire(timestamp if timestamp is not None else time.time())
+            return int(window.total)
+
+    def drain_pending_api_calls(self) -> dict[tuple[str, date], int]:
+        """
+        Returns and clears the API calls counted since the last drain, by tenant and day.
+        """
+        with self._lock:
+            pending, self._pending_api_calls = self._pending_api_calls, {}
+            return pending
+
+    def restore_pending_api_calls(self, pending: dict[tuple[str, date], int]):
+        """
+        Puts back drained API calls that could not be synced, so the next sync retries them.
+        """
+        with self._lock:
+            for key, calls in pending.items():
+                self._pending_api_calls[key] = self._pending_api_calls.get(key, 0) + calls
+
+    def load_api_usage(self, usage: Iterable[tuple[str, date, int]]):
+        """
+        Replaces the API call windows with the daily totals stored in the database.
+
+        The calls counted after the last drain are not stored yet, so they are added on top.
+
+        Args:
+            usage (Iterable[tuple[str, date, int]]): The API calls by tenant and day.
+        """
+        windows: dict[str, SlidingWindowAggregate] = {}
+        for tenant_id, usage_date, calls in usage:
+            window = windows.get(tenant_id)
+            if window is None:
+                window = windows[tenant_id] = self._new_window()
+            window.add(self._day_timestamp(usage_date), calls)
+        with self._lock:
+            for (tenant_id, usage_date), calls in self._pending_api_calls.items():
+                window = windows.get(tenant_id)
+                if window is None:
+                    window = windows[tenant_id] = self._new_window()
+                window.add(self._day_timestamp(usage_date), calls)
+            self._api_windows = windows
+
+    @staticmethod
+    def _day_timestamp(usage_date: date) -> float:
+        return datetime(usage_date.year, usage_date.month, usage_date.day, tzinfo=UTC).timestamp()
+
+    def resource_count(self, resource: str, tenant_id: str) -> int:
+        with self._lock:
+            return self._resources.get((resource, tenant_id), 0)
+
+    def reserve_resource(self, resource: str, tenant_id: str, amount: int, limit: Optional[int]) -> int:
+        """
+        Reserves up to `amount` rows of a resource for a tenant, checking and counting them at once.
+
+        Args:
+            resource (str): The name of the resource.
+            tenant_id (str): The ID of the tenant.
+            amount (int): The rows to create.
+            limit (Optional[int]): The rows the plan allows, None when it has no limit.
+
+        Returns:
+            int: The rows reserved, fewer than asked when the limit is reached.
+        """
+        key = (resource, tenant_id)
+        with self._lock:
+            count = self._resources.get(key, 0)
+            reserved = amount if limit is None else max(min(amount, limit - count), 0)
+            self._resources[key] = count + reserved
+            self._reserved_resources[key] = self._reserved_resources.get(key, 0) + reserved
+            return reserved
+
+    def finish_reservation(self, resource: str, tenant_id: str, reserved: int, created: int):
+        """
+        Ends a reservation once its transaction is over: the created rows stay counted until the next sync
+        loads them, the rest are given back.
+
+        Args:
+            resource (str): The name of the resource.
+            tenant_id (str): The ID of the tenant.
+            reserved (int): The rows reserved.
+            created (int): The rows committed, 0 when the transaction failed.
+        """
+        key = (resource, tenant_id)
+        with self._lock:
+            self._reserved_resources[key] = self._reserved_resources.get(key, 0) - reserved
+            if self._reserved_resources[key] <= 0:
+                del self._reserved_resources[key]
+            self._resources[key] = max(self._resources.get(key, 0) - (reserved - created), 0)
+
+    def load_resource_counts(self, resource: str, counts: dict[str, int]):
+        """
+        Replaces the counts of a resource with the ones stored in the database.
+
+        Args:
+            resource (str): The name of the resource.
+            counts (dict[str, int]): The rows of the resource per tenant.
+        """
+        with self._lock:
+            for key in [key for key in self._resources if key[0] == resource]:
+                del self._resources[key]
+            for tenant_id, count in counts.items():
+                self._resources[(resource, tenant_id)] = count
+            for key, reserved in self._reserved_resources.items():
+                if key[0] == resource:
+                    self._resources[key] = self._resources.get(key, 0) + reserved
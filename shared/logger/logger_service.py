@@ -2,11 +2,11 @@ import logging
 import sys
 import threading
 import traceback
-import uuid
 from typing import Literal
 
 from shared.constants import USER_LOGGER_SERVICE
 from shared.logger import LoggerConfig
+from shared.tracing.trace_context import get_trace_id
 
 
 class LoggerService:
@@ -54,7 +54,7 @@ class LoggerService:
             trace_id (str, optional): Identifier to trace the request. Defaults to None.
         """
         logger = cls._get_logger(20)  # logging.INFO
-        trace = trace_id or str(uuid.uuid4())
+        trace = trace_id or get_trace_id()
         extra = {
             "user": user if user is not None else cls._user,
             "origin": origin,
@@ -81,7 +81,7 @@ class LoggerService:
         """
         logger = cls._get_logger(40)  # logging.ERROR
         has_active_exception = sys.exc_info()[0] is not None
-        trace = trace_id or str(uuid.uuid4())
+        trace = trace_id or get_trace_id()
         extra = {
             "user": user if user is not None else cls._user,
             "origin": origin,
@@ -109,7 +109,7 @@ class LoggerService:
             trace_id (str, optional): Identifier to trace the request. Defaults to None.
         """
         logger = cls._get_logger(30)  # logging.WARNING
-        trace = trace_id or str(uuid.uuid4())
+        trace = trace_id or get_trace_id()
         extra = {
             "user": user if user is not None else cls._user,
             "origin": origin,
@@ -0,0 +1 @@
+from .sliding_window import SlidingWindowAggregate
@@ -0,0 +1,108 @@
+import math
+
+
+class SlidingWindowAggregate:
+    """
+    Time-bucketed sliding window that keeps running sums of a numerator, a denominator and a sample count.
+
+    The window is split into a fixed number of buckets stored in a ring. Adding a sample only touches the
+    bucket of its timestamp and expires at most `buckets` stale buckets, so the cost of every operation is
+    bounded by the bucket count and never depends on how many samples were seen before.
+    """
+
+    __slots__ = ("window_seconds", "buckets", "bucket_seconds", "_numerators", "_denominators", "_counts",
+                 "_numerator", "_denominator", "_count", "_head_epoch")
+
+    def __init__(self, window_seconds: float, buckets: int = 12):
+        """
+        Constructor for the SlidingWindowAggregate class.
+
+        Args:
+            window_seconds (float): The length of the window in seconds.
+            buckets (int): The number of buckets the window is split into. Defaults to 12.
+        """
+        if window_seconds <= 0 or buckets <= 0:
+            raise ValueError("window_seconds and buckets must be greater than zero")
+        self.window_seconds = window_seconds
+        self.buckets = buckets
+        self.bucket_seconds = window_seconds / buckets
+        self._numerators = [0.0] * buckets
+        self._denominators = [0.0] * buckets
+        self._counts = [0] * buckets
+        self._numerator = 0.0
+        self._denominator = 0.0
+        self._count = 0
+        self._head_epoch = -1
+
+    def _epoch(self, timestamp: float) -> int:
+        return math.floor(timestamp / self.bucket_seconds)
+
+    def _advance(self, epoch: int):
+        """
+        Expires the buckets that fell out of the window when moving the head to the given epoch.
+
+        Args:
+            epoch (int): The bucket epoch of the newest timestamp seen.
+        """
+        if epoch <= self._head_epoch:
+            return
+        start = max(self._head_epoch + 1, epoch - self.buckets + 1)
+        for stale_epoch in range(start, epoch + 1):
+            index = stale_epoch % self.buckets
+            self._numerator -= self._numerators[index]
+            self._denominator -= self._denominators[index]
+            self._count -= self._counts[index]
+            self._numerators[index] = 0.0
+            self._denominators[index] = 0.0
+            self._counts[index] = 0
+        self._head_epoch = epoch
+
+    def add(self, timestamp: float, numerator: float, denominator: float = 1.0):
+        """
+        Adds a sample to the window.
+
+        Samples older than the window are ignored, late samples still inside the window are accounted in
+        their own bucket.
+
+        Args:
+            timestamp (float): The POSIX timestamp of the sample.
+            numerator (float): The value added to the numerator sum.
+            denominator (float): The value added to the denominator sum. Defaults to 1.0.
+        """
+        epoch = self._epoch(timestamp)
+        self._advance(epoch)
+        if epoch <= self._head_epoch - self.buckets:
+            return
+        index = epoch % self.buckets
+        self._numerators[index] += numerator
+        self._denominators[index] += denominator
+        self._counts[index] += 1
+        self._numerator += numerator
+        self._denominator += denominator
+        self._count += 1
+
+    def expire(self, timestamp: float):
+        """
+        Drops the buckets that are older than the window at the given time.
+
+        Args:
+            timestamp (float): The current POSIX timestamp.
+        """
+        self._advance(self._epoch(timestamp))
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._numerator
+
+    @property
+    def ratio(self) -> float | None:
+        """
+        Returns the numerator sum divided by the denominator sum, or None when the denominator is zero.
+        """
+        if self._denominator <= 0:
+            return None
+        return self._numerator / self._denominator
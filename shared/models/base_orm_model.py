@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, UUID
+from sqlalchemy import Column, Index, Integer, String, UniqueConstraint, UUID, text
+from sqlalchemy.orm import declared_attr
 from sqlalchemy.ext.declarative import declarative_base
 
 # Define the base model for SQLAlchemy
@@ -6,7 +7,33 @@ Base = declarative_base()
 
 
 class TextileProBaseOrmModel(Base):
+    """
+    Base model of every tenant-owned table.
+
+    Subclasses declare their extra indexes and unique constraints as column tuples in `__tenant_indexes__`
+    and `__tenant_unique__`; the base prefixes them with tenant_id so every lookup is a range scan inside the
+    rows of a single tenant. `__tenant_partial_unique__` pairs a column tuple with the SQL condition of the
+    rows that must be unique, e.g. only the active ones.
+    """
     __abstract__ = True
+    __tenant_indexes__: tuple[tuple[str, ...], ...] = ()
+    __tenant_unique__: tuple[tuple[str, ...], ...] = ()
+    __tenant_partial_unique__: tuple[tuple[tuple[str, ...], str], ...] = ()
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    uuid = Column(UUID(as_uuid=True), unique=True, nullable=False)
+    uuid = Column(UUID(as_uuid=False), unique=True, nullable=False)
+    tenant_id = Column(String(64), nullable=False)
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        table_name = cls.__tablename__
+        table_args = [Index(f"ix_{table_name}_tenant_id_id", "tenant_id", "id")]
+        for columns in cls.__tenant_indexes__:
+            table_args.append(Index(f"ix_{table_name}_tenant_id_{'_'.join(columns)}", "tenant_id", *columns))
+        for columns in cls.__tenant_unique__:
+            table_args.append(UniqueConstraint("tenant_id", *columns,
+                                               name=f"uq_{table_name}_tenant_id_{'_'.join(columns)}"))
+        for columns, condition in cls.__tenant_partial_unique__:
+            table_args.append(Index(f"uq_{table_name}_tenant_id_{'_'.join(columns)}", "tenant_id", *columns,
+                                    unique=True, postgresql_where=text(condition), sqlite_where=text(condition)))
+        return tuple(table_args)
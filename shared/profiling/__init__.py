@@ -0,0 +1,2 @@
+from .stack_sampler import StackSampler, format_collapsed, parse_collapsed, group_collapsed
+from .request_profiler import RequestProfile, PROFILERS, CPROFILE, TRACEMALLOC
@@ -0,0 +1,56 @@
+import os
+
+from flask import Blueprint, Response, current_app, jsonify, request, send_file
+
+from shared.decorators import admin_required, handle_exceptions
+from shared.profiling.request_profiler import PROFILE_ID_PATTERN, profile_path
+from shared.profiling.stack_sampler import format_collapsed, group_collapsed
+
+# Create a new Blueprint for the profiling of the workers, only for the administrators
+profiling_blueprint = Blueprint('profiling', __name__, url_prefix='/admin/profiling')
+STACK_GROUPS = ('all', 'route', 'handler')
+
+
+@profiling_blueprint.route('/stacks', methods=['GET'])
+@handle_exceptions
+@admin_required
+def get_sampled_stacks(payload):
+    """
+    Return the stacks sampled in every worker as collapsed stacks, ready for flamegraph.pl or speedscope.
+
+    Query parameters:
+        group: 'all' (route, then bus message), 'route' or 'handler' (bus message first). Defaults to 'all'.
+        match: Only the stacks whose route or bus message contains it.
+    """
+    stack_sampler = current_app.config.get('stack_sampler')
+    if stack_sampler is None:
+        return jsonify({"error": "Stack sampling is disabled"}), 404
+    group = request.args.get('group', 'all')
+    if group not in STACK_GROUPS:
+        return jsonify({"error": f"group must be one of {', '.join(STACK_GROUPS)}"}), 400
+    counts = group_collapsed(stack_sampler.collect(), group, request.args.get('match') or None)
+    return Response(format_collapsed(counts), mimetype='text/plain')
+
+
+@profiling_blueprint.route('/requests/<profile_id>', methods=['GET'])
+@handle_exceptions
+@admin_required
+def get_request_profile(payload, profile_id: str):
+    """
+    Return the report of a request profiled with the `X-Profile` header, whose ID is sent back in the
+    `X-Profile-ID` header. `format=pstats` returns the cProfile data, for snakeviz or `pstats`.
+    """
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return jsonify({"error": "Profile not found"}), 404
+    directory = os.path.abspath(current_app.config['PROFILING_DIR'])
+    if request.args.get('format') == 'pstats':
+        path = profile_path(directory, profile_id, 'prof')
+        if not os.path.isfile(path):
+            return jsonify({"error": "Profile not found"}), 404
+        return send_file(path, mimetype='application/octet-stream', as_attachment=True,
+                         download_name=f"{profile_id}.prof")
+    path = profile_path(directory, profile_id, 'txt')
+    if not os.path.isfile(path):
+        return jsonify({"error": "Profile not found"}), 404
+    with open(path, encoding='utf-8') as file:
+        return Response(file.read(), mimetype='text/plain')
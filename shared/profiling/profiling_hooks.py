@@ -0,0 +1,59 @@
+from flask import Flask, g, request
+
+from shared.decorators.admin_required import get_admin_payload
+from shared.profiling.profiling_controller import profiling_blueprint
+from shared.profiling.request_profiler import PROFILERS, RequestProfile
+
+PROFILE_HEADER = 'X-Profile'
+
+
+def register_profiling_hooks(app: Flask, directory: str, request_profiles: bool = True):
+    """
+    Registers the endpoints of the profiling and, with `request_profiles`, profiles the requests of the
+    administrators sent with an `X-Profile: cprofile` or `X-Profile: tracemalloc` header. The response carries
+    the `X-Profile-ID` of the report, served by `/admin/profiling/requests/<id>`, or an `X-Profile-Status`
+    when it was not profiled.
+
+    It must be registered right after the tracing hooks, so the profile covers the other hooks.
+
+    Args:
+        app (Flask): The Flask application instance.
+        directory (str): Where the reports are written, shared by the workers.
+        request_profiles (bool): Whether the requests can be profiled on demand. Defaults to True.
+    """
+    app.register_blueprint(profiling_blueprint)
+    if not request_profiles:
+        return
+
+    @app.before_request
+    def start_request_profile():
+        profiler = request.headers.get(PROFILE_HEADER, '').strip().lower()
+        if not profiler:
+            return
+        if profiler not in PROFILERS:
+            g.request_profile_status = 'unknown profiler'
+        elif get_admin_payload() is None:
+            g.request_profile_status = 'forbidden'
+        else:
+            profile = RequestProfile(profiler, directory)
+            if profile.start():
+                g.request_profile = profile
+            else:
+                g.request_profile_status = 'busy'
+
+    @app.after_request
+    def end_request_profile(response):
+        profile = g.pop('request_profile', None)
+        if profile is not None:
+            response.headers['X-Profile-ID'] = profile.stop(
+                f"{request.method} {request.full_path.rstrip('?')} ({response.status_code})")
+        elif 'request_profile_status' in g:
+            response.headers['X-Profile-Status'] = g.pop('request_profile_status')
+        return response
+
+    @app.teardown_request
+    def discard_request_profile(error=None):
+        # Only left when the response was not built, the profiler must be released anyway
+        profile = g.pop('request_profile', None)
+        if profile is not None:
+            profile.stop(f"{request.method} {request.full_path.rstrip('?')}", save=False)
@@ -0,0 +1,16 @@
+from prometheus_client import Counter, Histogram
+
+PROFILING_SAMPLES = Counter(
+    'textile_pro_profiling_stack_samples_total',
+    'Thread stacks counted by the stack sampler of the worker',
+)
+PROFILING_SAMPLE_SECONDS = Histogram(
+    'textile_pro_profiling_sample_seconds',
+    'Seconds the stack sampler took to sample the threads of the worker',
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05),
+)
+PROFILED_REQUESTS = Counter(
+    'textile_pro_profiling_requests_total',
+    'Requests profiled on demand, per profiler and outcome',
+    ['profiler', 'outcome'],
+)
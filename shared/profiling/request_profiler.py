@@ -0,0 +1,156 @@
+import cProfile
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Optional
+
+from shared.profiling.profiling_metrics import PROFILED_REQUESTS
+
+CPROFILE = 'cprofile'
+TRACEMALLOC = 'tracemalloc'
+PROFILERS = (CPROFILE, TRACEMALLOC)
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+REQUESTS_DIRECTORY = 'requests'
+
+# A profiler of each kind at a time: cProfile hooks the interpreter and tracemalloc traces the whole process
+_profiler_locks = {profiler: threading.Lock() for profiler in PROFILERS}
+
+
+def profile_path(directory: str, profile_id: str, extension: str) -> str:
+    return os.path.join(directory, REQUESTS_DIRECTORY, f"{profile_id}.{extension}")
+
+
+class RequestProfile:
+    """
+    Profiles a single request with cProfile (where the time goes, per function) or tracemalloc (where the
+    memory goes, per line), and writes the report to the profiling directory so any worker can serve it.
+
+    tracemalloc traces the allocations of the whole process, so the report of a request also holds the ones
+    of the requests handled at the same time by the worker.
+    """
+
+    def __init__(self, profiler: str, directory: str, top: int = 50, max_reports: int = 200):
+        """
+        Constructor for the RequestProfile class.
+
+        Args:
+            profiler (str): 'cprofile' or 'tracemalloc'.
+            directory (str): The profiling directory, the reports go to its `requests` directory.
+            top (int): The functions or lines listed in the report. Defaults to 50.
+            max_reports (int): The reports kept, the oldest are deleted. Defaults to 200.
+        """
+        self.profiler = profiler
+        self.directory = directory
+        self.top = top
+        self.max_reports = max_reports
+        self.profile_id = uuid.uuid4().hex
+        self._profile: Optional[cProfile.Profile] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+        self._started = 0.0
+
+    def start(self) -> bool:
+        """
+        Starts profiling the current thread.
+
+        Returns:
+            bool: False when a request is already profiled with the same profiler.
+        """
+        if not _profiler_locks[self.profiler].acquire(blocking=False):
+            PROFILED_REQUESTS.labels(profiler=self.profiler, outcome='busy').inc()
+            return False
+        if self.profiler == TRACEMALLOC:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start(25)
+            tracemalloc.reset_peak()
+            self._snapshot = tracemalloc.take_snapshot()
+        self._started = time.perf_counter()
+        if self.profiler == CPROFILE:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return True
+
+    def stop(self, description: str, save: bool = True) -> str:
+        """
+        Stops profiling and writes the report.
+
+        Args:
+            description (str): What was profiled, e.g. the method and path of the request.
+            save (bool): Whether the report is written, False discards it, e.g. for a failed request.
+
+        Returns:
+            str: The ID of the report.
+        """
+        try:
+            if self.profiler == CPROFILE:
+                self._profile.disable()
+                duration_ms = (time.perf_counter() - self._started) * 1000
+                if save:
+                    self._save_cprofile(description, duration_ms)
+            else:
+                duration_ms = (time.perf_counter() - self._started) * 1000
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if self._started_tracing:
+                    tracemalloc.stop()
+                if save:
+                    self._save_tracemalloc(description, duration_ms, snapshot, peak)
+            PROFILED_REQUESTS.labels(profiler=self.profiler, outcome='saved' if save else 'discarded').inc()
+        finally:
+            _profiler_locks[self.profiler].release()
+        return self.profile_id
+
+    def _header(self, description: str, duration_ms: float) -> str:
+        return f"{self.profiler} profile {self.profile_id} of {description}: {duration_ms:.1f}ms, " \
+               f"worker {os.getpid()}\n\n"
+
+    def _save_cprofile(self, description: str, duration_ms: float):
+        os.makedirs(os.path.join(self.directory, REQUESTS_DIRECTORY), exist_ok=True)
+        self._profile.dump_stats(profile_path(self.directory, self.profile_id, 'prof'))
+        report = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=report)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        self._write_report(self._header(description, duration_ms) + report.getvalue())
+
+    def _save_tracemalloc(self, description: str, duration_ms: float, snapshot: tracemalloc.Snapshot,
+                          peak: int):
+        # Leaves out the allocations of the profiling itself, e.g. the stacks of the sampler
+        filters = (tracemalloc.Filter(False, tracemalloc.__file__),
+                   tracemalloc.Filter(False, os.path.join(os.path.dirname(__file__), '*')),
+                   tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'))
+        snapshot, before = snapshot.filter_traces(filters), self._snapshot.filter_traces(filters)
+        differences = snapshot.compare_to(before, 'lineno')
+        lines = [self._header(description, duration_ms), f"Peak traced memory: {peak / 1024:.1f} KiB\n\n",
+                 "Allocated during the request, per line:\n"]
+        lines.extend(f"{difference}\n" for difference in differences[:self.top])
+        lines.append("\nLargest allocations still alive, with their callers:\n")
+        for statistic in snapshot.compare_to(before, 'traceback')[:10]:
+            lines.append(f"\n{statistic.size_diff / 1024:.1f} KiB in {statistic.count_diff} blocks\n")
+            lines.extend(f"  {line}\n" for line in statistic.traceback.format(limit=10))
+        self._write_report(''.join(lines))
+
+    def _write_report(self, report: str):
+        os.makedirs(os.path.join(self.directory, REQUESTS_DIRECTORY), exist_ok=True)
+        with open(profile_path(self.directory, self.profile_id, 'txt'), 'w', encoding='utf-8') as file:
+            file.write(report)
+        self._prune_reports()
+
+    def _prune_reports(self):
+        requests_directory = os.path.join(self.directory, REQUESTS_DIRECTORY)
+        try:
+            entries = sorted(os.scandir(requests_directory), key=lambda entry: entry.stat().st_mtime)
+        except OSError:
+            return
+        reports = [entry for entry in entries if entry.name.endswith('.txt')]
+        for entry in reports[:max(0, len(reports) - self.max_reports)]:
+            for extension in ('txt', 'prof'):
+                try:
+                    os.remove(profile_path(self.directory, entry.name[:-4], extension))
+                except OSError:
+                    pass
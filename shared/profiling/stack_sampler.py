@@ -0,0 +1,285 @@
+import os
+import re
+import socket
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from typing import Iterable, Optional
+
+from flask import Flask
+
+from shared.communication_bus.command_bus.command_bus import CommandBus
+from shared.communication_bus.event_bus.event_bus import EventBus
+from shared.communication_bus.query_bus.query_bus import QueryBus
+from shared.profiling.profiling_metrics import PROFILING_SAMPLE_SECONDS, PROFILING_SAMPLES
+
+# Frames that name the unit of work of a stack, and the local holding its name
+_ROUTE_CODE = Flask.dispatch_request.__code__
+_BUS_CODES = {
+    CommandBus.execute.__code__: ('command', 'command_type'),
+    QueryBus.ask.__code__: ('query', 'query_type'),
+    EventBus.publish.__code__: ('event', 'event_type'),
+}
+# Numbers of the thread names, e.g. ThreadPoolExecutor-0_3, so the labels stay bounded
+_THREAD_NUMBERS = re.compile(r'[-_]?\d+')
+# Prefixes dropped from the file names of the frames: the project, the installed packages and the standard library
+_PATH_PREFIXES = tuple(sorted({os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) + os.sep,
+                               *(sysconfig.get_paths()[key] + os.sep for key in ('purelib', 'platlib', 'stdlib'))},
+                              key=len, reverse=True))
+STACKS_FILE_SUFFIX = '.collapsed'
+
+
+def _frame_name(code) -> str:
+    filename = code.co_filename
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            filename = filename[len(prefix):]
+            break
+    # The separators of the collapsed format cannot be part of a frame
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(';', ':')
+
+
+def _thread_cpu_seconds(thread_id: int) -> Optional[float]:
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+    except (AttributeError, OSError):
+        return None
+
+
+class StackSampler:
+    """
+    Samples the stacks of the threads of the worker at a low frequency, in a background thread, and counts
+    them as collapsed stacks (`frame;frame;frame count`), the input of flamegraph.pl, speedscope and most
+    flame graph viewers.
+
+    Each stack starts with the route of the request and the bus message it was handling, found in the frames
+    of `Flask.dispatch_request` and the buses, so the flame graph can be split per route or per handler
+    without touching the requests. Threads outside a request are labelled after their name.
+
+    With `cpu_only` a thread is only sampled when its CPU clock advanced since the previous sample, so the
+    threads waiting on the database, a lock or a socket do not hide the ones burning the CPU.
+
+    The counts cover the current window and the previous one, and are written every `flush_seconds` to a
+    file per worker in `directory`, so any worker can answer with the stacks of all of them.
+    """
+
+    def __init__(self, interval_seconds: float = 0.1, max_depth: int = 64, max_stacks: int = 20000,
+                 window_seconds: float = 600, directory: Optional[str] = None, flush_seconds: float = 15,
+                 cpu_only: bool = True):
+        """
+        Constructor for the StackSampler class.
+
+        Args:
+            interval_seconds (float): The seconds between two samples. Defaults to 0.1.
+            max_depth (int): The innermost frames kept per stack. Defaults to 64.
+            max_stacks (int): The distinct stacks counted per window, the rest are counted as truncated.
+                Defaults to 20000.
+            window_seconds (float): The seconds after which the oldest counts are discarded. Defaults to 600.
+            directory (Optional[str]): Where the workers write their counts, None keeps them in the worker.
+            flush_seconds (float): The seconds between two writes of the counts. Defaults to 15.
+            cpu_only (bool): Whether only the threads using the CPU are sampled. Defaults to True.
+        """
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+        self.window_seconds = window_seconds
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.cpu_only = cpu_only
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._current: Counter = Counter()
+        self._previous: Counter = Counter()
+        self._window_started = time.monotonic()
+        self._cpu_seconds: dict[int, float] = {}
+        self._frame_names: dict = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Starts sampling in a daemon thread, once per worker.
+        """
+        if self._thread is not None and self._thread.is_alive() and self._thread.ident is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds * 10)
+        self.flush()
+
+    def _run(self):
+        last_flush = time.monotonic()
+        while not self._stopped.wait(self.interval_seconds):
+            started = time.perf_counter()
+            try:
+                self.sample()
+                if self.directory and time.monotonic() - last_flush >= self.flush_seconds:
+                    last_flush = time.monotonic()
+                    self.flush()
+            except Exception:
+                # Profiling never takes the worker down, a failed sample is skipped
+                pass
+            PROFILING_SAMPLE_SECONDS.observe(time.perf_counter() - started)
+
+    def sample(self):
+        """
+        Counts the current stack of every thread of the worker but the sampler.
+        """
+        own_thread = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        stacks = []
+        for thread_id, frame in frames.items():
+            if thread_id == own_thread or not self._on_cpu(thread_id):
+                continue
+            stacks.append(self._collapse(frame, names.get(thread_id, 'thread')))
+        if len(self._cpu_seconds) > len(frames):
+            self._cpu_seconds = {thread_id: seconds for thread_id, seconds in self._cpu_seconds.items()
+                                 if thread_id in frames}
+        with self._lock:
+            if time.monotonic() - self._window_started >= self.window_seconds:
+                self._previous, self._current = self._current, Counter()
+                self._window_started = time.monotonic()
+            for stack in stacks:
+                if stack in self._current or len(self._current) < self.max_stacks:
+                    self._current[stack] += 1
+                else:
+                    self._current[f"{stack.split(';', 2)[0]};[truncated]"] += 1
+        PROFILING_SAMPLES.inc(len(stacks))
+
+    def _on_cpu(self, thread_id: int) -> bool:
+        if not self.cpu_only:
+            return True
+        cpu_seconds = _thread_cpu_seconds(thread_id)
+        if cpu_seconds is None:
+            return True
+        previous = self._cpu_seconds.get(thread_id)
+        self._cpu_seconds[thread_id] = cpu_seconds
+        return previous is not None and cpu_seconds > previous
+
+    def _collapse(self, frame, thread_name: str) -> str:
+        route, message, codes = None, None, []
+        while frame is not None:
+            code = frame.f_code
+            if len(codes) < self.max_depth:
+                codes.append(code)
+            if code is _ROUTE_CODE:
+                rule = frame.f_locals.get('rule')
+                route = f"route {rule.endpoint}" if rule is not None else None
+            elif code in _BUS_CODES and message is None:
+                bus, type_local = _BUS_CODES[code]
+                message_type = frame.f_locals.get(type_local)
+                message = f"{bus} {message_type.__name__}" if message_type is not None else None
+            frame = frame.f_back
+        frames = [route or f"thread {_THREAD_NUMBERS.sub('', thread_name)}"]
+        if message:
+            frames.append(message)
+        for code in reversed(codes):
+            name = self._frame_names.get(code)
+            if name is None:
+                name = self._frame_names[code] = _frame_name(code)
+            frames.append(name)
+        return ';'.join(frames)
+
+    def counts(self) -> Counter:
+        """
+        Returns the stacks of the worker sampled in the current and the previous windows.
+        """
+        with self._lock:
+            return self._previous + self._current
+
+    def flush(self):
+        """
+        Writes the counts of the worker to its file in the directory, replacing the previous ones.
+        """
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{self.worker_id}{STACKS_FILE_SUFFIX}")
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            file.write(format_collapsed(self.counts()))
+        os.replace(temporary_path, path)
+
+    def reset(self):
+        with self._lock:
+            self._current, self._previous = Counter(), Counter()
+            self._window_started = time.monotonic()
+
+    def collect(self, max_age_seconds: Optional[float] = None) -> Counter:
+        """
+        Returns the stacks of every worker: the live counts of this one and the files of the others, skipping
+        the files not written for `max_age_seconds`, e.g. the ones of the stopped workers.
+
+        Args:
+            max_age_seconds (Optional[float]): The age of the oldest file read. Defaults to twice the window.
+
+        Returns:
+            Counter: The counts per collapsed stack.
+        """
+        counts = self.counts()
+        if not self.directory or not os.path.isdir(self.directory):
+            return counts
+        max_age_seconds = max_age_seconds if max_age_seconds is not None else self.window_seconds * 2
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(STACKS_FILE_SUFFIX) or entry.name.startswith(self.worker_id + '.'):
+                continue
+            try:
+                if time.time() - entry.stat().st_mtime > max_age_seconds:
+                    continue
+                with open(entry.path, encoding='utf-8') as file:
+                    counts.update(parse_collapsed(file))
+            except OSError:
+                continue
+        return counts
+
+
+def format_collapsed(counts: Counter) -> str:
+    return ''.join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+
+def parse_collapsed(lines: Iterable[str]) -> Counter:
+    counts = Counter()
+    for line in lines:
+        stack, _, count = line.rstrip('\n').rpartition(' ')
+        if stack and count.isdigit():
+            counts[stack] += int(count)
+    return counts
+
+
+def group_collapsed(counts: Counter, group: str = 'all', match: Optional[str] = None) -> Counter:
+    """
+    Filters and regroups the collapsed stacks.
+
+    Args:
+        counts (Counter): The counts per collapsed stack.
+        group (str): 'all' keeps the stacks as sampled, 'route' drops the bus messages and 'handler' drops the
+            routes, so the flame graph starts at the bus message. Defaults to 'all'.
+        match (Optional[str]): Only keeps the stacks whose route or message contains it.
+
+    Returns:
+        Counter: The counts per collapsed stack.
+    """
+    grouped = Counter()
+    for stack, count in counts.items():
+        label, _, rest = stack.partition(';')
+        message = None
+        if rest.startswith(('command ', 'query ', 'event ')):
+            message, _, rest = rest.partition(';')
+        if match and match not in label and (message is None or match not in message):
+            continue
+        if group == 'route':
+            key = f"{label};{rest}"
+        elif group == 'handler':
+            key = f"{message or label};{rest}"
+        else:
+            key = stack
+        grouped[key.rstrip(';')] += count
+    return grouped
@@ -0,0 +1,4 @@
+from .admission_controller import AdmissionController
+from .rate_limiter import TokenBucketRateLimiter, RateLimitRule, RateLimitResult
+from .token_bucket_backends import TokenBucketBackend, InMemoryTokenBucketBackend, RedisTokenBucketBackend, \
+    RateLimitDecision
@@ -0,0 +1,76 @@
+import threading
+import time
+from typing import Optional
+
+ADMISSION_REJECTED_QUEUE_FULL = "queue_full"
+ADMISSION_REJECTED_QUEUE_TIMEOUT = "queue_timeout"
+
+
+class AdmissionController:
+    """
+    Concurrency-based admission control of a worker.
+
+    At most `max_concurrent` requests run at once. Requests above it wait for a slot, but only while fewer than
+    `max_queue` requests are waiting and for at most `queue_timeout_seconds`, so when the worker falls behind the
+    extra load is shed right away instead of piling up queue time for every request.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int = 0, queue_timeout_seconds: float = 0.0):
+        """
+        Constructor for the AdmissionController class.
+
+        Args:
+            max_concurrent (int): The maximum requests running at once.
+            max_queue (int): The maximum requests waiting for a slot. Defaults to 0.
+            queue_timeout_seconds (float): The maximum seconds a request waits for a slot. Defaults to 0.
+        """
+        if max_concurrent <= 0:
+            raise ValueError("max_concurrent must be greater than zero")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._in_flight = 0
+        self._waiting = 0
+        self._condition = threading.Condition(threading.Lock())
+
+    def try_acquire(self) -> tuple[Optional[str], float]:
+        """
+        Takes a slot, waiting for one when the queue allows it.
+
+        Returns:
+            tuple[Optional[str], float]: The reason of the rejection (None when a slot was taken) and the
+                seconds spent waiting.
+        """
+        with self._condition:
+            if self._in_flight < self.max_concurrent:
+                self._in_flight += 1
+                return None, 0.0
+            if self._waiting >= self.max_queue or self.queue_timeout_seconds <= 0:
+                return ADMISSION_REJECTED_QUEUE_FULL, 0.0
+
+            started_at = time.monotonic()
+            deadline = started_at + self.queue_timeout_seconds
+            self._waiting += 1
+            try:
+                while self._in_flight >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return ADMISSION_REJECTED_QUEUE_TIMEOUT, time.monotonic() - started_at
+                    self._condition.wait(remaining)
+                self._in_flight += 1
+                return None, time.monotonic() - started_at
+            finally:
+                self._waiting -= 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
@@ -0,0 +1,91 @@
+import math
+from typing import Iterable, Optional
+
+from flask import Flask, g, jsonify, make_response, request
+
+from shared.constants import RATE_LIMIT_SERVICE, RATE_LIMITED_CODE, SERVER_BUSY_CODE
+from shared.decorators.token_required import get_request_token
+from shared.logger import LoggerService
+from shared.rate_limit.admission_controller import AdmissionController
+from shared.rate_limit.rate_limit_metrics import ADMISSION_QUEUE_SECONDS, RATE_LIMIT_BACKEND_ERRORS, \
+    REQUESTS_ADMITTED, REQUESTS_IN_FLIGHT, REQUESTS_REJECTED
+from shared.rate_limit.rate_limiter import TokenBucketRateLimiter
+from shared.tenancy import get_current_tenant_id
+
+
+def _user_key() -> str:
+    """
+    Returns the key of the caller: the subject of its verified token, or its address for anonymous requests
+    such as the login and for invalid tokens, so sending a different junk token every time does not get a
+    fresh bucket.
+    """
+    payload, _ = get_request_token()
+    if payload and payload.get('sub'):
+        return f"sub:{payload['sub']}"
+    return f"ip:{request.remote_addr}"
+
+
+def _rejection_response(status_code: int, code: str, error: str, retry_after: float):
+    response = make_response(jsonify({"error": error, "code": code}), status_code)
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def register_rate_limit_hooks(app: Flask, rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                              admission_controller: Optional[AdmissionController] = None,
+                              exempt_endpoints: Iterable[str] = ()):
+    """
+    Protects the workers of the application from bursts.
+
+    Every request takes a token from the buckets of its tenant and of its tenant, user and route (429 when
+    empty), then an admission slot of the worker (503 when the worker is saturated). The tenant and the user
+    come from the verified token, so they must be registered after the tenancy hook. Views can override the
+    rule of their route with the `rate_limited` decorator. The exempt endpoints, e.g. the live streams that
+    spend their life waiting, skip both checks.
+
+    Args:
+        app (Flask): The Flask application instance.
+        rate_limiter (Optional[TokenBucketRateLimiter]): The token bucket limiter, None disables it.
+        admission_controller (Optional[AdmissionController]): The admission controller, None disables it.
+        exempt_endpoints (Iterable[str]): The endpoints that skip the checks.
+    """
+    exempt_endpoints = frozenset(exempt_endpoints)
+
+    @app.before_request
+    def admit_request():
+        endpoint = request.endpoint
+        if endpoint is None or endpoint in exempt_endpoints:
+            return None
+
+        if rate_limiter is not None:
+            view = app.view_functions.get(endpoint)
+            try:
+                result = rate_limiter.check(get_current_tenant_id(), _user_key(), endpoint,
+                                            getattr(view, 'rate_limit_rule', None))
+            except Exception as e:
+                # A rate limit backend outage must not take the API down with it
+                RATE_LIMIT_BACKEND_ERRORS.inc()
+                LoggerService.insert_error('rate_limit_hooks', f'Rate limit check failed: {str(e)}',
+                                           RATE_LIMIT_SERVICE)
+            else:
+                if not result.allowed:
+                    REQUESTS_REJECTED.labels(reason=f"rate_limit_{result.scope}").inc()
+                    return _rejection_response(429, RATE_LIMITED_CODE, 'Too many requests', result.retry_after)
+
+        if admission_controller is not None:
+            rejection, waited_seconds = admission_controller.try_acquire()
+            if rejection is not None:
+                REQUESTS_REJECTED.labels(reason=rejection).inc()
+                return _rejection_response(503, SERVER_BUSY_CODE, 'Server busy', 1)
+            g.admission_slot = True
+            REQUESTS_IN_FLIGHT.inc()
+            ADMISSION_QUEUE_SECONDS.observe(waited_seconds)
+
+        REQUESTS_ADMITTED.inc()
+        return None
+
+    @app.teardown_request
+    def release_admission_slot(error=None):
+        if g.pop('admission_slot', False):
+            REQUESTS_IN_FLIGHT.dec()
+            admission_controller.release()
@@ -0,0 +1,24 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+REQUESTS_ADMITTED = Counter(
+    'textile_pro_requests_admitted_total',
+    'Requests accepted by the rate limiter and the admission controller',
+)
+REQUESTS_REJECTED = Counter(
+    'textile_pro_requests_rejected_total',
+    'Requests rejected by the rate limiter or the admission controller',
+    ['reason'],
+)
+RATE_LIMIT_BACKEND_ERRORS = Counter(
+    'textile_pro_rate_limit_backend_errors_total',
+    'Rate limit checks skipped because the bucket backend failed',
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    'textile_pro_requests_in_flight',
+    'Requests holding an admission slot',
+)
+ADMISSION_QUEUE_SECONDS = Histogram(
+    'textile_pro_admission_queue_seconds',
+    'Seconds the admitted requests waited for an admission slot',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
@@ -0,0 +1,70 @@
+from typing import NamedTuple, Optional
+
+from shared.rate_limit.token_bucket_backends import RateLimitDecision, TokenBucketBackend
+
+RATE_LIMIT_SCOPE_TENANT = "tenant"
+RATE_LIMIT_SCOPE_ROUTE = "route"
+
+
+class RateLimitRule(NamedTuple):
+    rate: float
+    burst: float
+
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    scope: Optional[str]
+    retry_after: float
+
+
+class TokenBucketRateLimiter:
+    """
+    Token bucket rate limiter with two levels of buckets.
+
+    Every tenant has a bucket shared by all its users, so a single tenant cannot starve the others, and every
+    tenant, user and route has its own bucket, so a script hammering one endpoint is throttled before it spends
+    the budget of its teammates.
+    """
+
+    def __init__(self, backend: TokenBucketBackend, route_rule: RateLimitRule,
+                 tenant_rule: Optional[RateLimitRule] = None):
+        """
+        Constructor for the TokenBucketRateLimiter class.
+
+        Args:
+            backend (TokenBucketBackend): The storage of the buckets.
+            route_rule (RateLimitRule): The default rule of the tenant, user and route buckets.
+            tenant_rule (Optional[RateLimitRule]): The rule of the tenant buckets, None disables them.
+        """
+        self.backend = backend
+        self.route_rule = route_rule
+        self.tenant_rule = tenant_rule
+
+    def check(self, tenant_id: Optional[str], user_key: str, route: str,
+              rule: Optional[RateLimitRule] = None) -> RateLimitResult:
+        """
+        Takes a token from the buckets of a request.
+
+        Args:
+            tenant_id (Optional[str]): The ID of the tenant, None for anonymous requests.
+            user_key (str): The key of the caller, e.g. a hash of its token or its address.
+            route (str): The route of the request.
+            rule (Optional[RateLimitRule]): The rule of the route, defaults to the route rule of the limiter.
+
+        Returns:
+            RateLimitResult: Whether the request is allowed, the scope of the bucket that rejected it and the
+                seconds to wait before retrying.
+        """
+        tenant_key = tenant_id or "-"
+        if tenant_id and self.tenant_rule is not None:
+            decision = self._consume(f"t:{tenant_key}", self.tenant_rule)
+            if not decision.allowed:
+                return RateLimitResult(False, RATE_LIMIT_SCOPE_TENANT, decision.retry_after)
+
+        decision = self._consume(f"r:{tenant_key}:{user_key}:{route}", rule or self.route_rule)
+        if not decision.allowed:
+            return RateLimitResult(False, RATE_LIMIT_SCOPE_ROUTE, decision.retry_after)
+        return RateLimitResult(True, None, 0.0)
+
+    def _consume(self, key: str, rule: RateLimitRule) -> RateLimitDecision:
+        return self.backend.consume(key, rule.rate, rule.burst)
@@ -0,0 +1,120 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import NamedTuple
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - the shared backend is optional
+    redis = None
+
+
+class RateLimitDecision(NamedTuple):
+    allowed: bool
+    remaining: float
+    retry_after: float
+
+
+class TokenBucketBackend(ABC):
+    """
+    Storage of the token buckets. Every consume must refill and take the tokens of a bucket atomically.
+    """
+
+    @abstractmethod
+    def consume(self, key: str, rate: float, burst: float, cost: float = 1.0) -> RateLimitDecision:
+        """
+        Takes tokens from a bucket, refilling it first with the tokens earned since its last use.
+
+        Args:
+            key (str): The key of the bucket.
+            rate (float): The tokens added to the bucket per second.
+            burst (float): The capacity of the bucket.
+            cost (float): The tokens taken by the request. Defaults to 1.
+
+        Returns:
+            RateLimitDecision: Whether the tokens were taken, the tokens left and the seconds to wait otherwise.
+        """
+        pass
+
+
+class InMemoryTokenBucketBackend(TokenBucketBackend):
+    """
+    Token buckets of a single worker. The least recently used buckets are dropped beyond `max_keys`, which
+    only forgets buckets that were refilling anyway.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, rate: float, burst: float, cost: float = 1.0) -> RateLimitDecision:
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [burst, now]
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                return RateLimitDecision(True, bucket[0], 0.0)
+            bucket[0] = tokens
+            return RateLimitDecision(False, tokens, (cost - tokens) / rate)
+
+
+# Refill and take in one server-side step, using the clock of the server so every worker agrees on it
+_REDIS_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+
+class RedisTokenBucketBackend(TokenBucketBackend):
+    """
+    Token buckets shared by every worker and host, stored in Redis or any server speaking its protocol
+    (Valkey, KeyDB, Dragonfly...). Each consume is a single script call.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "rate_limit:", socket_timeout: float = 0.05):
+        """
+        Constructor for the RedisTokenBucketBackend class.
+
+        Args:
+            url (str): The URL of the server, e.g. redis://localhost:6379/0.
+            key_prefix (str): The prefix of the bucket keys.
+            socket_timeout (float): The seconds to wait for the server before failing the call.
+        """
+        if redis is None:
+            raise ImportError("The redis package is required to share the rate limits between workers")
+        self.key_prefix = key_prefix
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout,
+                                            socket_connect_timeout=socket_timeout)
+        self._script = self._client.register_script(_REDIS_TOKEN_BUCKET_SCRIPT)
+
+    def consume(self, key: str, rate: float, burst: float, cost: float = 1.0) -> RateLimitDecision:
+        allowed, remaining, retry_after = self._script(keys=[self.key_prefix + key], args=[rate, burst, cost])
+        return RateLimitDecision(bool(allowed), float(remaining), float(retry_after))
@@ -0,0 +1,2 @@
+from .broadcast_backends import BroadcastBackend, InMemoryBroadcastBackend, RedisBroadcastBackend
+from .broadcast_hub import BroadcastHub, ClientSubscription, HubMessage
@@ -0,0 +1,150 @@
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - the shared backend is optional
+    redis = None
+
+# Receives the id, channel, event and serialized payload of every message, in the order of their ids
+DeliverCallback = Callable[[int, str, str, str], None]
+
+
+class BroadcastBackend(ABC):
+    """
+    Transport of the messages of the BroadcastHub: it numbers every message and hands it to the hubs that
+    listen to it, in the order of their numbers.
+    """
+
+    @abstractmethod
+    def start(self, deliver: DeliverCallback):
+        """
+        Starts handing the published messages to a hub.
+
+        Args:
+            deliver (DeliverCallback): The callback of the hub that fans out a message to its clients.
+        """
+        pass
+
+    @abstractmethod
+    def publish(self, channel: str, event: str, data: str) -> int:
+        """
+        Numbers a message and sends it to every listening hub.
+
+        Args:
+            channel (str): The channel of the message.
+            event (str): The name of the event.
+            data (str): The serialized JSON payload of the event.
+
+        Returns:
+            int: The id of the message.
+        """
+        pass
+
+    def close(self):
+        """
+        Stops handing messages to the hub.
+        """
+        pass
+
+
+class InMemoryBroadcastBackend(BroadcastBackend):
+    """
+    Messages of a single worker: its hub only gets the messages published in the same process, numbered by a
+    counter of the process.
+    """
+
+    def __init__(self):
+        self._sequence = itertools.count(1)
+        self._deliver: Optional[DeliverCallback] = None
+        self._lock = threading.Lock()
+
+    def start(self, deliver: DeliverCallback):
+        self._deliver = deliver
+
+    def publish(self, channel: str, event: str, data: str) -> int:
+        # Numbered and delivered under the same lock, so the hub receives the messages in the order of their ids
+        with self._lock:
+            message_id = next(self._sequence)
+            if self._deliver is not None:
+                self._deliver(message_id, channel, event, data)
+        return message_id
+
+
+# Numbers the message and publishes it in one step, so every listener receives the messages in the order of
+# their ids
+_REDIS_PUBLISH_SCRIPT = """
+local id = redis.call('INCR', KEYS[1])
+redis.call('PUBLISH', KEYS[2], id .. '\\n' .. ARGV[1])
+return id
+"""
+
+
+class RedisBroadcastBackend(BroadcastBackend):
+    """
+    Messages shared by every worker and host through the pub/sub of Redis or any server speaking its protocol
+    (Valkey, KeyDB, Dragonfly...), numbered by a counter of the server.
+
+    Every hub receives the messages published by all the workers with the same ids, so a client resumes
+    with its Last-Event-ID from the history of whichever worker it reconnects to. The messages published
+    while a worker is disconnected from the server are lost for its clients, as the live updates are best
+    effort.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "live_updates:", socket_timeout: float = 0.5,
+                 reconnect_seconds: float = 1.0):
+        """
+        Constructor for the RedisBroadcastBackend class.
+
+        Args:
+            url (str): The URL of the server, e.g. redis://localhost:6379/0.
+            key_prefix (str): The prefix of the sequence key and of the pub/sub channel.
+            socket_timeout (float): The seconds to wait for the server before failing a publish.
+            reconnect_seconds (float): The seconds to wait before subscribing again after losing the server.
+        """
+        if redis is None:
+            raise ImportError("The redis package is required to share the live updates between workers")
+        self.key_prefix = key_prefix
+        self.reconnect_seconds = reconnect_seconds
+        self._sequence_key = f"{key_prefix}sequence"
+        self._topic = f"{key_prefix}messages"
+        self._client = redis.Redis.from_url(url, socket_timeout=socket_timeout,
+                                            socket_connect_timeout=socket_timeout)
+        self._publish_script = self._client.register_script(_REDIS_PUBLISH_SCRIPT)
+        # The subscriber blocks waiting for messages, it has no read timeout but checks the connection
+        self._subscriber_client = redis.Redis.from_url(url, socket_connect_timeout=socket_timeout,
+                                                       health_check_interval=30)
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, deliver: DeliverCallback):
+        self._thread = threading.Thread(target=self._listen, args=(deliver,), name="broadcast-backend",
+                                        daemon=True)
+        self._thread.start()
+
+    def publish(self, channel: str, event: str, data: str) -> int:
+        return int(self._publish_script(keys=[self._sequence_key, self._topic],
+                                        args=[f"{channel}\n{event}\n{data}"]))
+
+    def _listen(self, deliver: DeliverCallback):
+        while not self._closed.is_set():
+            pubsub = self._subscriber_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self._topic)
+                while not self._closed.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    message_id, channel, event, data = message["data"].decode("utf-8").split("\n", 3)
+                    deliver(int(message_id), channel, event, data)
+            except redis.RedisError:
+                self._closed.wait(self.reconnect_seconds)
+            finally:
+                pubsub.close()
+
+    def close(self):
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
@@ -0,0 +1,280 @@
+import asyncio
+import json
+import threading
+import weakref
+from collections import deque
+from typing import Optional
+
+from shared.realtime.broadcast_backends import BroadcastBackend, InMemoryBroadcastBackend
+
+
+class HubMessage:
+    """
+    Message fanned out by the BroadcastHub.
+
+    The payload is serialized once when the message is published and shared by every subscriber, both as
+    JSON for long-polling clients and as a ready to write Server-Sent Events frame.
+    """
+    __slots__ = ("id", "event", "data", "frame")
+
+    def __init__(self, message_id: int, event: str, data: str):
+        self.id = message_id
+        self.event = event
+        self.data = data
+        self.frame = f"id: {message_id}\nevent: {event}\ndata: {data}\n\n".encode("utf-8")
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "event": self.event, "data": json.loads(self.data)}
+
+
+class _LoopWaker:
+    """
+    Sets the asyncio events of the subscriptions waiting in an event loop from the publishing threads.
+
+    A publish wakes up the loop once for every subscription it reaches in that loop, instead of once per
+    subscription, so a message fanned out to thousands of async clients costs a single loop wakeup.
+    """
+    __slots__ = ("loop", "_pending", "_scheduled", "_lock", "__weakref__")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self._pending: list[asyncio.Event] = []
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def wake(self, event: asyncio.Event):
+        with self._lock:
+            self._pending.append(event)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self.loop.call_soon_threadsafe(self._set_pending)
+        except RuntimeError:
+            # The loop is closed, nobody is waiting anymore
+            pass
+
+    def _set_pending(self):
+        with self._lock:
+            events, self._pending = self._pending, []
+            self._scheduled = False
+        for event in events:
+            event.set()
+
+
+_loop_wakers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopWaker]" = weakref.WeakKeyDictionary()
+_loop_wakers_lock = threading.Lock()
+
+
+def _get_loop_waker(loop: asyncio.AbstractEventLoop) -> _LoopWaker:
+    with _loop_wakers_lock:
+        waker = _loop_wakers.get(loop)
+        if waker is None:
+            waker = _loop_wakers[loop] = _LoopWaker(loop)
+        return waker
+
+
+class ClientSubscription:
+    """
+    Subscription of a connected client to a channel of the BroadcastHub.
+
+    Messages are kept in a bounded buffer: a slow client loses its oldest messages instead of making the
+    hub or the publishers wait, and the number of lost messages is exposed in `dropped`.
+
+    A client can wait in a worker thread with `drain` or in an event loop with `drain_async`.
+    """
+    __slots__ = ("channel", "_buffer", "_ready", "_async_ready", "_waker", "dropped", "closed")
+
+    def __init__(self, channel: str, buffer_size: int):
+        self.channel = channel
+        self._buffer: deque[HubMessage] = deque(maxlen=buffer_size)
+        self._ready = threading.Event()
+        self._async_ready: Optional[asyncio.Event] = None
+        self._waker: Optional[_LoopWaker] = None
+        self.dropped = 0
+        self.closed = False
+
+    def _wake(self):
+        self._ready.set()
+        if self._waker is not None:
+            self._waker.wake(self._async_ready)
+
+    def push(self, message: HubMessage):
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(message)
+        self._wake()
+
+    def drain(self, timeout: float) -> list[HubMessage]:
+        """
+        Waits until there are buffered messages or the timeout expires and returns the buffered messages.
+
+        An idle client blocks on its own event without polling, so it does not consume CPU.
+
+        Args:
+            timeout (float): The maximum seconds to wait for messages.
+
+        Returns:
+            list[HubMessage]: The buffered messages, empty when the timeout expired or the hub closed.
+        """
+        if not self._buffer:
+            self._ready.wait(timeout)
+        return self._take()
+
+    async def drain_async(self, timeout: float) -> list[HubMessage]:
+        """
+        Same as `drain`, but waits in the running event loop instead of blocking a thread.
+
+        Args:
+            timeout (float): The maximum seconds to wait for messages.
+
+        Returns:
+            list[HubMessage]: The buffered messages, empty when the timeout expired or the hub closed.
+        """
+        if not self._buffer and not self.closed:
+            loop = asyncio.get_running_loop()
+            if self._async_ready is None:
+                self._async_ready = asyncio.Event()
+                self._waker = _get_loop_waker(loop)
+            deadline = loop.time() + timeout
+            # A wakeup scheduled before the previous drain emptied the buffer must not end this wait early
+            while not self._buffer and not self.closed:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._async_ready.clear()
+                try:
+                    await asyncio.wait_for(self._async_ready.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        return self._take()
+
+    def _take(self) -> list[HubMessage]:
+        self._ready.clear()
+        messages = []
+        while self._buffer:
+            messages.append(self._buffer.popleft())
+        return messages
+
+    def close(self):
+        self.closed = True
+        self._wake()
+
+
+class BroadcastHub:
+    """
+    Publish/subscribe hub that fans out messages to the clients connected to a channel.
+
+    Every channel keeps a short history so a reconnecting client can resume from its last event id. The
+    messages go through a backend that numbers them: the in-memory one only reaches the clients of the worker
+    that publishes, a shared one reaches the clients of every worker with the same ids.
+    """
+
+    def __init__(self, buffer_size: int = 100, history_size: int = 100, max_clients: int = 10000,
+                 backend: Optional[BroadcastBackend] = None):
+        """
+        Constructor for the BroadcastHub class.
+
+        Args:
+            buffer_size (int): The maximum buffered messages per client. Defaults to 100.
+            history_size (int): The messages kept per channel for resuming clients. Defaults to 100.
+            max_clients (int): The maximum connected clients in the process. Defaults to 10000.
+            backend (Optional[BroadcastBackend]): The transport of the messages. Defaults to the one of the
+                process.
+        """
+        self.buffer_size = buffer_size
+        self.history_size = history_size
+        self.max_clients = max_clients
+        self._subscribers: dict[str, set[ClientSubscription]] = {}
+        self._history: dict[str, deque[HubMessage]] = {}
+        self._clients = 0
+        self._lock = threading.Lock()
+        self.backend = backend or InMemoryBroadcastBackend()
+        self.backend.start(self._deliver)
+
+    def publish(self, channel: str, event: str, payload: dict) -> int:
+        """
+        Publishes a message to every client subscribed to a channel.
+
+        Args:
+            channel (str): The channel to publish to, usually the tenant ID.
+            event (str): The name of the event.
+            payload (dict): The JSON serializable payload of the event.
+
+        Returns:
+            int: The id of the published message.
+        """
+        return self.backend.publish(channel, event, json.dumps(payload, default=str, separators=(",", ":")))
+
+    def _deliver(self, message_id: int, channel: str, event: str, data: str):
+        """
+        Fans out a message numbered by the backend to the clients of the channel and keeps it in its history.
+        """
+        message = HubMessage(message_id, event, data)
+        with self._lock:
+            history = self._history.get(channel)
+            if history is None:
+                history = self._history[channel] = deque(maxlen=self.history_size)
+            history.append(message)
+            subscribers = tuple(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.push(message)
+
+    def subscribe(self, channel: str, last_event_id: Optional[int] = None) -> Optional[ClientSubscription]:
+        """
+        Subscribes a client to a channel.
+
+        Args:
+            channel (str): The channel to subscribe to.
+            last_event_id (Optional[int]): The last event id received by the client, the newer messages of the
+                channel history are replayed into the subscription.
+
+        Returns:
+            Optional[ClientSubscription]: The subscription, or None when the hub is full.
+        """
+        subscription = ClientSubscription(channel, self.buffer_size)
+        with self._lock:
+            if self._clients >= self.max_clients:
+                return None
+            self._subscribers.setdefault(channel, set()).add(subscription)
+            self._clients += 1
+            if last_event_id is not None:
+                for message in self._history.get(channel, ()):
+                    if message.id > last_event_id:
+                        subscription.push(message)
+        return subscription
+
+    def unsubscribe(self, subscription: ClientSubscription):
+        """
+        Removes a subscription from the hub.
+
+        Args:
+            subscription (ClientSubscription): The subscription to remove.
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None and subscription in subscribers:
+                subscribers.discard(subscription)
+                self._clients -= 1
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+        subscription.close()
+
+    def close(self):
+        """
+        Closes every subscription, waking up the clients so their responses end, and stops the backend.
+        """
+        self.backend.close()
+        with self._lock:
+            subscriptions = [s for subscribers in self._subscribers.values() for s in subscribers]
+            self._subscribers.clear()
+            self._clients = 0
+        for subscription in subscriptions:
+            subscription.close()
+
+    def stats(self) -> dict:
+        """
+        Returns the number of connected clients and channels of the hub.
+        """
+        with self._lock:
+            return {"clients": self._clients, "channels": len(self._subscribers)}
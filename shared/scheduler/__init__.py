@@ -0,0 +1,3 @@
+from .job_schedules import JobSchedule, IntervalSchedule, CronSchedule, parse_schedule
+from .job_lease_backends import JobLease, JobLeaseBackend, InMemoryJobLeaseBackend, SqlJobLeaseBackend
+from .job_scheduler import JobScheduler, ScheduledJob, CATCH_UP_ONCE, CATCH_UP_ALL, CATCH_UP_SKIP
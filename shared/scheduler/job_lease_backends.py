@@ -0,0 +1,260 @@
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, UTC
+from typing import NamedTuple, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from shared.scheduler.scheduled_jobs_orm_model import ScheduledJobsOrmModel
+from shared.scheduler.scheduler_exceptions import JobLeaseBackendException
+
+JOB_STATUS_SUCCEEDED = 'succeeded'
+JOB_STATUS_FAILED = 'failed'
+JOB_STATUS_SKIPPED = 'skipped'
+
+
+class JobLease(NamedTuple):
+    name: str
+    owner: str
+    scheduled_at: datetime
+    locked_until: datetime
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite drops the timezone of the stored dates, they are always written in UTC
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+class JobLeaseBackend(ABC):
+    """
+    Storage of the next run and the lease of every job. Taking a lease must be atomic, so a due run is only
+    started by one scheduler among the ones sharing the backend.
+    """
+
+    @abstractmethod
+    def register(self, name: str, schedule: str, first_run_at: datetime) -> datetime:
+        """
+        Creates the state of a job unless it exists with the same schedule, keeping the runs it missed while
+        every scheduler was down.
+
+        Args:
+            name (str): The name of the job.
+            schedule (str): The schedule expression, a changed schedule starts over from `first_run_at`.
+            first_run_at (datetime): The first run of a new job.
+
+        Returns:
+            datetime: The next run of the job.
+        """
+        pass
+
+    @abstractmethod
+    def acquire(self, name: str, owner: str, now: datetime, lease_seconds: float) -> Optional[JobLease]:
+        """
+        Takes the lease of a job if it is due and nobody holds it.
+
+        Args:
+            name (str): The name of the job.
+            owner (str): The scheduler taking the lease.
+            now (datetime): The current date.
+            lease_seconds (float): The seconds the lease lasts unless renewed.
+
+        Returns:
+            Optional[JobLease]: The lease with the scheduled date of the run, None when the job is not due or
+                another scheduler runs it.
+        """
+        pass
+
+    @abstractmethod
+    def renew(self, lease: JobLease, now: datetime, lease_seconds: float) -> Optional[JobLease]:
+        """
+        Extends a lease while its run is still going.
+
+        Returns:
+            Optional[JobLease]: The extended lease, None when it was lost.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, lease: JobLease, next_run_at: datetime, finished_at: datetime, duration_seconds: float,
+                status: str, error: Optional[str] = None):
+        """
+        Frees a lease, storing the next run and the outcome of the finished one.
+
+        Args:
+            lease (JobLease): The lease taken by `acquire`.
+            next_run_at (datetime): The next run of the job.
+            finished_at (datetime): The date the run finished.
+            duration_seconds (float): The seconds the run took.
+            status (str): 'succeeded', 'failed' or 'skipped'.
+            error (Optional[str]): The error of a failed run.
+        """
+        pass
+
+    @abstractmethod
+    def get_next_run(self, name: str) -> Optional[datetime]:
+        """
+        Returns the next run of a job, which another scheduler may have moved.
+        """
+        pass
+
+
+class InMemoryJobLeaseBackend(JobLeaseBackend):
+    """
+    Leases of the jobs of a single process, for the jobs that must run in every worker and for development.
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, schedule: str, first_run_at: datetime) -> datetime:
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None or job['schedule'] != schedule:
+                job = self._jobs[name] = {'schedule': schedule, 'next_run_at': first_run_at, 'locked_by': None,
+                                          'locked_until': None}
+            return job['next_run_at']
+
+    def acquire(self, name: str, owner: str, now: datetime, lease_seconds: float) -> Optional[JobLease]:
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None or job['next_run_at'] > now:
+                return None
+            if job['locked_until'] is not None and job['locked_until'] >= now:
+                return None
+            job['locked_by'] = owner
+            job['locked_until'] = now + timedelta(seconds=lease_seconds)
+            return JobLease(name, owner, job['next_run_at'], job['locked_until'])
+
+    def renew(self, lease: JobLease, now: datetime, lease_seconds: float) -> Optional[JobLease]:
+        with self._lock:
+            job = self._jobs.get(lease.name)
+            if job is None or job['locked_by'] != lease.owner:
+                return None
+            job['locked_until'] = now + timedelta(seconds=lease_seconds)
+            return lease._replace(locked_until=job['locked_until'])
+
+    def release(self, lease: JobLease, next_run_at: datetime, finished_at: datetime, duration_seconds: float,
+                status: str, error: Optional[str] = None):
+        with self._lock:
+            job = self._jobs.get(lease.name)
+            if job is None or job['locked_by'] != lease.owner:
+                return
+            job.update(next_run_at=next_run_at, locked_by=None, locked_until=None)
+
+    def get_next_run(self, name: str) -> Optional[datetime]:
+        with self._lock:
+            job = self._jobs.get(name)
+            return job['next_run_at'] if job is not None else None
+
+
+class SqlJobLeaseBackend(JobLeaseBackend):
+    """
+    Leases of the jobs in the scheduled_jobs table, shared by every replica connected to the database.
+
+    A lease is taken with a single conditional UPDATE on the due and unlocked row, which the database applies
+    to one transaction at a time, so it needs no advisory locks and works on every supported engine. A
+    replica that dies keeps the job locked until its lease expires.
+    """
+
+    def __init__(self, database_manager):
+        """
+        Constructor for the SqlJobLeaseBackend class.
+
+        Args:
+            database_manager (DataBaseManager): The database manager to open the sessions.
+        """
+        self.database_manager = database_manager
+
+    def _execute(self, operation):
+        session = self.database_manager.get_session()
+        try:
+            result = operation(session)
+            session.commit()
+            return result
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise JobLeaseBackendException(f"Database error updating the scheduled jobs: {str(e)}") from e
+        finally:
+            self.database_manager.close_session(session)
+
+    def register(self, name: str, schedule: str, first_run_at: datetime) -> datetime:
+        def operation(session):
+            job = session.get(ScheduledJobsOrmModel, name)
+            if job is None:
+                session.add(ScheduledJobsOrmModel(name=name, schedule=schedule, next_run_at=first_run_at, runs=0,
+                                                  failures=0))
+                return first_run_at
+            if job.schedule != schedule:
+                job.schedule = schedule
+                job.next_run_at = first_run_at
+                return first_run_at
+            return _aware(job.next_run_at)
+
+        try:
+            return self._execute(operation)
+        except JobLeaseBackendException as e:
+            if not isinstance(e.__cause__, IntegrityError):
+                raise
+            # Another replica registered the job first
+            return self.get_next_run(name)
+
+    def acquire(self, name: str, owner: str, now: datetime, lease_seconds: float) -> Optional[JobLease]:
+        locked_until = now + timedelta(seconds=lease_seconds)
+
+        def operation(session):
+            taken = session.execute(
+                update(ScheduledJobsOrmModel)
+                .where(ScheduledJobsOrmModel.name == name, ScheduledJobsOrmModel.next_run_at <= now,
+                       or_(ScheduledJobsOrmModel.locked_until.is_(None), ScheduledJobsOrmModel.locked_until < now))
+                .values(locked_by=owner, locked_until=locked_until, last_started_at=now)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if taken != 1:
+                return None
+            scheduled_at = session.execute(
+                select(ScheduledJobsOrmModel.next_run_at).where(ScheduledJobsOrmModel.name == name)).scalar_one()
+            return JobLease(name, owner, _aware(scheduled_at), locked_until)
+
+        return self._execute(operation)
+
+    def renew(self, lease: JobLease, now: datetime, lease_seconds: float) -> Optional[JobLease]:
+        locked_until = now + timedelta(seconds=lease_seconds)
+
+        def operation(session):
+            return session.execute(
+                update(ScheduledJobsOrmModel)
+                .where(ScheduledJobsOrmModel.name == lease.name, ScheduledJobsOrmModel.locked_by == lease.owner)
+                .values(locked_until=locked_until)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+        if self._execute(operation) != 1:
+            return None
+        return lease._replace(locked_until=locked_until)
+
+    def release(self, lease: JobLease, next_run_at: datetime, finished_at: datetime, duration_seconds: float,
+                status: str, error: Optional[str] = None):
+        def operation(session):
+            values = dict(next_run_at=next_run_at, locked_by=None, locked_until=None, last_finished_at=finished_at,
+                          last_duration_seconds=duration_seconds, last_status=status,
+                          last_error=error[:500] if error else None)
+            if status != JOB_STATUS_SKIPPED:
+                values['runs'] = ScheduledJobsOrmModel.runs + 1
+            if status == JOB_STATUS_FAILED:
+                values['failures'] = ScheduledJobsOrmModel.failures + 1
+            session.execute(
+                update(ScheduledJobsOrmModel)
+                .where(ScheduledJobsOrmModel.name == lease.name, ScheduledJobsOrmModel.locked_by == lease.owner)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+        self._execute(operation)
+
+    def get_next_run(self, name: str) -> Optional[datetime]:
+        return _aware(self._execute(lambda session: session.execute(
+            select(ScheduledJobsOrmModel.next_run_at).where(ScheduledJobsOrmModel.name == name)).scalar_one_or_none()))
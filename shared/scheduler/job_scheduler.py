@@ -0,0 +1,275 @@
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, UTC
+from typing import Any, Callable, NamedTuple, Optional
+
+from shared.constants import SCHEDULER_SERVICE
+from shared.logger import LoggerService
+from shared.scheduler.job_lease_backends import InMemoryJobLeaseBackend, JobLease, JobLeaseBackend, \
+    JOB_STATUS_FAILED, JOB_STATUS_SKIPPED, JOB_STATUS_SUCCEEDED
+from shared.scheduler.job_schedules import JobSchedule
+from shared.scheduler.scheduler_exceptions import SchedulerException
+from shared.scheduler.scheduler_metrics import SCHEDULED_JOB_LAG_SECONDS, SCHEDULED_JOB_LAST_SUCCESS, \
+    SCHEDULED_JOB_RUNS, SCHEDULED_JOB_SECONDS, SCHEDULED_JOBS_RUNNING
+
+CATCH_UP_ONCE = 'once'
+CATCH_UP_ALL = 'all'
+CATCH_UP_SKIP = 'skip'
+
+
+class ScheduledJob(NamedTuple):
+    """
+    A recurring job.
+
+    Attributes:
+        name (str): Unique name of the job, the key of its lease.
+        schedule (JobSchedule): When the job runs.
+        func (Callable[[datetime], Any]): The work, called with the scheduled date of the run.
+        cpu_bound (bool): Runs the job in the process pool. The function and its arguments must be picklable,
+            e.g. a module-level function or a `functools.partial` of one.
+        distributed (bool): Only one scheduler sharing the lease backend runs each occurrence. Jobs working on
+            the state of their own process must set it to False to run in every process.
+        catch_up (str): What happens with the occurrences missed while no scheduler was running: 'once' runs
+            the job a single time for all of them, 'all' runs it once per missed occurrence and 'skip' drops
+            the runs started more than `misfire_grace_seconds` late.
+        lease_seconds (float): Seconds a run holds the job without renewing its lease.
+        misfire_grace_seconds (float): Lateness tolerated by the 'skip' policy.
+    """
+    name: str
+    schedule: JobSchedule
+    func: Callable[[datetime], Any]
+    cpu_bound: bool = False
+    distributed: bool = True
+    catch_up: str = CATCH_UP_ONCE
+    lease_seconds: float = 300
+    misfire_grace_seconds: float = 60
+
+
+class _RunningJob(NamedTuple):
+    job: ScheduledJob
+    lease: JobLease
+    future: Future
+    started_at: float
+
+
+class JobScheduler:
+    """
+    Runs the recurring jobs of the service, such as the refresh of the projections or the monthly archive,
+    outside the request handlers.
+
+    Every tick the scheduler takes the lease of the due jobs from the backend and submits them to a thread
+    pool, or to a process pool for the CPU-bound ones so they do not hold the GIL of the process. With a
+    shared backend every replica can run a scheduler and each occurrence still runs once. The next run is
+    stored when the run finishes, so the occurrences missed while every scheduler was down are caught up
+    following the policy of each job.
+    """
+
+    def __init__(self, lease_backend: JobLeaseBackend, owner: Optional[str] = None, max_workers: int = 2,
+                 process_workers: int = 0, tick_seconds: float = 1):
+        """
+        Constructor for the JobScheduler class.
+
+        Args:
+            lease_backend (JobLeaseBackend): The backend of the distributed jobs.
+            owner (Optional[str]): The name of the scheduler in the leases. Defaults to the host and process ID.
+            max_workers (int): The threads running the jobs. Defaults to 2.
+            process_workers (int): The processes running the CPU-bound jobs, 0 disables them. Defaults to 0.
+            tick_seconds (float): The seconds between two checks of the due jobs. Defaults to 1.
+        """
+        self.origin = self.__class__.__name__
+        self.user: str = SCHEDULER_SERVICE
+        self.lease_backend = lease_backend
+        self.local_lease_backend = InMemoryJobLeaseBackend()
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+        self.tick_seconds = tick_seconds
+        self.jobs: dict[str, ScheduledJob] = {}
+        self._running: dict[str, _RunningJob] = {}
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._stopped = threading.Event()
+        self._loop: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _backend(self, job: ScheduledJob) -> JobLeaseBackend:
+        return self.lease_backend if job.distributed else self.local_lease_backend
+
+    def add_job(self, job: ScheduledJob, now: Optional[datetime] = None) -> datetime:
+        """
+        Registers a job, keeping the next run stored by a previous scheduler.
+
+        Args:
+            job (ScheduledJob): The job.
+            now (Optional[datetime]): The current date, for the first run of a new job.
+
+        Returns:
+            datetime: The next run of the job.
+
+        Raises:
+            SchedulerException: If the job is invalid or cannot be registered.
+        """
+        if job.name in self.jobs:
+            raise SchedulerException(f"The job {job.name} is already scheduled")
+        if job.catch_up not in (CATCH_UP_ONCE, CATCH_UP_ALL, CATCH_UP_SKIP):
+            raise SchedulerException(f"Unknown catch up policy {job.catch_up} of the job {job.name}")
+        if job.cpu_bound and self.process_workers <= 0:
+            raise SchedulerException(f"The job {job.name} is CPU-bound but the scheduler has no process workers")
+        now = now or datetime.now(UTC)
+        next_run_at = self._backend(job).register(job.name, repr(job.schedule), job.schedule.next_after(now))
+        self.jobs[job.name] = job
+        LoggerService.insert_log(self.origin, f"Scheduled job {job.name} {job.schedule!r}, next run at "
+                                              f"{next_run_at.isoformat()}", self.user)
+        return next_run_at
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scheduled-job')
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # Forking a process with running threads and open connections is unsafe, the workers start clean
+            self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+        return self._process_pool
+
+    def _next_run(self, job: ScheduledJob, scheduled_at: datetime, now: datetime) -> datetime:
+        next_run_at = job.schedule.next_after(scheduled_at)
+        if job.catch_up != CATCH_UP_ALL and next_run_at <= now:
+            # The missed occurrences collapse into the run that just happened
+            next_run_at = job.schedule.next_after(now)
+        return next_run_at
+
+    def run_pending(self, now: Optional[datetime] = None) -> list[str]:
+        """
+        Collects the finished runs and starts the due jobs this scheduler wins.
+
+        Args:
+            now (Optional[datetime]): The current date.
+
+        Returns:
+            list[str]: The jobs started.
+        """
+        now = now or datetime.now(UTC)
+        with self._lock:
+            self._collect(now)
+            started = []
+            for job in self.jobs.values():
+                if job.name in self._running:
+                    continue
+                try:
+                    if self._start(job, now):
+                        started.append(job.name)
+                except SchedulerException as e:
+                    LoggerService.insert_error(self.origin, f"Error starting the job {job.name}: {str(e)}",
+                                               self.user)
+            return started
+
+    def _start(self, job: ScheduledJob, now: datetime) -> bool:
+        backend = self._backend(job)
+        lease = backend.acquire(job.name, self.owner, now, job.lease_seconds)
+        if lease is None:
+            return False
+        lag = max((now - lease.scheduled_at).total_seconds(), 0.0)
+        if job.catch_up == CATCH_UP_SKIP and lag > job.misfire_grace_seconds:
+            SCHEDULED_JOB_RUNS.labels(job=job.name, status=JOB_STATUS_SKIPPED).inc()
+            LoggerService.insert_warning(self.origin, f"Skipped the run of {job.name} scheduled at "
+                                                      f"{lease.scheduled_at.isoformat()}, {lag:.0f}s late", self.user)
+            backend.release(lease, job.schedule.next_after(now), now, 0.0, JOB_STATUS_SKIPPED)
+            return False
+        SCHEDULED_JOB_LAG_SECONDS.labels(job=job.name).observe(lag)
+        pool = self._get_process_pool() if job.cpu_bound else self._get_thread_pool()
+        try:
+            future = pool.submit(job.func, lease.scheduled_at)
+        except RuntimeError as e:
+            # The pool is shut down or cannot start its workers, the run counts as failed
+            backend.release(lease, self._next_run(job, lease.scheduled_at, now), now, 0.0, JOB_STATUS_FAILED,
+                            str(e))
+            SCHEDULED_JOB_RUNS.labels(job=job.name, status=JOB_STATUS_FAILED).inc()
+            raise SchedulerException(f"The job {job.name} could not be submitted: {str(e)}") from e
+        self._running[job.name] = _RunningJob(job, lease, future, time.perf_counter())
+        SCHEDULED_JOBS_RUNNING.inc()
+        return True
+
+    def _collect(self, now: datetime):
+        for name, running in list(self._running.items()):
+            job, lease = running.job, running.lease
+            backend = self._backend(job)
+            if not running.future.done():
+                remaining = (lease.locked_until - now).total_seconds()
+                if remaining < job.lease_seconds / 2:
+                    renewed = backend.renew(lease, now, job.lease_seconds)
+                    if renewed is None:
+                        LoggerService.insert_warning(self.origin, f"The lease of the job {name} expired while it "
+                                                                  f"was running", self.user)
+                    else:
+                        self._running[name] = running._replace(lease=renewed)
+                continue
+
+            del self._running[name]
+            SCHEDULED_JOBS_RUNNING.dec()
+            duration = time.perf_counter() - running.started_at
+            error = running.future.exception()
+            status = JOB_STATUS_FAILED if error is not None else JOB_STATUS_SUCCEEDED
+            SCHEDULED_JOB_RUNS.labels(job=name, status=status).inc()
+            SCHEDULED_JOB_SECONDS.labels(job=name).observe(duration)
+            if error is None:
+                SCHEDULED_JOB_LAST_SUCCESS.labels(job=name).set(now.timestamp())
+            else:
+                LoggerService.insert_error(self.origin, f"The job {name} scheduled at "
+                                                        f"{lease.scheduled_at.isoformat()} failed: {str(error)}",
+                                           self.user)
+            # A failed run is not retried before its next occurrence
+            backend.release(lease, self._next_run(job, lease.scheduled_at, now), now, duration, status,
+                            str(error) if error is not None else None)
+
+    def start(self):
+        """
+        Starts the loop of the scheduler in a background thread, once.
+        """
+        with self._lock:
+            if self._loop is not None and self._loop.is_alive():
+                return
+            self._stopped.clear()
+            self._loop = threading.Thread(target=self._run, name='job-scheduler', daemon=True)
+            self._loop.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the scheduler after the runs in progress, storing their outcome.
+
+        Args:
+            timeout (Optional[float]): The seconds to wait for the loop.
+        """
+        self._stopped.set()
+        if self._loop is not None:
+            self._loop.join(timeout)
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        with self._lock:
+            self._collect(datetime.now(UTC))
+
+    def run_forever(self):
+        """
+        Runs the loop of the scheduler in the calling thread until `stop` is called.
+        """
+        self._stopped.clear()
+        self._run()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.run_pending()
+            except SchedulerException as e:
+                # The backend may be briefly unavailable, the due jobs are still due on the next tick
+                LoggerService.insert_error(self.origin, f"Error running the scheduled jobs: {str(e)}", self.user)
+            except Exception as e:
+                LoggerService.insert_error(self.origin, f"Unexpected error running the scheduled jobs: {str(e)}",
+                                           self.user)
+            self._stopped.wait(self.tick_seconds)
@@ -0,0 +1,156 @@
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, UTC
+
+from shared.scheduler.scheduler_exceptions import InvalidScheduleException
+
+_CRON_MACROS = {
+    '@hourly': '0 * * * *',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@weekly': '0 0 * * 0',
+    '@monthly': '0 0 1 * *',
+    '@yearly': '0 0 1 1 *',
+}
+_EVERY_PATTERN = re.compile(r'^@every\s+(\d+)\s*([smhd])$')
+_EVERY_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+# (first, last) value of the minute, hour, day of month, month and day of week fields
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+# A valid expression always matches within a few years, e.g. the 29th of February
+_CRON_SEARCH_DAYS = 366 * 5
+
+
+class JobSchedule(ABC):
+    """
+    When a recurring job runs. Schedules work in UTC.
+    """
+
+    @abstractmethod
+    def next_after(self, after: datetime) -> datetime:
+        """
+        Returns the first run strictly after a date.
+
+        Args:
+            after (datetime): The reference date, timezone aware.
+
+        Returns:
+            datetime: The date of the next run, in UTC.
+        """
+        pass
+
+
+class IntervalSchedule(JobSchedule):
+    """
+    Runs a job every fixed number of seconds, counted from its previous scheduled run.
+    """
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise InvalidScheduleException("The interval of a schedule must be greater than zero")
+        self.interval = timedelta(seconds=seconds)
+
+    def next_after(self, after: datetime) -> datetime:
+        return after.astimezone(UTC) + self.interval
+
+    def __repr__(self):
+        return f"IntervalSchedule({self.interval.total_seconds():g}s)"
+
+
+class CronSchedule(JobSchedule):
+    """
+    Runs a job on a five-field cron expression: minute, hour, day of month, month and day of week.
+
+    Fields accept `*`, values, ranges `a-b`, lists `a,b` and steps `*/n` or `a-b/n`; Sunday is 0 or 7. As in
+    cron, when both the day of month and the day of week are restricted a day matching either one runs.
+    The macros `@hourly`, `@daily`, `@weekly`, `@monthly` and `@yearly` are also accepted.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = _CRON_MACROS.get(expression.strip(), expression.strip())
+        fields = self.expression.split()
+        if len(fields) != 5:
+            raise InvalidScheduleException(f"The cron expression '{expression}' must have five fields")
+        minutes, hours, days, months, weekdays = (
+            self._parse_field(field, first, last) for field, (first, last) in zip(fields, _CRON_FIELDS))
+        self.minutes = sorted(minutes)
+        self.hours = set(hours)
+        self.days = set(days)
+        self.months = set(months)
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def _parse_field(field: str, first: int, last: int) -> set[int]:
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                if not step_text.isdigit() or int(step_text) == 0:
+                    raise InvalidScheduleException(f"Invalid step in the cron field '{field}'")
+                step = int(step_text)
+            if part == '*':
+                start, end = first, last
+            elif '-' in part:
+                start_text, end_text = part.split('-', 1)
+                if not (start_text.isdigit() and end_text.isdigit()):
+                    raise InvalidScheduleException(f"Invalid range in the cron field '{field}'")
+                start, end = int(start_text), int(end_text)
+            elif part.isdigit():
+                start = end = int(part)
+                if step > 1:
+                    end = last
+            else:
+                raise InvalidScheduleException(f"Invalid cron field '{field}'")
+            if start < first or end > last or start > end:
+                raise InvalidScheduleException(f"The cron field '{field}' must be between {first} and {last}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day_matches = moment.day in self.days
+        # isoweekday is 1 on Monday and 7 on Sunday, cron counts from Sunday as 0
+        weekday_matches = moment.isoweekday() % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return day_matches and weekday_matches
+        return day_matches or weekday_matches
+
+    def next_after(self, after: datetime) -> datetime:
+        moment = after.astimezone(UTC).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=_CRON_SEARCH_DAYS)
+        while moment < limit:
+            if moment.month not in self.months or not self._matches_day(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            minute = next((minute for minute in self.minutes if minute >= moment.minute), None)
+            if minute is None:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            return moment.replace(minute=minute)
+        raise InvalidScheduleException(f"The cron expression '{self.expression}' never matches")
+
+    def __repr__(self):
+        return f"CronSchedule('{self.expression}')"
+
+
+def parse_schedule(expression: str) -> JobSchedule:
+    """
+    Builds a schedule from a cron expression, a cron macro or an interval such as `@every 30s`, `@every 5m`.
+
+    Args:
+        expression (str): The schedule expression.
+
+    Returns:
+        JobSchedule: The schedule.
+
+    Raises:
+        InvalidScheduleException: If the expression is not valid.
+    """
+    match = _EVERY_PATTERN.match(expression.strip())
+    if match:
+        return IntervalSchedule(int(match.group(1)) * _EVERY_UNITS[match.group(2)])
+    return CronSchedule(expression)
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, String, DateTime, Float, Integer
+from shared.models.base_orm_model import Base
+
+
+class ScheduledJobsOrmModel(Base):
+    """
+    SQLAlchemy model for the scheduled_jobs table, the next run and the lease of every recurring job.
+
+    Jobs are shared by every replica, so the table is not tenant-scoped. A replica runs a job after moving its
+    lease forward with a conditional update, which only one of them can win.
+
+    Class Attributes:
+        name (Column): Name of the job.
+        schedule (Column): Schedule the next run was computed with.
+        next_run_at (Column): Date the job is due.
+        locked_by (Column): Replica running the job, if any.
+        locked_until (Column): Date the lease expires, a crashed replica loses the job after it.
+        last_started_at (Column): Date the last run started.
+        last_finished_at (Column): Date the last run finished.
+        last_duration_seconds (Column): Seconds the last run took.
+        last_status (Column): 'succeeded', 'failed' or 'skipped'.
+        last_error (Column): Error of the last failed run.
+        runs (Column): Finished runs.
+        failures (Column): Failed runs.
+    """
+
+    __tablename__ = "scheduled_jobs"
+    name = Column(String(100), primary_key=True)
+    schedule = Column(String(100), nullable=False)
+    next_run_at = Column(DateTime(timezone=True), nullable=False)
+    locked_by = Column(String(255), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    last_started_at = Column(DateTime(timezone=True), nullable=True)
+    last_finished_at = Column(DateTime(timezone=True), nullable=True)
+    last_duration_seconds = Column(Float, nullable=True)
+    last_status = Column(String(20), nullable=True)
+    last_error = Column(String(500), nullable=True)
+    runs = Column(Integer, nullable=False, default=0)
+    failures = Column(Integer, nullable=False, default=0)
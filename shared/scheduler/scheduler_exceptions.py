@@ -0,0 +1,16 @@
+from shared.exceptions import InfrastructureException
+
+
+class SchedulerException(InfrastructureException):
+    """Base exception for the job scheduler."""
+    pass
+
+
+class InvalidScheduleException(SchedulerException):
+    """Raised when a schedule expression cannot be parsed."""
+    pass
+
+
+class JobLeaseBackendException(SchedulerException):
+    """Raised when the leases of the jobs cannot be read or written."""
+    pass
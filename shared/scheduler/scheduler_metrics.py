@@ -0,0 +1,28 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+SCHEDULED_JOB_RUNS = Counter(
+    'textile_pro_scheduled_job_runs_total',
+    'Runs of the scheduled jobs by outcome',
+    ['job', 'status'],
+)
+SCHEDULED_JOB_SECONDS = Histogram(
+    'textile_pro_scheduled_job_seconds',
+    'Seconds the scheduled jobs ran',
+    ['job'],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0),
+)
+SCHEDULED_JOB_LAG_SECONDS = Histogram(
+    'textile_pro_scheduled_job_lag_seconds',
+    'Seconds between the scheduled time of a run and its start',
+    ['job'],
+    buckets=(0.1, 1.0, 5.0, 15.0, 60.0, 300.0, 3600.0, 86400.0),
+)
+SCHEDULED_JOB_LAST_SUCCESS = Gauge(
+    'textile_pro_scheduled_job_last_success_timestamp_seconds',
+    'Unix time of the last successful run of the scheduled jobs',
+    ['job'],
+)
+SCHEDULED_JOBS_RUNNING = Gauge(
+    'textile_pro_scheduled_jobs_running',
+    'Scheduled jobs running in this process',
+)
@@ -0,0 +1,2 @@
+from .orjson_provider import OrjsonProvider, json_dumps
+from .json_streaming import iter_json_array, stream_json_array
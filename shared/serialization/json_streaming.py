@@ -0,0 +1,42 @@
+from typing import Any, Iterable, Iterator, Optional
+
+from flask import Response
+
+from shared.serialization.orjson_provider import json_dumps
+
+
+def iter_json_array(items: Iterable[Any], key: Optional[str] = None, chunk_size: int = 500) -> Iterator[bytes]:
+    """
+    Serializes a list as a stream of JSON chunks, optionally wrapped in an object with a single key.
+
+    Only `chunk_size` items are serialized at a time, so the memory used does not grow with the list when
+    the items come from a generator or a server-side cursor.
+
+    Args:
+        items (Iterable[Any]): The items of the list.
+        key (Optional[str]): The key of the list in the wrapping object, None streams a bare array.
+        chunk_size (int): The items serialized per chunk. Defaults to 500.
+
+    Yields:
+        bytes: The chunks of the JSON document.
+    """
+    yield b'{' + json_dumps(key) + b':[' if key is not None else b'['
+    separator = b''
+    chunk: list[bytes] = []
+    for item in items:
+        chunk.append(json_dumps(item))
+        if len(chunk) >= chunk_size:
+            yield separator + b','.join(chunk)
+            separator = b','
+            chunk = []
+    if chunk:
+        yield separator + b','.join(chunk)
+    yield b']}' if key is not None else b']'
+
+
+def stream_json_array(items: Iterable[Any], key: Optional[str] = None, chunk_size: int = 500,
+                      status: int = 200) -> Response:
+    """
+    Builds a streamed JSON response of a large list, see `iter_json_array`.
+    """
+    return Response(iter_json_array(items, key, chunk_size), status=status, mimetype='application/json')
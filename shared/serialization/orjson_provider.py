@@ -0,0 +1,64 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel
+
+from shared.tracing import trace_span
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serializes the types orjson does not know. Datetimes, dates, UUIDs, enums and dataclasses are handled
+    natively by orjson.
+    """
+    if isinstance(obj, BaseModel):
+        # The JSON dump of the model applies its extra fields, serializers, computed and excluded fields
+        return obj.model_dump(mode='json')
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serializes an object to compact JSON bytes.
+
+    Args:
+        obj (Any): The object to serialize, pydantic models included.
+        sort_keys (bool): Whether to sort the keys of the dictionaries. Defaults to False.
+
+    Returns:
+        bytes: The UTF-8 JSON document.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider built on orjson.
+
+    `jsonify` and `request.get_json` go through it. Pydantic models, datetimes, UUIDs and enums (UserRole,
+    UserStatus...) can be returned directly. The models are written like their `model_dump(mode='json')`, the
+    other datetimes in ISO 8601.
+    """
+    sort_keys = False
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return json_dumps(obj, kwargs.pop("sort_keys", self.sort_keys)).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        with trace_span('serialize json'):
+            body = json_dumps(obj, self.sort_keys)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,4 @@
+from .tabular_exceptions import TabularFileException
+from .tabular_readers import iter_row_chunks, iter_csv_chunks, iter_xlsx_chunks, estimate_row_count
+from .tabular_writers import TabularColumn, TABULAR_MEDIA_TYPES, check_export_format, iter_tabular_bytes, \
+    iter_csv_bytes, iter_xlsx_bytes, iter_parquet_bytes
@@ -0,0 +1,6 @@
+from shared.exceptions import InfrastructureException
+
+
+class TabularFileException(InfrastructureException):
+    """Raised when a CSV or Excel file cannot be read."""
+    pass
@@ -0,0 +1,177 @@
+import csv
+from datetime import datetime, time
+from typing import Iterator, Optional
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - Excel support is optional
+    openpyxl = None
+
+from shared.tabular.tabular_exceptions import TabularFileException
+
+CSV_FORMAT = 'csv'
+XLSX_FORMAT = 'xlsx'
+_SNIFF_BYTES = 64 * 1024
+_COUNT_BUFFER_BYTES = 1024 * 1024
+
+
+def _sniff_delimiter(sample: str) -> str:
+    """
+    Spreadsheets exported with a Spanish locale separate the cells with ';', so the delimiter is sniffed
+    instead of assuming ','.
+    """
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ','
+
+
+def _clean_row(header: list[str], values) -> dict:
+    """
+    Maps the cells of a row to the header, dropping the empty ones so the defaults of the schema apply.
+    """
+    row = {}
+    for name, value in zip(header, values):
+        if value is None or not name:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        elif isinstance(value, datetime) and value.time() == time.min:
+            value = value.date()
+        row[name] = value
+    return row
+
+
+def iter_csv_chunks(path: str, chunk_size: int, encoding: str = 'utf-8-sig') -> Iterator[list[dict]]:
+    """
+    Reads a CSV file in chunks of rows, keeping only one chunk in memory.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int): The rows per chunk.
+        encoding (str): The encoding of the file. Defaults to UTF-8, with or without BOM.
+
+    Yields:
+        list[dict]: The rows of the chunk, as header to cell dicts without the empty cells.
+
+    Raises:
+        TabularFileException: If the file is not a valid CSV file.
+    """
+    try:
+        with open(path, 'r', encoding=encoding, newline='') as file:
+            delimiter = _sniff_delimiter(file.read(_SNIFF_BYTES))
+            file.seek(0)
+            reader = csv.reader(file, delimiter=delimiter)
+            header = [name.strip() for name in next(reader, [])]
+            chunk = []
+            for values in reader:
+                chunk.append(_clean_row(header, values))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise TabularFileException(f"The file is not a valid {encoding} CSV file: {str(e)}") from e
+
+
+def iter_xlsx_chunks(path: str, chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Reads the first sheet of an Excel file in chunks of rows.
+
+    The workbook is opened in read-only mode, which streams the sheet XML instead of loading every cell.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int): The rows per chunk.
+
+    Yields:
+        list[dict]: The rows of the chunk, as header to cell dicts without the empty cells.
+
+    Raises:
+        TabularFileException: If openpyxl is not installed or the file is not a valid Excel file.
+    """
+    if openpyxl is None:
+        raise TabularFileException("The openpyxl package is required to import Excel files")
+    try:
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    except Exception as e:
+        raise TabularFileException(f"The file is not a valid Excel file: {str(e)}") from e
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(name).strip() if name is not None else '' for name in next(rows, ())]
+        chunk = []
+        for values in rows:
+            row = _clean_row(header, values)
+            if not row:
+                # Read-only sheets report formatted but empty rows, they are not data
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def iter_row_chunks(path: str, file_format: str, chunk_size: int) -> Iterator[list[dict]]:
+    """
+    Reads a CSV or Excel file in chunks of rows.
+
+    Args:
+        path (str): The path of the file.
+        file_format (str): 'csv' or 'xlsx'.
+        chunk_size (int): The rows per chunk.
+
+    Yields:
+        list[dict]: The rows of the chunk.
+
+    Raises:
+        TabularFileException: If the format is not supported or the file cannot be read.
+    """
+    if file_format == CSV_FORMAT:
+        return iter_csv_chunks(path, chunk_size)
+    if file_format == XLSX_FORMAT:
+        return iter_xlsx_chunks(path, chunk_size)
+    raise TabularFileException(f"Unsupported file format {file_format}")
+
+
+def estimate_row_count(path: str, file_format: str) -> Optional[int]:
+    """
+    Estimates the data rows of a file to report the progress of an import.
+
+    CSV files are counted by their line breaks, so quoted cells with line breaks make the estimate higher;
+    Excel files report the dimension stored in the sheet, which some writers leave out.
+
+    Args:
+        path (str): The path of the file.
+        file_format (str): 'csv' or 'xlsx'.
+
+    Returns:
+        Optional[int]: The estimated rows without the header, None when unknown.
+    """
+    if file_format == CSV_FORMAT:
+        lines = 0
+        last = b''
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(_COUNT_BUFFER_BYTES), b''):
+                lines += block.count(b'\n')
+                last = block
+        if last and not last.endswith(b'\n'):
+            lines += 1
+        return max(lines - 1, 0)
+    if file_format == XLSX_FORMAT and openpyxl is not None:
+        try:
+            workbook = openpyxl.load_workbook(path, read_only=True)
+        except Exception:
+            return None
+        try:
+            max_row = workbook.worksheets[0].max_row
+            return max(max_row - 1, 0) if max_row else None
+        finally:
+            workbook.close()
+    return None
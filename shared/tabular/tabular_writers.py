@@ -0,0 +1,225 @@
+import csv
+import io
+import tempfile
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, NamedTuple, Sequence
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - Excel support is optional
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - Parquet support is optional
+    pyarrow = None
+
+from shared.tabular.tabular_exceptions import TabularFileException
+from shared.tabular.tabular_readers import CSV_FORMAT, XLSX_FORMAT
+
+PARQUET_FORMAT = 'parquet'
+
+TABULAR_MEDIA_TYPES = {
+    CSV_FORMAT: 'text/csv; charset=utf-8',
+    XLSX_FORMAT: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    PARQUET_FORMAT: 'application/vnd.apache.parquet',
+}
+
+_FILE_CHUNK_BYTES = 64 * 1024
+
+
+class TabularColumn(NamedTuple):
+    """
+    A column of an exported file. The type is only used by the formats with a schema, such as Parquet, and
+    is one of 'str', 'int', 'float', 'date' or 'datetime'.
+    """
+    name: str
+    type: str = 'str'
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only file that keeps what was written until it is drained, so a writer that expects a file can
+    hand its output to a generator piece by piece.
+    """
+    def __init__(self):
+        super().__init__()
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts = []
+        return data
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_csv_bytes(columns: Sequence[TabularColumn], rows: Iterable[Sequence[Any]], chunk_size: int = 1000,
+                   delimiter: str = ',') -> Iterator[bytes]:
+    """
+    Writes rows as a UTF-8 CSV file, yielding it every `chunk_size` rows.
+
+    The file starts with a BOM so spreadsheets open the accents right.
+
+    Args:
+        columns (Sequence[TabularColumn]): The columns of the file.
+        rows (Iterable[Sequence[Any]]): The values of every row, in the order of the columns.
+        chunk_size (int): The rows written per yielded chunk. Defaults to 1000.
+        delimiter (str): The cell separator. Defaults to ','.
+
+    Yields:
+        bytes: The chunks of the file.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter)
+    buffer.write('\ufeff')
+    writer.writerow([column.name for column in columns])
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode('utf-8')
+
+
+def iter_xlsx_bytes(columns: Sequence[TabularColumn], rows: Iterable[Sequence[Any]], sheet_title: str = 'Report'
+                    ) -> Iterator[bytes]:
+    """
+    Writes rows as an Excel file with a write-only workbook, then yields the file in chunks.
+
+    Write-only workbooks flush every appended row to a temporary file instead of keeping the cells, and the
+    zipped workbook is built in a temporary file too, so the memory does not grow with the rows. The
+    format needs the whole sheet before the archive can be closed, so nothing is yielded until the last row
+    is written.
+
+    Args:
+        columns (Sequence[TabularColumn]): The columns of the file.
+        rows (Iterable[Sequence[Any]]): The values of every row, in the order of the columns.
+        sheet_title (str): The title of the sheet. Defaults to 'Report'.
+
+    Yields:
+        bytes: The chunks of the file.
+
+    Raises:
+        TabularFileException: If openpyxl is not installed.
+    """
+    if openpyxl is None:
+        raise TabularFileException("The openpyxl package is required to export Excel files")
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    sheet.append([column.name for column in columns])
+    for row in rows:
+        # Excel does not store time zones
+        sheet.append([value.replace(tzinfo=None) if isinstance(value, datetime) else value for value in row])
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while chunk := file.read(_FILE_CHUNK_BYTES):
+            yield chunk
+
+
+def _parquet_schema(columns: Sequence[TabularColumn]):
+    types = {
+        'str': pyarrow.string(),
+        'int': pyarrow.int64(),
+        'float': pyarrow.float64(),
+        'date': pyarrow.date32(),
+        'datetime': pyarrow.timestamp('us', tz='UTC'),
+    }
+    return pyarrow.schema([(column.name, types[column.type]) for column in columns])
+
+
+def iter_parquet_bytes(columns: Sequence[TabularColumn], rows: Iterable[Sequence[Any]], chunk_size: int = 10000,
+                       compression: str = 'zstd') -> Iterator[bytes]:
+    """
+    Writes rows as a Parquet file with one row group every `chunk_size` rows, yielding every row group as
+    soon as it is written.
+
+    Args:
+        columns (Sequence[TabularColumn]): The columns of the file, their type sets the schema.
+        rows (Iterable[Sequence[Any]]): The values of every row, in the order of the columns.
+        chunk_size (int): The rows of every row group. Defaults to 10000.
+        compression (str): The compression codec of the columns. Defaults to 'zstd'.
+
+    Yields:
+        bytes: The chunks of the file.
+
+    Raises:
+        TabularFileException: If pyarrow is not installed.
+    """
+    if pyarrow is None:
+        raise TabularFileException("The pyarrow package is required to export Parquet files")
+    schema = _parquet_schema(columns)
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression=compression)
+    try:
+        batch: list[Sequence[Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                writer.write_batch(pyarrow.RecordBatch.from_arrays(
+                    [pyarrow.array(values, type=field.type) for values, field in zip(zip(*batch), schema)],
+                    schema=schema))
+                batch = []
+                yield sink.drain()
+        if batch:
+            writer.write_batch(pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(values, type=field.type) for values, field in zip(zip(*batch), schema)],
+                schema=schema))
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def check_export_format(file_format: str):
+    """
+    Checks that a format can be exported, before a response starts streaming it.
+
+    Raises:
+        TabularFileException: If the format is unknown or its optional package is not installed.
+    """
+    if file_format not in TABULAR_MEDIA_TYPES:
+        raise TabularFileException(f"Unsupported file format {file_format}")
+    if file_format == XLSX_FORMAT and openpyxl is None:
+        raise TabularFileException("The openpyxl package is required to export Excel files")
+    if file_format == PARQUET_FORMAT and pyarrow is None:
+        raise TabularFileException("The pyarrow package is required to export Parquet files")
+
+
+def iter_tabular_bytes(file_format: str, columns: Sequence[TabularColumn], rows: Iterable[Sequence[Any]]
+                       ) -> Iterator[bytes]:
+    """
+    Writes rows as a CSV, Excel or Parquet file, see `iter_csv_bytes`, `iter_xlsx_bytes` and
+    `iter_parquet_bytes`.
+
+    Raises:
+        TabularFileException: If the format is not supported.
+    """
+    check_export_format(file_format)
+    if file_format == CSV_FORMAT:
+        return iter_csv_bytes(columns, rows)
+    if file_format == XLSX_FORMAT:
+        return iter_xlsx_bytes(columns, rows)
+    return iter_parquet_bytes(columns, rows)
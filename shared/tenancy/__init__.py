@@ -0,0 +1,6 @@
+from .tenant_context import get_current_tenant_id, set_current_tenant_id, reset_current_tenant_id, tenant_scope, \
+    all_tenants_scope, is_all_tenants_scope
+from .tenant_exceptions import TenantException, TenantContextMissingException, TenantMismatchException, \
+    TenantNotAllowedException
+from .tenant_session_events import register_tenant_session_events, INCLUDE_ALL_TENANTS
+from .request_tenant import resolve_request_tenant, TENANT_CLAIM
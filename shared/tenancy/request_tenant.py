@@ -0,0 +1,31 @@
+from typing import Optional
+
+from shared.tenancy.tenant_exceptions import TenantNotAllowedException
+
+# Claim of the access tokens with the tenant the user belongs to
+TENANT_CLAIM = 'tenant_id'
+
+
+def resolve_request_tenant(token_payload: Optional[dict], requested_tenant_id: Optional[str]) -> Optional[str]:
+    """
+    Returns the tenant a request acts for: the one of its verified token. The `X-Tenant-ID` header sent by
+    the frontend can only name that same tenant, and a request without a valid token has no tenant at all,
+    whatever header it sends.
+
+    Args:
+        token_payload (Optional[dict]): The payload of the verified access token, None when it is missing or
+            invalid.
+        requested_tenant_id (Optional[str]): The tenant sent in the X-Tenant-ID header.
+
+    Returns:
+        Optional[str]: The ID of the tenant, or None for unauthenticated requests and tokens without tenant.
+
+    Raises:
+        TenantNotAllowedException: If the header names a tenant different from the one of the token.
+    """
+    if not token_payload:
+        return None
+    tenant_id = token_payload.get(TENANT_CLAIM) or None
+    if requested_tenant_id and requested_tenant_id != tenant_id:
+        raise TenantNotAllowedException("The token does not grant access to the requested tenant")
+    return tenant_id
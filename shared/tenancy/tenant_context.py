@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_current_tenant_id: ContextVar[Optional[str]] = ContextVar("current_tenant_id", default=None)
+_all_tenants: ContextVar[bool] = ContextVar("all_tenants", default=False)
+
+
+def get_current_tenant_id() -> Optional[str]:
+    """
+    Returns the ID of the tenant of the current request or unit of work, or None if there is none.
+    """
+    return _current_tenant_id.get()
+
+
+def is_all_tenants_scope() -> bool:
+    """
+    Returns True when the current unit of work was explicitly allowed to read every tenant.
+    """
+    return _all_tenants.get()
+
+
+def set_current_tenant_id(tenant_id: Optional[str]):
+    """
+    Sets the tenant of the current context.
+
+    Args:
+        tenant_id (Optional[str]): The ID of the tenant.
+
+    Returns:
+        Token: The token to restore the previous tenant with reset_current_tenant_id.
+    """
+    return _current_tenant_id.set(tenant_id)
+
+
+def reset_current_tenant_id(token):
+    """
+    Restores the tenant that was in context before set_current_tenant_id.
+
+    Args:
+        token (Token): The token returned by set_current_tenant_id.
+    """
+    _current_tenant_id.reset(token)
+
+
+@contextmanager
+def tenant_scope(tenant_id: str):
+    """
+    Context manager that runs the block on behalf of a tenant.
+
+    Args:
+        tenant_id (str): The ID of the tenant.
+    """
+    token = _current_tenant_id.set(tenant_id)
+    try:
+        yield tenant_id
+    finally:
+        _current_tenant_id.reset(token)
+
+
+@contextmanager
+def all_tenants_scope():
+    """
+    Context manager for system jobs (archival, rollups) that need to read the rows of every tenant.
+    """
+    token = _all_tenants.set(True)
+    try:
+        yield
+    finally:
+        _all_tenants.reset(token)
@@ -0,0 +1,21 @@
+from shared.exceptions import InfrastructureException
+
+
+class TenantException(InfrastructureException):
+    """Base exception for the tenancy of the data layer."""
+    pass
+
+
+class TenantContextMissingException(TenantException):
+    """Raised when a tenant-scoped statement runs without a tenant in context."""
+    pass
+
+
+class TenantMismatchException(TenantException):
+    """Raised when a session tries to write rows of a tenant different from the one in context."""
+    pass
+
+
+class TenantNotAllowedException(TenantException):
+    """Raised when a request asks for a tenant different from the one of its verified token."""
+    pass
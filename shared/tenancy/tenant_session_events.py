@@ -0,0 +1,101 @@
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker, with_loader_criteria
+
+from shared.models import TextileProBaseOrmModel
+from shared.tenancy.tenant_context import get_current_tenant_id, is_all_tenants_scope
+from shared.tenancy.tenant_exceptions import TenantContextMissingException, TenantMismatchException
+
+INCLUDE_ALL_TENANTS = "include_all_tenants"
+_TOUCHED_NAMESPACES = "tenant_touched_namespaces"
+
+
+def _is_tenant_scoped(orm_execute_state: ORMExecuteState) -> bool:
+    return any(issubclass(mapper.class_, TextileProBaseOrmModel) for mapper in orm_execute_state.all_mappers)
+
+
+def _scope_statement(orm_execute_state: ORMExecuteState):
+    """
+    Adds the tenant criteria to every ORM SELECT, UPDATE and DELETE of a tenant-owned model, including the
+    lazy and eager loads of their relationships. The bulk INSERTs, which skip the flush, are only recorded as
+    writes of their table.
+    """
+    if orm_execute_state.is_insert:
+        tenant_id = get_current_tenant_id()
+        if tenant_id is not None and _is_tenant_scoped(orm_execute_state):
+            _touch(orm_execute_state.session, tenant_id,
+                   {mapper.local_table.name for mapper in orm_execute_state.all_mappers})
+        return
+    if not (orm_execute_state.is_select or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.is_column_load or orm_execute_state.is_relationship_load:
+        return
+    if orm_execute_state.execution_options.get(INCLUDE_ALL_TENANTS) or is_all_tenants_scope():
+        return
+    if not _is_tenant_scoped(orm_execute_state):
+        return
+
+    tenant_id = get_current_tenant_id()
+    if tenant_id is None:
+        raise TenantContextMissingException("Tenant-scoped statement executed without a tenant in context")
+
+    orm_execute_state.statement = orm_execute_state.statement.options(
+        with_loader_criteria(TextileProBaseOrmModel, lambda cls: cls.tenant_id == tenant_id, include_aliases=True)
+    )
+    if not orm_execute_state.is_select:
+        _touch(orm_execute_state.session, tenant_id,
+               {mapper.local_table.name for mapper in orm_execute_state.all_mappers})
+
+
+def _stamp_tenant(session: Session, flush_context, instances):
+    """
+    Stamps the tenant in context on the new rows and rejects writes of rows that belong to another tenant.
+    """
+    tenant_id = get_current_tenant_id()
+    all_tenants = is_all_tenants_scope()
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        if not isinstance(instance, TextileProBaseOrmModel):
+            continue
+        if instance.tenant_id is None:
+            if tenant_id is None:
+                raise TenantContextMissingException(
+                    f"Cannot write {instance.__tablename__} rows without a tenant in context")
+            instance.tenant_id = tenant_id
+        elif tenant_id is not None and instance.tenant_id != tenant_id and not all_tenants:
+            raise TenantMismatchException(
+                f"Cannot write {instance.__tablename__} rows of tenant {instance.tenant_id} from tenant {tenant_id}")
+        _touch(session, instance.tenant_id, {instance.__tablename__})
+
+
+def _touch(session: Session, tenant_id: str, namespaces: set[str]):
+    session.info.setdefault(_TOUCHED_NAMESPACES, set()).update((tenant_id, namespace) for namespace in namespaces)
+
+
+def register_tenant_session_events(session_factory: sessionmaker, tenant_cache=None):
+    """
+    Makes the sessions of a session factory tenant-aware.
+
+    Queries only see the rows of the tenant in context, new rows are stamped with it, and when a tenant cache
+    is given, the namespaces of the tables written by a transaction are invalidated in the partition of
+    their tenant once it commits.
+
+    Args:
+        session_factory (sessionmaker): The session factory to instrument.
+        tenant_cache (Optional[TenantPartitionedCache]): The cache to invalidate on commit.
+    """
+    event.listen(session_factory, "do_orm_execute", _scope_statement)
+    event.listen(session_factory, "before_flush", _stamp_tenant)
+
+    def _invalidate_touched(session: Session):
+        touched: Optional[set] = session.info.pop(_TOUCHED_NAMESPACES, None)
+        if tenant_cache is None or not touched:
+            return
+        for tenant_id, namespace in touched:
+            tenant_cache.invalidate_namespace(namespace, tenant_id=tenant_id)
+
+    def _discard_touched(session: Session, *args):
+        session.info.pop(_TOUCHED_NAMESPACES, None)
+
+    event.listen(session_factory, "after_commit", _invalidate_touched)
+    event.listen(session_factory, "after_rollback", _discard_touched)
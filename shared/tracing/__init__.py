@@ -0,0 +1,6 @@
+from .trace_context import get_current_span, get_current_trace_id, get_trace_id
+from .span_exporters import SpanExporter, ConsoleSpanExporter, OtlpJsonFileSpanExporter, OtlpHttpSpanExporter, \
+    to_otlp_json
+from .tracer import Span, Tracer, get_tracer, set_tracer, trace_span, traced, SPAN_KIND_INTERNAL, SPAN_KIND_SERVER, \
+    SPAN_KIND_CLIENT
+from .sql_tracing import register_sql_tracing_events
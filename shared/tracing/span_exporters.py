@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import urllib.request
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Sequence, TextIO
+
+# Numeric values of the OTLP enums
+_OTLP_SPAN_KINDS = {'internal': 1, 'server': 2, 'client': 3}
+_OTLP_STATUS_CODES = {'unset': 0, 'ok': 1, 'error': 2}
+
+
+def _otlp_trace_id(trace_id: str) -> str:
+    """
+    Returns the 32 hexadecimal characters of a trace ID, the UUIDs of the logs keep their digits.
+    """
+    try:
+        return uuid.UUID(trace_id).hex
+    except ValueError:
+        return hashlib.blake2b(trace_id.encode(), digest_size=16).hexdigest()
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp_json(spans: Sequence[Any], service_name: str) -> dict:
+    """
+    Builds the OTLP/JSON export request of some finished spans, the format of the OpenTelemetry collectors.
+
+    Args:
+        spans (Sequence[Span]): The spans.
+        service_name (str): The name of the service.
+
+    Returns:
+        dict: The ExportTraceServiceRequest.
+    """
+    otlp_spans = []
+    for span in spans:
+        otlp_span = {
+            "traceId": _otlp_trace_id(span.trace_id),
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _OTLP_SPAN_KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+            "status": {"code": _OTLP_STATUS_CODES.get(span.status, 0)},
+        }
+        if span.parent_span_id:
+            otlp_span["parentSpanId"] = span.parent_span_id
+        if span.status_message:
+            otlp_span["status"]["message"] = span.status_message
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": "textile_pro.tracing"}, "spans": otlp_spans}],
+        }]
+    }
+
+
+class SpanExporter(ABC):
+    """
+    Destination of the finished spans, called from the exporter thread of the tracer.
+    """
+
+    @abstractmethod
+    def export(self, spans: Sequence[Any], service_name: str):
+        """
+        Writes a batch of finished spans.
+
+        Args:
+            spans (Sequence[Span]): The spans.
+            service_name (str): The name of the service.
+        """
+        pass
+
+    def shutdown(self):
+        pass
+
+
+class ConsoleSpanExporter(SpanExporter):
+    """
+    Prints a line per span, for development.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def export(self, spans: Sequence[Any], service_name: str):
+        stream = self.stream or sys.stdout
+        for span in spans:
+            attributes = ' '.join(f"{key}={value}" for key, value in span.attributes.items())
+            stream.write(f"[trace {span.trace_id}] {span.name} {span.duration_ms:.2f}ms status={span.status} "
+                         f"span={span.span_id} parent={span.parent_span_id or '-'} {attributes}\n")
+        stream.flush()
+
+
+class OtlpJsonFileSpanExporter(SpanExporter):
+    """
+    Appends an OTLP/JSON export request per batch to a file, a line each. It is the format of the file
+    exporter of the OpenTelemetry collector, whose `otlpjsonfile` receiver can forward it to any backend.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any], service_name: str):
+        line = json.dumps(to_otlp_json(spans, service_name), separators=(',', ':'))
+        with self._lock, open(self.path, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """
+    Sends the spans to an OpenTelemetry collector or backend through OTLP/HTTP with the JSON encoding.
+    """
+
+    def __init__(self, endpoint: str = 'http://localhost:4318/v1/traces', headers: Optional[dict[str, str]] = None,
+                 timeout_seconds: float = 5):
+        """
+        Constructor for the OtlpHttpSpanExporter class.
+
+        Args:
+            endpoint (str): The URL of the traces endpoint.
+            headers (Optional[dict[str, str]]): Extra headers, e.g. the API key of the backend.
+            timeout_seconds (float): The seconds to wait for the endpoint. Defaults to 5.
+        """
+        self.endpoint = endpoint
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.timeout_seconds = timeout_seconds
+
+    def export(self, spans: Sequence[Any], service_name: str):
+        body = json.dumps(to_otlp_json(spans, service_name), separators=(',', ':')).encode()
+        request = urllib.request.Request(self.endpoint, data=body, headers=self.headers, method='POST')
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            response.read()
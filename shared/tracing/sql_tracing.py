@@ -0,0 +1,86 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from shared.tracing.trace_context import get_current_span
+from shared.tracing.tracer import SPAN_KIND_CLIENT, get_tracer
+
+
+def _record(name: str, total_key: str, elapsed_seconds: float, attributes: dict = None, error: Exception = None):
+    """
+    Adds a database operation to the totals of the current span and of its trace, and records it as a span
+    of its own when the trace is sampled.
+    """
+    span = get_current_span()
+    if span is None:
+        return
+    elapsed_ms = elapsed_seconds * 1000
+    root = span.root
+    root.add(f"{total_key}.count", 1)
+    root.add(f"{total_key}.duration_ms", elapsed_ms)
+    if span is not root:
+        span.add(f"{total_key}.count", 1)
+        span.add(f"{total_key}.duration_ms", elapsed_ms)
+    if span.sampled and attributes is not None:
+        end_time_ns = time.time_ns()
+        get_tracer().record_span(name, end_time_ns - int(elapsed_seconds * 1e9), end_time_ns, attributes,
+                                 SPAN_KIND_CLIENT, error)
+
+
+def register_sql_tracing_events(engine: Engine, session_factory: sessionmaker):
+    """
+    Times the SQL statements and the connection checkouts of an engine in the trace in progress.
+
+    Every span gets the count and milliseconds of the statements run inside it (`db.statements.*`) and the
+    root span of the trace the totals of the request, including the time waiting for a pooled connection
+    (`db.checkouts.*`). With a sampled trace each statement is also a span with its SQL text.
+
+    Args:
+        engine (Engine): The engine whose statements are timed.
+        session_factory (sessionmaker): The sessions whose connection checkouts are timed.
+    """
+    system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_statement(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('trace_statement_starts', []).append(time.perf_counter())
+
+    def finish_statement(conn, statement: str, executemany: bool, error: Exception = None):
+        starts = conn.info.get('trace_statement_starts')
+        if not starts:
+            return
+        elapsed_seconds = time.perf_counter() - starts.pop()
+        tracer = get_tracer()
+        attributes = None
+        if tracer.sql_statement_spans:
+            attributes = {'db.system': system, 'db.statement': statement[:tracer.max_statement_length]}
+            if executemany:
+                attributes['db.executemany'] = True
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else 'SQL'
+        _record(f"db {operation}", 'db.statements', elapsed_seconds, attributes, error)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def end_statement(conn, cursor, statement, parameters, context, executemany):
+        finish_statement(conn, statement, executemany)
+
+    @event.listens_for(engine, "handle_error")
+    def fail_statement(exception_context):
+        if exception_context.connection is not None and exception_context.statement is not None:
+            finish_statement(exception_context.connection, exception_context.statement,
+                             bool(exception_context.execution_context is not None
+                                  and exception_context.execution_context.executemany),
+                             exception_context.original_exception)
+
+    @event.listens_for(session_factory, "after_transaction_create")
+    def start_checkout(session, transaction):
+        # The connection of a session is checked out right after its outermost transaction begins
+        if transaction.parent is None:
+            session.info['trace_checkout_start'] = time.perf_counter()
+
+    @event.listens_for(session_factory, "after_begin")
+    def end_checkout(session, transaction, connection):
+        started = session.info.pop('trace_checkout_start', None)
+        if started is not None:
+            _record("db checkout", 'db.checkouts', time.perf_counter() - started, {'db.system': system})
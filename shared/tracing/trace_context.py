@@ -0,0 +1,38 @@
+import uuid
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+# The span in progress in the current thread or task, its trace ID is the one every layer logs
+_current_span: ContextVar[Optional[Any]] = ContextVar('current_span', default=None)
+
+
+def get_current_span() -> Optional[Any]:
+    """
+    Returns the span in progress, None outside a trace.
+    """
+    return _current_span.get()
+
+
+def set_current_span(span: Any) -> Token:
+    return _current_span.set(span)
+
+
+def reset_current_span(token: Token):
+    _current_span.reset(token)
+
+
+def get_current_trace_id() -> Optional[str]:
+    """
+    Returns the trace ID of the trace in progress, None outside a trace.
+    """
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+def get_trace_id() -> str:
+    """
+    Returns the trace ID of the trace in progress, or a new one outside a trace, for the layers called
+    without a trace ID.
+    """
+    span = _current_span.get()
+    return span.trace_id if span is not None else str(uuid.uuid4())
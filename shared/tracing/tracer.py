@@ -0,0 +1,328 @@
+import atexit
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from shared.tracing.span_exporters import SpanExporter
+from shared.tracing.trace_context import get_current_span, reset_current_span, set_current_span
+from shared.tracing.tracing_metrics import TRACING_EXPORT_ERRORS, TRACING_SPANS_DROPPED, TRACING_SPANS_EXPORTED
+
+SPAN_KIND_INTERNAL = 'internal'
+SPAN_KIND_SERVER = 'server'
+SPAN_KIND_CLIENT = 'client'
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class Span:
+    """
+    A timed operation of a trace. The root span of a trace also accumulates the totals of the whole trace,
+    such as the SQL statements run, and collects the finished spans to export them together.
+    """
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id", "kind", "start_time_ns", "end_time_ns",
+                 "attributes", "status", "status_message", "sampled", "root", "_finished")
+
+    def __init__(self, name: str, trace_id: str, parent: Optional["Span"] = None, kind: str = SPAN_KIND_INTERNAL,
+                 attributes: Optional[dict[str, Any]] = None, sampled: bool = True,
+                 parent_span_id: Optional[str] = None, start_time_ns: Optional[int] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = _new_span_id()
+        self.parent_span_id = parent.span_id if parent is not None else parent_span_id
+        self.kind = kind
+        self.start_time_ns = start_time_ns if start_time_ns is not None else time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.attributes: dict[str, Any] = dict(attributes) if attributes else {}
+        self.status = 'unset'
+        self.status_message: Optional[str] = None
+        self.sampled = sampled
+        self.root: Span = parent.root if parent is not None else self
+        self._finished: list[Span] = []
+
+    @property
+    def recording(self) -> bool:
+        return self.sampled
+
+    @property
+    def duration_ms(self) -> float:
+        end_time_ns = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return (end_time_ns - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: float):
+        """
+        Adds an amount to a numeric attribute, e.g. the statements or the milliseconds spent in the database.
+        """
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def record_exception(self, error: BaseException):
+        self.status = 'error'
+        self.status_message = str(error)
+        self.attributes['exception.type'] = type(error).__name__
+
+
+class _NonRecordingSpan:
+    """
+    Stands for the spans of a trace that is not sampled: it keeps the trace ID and ignores the rest.
+    """
+    __slots__ = ("parent",)
+    recording = False
+
+    def __init__(self, parent: Span):
+        self.parent = parent
+
+    @property
+    def trace_id(self) -> str:
+        return self.parent.trace_id
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def add(self, key: str, amount: float):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+
+class _SpanScope:
+    """
+    Context manager that makes a span current while the block runs and ends it afterward.
+    """
+    __slots__ = ("tracer", "span", "_token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self.tracer = tracer
+        self.span = span
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = set_current_span(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_value is not None:
+            self.span.record_exception(exc_value)
+        reset_current_span(self._token)
+        self.tracer.end_span(self.span)
+        return False
+
+
+class _NonRecordingScope:
+    """
+    Context manager of a span that is not recorded, the current span stays the same.
+    """
+    __slots__ = ("span",)
+
+    def __init__(self, parent: Span):
+        self.span = _NonRecordingSpan(parent)
+
+    def __enter__(self) -> _NonRecordingSpan:
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
+class Tracer:
+    """
+    Times the layers a request goes through (dispatch, validation, session checkout, SQL, serialization)
+    as spans of a single trace propagated through context variables, so the trace ID reaches every layer
+    and every log without being passed around.
+
+    A trace always has a root span, which carries the trace ID even when nothing is exported. Only the
+    sampled traces record their inner spans, which the exporter receives in batches from a background
+    thread once the root span ends; when the queue is full the spans are dropped instead of slowing the
+    requests down.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None, sample_ratio: float = 1.0,
+                 service_name: str = 'textile-pro', sql_statement_spans: bool = True,
+                 max_statement_length: int = 1000, max_queue_size: int = 10000, export_batch_size: int = 512,
+                 export_interval_seconds: float = 2.0):
+        """
+        Constructor for the Tracer class.
+
+        Args:
+            exporter (Optional[SpanExporter]): Receives the sampled spans, None only propagates the trace IDs.
+            sample_ratio (float): The share of the traces recorded, from 0 to 1. Defaults to 1.
+            service_name (str): The name of the service in the exported spans. Defaults to 'textile-pro'.
+            sql_statement_spans (bool): Records a span per SQL statement, otherwise only the totals of the
+                spans. Defaults to True.
+            max_statement_length (int): The characters of the SQL statements kept in the spans. Defaults to 1000.
+            max_queue_size (int): The finished spans waiting for the exporter. Defaults to 10000.
+            export_batch_size (int): The spans exported at once. Defaults to 512.
+            export_interval_seconds (float): The maximum seconds a finished span waits for the exporter.
+                Defaults to 2.
+        """
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.service_name = service_name
+        self.sql_statement_spans = sql_statement_spans
+        self.max_statement_length = max_statement_length
+        self.max_queue_size = max_queue_size
+        self.export_batch_size = export_batch_size
+        self.export_interval_seconds = export_interval_seconds
+        self.enabled = exporter is not None and sample_ratio > 0
+        self._queue: deque[Span] = deque()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._export_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def start_span(self, name: str, attributes: Optional[dict[str, Any]] = None, kind: str = SPAN_KIND_INTERNAL,
+                   trace_id: Optional[str] = None, parent_span_id: Optional[str] = None):
+        """
+        Returns a context manager running the block in a new span, a child of the current one or the root
+        of a new trace.
+
+        Args:
+            name (str): The name of the operation.
+            attributes (Optional[dict[str, Any]]): The attributes of the span.
+            kind (str): 'internal', 'server' or 'client'. Defaults to 'internal'.
+            trace_id (Optional[str]): The trace ID of a new trace, e.g. the one sent by the caller.
+            parent_span_id (Optional[str]): The span of the caller of a new trace.
+
+        Returns:
+            The context manager, which yields the span.
+        """
+        parent = get_current_span()
+        if parent is None:
+            sampled = self.enabled and (self.sample_ratio >= 1 or random.random() < self.sample_ratio)
+            return _SpanScope(self, Span(name, trace_id or str(uuid.uuid4()), kind=kind, attributes=attributes,
+                                         sampled=sampled, parent_span_id=parent_span_id))
+        if not parent.sampled:
+            return _NonRecordingScope(parent)
+        return _SpanScope(self, Span(name, parent.trace_id, parent, kind, attributes))
+
+    def record_span(self, name: str, start_time_ns: int, end_time_ns: int,
+                    attributes: Optional[dict[str, Any]] = None, kind: str = SPAN_KIND_INTERNAL,
+                    error: Optional[BaseException] = None):
+        """
+        Records a finished child of the current span, for the operations timed by callbacks such as the SQL
+        statements.
+        """
+        parent = get_current_span()
+        if not isinstance(parent, Span) or not parent.sampled:
+            return
+        span = Span(name, parent.trace_id, parent, kind, attributes, start_time_ns=start_time_ns)
+        if error is not None:
+            span.record_exception(error)
+        self.end_span(span, end_time_ns)
+
+    def end_span(self, span: Span, end_time_ns: Optional[int] = None):
+        span.end_time_ns = end_time_ns if end_time_ns is not None else time.time_ns()
+        if not span.sampled or self.exporter is None:
+            return
+        root = span.root
+        if span is root:
+            root._finished.append(root)
+            finished, root._finished = root._finished, []
+            self._enqueue(finished)
+        elif root.end_time_ns is None:
+            root._finished.append(span)
+        else:
+            # Ended after its trace, e.g. a background load started by the request
+            self._enqueue([span])
+
+    def _enqueue(self, spans: list[Span]):
+        if len(self._queue) + len(spans) > self.max_queue_size:
+            TRACING_SPANS_DROPPED.inc(len(spans))
+            return
+        self._queue.extend(spans)
+        self._start_worker()
+        if len(self._queue) >= self.export_batch_size:
+            self._wakeup.set()
+
+    def _start_worker(self):
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='trace-exporter', daemon=True)
+                self._worker.start()
+                atexit.register(self.shutdown)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.export_interval_seconds)
+            self._wakeup.clear()
+            self.force_flush()
+
+    def force_flush(self):
+        """
+        Exports the finished spans now.
+        """
+        with self._export_lock:
+            while self._queue:
+                batch = []
+                while self._queue and len(batch) < self.export_batch_size:
+                    batch.append(self._queue.popleft())
+                try:
+                    self.exporter.export(batch, self.service_name)
+                    TRACING_SPANS_EXPORTED.inc(len(batch))
+                except Exception:
+                    # Tracing never fails the traced code, the lost batch is counted
+                    TRACING_EXPORT_ERRORS.inc()
+
+    def shutdown(self):
+        """
+        Exports the pending spans and stops the exporter thread.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self.exporter is not None:
+            self.force_flush()
+            self.exporter.shutdown()
+
+
+# The tracer of the process, set by the application factory
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer):
+    global _tracer
+    _tracer = tracer
+
+
+def trace_span(name: str, attributes: Optional[dict[str, Any]] = None, kind: str = SPAN_KIND_INTERNAL):
+    """
+    Runs the block in a span of the tracer of the process, see `Tracer.start_span`.
+    """
+    return _tracer.start_span(name, attributes, kind)
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator that runs the function in a span named after it.
+
+    Args:
+        name (Optional[str]): The name of the span. Defaults to the qualified name of the function.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _tracer.start_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,67 @@
+import re
+import uuid
+from typing import Mapping, Optional
+
+from flask import Flask, g, request
+
+from shared.tracing.tracer import SPAN_KIND_SERVER, get_tracer
+
+# W3C trace context header: version-trace_id-parent_id-flags
+_TRACEPARENT = re.compile(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$')
+
+
+def incoming_trace(headers: Mapping[str, str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    Returns the trace ID and the parent span sent by the caller, from a W3C `traceparent` or an `X-Trace-ID`.
+
+    Args:
+        headers (Mapping[str, str]): The request headers, looked up by their lowercase names.
+    """
+    match = _TRACEPARENT.match(headers.get('traceparent', '').strip().lower())
+    if match and int(match.group(1), 16):
+        return str(uuid.UUID(match.group(1))), match.group(2)
+    trace_id = headers.get('x-trace-id', '').strip()
+    if trace_id and len(trace_id) <= 64:
+        return trace_id, None
+    return None, None
+
+
+def register_tracing_hooks(app: Flask):
+    """
+    Runs every request in the root span of a trace, continuing the trace of the caller when it sends one,
+    and returns its trace ID in the `X-Trace-ID` header so a slow response can be looked up in the traces
+    and the logs.
+
+    It must be registered before the other hooks, so the span covers them.
+
+    Args:
+        app (Flask): The Flask application instance.
+    """
+
+    @app.before_request
+    def start_request_span():
+        trace_id, parent_span_id = incoming_trace(request.headers)
+        route = request.url_rule.rule if request.url_rule is not None else request.path
+        scope = get_tracer().start_span(f"{request.method} {route}", {
+            'http.method': request.method,
+            'http.route': route,
+        }, SPAN_KIND_SERVER, trace_id, parent_span_id)
+        g.trace_span = scope.__enter__()
+        g.trace_scope = scope
+
+    @app.after_request
+    def tag_response(response):
+        span = g.get('trace_span')
+        if span is not None:
+            span.set_attribute('http.status_code', response.status_code)
+            if response.status_code >= 500:
+                span.status = 'error'
+            response.headers['X-Trace-ID'] = span.trace_id
+        return response
+
+    @app.teardown_request
+    def end_request_span(error=None):
+        scope = g.pop('trace_scope', None)
+        g.pop('trace_span', None)
+        if scope is not None:
+            scope.__exit__(type(error) if error is not None else None, error, None)
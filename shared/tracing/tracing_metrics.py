@@ -0,0 +1,14 @@
+from prometheus_client import Counter
+
+TRACING_SPANS_EXPORTED = Counter(
+    'textile_pro_tracing_spans_exported_total',
+    'Sampled spans handed to the trace exporter',
+)
+TRACING_SPANS_DROPPED = Counter(
+    'textile_pro_tracing_spans_dropped_total',
+    'Sampled spans dropped because the export queue was full',
+)
+TRACING_EXPORT_ERRORS = Counter(
+    'textile_pro_tracing_export_errors_total',
+    'Batches of spans the exporter failed to write',
+)
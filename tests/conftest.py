@@ -0,0 +1,133 @@
+import os
+import tempfile
+import uuid
+from datetime import datetime, UTC
+
+import pytest
+from sqlalchemy import create_engine
+
+# The configuration is read when the application is imported: the tests run on their own database, without
+# the background threads of a worker and without throttling the client
+_TEST_DIR = tempfile.mkdtemp(prefix="textile-pro-tests-")
+os.environ["DEV_DATABASE_URI"] = f"sqlite:///{os.path.join(_TEST_DIR, 'test_database.db')}"
+os.environ["CACHE_WARMUP_ENABLED"] = "false"
+os.environ["PROFILING_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["TRACING_EXPORTER"] = "none"
+
+from apps.alerts.infrastructure.adapters.secondary.orm.models.alerts_orm_model import AlertsOrmModel  # noqa: E402
+from apps.tenants.infrastructure.adapters.secondary.orm.models.tenants_orm_model import TenantsOrmModel  # noqa: E402
+from apps.users.infrastructure.adapters.primary.framework.flask_app import create_app  # noqa: E402
+from shared.constants import ALERT_SCOPE_MODULE, ALERT_SEVERITY_WARNING, ALERT_STATUS_ACTIVE  # noqa: E402
+from shared.database import DataBaseManager  # noqa: E402
+from shared.models.base_orm_model import Base  # noqa: E402
+from shared.scheduler import scheduled_jobs_orm_model  # noqa: E402,F401
+from shared.security import create_access_token  # noqa: E402
+from shared.tenancy import tenant_scope  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    engine = create_engine(os.environ["DEV_DATABASE_URI"])
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    app = create_app('default')
+    yield app
+    app.config['plant_import_service'].shutdown()
+    app.config['broadcast_hub'].close()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def database_manager(app):
+    """
+    Sessions on the database of the application, its committed writes invalidate the cache of the application.
+    """
+    database_manager = DataBaseManager(app.config['DATABASE_URI'], app.config['tenant_cache'])
+    yield database_manager
+    database_manager.dispose_engine()
+
+
+@pytest.fixture
+def make_tenant(app, database_manager):
+    """
+    Creates a tenant with a plan it cannot exhaust unless the test lowers one of its limits, a new one per call so
+    the tests do not see each other's rows. The plans are reloaded right away, the workers only know a new tenant
+    from their next sync.
+    """
+    def make(name: str = "plant", **plan) -> str:
+        tenant_id = f"{name}-{uuid.uuid4().hex[:8]}"
+        plan = {"max_users": 1000, "max_modules": 1000, "max_storage_gb": 100, "api_calls_per_month": 10 ** 9,
+                **plan}
+        with tenant_scope(tenant_id):
+            session = database_manager.get_session()
+            try:
+                session.add(TenantsOrmModel(uuid=str(uuid.uuid4()), name=f"Test {name}", slug=tenant_id,
+                                            status="active", plan_type="enterprise", **plan))
+                session.commit()
+            finally:
+                database_manager.close_session(session)
+        app.config['plan_limits_service'].sync()
+        return tenant_id
+
+    return make
+
+
+@pytest.fixture
+def auth_headers():
+    """
+    Returns the headers of a request signed for a user of a tenant.
+    """
+    def headers(tenant_id: str, sub: str = "supervisor@plant.test") -> dict:
+        return {"Authorization": f"Bearer {create_access_token({'sub': sub, 'tenant_id': tenant_id})}"}
+
+    return headers
+
+
+@pytest.fixture
+def insert_alerts(database_manager):
+    """
+    Inserts active alerts of a tenant, one per module, committing them like the alerts service does.
+    """
+    def insert(tenant_id: str, count: int = 1) -> list[str]:
+        fingerprints = [f"low_efficiency:module:{uuid.uuid4().hex[:8]}" for _ in range(count)]
+        with tenant_scope(tenant_id):
+            session = database_manager.get_session()
+            try:
+                session.add_all(AlertsOrmModel(uuid=str(uuid.uuid4()), fingerprint=fingerprint,
+                                               rule_code="low_efficiency", severity=ALERT_SEVERITY_WARNING,
+                                               scope=ALERT_SCOPE_MODULE, scope_id=fingerprint.rsplit(':', 1)[1],
+                                               title="Low efficiency", message="The module is below its target",
+                                               value=40.0, threshold=60.0, status=ALERT_STATUS_ACTIVE,
+                                               raised_at=datetime.now(UTC))
+                                for fingerprint in fingerprints)
+                session.commit()
+            finally:
+                database_manager.close_session(session)
+        return fingerprints
+
+    return insert
+
+
+@pytest.fixture
+def record_production(client, auth_headers):
+    """
+    Logs a production record of a module through the API and returns its ledger event.
+    """
+    def record(tenant_id: str, module_id: str = "module-1", occurred_at: datetime = None,
+               minutes_worked: float = 60, produced_minutes: float = 45) -> dict:
+        body = {"moduleId": module_id, "referenceId": "reference-1", "timeSlotId": "slot-1",
+                "personEntries": [{"personId": "person-1", "minutesWorked": minutes_worked,
+                                   "producedMinutes": produced_minutes}]}
+        if occurred_at is not None:
+            body["occurredAt"] = occurred_at.isoformat()
+        response = client.post('/production/records', headers=auth_headers(tenant_id), json=body)
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()
+
+    return record
@@ -0,0 +1,69 @@
+import sys
+
+from flask import Flask, jsonify
+
+from shared.constants import USER_ROLE, USER_ROLE_ADMIN
+from shared.decorators import admin_required
+from shared.decorators.admin_required import get_admin_payload
+from shared.security import create_access_token
+
+# The package re-exports the decorator under the name of its module
+token_required_module = sys.modules['shared.decorators.token_required']
+
+
+def _admin_app(seen: list) -> Flask:
+    admin_app = Flask(__name__)
+
+    @admin_app.before_request
+    def look_for_admin():
+        seen.append(get_admin_payload() is not None)
+
+    @admin_app.route('/admin')
+    @admin_required
+    def admin_view(payload):
+        return jsonify({"sub": payload["sub"]})
+
+    return admin_app
+
+
+def _bearer(role: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': 'admin@plant.test', 'role': role})}"}
+
+
+def test_admin_required_answers_like_token_required_without_a_valid_token():
+    client = _admin_app([]).test_client()
+
+    missing = client.get('/admin')
+    invalid = client.get('/admin', headers={"Authorization": "Bearer not-a-token"})
+
+    assert (missing.status_code, missing.get_json()) == (401, {"error": "Token is missing"})
+    assert (invalid.status_code, invalid.get_json()) == (401, {"error": "Invalid token"})
+
+
+def test_admin_required_only_lets_the_administrators_in():
+    client = _admin_app([]).test_client()
+
+    user = client.get('/admin', headers=_bearer(USER_ROLE))
+    admin = client.get('/admin', headers=_bearer(USER_ROLE_ADMIN))
+
+    assert (user.status_code, user.get_json()) == (403, {"error": "Administrator token required"})
+    assert (admin.status_code, admin.get_json()) == (200, {"sub": "admin@plant.test"})
+
+
+def test_the_token_is_decoded_once_per_request(monkeypatch):
+    decoded = []
+    decode_access_token = token_required_module.decode_access_token
+
+    def counting_decode(token):
+        decoded.append(token)
+        return decode_access_token(token)
+
+    monkeypatch.setattr(token_required_module, 'decode_access_token', counting_decode)
+    seen = []
+    client = _admin_app(seen).test_client()
+
+    response = client.get('/admin', headers=_bearer(USER_ROLE_ADMIN))
+
+    assert response.status_code == 200
+    assert seen == [True]
+    assert len(decoded) == 1
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from apps.production.application.services.production_archive_service import ProductionArchiveService
+from apps.production.infrastructure.adapters.secondary.parquet.repositories.production_archive_parquet_repository \
+    import ProductionArchiveParquetRepository
+
+# The cold archive is written with pyarrow, an optional dependency
+pytest.importorskip("pyarrow")
+
+NOW = datetime.now(UTC)
+
+
+@pytest.fixture
+def archive_service(app, tmp_path):
+    runner = app.config['production_projection_runner']
+    return ProductionArchiveService(runner.db_repository, ProductionArchiveParquetRepository(str(tmp_path)),
+                                    runner.database_manager, runner, archive_after_months=6)
+
+
+def test_closed_before_keeps_the_open_months(archive_service):
+    assert archive_service.closed_before(datetime(2026, 8, 20, 15, tzinfo=UTC)) == datetime(2026, 2, 1, tzinfo=UTC)
+    assert archive_service.closed_before(datetime(2026, 1, 1, tzinfo=UTC)) == datetime(2025, 7, 1, tzinfo=UTC)
+
+
+def test_closed_months_move_to_the_archive(archive_service, client, auth_headers, make_tenant, record_production):
+    tenant_id = make_tenant()
+    old = NOW - timedelta(days=300)
+    archived_events = [record_production(tenant_id, module_id="module-9", occurred_at=old) for _ in range(3)]
+    recent_event = record_production(tenant_id, module_id="module-9")
+    headers = auth_headers(tenant_id)
+
+    archived = archive_service.archive_closed_months(NOW)
+
+    assert archived[tenant_id] == 3
+    assert archive_service.archive_repository.archived_months(tenant_id) == [old.date().replace(day=1)]
+    # The archived events stay in the totals, folded before they were moved
+    aggregate = client.get('/production/aggregates/module/module-9', headers=headers).get_json()
+    assert aggregate["records"] == 4
+    # Only the events of the open months can still be corrected
+    correction = {"expectedVersion": 1, "personEntries": [{"personId": "person-1", "minutesWorked": 30}]}
+    archived_record = archived_events[0]["record_id"]
+    assert client.put(f'/production/records/{archived_record}', headers=headers, json=correction).status_code == 404
+    assert client.put(f'/production/records/{recent_event["record_id"]}', headers=headers,
+                      json=correction).status_code == 200
+    # A second run finds nothing left to move
+    assert tenant_id not in archive_service.archive_closed_months(NOW)
@@ -0,0 +1,134 @@
+import uuid
+from datetime import datetime, UTC
+
+import pytest
+
+from apps.plant.domain.entities.plant_import_model import ImportEntity
+from shared.tenancy import tenant_scope
+
+
+@pytest.fixture
+def bus_queries(app, monkeypatch):
+    """
+    Records the queries the views ask to the query bus.
+    """
+    query_bus, asked = app.config['query_bus'], []
+    ask = query_bus.ask
+
+    def recording_ask(query, *args, **kwargs):
+        asked.append(query)
+        return ask(query, *args, **kwargs)
+
+    monkeypatch.setattr(query_bus, 'ask', recording_ask)
+    return asked
+
+
+def test_unchanged_alerts_are_answered_with_304(client, auth_headers, make_tenant, insert_alerts, bus_queries):
+    tenant_id = make_tenant()
+    insert_alerts(tenant_id, 2)
+    headers = auth_headers(tenant_id)
+
+    first = client.get('/alerts', headers=headers)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert etag.startswith('W/')
+
+    bus_queries.clear()
+    revalidated = client.get('/alerts', headers={**headers, 'If-None-Match': etag})
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b''
+    assert revalidated.headers['ETag'] == etag
+    assert bus_queries == []
+
+
+def test_writes_change_the_etag(client, auth_headers, make_tenant, insert_alerts):
+    tenant_id = make_tenant()
+    insert_alerts(tenant_id)
+    headers = auth_headers(tenant_id)
+    etag = client.get('/alerts', headers=headers).headers['ETag']
+
+    new_fingerprint = insert_alerts(tenant_id)[0]
+    response = client.get('/alerts', headers={**headers, 'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert new_fingerprint in {alert["fingerprint"] for alert in response.get_json()["Alerts"]}
+
+
+def test_etags_are_not_shared_between_tenants(client, auth_headers, make_tenant):
+    plant_a, plant_b = make_tenant("plant-a"), make_tenant("plant-b")
+    etag = client.get('/alerts', headers=auth_headers(plant_a)).headers['ETag']
+
+    response = client.get('/alerts', headers={**auth_headers(plant_b), 'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+def test_cached_body_is_served_without_running_the_view(client, auth_headers, make_tenant, insert_alerts,
+                                                        bus_queries):
+    tenant_id = make_tenant()
+    insert_alerts(tenant_id, 3)
+    headers = auth_headers(tenant_id)
+    first = client.get('/alerts', headers=headers)
+
+    bus_queries.clear()
+    second = client.get('/alerts', headers=headers)
+
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert second.headers['Vary'].startswith('X-Tenant-ID, Authorization')
+    assert bus_queries == []
+
+
+def test_recorded_production_changes_the_etag_of_the_aggregate(client, auth_headers, make_tenant,
+                                                               record_production, bus_queries):
+    tenant_id = make_tenant()
+    headers = auth_headers(tenant_id)
+    record_production(tenant_id, module_id="module-3")
+    first = client.get('/production/aggregates/module/module-3', headers=headers)
+
+    bus_queries.clear()
+    assert client.get('/production/aggregates/module/module-3',
+                      headers={**headers, 'If-None-Match': first.headers['ETag']}).status_code == 304
+    assert bus_queries == []
+
+    record_production(tenant_id, module_id="module-3")
+    response = client.get('/production/aggregates/module/module-3',
+                          headers={**headers, 'If-None-Match': first.headers['ETag']})
+
+    assert response.status_code == 200
+    assert response.get_json()["records"] == first.get_json()["records"] + 1
+
+
+def test_refreshed_summaries_change_the_etag(app, client, auth_headers, make_tenant, record_production):
+    tenant_id = make_tenant()
+    headers = auth_headers(tenant_id)
+    today = datetime.now(UTC).date().isoformat()
+    url = f'/production/summaries/daily/modules?dateFrom={today}&dateTo={today}&moduleId=module-5'
+    etag = client.get(url, headers=headers).headers['ETag']
+    assert client.get(url, headers={**headers, 'If-None-Match': etag}).status_code == 304
+
+    record_production(tenant_id, module_id="module-5")
+    app.config['production_projection_runner'].catch_up()
+    response = client.get(url, headers={**headers, 'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert [summary["records"] for summary in response.get_json()] == [1]
+
+
+def test_imported_rows_change_the_etag_of_the_plant_listing(app, client, auth_headers, make_tenant):
+    tenant_id = make_tenant()
+    headers = auth_headers(tenant_id)
+    etag = client.get('/plant/modules', headers=headers).headers['ETag']
+    assert client.get('/plant/modules', headers={**headers, 'If-None-Match': etag}).status_code == 304
+
+    with tenant_scope(tenant_id):
+        app.config['plant_import_service'].import_chunk(
+            str(uuid.uuid4()), tenant_id, ImportEntity.MODULES, [{'code': 'M2', 'name': 'Sewing 2'},
+                                                                 {'code': 'M1', 'name': 'Sewing 1'}],
+            {'processed_rows': 0, 'inserted_rows': 0, 'duplicated_rows': 0, 'failed_rows': 0}, [], set())
+    response = client.get('/plant/modules?limit=1', headers={**headers, 'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert [module["code"] for module in response.get_json()] == ['M1']
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone, UTC
+
+import pytest
+
+from shared.scheduler import CronSchedule, IntervalSchedule, parse_schedule
+from shared.scheduler.scheduler_exceptions import InvalidScheduleException
+
+# A Monday
+MONDAY = datetime(2026, 3, 2, 10, 17, 30, tzinfo=UTC)
+
+
+@pytest.mark.parametrize("expression, seconds", [("@every 30s", 30), ("@every 5m", 300), ("@every 2h", 7200),
+                                                 ("@every 1d", 86400), ("  @every 15s ", 15)])
+def test_every_is_an_interval(expression, seconds):
+    schedule = parse_schedule(expression)
+
+    assert isinstance(schedule, IntervalSchedule)
+    assert schedule.next_after(MONDAY) == MONDAY + timedelta(seconds=seconds)
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("* * * * *", datetime(2026, 3, 2, 10, 18, tzinfo=UTC)),
+    ("*/15 * * * *", datetime(2026, 3, 2, 10, 30, tzinfo=UTC)),
+    ("0 3 * * *", datetime(2026, 3, 3, 3, 0, tzinfo=UTC)),
+    ("30 9-17/4 * * *", datetime(2026, 3, 2, 13, 30, tzinfo=UTC)),
+    ("0 6 * * 1,3", datetime(2026, 3, 4, 6, 0, tzinfo=UTC)),
+    ("0 0 * * 7", datetime(2026, 3, 8, 0, 0, tzinfo=UTC)),
+    ("0 0 29 2 *", datetime(2028, 2, 29, 0, 0, tzinfo=UTC)),
+    ("@hourly", datetime(2026, 3, 2, 11, 0, tzinfo=UTC)),
+    ("@monthly", datetime(2026, 4, 1, 0, 0, tzinfo=UTC)),
+])
+def test_cron_next_after(expression, expected):
+    schedule = parse_schedule(expression)
+
+    assert isinstance(schedule, CronSchedule)
+    assert schedule.next_after(MONDAY) == expected
+
+
+def test_cron_restricted_day_and_weekday_match_either():
+    # The 15th of the month or any Friday, as in cron
+    schedule = CronSchedule("0 12 15 * 5")
+
+    assert schedule.next_after(MONDAY) == datetime(2026, 3, 6, 12, 0, tzinfo=UTC)
+    assert schedule.next_after(datetime(2026, 3, 13, 13, 0, tzinfo=UTC)) == datetime(2026, 3, 15, 12, 0, tzinfo=UTC)
+
+
+def test_cron_runs_in_utc():
+    bogota = timezone(timedelta(hours=-5))
+
+    assert CronSchedule("0 3 * * *").next_after(datetime(2026, 3, 2, 21, 0, tzinfo=bogota)) == \
+        datetime(2026, 3, 3, 3, 0, tzinfo=UTC)
+
+
+def test_next_after_is_strictly_after():
+    schedule = CronSchedule("0 3 * * *")
+    run = schedule.next_after(MONDAY)
+
+    assert schedule.next_after(run) == run + timedelta(days=1)
+
+
+@pytest.mark.parametrize("expression", ["", "* * * *", "* * * * * *", "60 * * * *", "* 24 * * *", "* * 0 * *",
+                                        "* * * 13 *", "* * * * 8", "*/0 * * * *", "5-1 * * * *", "a * * * *",
+                                        "@every 0s", "@every 5w", "0 0 31 2 *"])
+def test_invalid_expressions_are_rejected(expression):
+    with pytest.raises(InvalidScheduleException):
+        parse_schedule(expression).next_after(MONDAY)
@@ -0,0 +1,65 @@
+import json
+from datetime import datetime, UTC
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
+
+from apps.users.domain.entities.users_model import UserRole
+from shared.serialization import OrjsonProvider
+
+
+class Garment(BaseModel):
+    """
+    A model with an alias, extra fields, an excluded field, a serializer and a computed field.
+    """
+    model_config = ConfigDict(populate_by_name=True, extra='allow')
+
+    reference_id: str = Field(alias='referenceId')
+    minutes_per_unit: Decimal = Field(alias='minutesPerUnit')
+    role: UserRole = UserRole.USER
+    created_at: datetime = datetime(2026, 1, 5, 8, 30, tzinfo=UTC)
+    uuid: UUID = UUID(int=7)
+    secret: Optional[str] = Field(None, exclude=True)
+
+    @field_serializer('reference_id')
+    def serialize_reference_id(self, value):
+        return value.upper()
+
+    @computed_field
+    @property
+    def label(self) -> str:
+        return f"{self.reference_id}-{self.minutes_per_unit}"
+
+
+class Module(BaseModel):
+    """
+    A model without serializers whose extra fields are only kept apart from its instance dictionary.
+    """
+    model_config = ConfigDict(populate_by_name=True, extra='allow')
+
+    module_id: str = Field(alias='moduleId')
+
+
+@pytest.fixture
+def providers():
+    app = Flask(__name__)
+    return OrjsonProvider(app), DefaultJSONProvider(app)
+
+
+@pytest.mark.parametrize("model", [
+    Garment(referenceId="ref-1", minutesPerUnit=Decimal("1.25"), secret="hidden", lot="L-7"),
+    Garment(reference_id="ref-2", minutes_per_unit=Decimal("3"), sizes=[{"name": "M", "quantity": 4}]),
+    Module(moduleId="module-1", efficiency=0.75),
+])
+def test_models_are_written_like_their_json_dump(providers, model):
+    orjson_provider, default_provider = providers
+
+    written = json.loads(orjson_provider.dumps({"Rows": [model]}))
+
+    assert written == json.loads(default_provider.dumps({"Rows": [model.model_dump(mode='json')]}))
+    assert "secret" not in written["Rows"][0]
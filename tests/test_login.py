@@ -0,0 +1,64 @@
+import uuid
+
+import pytest
+
+from apps.users.domain.entities.users_model import InsertUsersModel, UserRole, UserStatus
+from apps.users.infrastructure.adapters.secondary.orm.repositories.users_orm_repository import UsersOrmRepository
+from shared.security import decode_access_token, hash_password
+from shared.tenancy import tenant_scope
+
+
+@pytest.fixture
+def make_user(database_manager):
+    """
+    Stores a user of a tenant with a hashed password and returns its email.
+    """
+    def make(tenant_id: str, password: str = "s3cret", role: UserRole = UserRole.USER,
+             status: UserStatus = UserStatus.ACTIVE) -> str:
+        email = f"operator-{uuid.uuid4().hex[:8]}@plant.test"
+        with tenant_scope(tenant_id):
+            session = database_manager.get_session()
+            try:
+                UsersOrmRepository().insert(session, InsertUsersModel(
+                    name="Operator", email=email, password=hash_password(password), role=role, status=status))
+                session.commit()
+            finally:
+                database_manager.close_session(session)
+        return email
+
+    return make
+
+
+def test_login_returns_a_token_of_the_user_and_its_tenant(client, make_tenant, make_user):
+    tenant_id = make_tenant()
+    email = make_user(tenant_id, role=UserRole.ADMIN)
+
+    response = client.post('/auth/login', json={"tenantId": tenant_id, "email": email, "password": "s3cret"})
+
+    assert response.status_code == 200
+    payload = decode_access_token(response.get_json()["accessToken"])
+    assert (payload["sub"], payload["tenant_id"], payload["role"]) == (email, tenant_id, "admin")
+
+
+@pytest.mark.parametrize("password, status", [("wrong", UserStatus.ACTIVE), ("s3cret", UserStatus.BLOCKED)])
+def test_login_refuses_wrong_credentials(client, make_tenant, make_user, password, status):
+    tenant_id = make_tenant()
+    email = make_user(tenant_id, status=status)
+
+    response = client.post('/auth/login', json={"tenantId": tenant_id, "email": email, "password": password})
+
+    assert response.status_code == 401
+    assert response.get_json() == {"error": "Invalid credentials"}
+
+
+def test_users_only_sign_in_to_their_tenant(client, make_tenant, make_user):
+    plant_a, plant_b = make_tenant("plant-a"), make_tenant("plant-b")
+    email = make_user(plant_a)
+
+    response = client.post('/auth/login', json={"tenantId": plant_b, "email": email, "password": "s3cret"})
+
+    assert response.status_code == 401
+
+
+def test_login_requires_its_credentials(client):
+    assert client.post('/auth/login', json={"email": "operator@plant.test"}).status_code == 400
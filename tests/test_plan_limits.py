@@ -0,0 +1,21 @@
+from shared.constants import PLAN_LIMIT_API_CALLS, TENANT_PLAN_LIMIT_CODE
+
+
+def test_calls_over_the_monthly_quota_are_refused(client, auth_headers, make_tenant):
+    tenant_id = make_tenant(api_calls_per_month=2)
+
+    statuses = [client.get('/alerts', headers=auth_headers(tenant_id)).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 402]
+    body = client.get('/alerts', headers=auth_headers(tenant_id)).get_json()
+    assert body["code"] == TENANT_PLAN_LIMIT_CODE
+    assert body["limit"] == PLAN_LIMIT_API_CALLS
+
+
+def test_tenants_without_a_plan_are_refused(client, auth_headers, make_tenant):
+    make_tenant()
+
+    response = client.get('/alerts', headers=auth_headers("plant-without-plan"))
+
+    assert response.status_code == 403
+    assert response.get_json() == {"error": "The tenant has no plan"}
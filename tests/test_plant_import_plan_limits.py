@@ -0,0 +1,100 @@
+import threading
+import uuid
+
+from apps.plant.domain.entities.plant_import_model import ImportEntity
+from apps.plant.exceptions.infrastructure.orm.plant_orm_repository_exceptions import \
+    PlantOrmRepositoryDuplicatedException
+from shared.constants import PLAN_RESOURCE_MODULES
+from shared.limits import PlanUsageCounters
+from shared.tenancy import tenant_scope
+
+
+def _import_modules(app, tenant_id: str, codes: list[str]) -> tuple[dict, list[dict]]:
+    progress = {'processed_rows': 0, 'inserted_rows': 0, 'duplicated_rows': 0, 'failed_rows': 0}
+    errors = []
+    with tenant_scope(tenant_id):
+        app.config['plant_import_service'].import_chunk(
+            str(uuid.uuid4()), tenant_id, ImportEntity.MODULES,
+            [{'code': code, 'name': f'Module {code}'} for code in codes], progress, errors, set())
+    return progress, errors
+
+
+def test_rows_over_the_plan_are_rejected(app, make_tenant):
+    tenant_id = make_tenant(max_modules=2)
+
+    progress, errors = _import_modules(app, tenant_id, ['M1', 'M2', 'M3'])
+
+    assert (progress['inserted_rows'], progress['failed_rows']) == (2, 1)
+    assert errors == [{'row': 4, 'message': 'The plan of the tenant does not allow more modules'}]
+    assert app.config['plan_limits_service'].counters.resource_count(PLAN_RESOURCE_MODULES, tenant_id) == 2
+
+
+def test_a_retried_chunk_reports_its_rows_over_the_plan_once(app, make_tenant, monkeypatch):
+    tenant_id = make_tenant(max_modules=2)
+    repository = app.config['plant_import_service'].db_repository
+    insert_many = repository.insert_many
+    attempts = []
+
+    def insert_after_a_concurrent_import(session, entity, rows, trace_id=None):
+        attempts.append(len(rows))
+        if len(attempts) == 1:
+            raise PlantOrmRepositoryDuplicatedException("A concurrent import wrote the codes")
+        return insert_many(session, entity, rows, trace_id)
+
+    monkeypatch.setattr(repository, 'insert_many', insert_after_a_concurrent_import)
+
+    progress, errors = _import_modules(app, tenant_id, ['M1', 'M2', 'M3', 'M4'])
+
+    assert attempts == [2, 2]
+    assert [error['row'] for error in errors] == [4, 5]
+    assert (progress['inserted_rows'], progress['failed_rows']) == (2, 2)
+
+
+def test_a_failed_chunk_gives_its_reservation_back(app, make_tenant, monkeypatch):
+    tenant_id = make_tenant(max_modules=2)
+    repository = app.config['plant_import_service'].db_repository
+
+    def fail(session, entity, rows, trace_id=None):
+        raise PlantOrmRepositoryDuplicatedException("A concurrent import wrote the codes")
+
+    monkeypatch.setattr(repository, 'insert_many', fail)
+    try:
+        _import_modules(app, tenant_id, ['M1', 'M2'])
+    except PlantOrmRepositoryDuplicatedException:
+        pass
+    monkeypatch.undo()
+    assert app.config['plan_limits_service'].counters.resource_count(PLAN_RESOURCE_MODULES, tenant_id) == 0
+
+    progress, errors = _import_modules(app, tenant_id, ['M1', 'M2'])
+
+    assert progress['inserted_rows'] == 2 and not errors
+
+
+def test_concurrent_reservations_never_overrun_the_limit():
+    counters = PlanUsageCounters()
+    granted = []
+    start = threading.Barrier(8)
+
+    def reserve():
+        start.wait()
+        granted.append(counters.reserve_resource(PLAN_RESOURCE_MODULES, 'plant-a', 2, limit=5))
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(granted) == 5
+    assert counters.resource_count(PLAN_RESOURCE_MODULES, 'plant-a') == 5
+
+
+def test_a_sync_keeps_the_rows_reserved_in_flight():
+    counters = PlanUsageCounters()
+    reserved = counters.reserve_resource(PLAN_RESOURCE_MODULES, 'plant-a', 3, limit=10)
+
+    counters.load_resource_counts(PLAN_RESOURCE_MODULES, {'plant-a': 4})
+    assert counters.resource_count(PLAN_RESOURCE_MODULES, 'plant-a') == 7
+
+    counters.finish_reservation(PLAN_RESOURCE_MODULES, 'plant-a', reserved, 1)
+    assert counters.resource_count(PLAN_RESOURCE_MODULES, 'plant-a') == 5
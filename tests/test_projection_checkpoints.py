@@ -0,0 +1,139 @@
+import uuid
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+
+import pytest
+
+from apps.production.application.services.production_projection_runner import ProductionProjectionRunner
+from apps.production.domain.projections.production_projection_interface import ProductionProjectionInterface
+from apps.production.domain.services.production_ledger import gapless_prefix, settled_prefix
+from apps.production.exceptions.application.services.production_ledger_service_exceptions import \
+    ProductionProjectionRunnerException
+from shared.tenancy import all_tenants_scope
+
+NOW = datetime(2026, 3, 2, 12, 0, tzinfo=UTC)
+SETTLED_BEFORE = NOW - timedelta(seconds=60)
+
+
+def _event(event_id: int, age_seconds: float):
+    return SimpleNamespace(id=event_id, recorded_at=NOW - timedelta(seconds=age_seconds))
+
+
+class RecordingProjection(ProductionProjectionInterface):
+    """
+    Projection that keeps the ids of the events it was fed, optionally failing on a batch.
+    """
+
+    def __init__(self, fail_on_batch: int = None):
+        self.name = f"test-{uuid.uuid4().hex[:8]}"
+        self.fail_on_batch = fail_on_batch
+        self.batches: list[list[int]] = []
+
+    def reset(self, session, trace_id: str = None):
+        self.batches = []
+
+    def apply_batch(self, session, events, trace_id: str = None):
+        if self.fail_on_batch is not None and len(self.batches) + 1 == self.fail_on_batch:
+            raise RuntimeError("Projection failed")
+        self.batches.append([event.id for event in events])
+
+    @property
+    def applied_ids(self) -> list[int]:
+        return [event_id for batch in self.batches for event_id in batch]
+
+
+@pytest.fixture
+def make_runner(app):
+    shared_runner = app.config['production_projection_runner']
+
+    def make(projection: ProductionProjectionInterface, batch_size: int = 2) -> ProductionProjectionRunner:
+        # Every event is settled: the ledger of the other tests has gaps, e.g. the archived events
+        return ProductionProjectionRunner(shared_runner.db_repository, shared_runner.database_manager, [projection],
+                                          batch_size=batch_size, settle_seconds=0)
+
+    return make
+
+
+def _checkpoint(runner: ProductionProjectionRunner, name: str) -> int:
+    session = runner.database_manager.get_session()
+    try:
+        with all_tenants_scope():
+            return runner.db_repository.get_checkpoint(session, name)
+    finally:
+        runner.database_manager.close_session(session)
+
+
+def test_gapless_prefix_skips_settled_gaps_and_stops_at_young_ones():
+    events = [_event(3, 300), _event(5, 200), _event(6, 10), _event(8, 5), _event(9, 1)]
+
+    assert [event.id for event in gapless_prefix(events, 2, SETTLED_BEFORE)] == [3, 5, 6]
+    assert [event.id for event in gapless_prefix(events, 0, SETTLED_BEFORE)] == [3, 5, 6]
+    assert gapless_prefix([_event(4, 1)], 2, SETTLED_BEFORE) == []
+
+
+def test_settled_prefix_stops_at_the_first_young_event():
+    events = [_event(1, 300), _event(2, 120), _event(3, 30), _event(4, 600)]
+
+    assert [event.id for event in settled_prefix(events, SETTLED_BEFORE)] == [1, 2]
+
+
+def test_runner_applies_every_event_once_from_its_checkpoint(make_runner, make_tenant, record_production):
+    tenant_id = make_tenant()
+    for _ in range(3):
+        record_production(tenant_id)
+    projection = RecordingProjection()
+    runner = make_runner(projection)
+
+    applied = runner.catch_up()[projection.name]
+    last_id = projection.applied_ids[-1]
+    assert applied == len(projection.applied_ids) >= 3
+    assert projection.applied_ids == sorted(set(projection.applied_ids))
+    assert all(len(batch) <= 2 for batch in projection.batches)
+    assert _checkpoint(runner, projection.name) == last_id
+
+    # A restarted worker resumes from the stored checkpoint
+    restarted = make_runner(projection)
+    assert restarted.catch_up()[projection.name] == 0
+    event = record_production(tenant_id)
+    assert restarted.catch_up()[projection.name] == 1
+    assert projection.applied_ids[-1] == event["id"]
+    assert _checkpoint(runner, projection.name) == event["id"]
+
+
+def test_failed_batch_keeps_the_previous_checkpoint(make_runner, make_tenant, record_production):
+    tenant_id = make_tenant()
+    for _ in range(3):
+        record_production(tenant_id)
+    projection = RecordingProjection(fail_on_batch=2)
+    runner = make_runner(projection)
+
+    with pytest.raises(ProductionProjectionRunnerException):
+        runner.catch_up()
+
+    assert _checkpoint(runner, projection.name) == projection.batches[0][-1]
+
+
+def test_rebuild_replays_the_ledger(make_runner, make_tenant, record_production):
+    record_production(make_tenant())
+    projection = RecordingProjection()
+    runner = make_runner(projection, batch_size=1000)
+    applied = runner.catch_up()[projection.name]
+
+    assert runner.rebuild(projection.name) == applied
+    assert _checkpoint(runner, projection.name) == projection.applied_ids[-1]
+
+
+def test_read_models_follow_the_ledger(app, client, auth_headers, make_tenant, record_production):
+    tenant_id = make_tenant()
+    record_production(tenant_id, module_id="module-7", minutes_worked=60, produced_minutes=30)
+    record_production(tenant_id, module_id="module-7", minutes_worked=60, produced_minutes=60)
+    app.config['production_projection_runner'].catch_up()
+    today = datetime.now(UTC).date().isoformat()
+
+    summaries = client.get(f'/production/summaries/daily/modules?dateFrom={today}&dateTo={today}'
+                           f'&moduleId=module-7', headers=auth_headers(tenant_id)).get_json()
+
+    assert len(summaries) == 1
+    assert summaries[0]["records"] == 2
+    assert summaries[0]["worked_minutes"] == 120
+    assert summaries[0]["produced_minutes"] == 90
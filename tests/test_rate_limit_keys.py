@@ -0,0 +1,117 @@
+import pytest
+from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from shared.constants import LOGIN_RATE_LIMIT_BURST, LOGIN_RATE_LIMIT_RATE
+from shared.decorators import rate_limited
+from shared.rate_limit import InMemoryTokenBucketBackend, RateLimitRule, TokenBucketRateLimiter
+from shared.rate_limit.rate_limit_hooks import _user_key, register_rate_limit_hooks
+from shared.security import create_access_token
+
+
+class RecordingBackend(InMemoryTokenBucketBackend):
+    """
+    Token buckets that remember the keys they were asked for.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.keys = []
+
+    def consume(self, key, rate, burst, cost=1.0):
+        self.keys.append(key)
+        return super().consume(key, rate, burst, cost)
+
+
+@pytest.fixture
+def limited_app():
+    app = Flask(__name__)
+    backend = RecordingBackend()
+    register_rate_limit_hooks(app, TokenBucketRateLimiter(backend, RateLimitRule(rate=0.001, burst=1)))
+
+    @app.route('/ping')
+    def ping():
+        return 'pong'
+
+    @app.route('/pong')
+    def pong():
+        return 'ping'
+
+    app.backend = backend
+    return app
+
+
+def _bearer(sub: str) -> dict:
+    return {'Authorization': f"Bearer {create_access_token({'sub': sub, 'tenant_id': 'plant-a'})}"}
+
+
+def test_user_key_is_the_subject_of_a_valid_token(limited_app):
+    with limited_app.test_request_context('/ping', headers=_bearer('operator@plant.test')):
+        assert _user_key() == 'sub:operator@plant.test'
+
+
+@pytest.mark.parametrize('headers', [{}, {'Authorization': 'Bearer junk'}, {'Authorization': 'junk'}])
+def test_user_key_falls_back_to_the_address(limited_app, headers):
+    with limited_app.test_request_context('/ping', headers=headers, environ_base={'REMOTE_ADDR': '10.0.0.7'}):
+        assert _user_key() == 'ip:10.0.0.7'
+
+
+def test_junk_tokens_share_the_bucket_of_their_address(limited_app):
+    client = limited_app.test_client()
+
+    assert client.get('/ping', headers={'Authorization': 'Bearer junk-1'}).status_code == 200
+    response = client.get('/ping', headers={'Authorization': 'Bearer junk-2'})
+
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert len(set(limited_app.backend.keys)) == 1
+
+
+def test_buckets_are_per_user_and_route(limited_app):
+    client = limited_app.test_client()
+
+    assert client.get('/ping', headers=_bearer('first@plant.test')).status_code == 200
+    assert client.get('/ping', headers=_bearer('first@plant.test')).status_code == 429
+    assert client.get('/ping', headers=_bearer('second@plant.test')).status_code == 200
+    assert client.get('/pong', headers=_bearer('first@plant.test')).status_code == 200
+    assert limited_app.backend.keys[0] == 'r:-:sub:first@plant.test:ping'
+
+
+def test_tenant_bucket_is_shared_by_its_users():
+    limiter = TokenBucketRateLimiter(InMemoryTokenBucketBackend(), RateLimitRule(rate=0.001, burst=5),
+                                     tenant_rule=RateLimitRule(rate=0.001, burst=2))
+
+    assert limiter.check('plant-a', 'sub:first', 'alerts.get_alerts').allowed
+    assert limiter.check('plant-a', 'sub:second', 'alerts.get_alerts').allowed
+    rejected = limiter.check('plant-a', 'sub:third', 'alerts.get_alerts')
+    assert not rejected.allowed and rejected.scope == 'tenant'
+    assert limiter.check('plant-b', 'sub:first', 'alerts.get_alerts').allowed
+
+
+def test_login_has_a_strict_bucket(app):
+    rule = app.view_functions['users.login'].rate_limit_rule
+
+    assert (rule.rate, rule.burst) == (LOGIN_RATE_LIMIT_RATE, LOGIN_RATE_LIMIT_BURST)
+    assert rule.burst < app.config['RATE_LIMIT_ROUTE_BURST']
+
+
+def test_anonymous_clients_are_keyed_on_the_address_seen_by_the_trusted_proxy():
+    app = Flask(__name__)
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1)
+    backend = RecordingBackend()
+    register_rate_limit_hooks(app, TokenBucketRateLimiter(backend, RateLimitRule(rate=10, burst=10)))
+
+    @app.route('/login', methods=['POST'])
+    @rate_limited(rate=0.001, burst=2)
+    def login():
+        return 'token'
+
+    client = app.test_client()
+    # The proxy appends the address it saw, the entries the client sent before it are not trusted
+    statuses = [client.post('/login', headers={'X-Forwarded-For': f'10.9.9.{attempt}, 203.0.113.7'}).status_code
+                for attempt in range(3)]
+    other_client = client.post('/login', headers={'X-Forwarded-For': '203.0.113.8'})
+
+    assert statuses == [200, 200, 429]
+    assert other_client.status_code == 200
+    assert set(backend.keys) == {'r:-:ip:203.0.113.7:login', 'r:-:ip:203.0.113.8:login'}
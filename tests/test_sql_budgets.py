@@ -0,0 +1,112 @@
+from datetime import datetime, UTC
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, text
+from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
+
+from shared.database import SqlBudgetExceededException, register_sql_audit_events, sql_budget
+
+# Models with a lazy relationship, which the models of the application do not declare
+LazyBase = declarative_base()
+
+
+class LineOrmModel(LazyBase):
+    __tablename__ = 'lines'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+    modules = relationship('ModuleOrmModel', lazy='select')
+
+
+class ModuleOrmModel(LazyBase):
+    __tablename__ = 'modules'
+    id = Column(Integer, primary_key=True)
+    line_id = Column(Integer, ForeignKey('lines.id'), nullable=False)
+    name = Column(String(50), nullable=False)
+
+
+@pytest.fixture
+def busy_tenant(app, make_tenant, insert_alerts, record_production):
+    """
+    A tenant with enough alerts and records for a statement run per row to exceed the budgets.
+    """
+    tenant_id = make_tenant()
+    for index in range(12):
+        record_production(tenant_id, module_id=f"module-{index % 3}")
+    app.config['production_projection_runner'].catch_up()
+    return tenant_id
+
+
+def test_alerts_budget(client, auth_headers, insert_alerts, busy_tenant):
+    fingerprints = insert_alerts(busy_tenant, 20)
+    with sql_budget(max_statements=2, max_repeats=1):
+        response = client.get('/alerts', headers=auth_headers(busy_tenant))
+    assert response.status_code == 200
+    assert set(fingerprints) <= {alert["fingerprint"] for alert in response.get_json()["Alerts"]}
+
+
+def test_aggregate_budget(client, auth_headers, busy_tenant):
+    with sql_budget(max_statements=3, max_repeats=1):
+        response = client.get('/production/aggregates/module/module-1', headers=auth_headers(busy_tenant))
+    assert response.status_code == 200
+    assert response.get_json()["records"] == 4
+
+
+@pytest.mark.parametrize("summary", ["modules", "people"])
+def test_daily_summaries_budget(client, auth_headers, busy_tenant, summary):
+    today = datetime.now(UTC).date().isoformat()
+    with sql_budget(max_statements=2, max_repeats=1):
+        response = client.get(f'/production/summaries/daily/{summary}?dateFrom={today}&dateTo={today}',
+                              headers=auth_headers(busy_tenant))
+    assert response.status_code == 200
+
+
+def test_record_production_budget(client, auth_headers, busy_tenant):
+    body = {"moduleId": "module-1", "referenceId": "reference-1", "timeSlotId": "slot-2",
+            "personEntries": [{"personId": f"person-{index}", "minutesWorked": 60, "producedMinutes": 50}
+                              for index in range(8)]}
+    with sql_budget(max_statements=8, max_repeats=1):
+        response = client.post('/production/records', headers=auth_headers(busy_tenant), json=body)
+    assert response.status_code == 201
+
+
+def test_budget_reports_the_statements(database_manager):
+    with pytest.raises(SqlBudgetExceededException, match="a likely N\\+1"):
+        with sql_budget(max_repeats=2):
+            with database_manager.engine.connect() as connection:
+                for value in range(3):
+                    connection.execute(text("SELECT :value"), {"value": value})
+
+
+@pytest.fixture
+def lazy_session():
+    """
+    A session on a database of lines with their modules, its engine audited like the ones of the application.
+    """
+    engine = create_engine("sqlite://")
+    register_sql_audit_events(engine)
+    LazyBase.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(LineOrmModel(name=f"line-{line}", modules=[ModuleOrmModel(name=f"module-{line}-{module}")
+                                                               for module in range(3)])
+                    for line in range(4))
+    session.commit()
+    session.expunge_all()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_budget_catches_a_lazy_loaded_relationship(lazy_session):
+    with pytest.raises(SqlBudgetExceededException, match="a likely N\\+1") as error:
+        with sql_budget(max_repeats=1):
+            for line in lazy_session.query(LineOrmModel).all():
+                assert len(line.modules) == 3
+
+    # One SELECT of the modules per line, each with the ID of its line
+    assert "4x (4 distinct parameters" in str(error.value)
+
+
+def test_budget_allows_the_eager_loaded_relationship(lazy_session):
+    with sql_budget(max_statements=2, max_repeats=1):
+        lines = lazy_session.query(LineOrmModel).options(selectinload(LineOrmModel.modules)).all()
+        assert [len(line.modules) for line in lines] == [3, 3, 3, 3]
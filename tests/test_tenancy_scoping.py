@@ -0,0 +1,83 @@
+import pytest
+
+from apps.alerts.infrastructure.adapters.secondary.orm.models.alerts_orm_model import AlertsOrmModel
+from shared.tenancy import TenantContextMissingException, TenantMismatchException, TenantNotAllowedException, \
+    resolve_request_tenant, tenant_scope
+
+
+def test_requests_only_read_the_rows_of_their_tenant(client, auth_headers, make_tenant, insert_alerts):
+    plant_a, plant_b = make_tenant("plant-a"), make_tenant("plant-b")
+    alerts_a = insert_alerts(plant_a, 2)
+    alerts_b = insert_alerts(plant_b, 3)
+
+    alerts = client.get('/alerts', headers=auth_headers(plant_b)).get_json()["Alerts"]
+    assert {alert["fingerprint"] for alert in alerts} == set(alerts_b)
+    assert {alert["tenant_id"] for alert in alerts} == {plant_b}
+    assert not set(alerts_a) & {alert["fingerprint"] for alert in alerts}
+
+
+def test_aggregates_only_fold_the_events_of_their_tenant(client, auth_headers, make_tenant, record_production):
+    plant_a, plant_b = make_tenant("plant-a"), make_tenant("plant-b")
+    record_production(plant_a, module_id="shared-module")
+
+    aggregate = client.get('/production/aggregates/module/shared-module', headers=auth_headers(plant_b)).get_json()
+
+    assert aggregate["records"] == 0
+
+
+def test_header_cannot_switch_tenant(client, auth_headers, make_tenant):
+    plant_a, plant_b = make_tenant("plant-a"), make_tenant("plant-b")
+
+    response = client.get('/alerts', headers={**auth_headers(plant_a), 'X-Tenant-ID': plant_b})
+
+    assert response.status_code == 403
+
+
+def test_header_without_token_reads_nothing(client, make_tenant, insert_alerts):
+    plant_a = make_tenant("plant-a")
+    insert_alerts(plant_a)
+
+    response = client.get('/alerts', headers={'X-Tenant-ID': plant_a})
+
+    assert response.status_code == 401
+
+
+def test_resolve_request_tenant():
+    assert resolve_request_tenant({"sub": "user", "tenant_id": "plant-a"}, None) == "plant-a"
+    assert resolve_request_tenant({"sub": "user", "tenant_id": "plant-a"}, "plant-a") == "plant-a"
+    assert resolve_request_tenant(None, "plant-a") is None
+    with pytest.raises(TenantNotAllowedException):
+        resolve_request_tenant({"sub": "user", "tenant_id": "plant-a"}, "plant-b")
+
+
+def test_sessions_need_a_tenant(database_manager):
+    session = database_manager.get_session()
+    try:
+        with pytest.raises(TenantContextMissingException):
+            session.query(AlertsOrmModel).all()
+    finally:
+        database_manager.close_session(session)
+
+
+def test_sessions_do_not_write_rows_of_another_tenant(database_manager, make_tenant, insert_alerts):
+    plant_a, plant_b = make_tenant("plant-a"), make_tenant("plant-b")
+    fingerprint = insert_alerts(plant_a)[0]
+
+    with tenant_scope(plant_a):
+        session = database_manager.get_session()
+        try:
+            alert = session.query(AlertsOrmModel).filter_by(fingerprint=fingerprint).one()
+        finally:
+            database_manager.close_session(session)
+
+    with tenant_scope(plant_b):
+        session = database_manager.get_session()
+        try:
+            assert session.query(AlertsOrmModel).filter_by(fingerprint=fingerprint).first() is None
+            alert = session.merge(alert)
+            alert.title = "Overwritten"
+            with pytest.raises(TenantMismatchException):
+                session.flush()
+        finally:
+            session.rollback()
+            database_manager.close_session(session)
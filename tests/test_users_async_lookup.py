@@ -0,0 +1,95 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, UTC
+
+from apps.users.application.services.async_users_service import AsyncUsersService
+from apps.users.domain.entities.users_model import UserRole, UsersModel, UserStatus
+from apps.users.infrastructure.adapters.primary.framework.controllers.users_async_controller import \
+    users_async_routes
+from shared.asgi import AsgiApp
+from shared.security import create_access_token
+from shared.tenancy import get_current_tenant_id
+
+
+class SlowUsersRepository:
+    """
+    Users of one tenant whose lookups take a while, remembering how many of them were awaited at once.
+    """
+
+    def __init__(self, tenant_id: str, emails: list[str]):
+        self.users = {(tenant_id, email): UsersModel(
+            id=index, uuid=str(uuid.uuid4()), name="Operator", email=email, password="hashed", role=UserRole.USER,
+            status=UserStatus.ACTIVE, created_at=datetime.now(UTC), updated_at=datetime.now(UTC))
+            for index, email in enumerate(emails)}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_by_email(self, session, email, trace_id=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return self.users.get((get_current_tenant_id(), email))
+
+
+class SessionsManager:
+    """
+    Hands out a session per lookup like the AsyncDataBaseManager.
+    """
+
+    class Session:
+        async def rollback(self):
+            pass
+
+    def get_session(self):
+        return self.Session()
+
+    async def close_session(self, session):
+        pass
+
+
+def _lookup(repository: SlowUsersRepository, query: str, tenant_id: str = "plant-a") -> tuple[int, dict]:
+    app = AsgiApp(lambda environ, start_response: [], {
+        'DEBUG': False, 'async_users_service': AsyncUsersService(repository, SessionsManager())}, users_async_routes)
+    token = create_access_token({'sub': 'supervisor@plant.test', 'tenant_id': tenant_id})
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app({'type': 'http', 'method': 'GET', 'path': '/users/lookup', 'query_string': query.encode(),
+                     'headers': [(b'authorization', f'Bearer {token}'.encode())]}, receive, send))
+    app.bridge.shutdown()
+    return messages[0]['status'], json.loads(messages[1]['body'])
+
+
+def test_lookup_awaits_the_independent_queries_together():
+    emails = [f"operator-{index}@plant.test" for index in range(4)]
+    repository = SlowUsersRepository("plant-a", emails)
+
+    status, body = _lookup(repository, f"emails={','.join(emails + ['ghost@plant.test'])}")
+
+    assert status == 200
+    assert repository.max_in_flight == 5
+    assert [user["email"] for user in body["Users"].values() if user] == emails
+    assert body["Users"]["ghost@plant.test"] is None
+    assert "password" not in body["Users"][emails[0]]
+
+
+def test_lookup_only_finds_the_users_of_the_tenant_of_the_token():
+    repository = SlowUsersRepository("plant-a", ["operator@plant.test"])
+
+    status, body = _lookup(repository, "emails=operator@plant.test", tenant_id="plant-b")
+
+    assert status == 200
+    assert body["Users"] == {"operator@plant.test": None}
+
+
+def test_lookup_requires_emails():
+    status, body = _lookup(SlowUsersRepository("plant-a", []), "emails=")
+
+    assert status == 400
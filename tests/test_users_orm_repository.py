@@ -0,0 +1,56 @@
+import uuid
+
+import pytest
+
+from apps.users.domain.entities.users_model import InsertUsersModel, UpdateUsersModel, UserRole, UserStatus
+from apps.users.infrastructure.adapters.secondary.orm.models.users_orm_model import UsersOrmModel
+from apps.users.infrastructure.adapters.secondary.orm.repositories.users_orm_repository import UsersOrmRepository
+from shared.tenancy import tenant_scope
+
+
+@pytest.fixture
+def users_session(database_manager, make_tenant):
+    """
+    A session acting for a new tenant, rolled back after the test.
+    """
+    with tenant_scope(make_tenant()):
+        session = database_manager.get_session()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            database_manager.close_session(session)
+
+
+def _insert_user(session, role: UserRole = UserRole.USER):
+    return UsersOrmRepository().insert(session, InsertUsersModel(
+        name="Operator", email=f"operator-{uuid.uuid4().hex[:8]}@plant.test", password="hashed", role=role,
+        status=UserStatus.ACTIVE))
+
+
+def test_insert_returns_the_stored_user(users_session):
+    user = _insert_user(users_session, UserRole.ADMIN)
+
+    assert user.id is not None
+    assert user.role == UserRole.ADMIN
+    assert user.created_at is not None
+    stored = users_session.query(UsersOrmModel.role, UsersOrmModel.status).filter_by(id=user.id).one()
+    assert tuple(stored) == ('admin', 'active')
+
+
+def test_update_stores_the_enums_by_value(users_session):
+    user = _insert_user(users_session)
+
+    updated = UsersOrmRepository().update(users_session, UpdateUsersModel(id=user.id, status=UserStatus.BLOCKED))
+    users_session.flush()
+
+    assert updated.status == UserStatus.BLOCKED
+    assert users_session.query(UsersOrmModel.status).filter_by(id=user.id).scalar() == 'blocked'
+
+
+def test_get_by_email(users_session):
+    user = _insert_user(users_session)
+    repository = UsersOrmRepository()
+
+    assert repository.get_by_email(users_session, user.email).id == user.id
+    assert repository.get_by_email(users_session, "nobody@plant.test") is None